@@ -91,7 +91,8 @@ def main():
             # Process batch directory
             success = process_batch_directory(
                 file_ops, file_processing['directory'], 
-                analysis_options, config['processing_options']['auto']
+                analysis_options, config['processing_options']['auto'],
+                garch_fit_cache=file_processing.get('garch_fit_cache', False)
             )
             
         elif file_processing['mode'] == 'batch_all':
@@ -153,8 +154,9 @@ def process_single_file(file_ops: FinanceFileOperations, filename: str,
 
 
 def process_batch_directory(file_ops: FinanceFileOperations, directory: str,
-                          analysis_options: Dict[str, bool], auto_mode: bool) -> bool:
-    """Process all files in a batch directory."""
+                          analysis_options: Dict[str, bool], auto_mode: bool,
+                          garch_fit_cache: bool = False) -> bool:
+    """Process all files in a batch directory (garch_fit_cache keeps GARCH fits on disk for reruns)."""
     try:
         if not os.path.exists(directory):
             print(ColorUtils.error(f"Directory '{directory}' does not exist"))
@@ -208,7 +210,8 @@ def process_batch_directory(file_ops: FinanceFileOperations, directory: str,
                 
                 # Perform analysis
                 success = perform_financial_analysis(
-                    data, file_metadata, analysis_options, auto_mode
+                    data, file_metadata, analysis_options, auto_mode,
+                    garch_fit_cache=garch_fit_cache
                 )
                 
                 if success:
@@ -339,7 +342,7 @@ def process_custom_path(file_ops: FinanceFileOperations, path: str,
 
 def perform_financial_analysis(data, file_metadata: Dict[str, Any], 
                               analysis_options: Dict[str, bool], 
-                              auto_mode: bool) -> bool:
+                              auto_mode: bool, garch_fit_cache: bool = False) -> bool:
     """Perform comprehensive financial analysis."""
     try:
         print(ColorUtils.header("Starting Financial Analysis"))
@@ -374,8 +377,10 @@ def perform_financial_analysis(data, file_metadata: Dict[str, Any],
         # Volatility Analysis
         if analysis_options.get('volatility', False):
             print(ColorUtils.analysis("Performing Volatility Analysis..."))
-            volatility_analyzer = VolatilityAnalysis()
-            volatility_results = volatility_analyzer.analyze_volatility(data, numeric_columns)
+            volatility_analyzer = VolatilityAnalysis(use_fit_cache=garch_fit_cache)
+            volatility_results = volatility_analyzer.analyze_volatility(
+                data, numeric_columns, source=file_metadata.get('file_path')
+            )
             analysis_results['volatility_analysis'] = volatility_results
             
             # Display volatility summary
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the recursive trend indicator kernels (SAR, SuperTrend, Wave).
+
+Compares the original bar-by-bar pandas ``.iloc`` loops ("before") against the
+array kernels in src/calculation/indicators/trend/trend_kernels.py ("after"),
+checks that both produce bit-for-bit identical values and prints rows/second.
+
+Usage:
+    uv run scripts/analysis/benchmark_trend_kernels.py --rows 1000000 --legacy-rows 20000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.calculation.indicators.trend.sar_ind import calculate_sar
+from src.calculation.indicators.trend.supertrend_ind import calculate_supertrend
+from src.calculation.indicators.trend.wave_ind import (
+    calculate_ecore, calc_draw_lines, tr_switch, ENUM_MOM_TR
+)
+from src.calculation.indicators.trend.trend_kernels import NUMBA_AVAILABLE
+from src.common.constants import BUY, SELL, NOTRADE
+
+
+# --- Legacy implementations (pre-kernel .iloc loops) ---
+
+def legacy_sar(df, acceleration=0.02, maximum=0.2):
+    high_prices, low_prices = df['High'], df['Low']
+    sar = pd.Series(index=df.index, dtype=float)
+    ep = pd.Series(index=df.index, dtype=float)
+    af = pd.Series(index=df.index, dtype=float)
+    trend = pd.Series(index=df.index, dtype=int)
+    sar.iloc[0], ep.iloc[0], af.iloc[0], trend.iloc[0] = low_prices.iloc[0], high_prices.iloc[0], acceleration, 1
+    for i in range(1, len(df)):
+        if trend.iloc[i-1] == 1:
+            if high_prices.iloc[i] > ep.iloc[i-1]:
+                ep.iloc[i], af.iloc[i], trend.iloc[i] = high_prices.iloc[i], min(af.iloc[i-1] + acceleration, maximum), 1
+            else:
+                ep.iloc[i], af.iloc[i], trend.iloc[i] = low_prices.iloc[i], acceleration, -1
+            sar.iloc[i] = sar.iloc[i-1] + af.iloc[i-1] * (ep.iloc[i-1] - sar.iloc[i-1])
+            if sar.iloc[i] > low_prices.iloc[i-1]:
+                sar.iloc[i] = low_prices.iloc[i-1]
+            if sar.iloc[i] > low_prices.iloc[i]:
+                sar.iloc[i] = low_prices.iloc[i]
+        else:
+            if low_prices.iloc[i] < ep.iloc[i-1]:
+                ep.iloc[i], af.iloc[i], trend.iloc[i] = low_prices.iloc[i], min(af.iloc[i-1] + acceleration, maximum), -1
+            else:
+                ep.iloc[i], af.iloc[i], trend.iloc[i] = high_prices.iloc[i], acceleration, 1
+            sar.iloc[i] = sar.iloc[i-1] + af.iloc[i-1] * (ep.iloc[i-1] - sar.iloc[i-1])
+            if sar.iloc[i] < high_prices.iloc[i-1]:
+                sar.iloc[i] = high_prices.iloc[i-1]
+            if sar.iloc[i] < high_prices.iloc[i]:
+                sar.iloc[i] = high_prices.iloc[i]
+    return sar
+
+
+def legacy_supertrend(df, period=10, multiplier=3.0):
+    high_prices, low_prices, close_prices = df['High'], df['Low'], df['Close']
+    tr1 = high_prices - low_prices
+    tr2 = abs(high_prices - close_prices.shift(1))
+    tr3 = abs(low_prices - close_prices.shift(1))
+    atr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1).rolling(window=period).mean()
+    basic_upper = (high_prices + low_prices) / 2 + multiplier * atr
+    basic_lower = (high_prices + low_prices) / 2 - multiplier * atr
+    supertrend = pd.Series(index=df.index, dtype=float)
+    trend = pd.Series(index=df.index, dtype=int)
+    supertrend.iloc[0], trend.iloc[0] = basic_lower.iloc[0], 1
+    for i in range(1, len(df)):
+        if trend.iloc[i-1] == 1:
+            if close_prices.iloc[i] <= supertrend.iloc[i-1]:
+                supertrend.iloc[i], trend.iloc[i] = basic_upper.iloc[i], -1
+            else:
+                supertrend.iloc[i] = basic_lower.iloc[i]
+                if supertrend.iloc[i] < supertrend.iloc[i-1]:
+                    supertrend.iloc[i] = supertrend.iloc[i-1]
+                trend.iloc[i] = 1
+        else:
+            if close_prices.iloc[i] >= supertrend.iloc[i-1]:
+                supertrend.iloc[i], trend.iloc[i] = basic_lower.iloc[i], 1
+            else:
+                supertrend.iloc[i] = basic_upper.iloc[i]
+                if supertrend.iloc[i] > supertrend.iloc[i-1]:
+                    supertrend.iloc[i] = supertrend.iloc[i-1]
+                trend.iloc[i] = -1
+    return supertrend, trend
+
+
+def legacy_wave_line(price, div_long=2.0 / 339, div_fast=2.0 / 10, div_dir=2.0 / 3):
+    ecore = pd.Series(0.0, index=price.index)
+    diff = (price / price.shift(1) - 1) * 100
+    for i in range(1, len(price)):
+        ecore.loc[ecore.index[i]] = ecore.iloc[i - 1] + div_long * (diff.iloc[i] - ecore.iloc[i - 1])
+    wave = pd.Series(0.0, index=ecore.index)
+    fastline = pd.Series(0.0, index=ecore.index)
+    for i in range(1, len(ecore)):
+        wave.loc[wave.index[i]] = wave.iloc[i - 1] + div_fast * (ecore.iloc[i] - wave.iloc[i - 1])
+        fastline.loc[fastline.index[i]] = fastline.iloc[i - 1] + div_dir * (wave.iloc[i] - fastline.iloc[i - 1])
+    colors = pd.Series(NOTRADE, index=wave.index)
+    for i in range(1, len(wave)):
+        colors.iloc[i] = BUY if wave.iloc[i] > fastline.iloc[i] else SELL
+    return colors
+
+
+# --- Kernel-backed equivalents ---
+
+def kernel_wave_line(price, div_long=2.0 / 339, div_fast=2.0 / 10, div_dir=2.0 / 3):
+    wave, fastline = calc_draw_lines(div_fast, div_dir, calculate_ecore(div_long, price))
+    return tr_switch(ENUM_MOM_TR.TR_Fast, wave, fastline, NOTRADE, 0.0)
+
+
+def create_ohlc(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Create a random-walk M1 OHLC frame."""
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0002, rows))
+    spread = np.abs(rng.normal(0, 0.0003, rows))
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.0001, rows),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+    }, index=pd.date_range('2020-01-01', periods=rows, freq='min'))
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _first(result):
+    return result[0] if isinstance(result, tuple) else result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark trend indicator kernels")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Rows for the kernel run")
+    parser.add_argument('--legacy-rows', type=int, default=20_000,
+                        help="Rows for the legacy .iloc run (it is slow, rows/s is extrapolated)")
+    args = parser.parse_args()
+
+    df_big = create_ohlc(args.rows)
+    df_small = df_big.iloc[:args.legacy_rows]
+    print(f"Backend: {'numba' if NUMBA_AVAILABLE else 'numpy'}")
+    print(f"{'Indicator':<12}{'before rows/s':>16}{'after rows/s':>16}{'speedup':>10}  identical")
+
+    cases = [
+        ("SAR", legacy_sar, calculate_sar, lambda df: (df,)),
+        ("SuperTrend", legacy_supertrend, calculate_supertrend, lambda df: (df,)),
+        ("Wave", legacy_wave_line, kernel_wave_line, lambda df: (df['Open'],)),
+    ]
+    for name, legacy_func, kernel_func, make_args in cases:
+        # Warm-up (triggers JIT compilation when Numba is installed)
+        kernel_func(*make_args(df_small.iloc[:100]))
+
+        legacy_result, legacy_time = _timed(legacy_func, *make_args(df_small))
+        kernel_small = kernel_func(*make_args(df_small))
+        _, kernel_time = _timed(kernel_func, *make_args(df_big))
+
+        identical = np.array_equal(_first(legacy_result).to_numpy(), _first(kernel_small).to_numpy(), equal_nan=True)
+        before = len(df_small) / legacy_time
+        after = len(df_big) / kernel_time
+        print(f"{name:<12}{before:>16,.0f}{after:>16,.0f}{after / before:>9.0f}x  {identical}")
+
+
+if __name__ == "__main__":
+    main()
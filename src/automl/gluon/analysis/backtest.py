@@ -10,6 +10,8 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import logging
 
+from src.data.parquet_reader import read_parquet_data
+
 
 class SCHRBacktester:
     """Backtesting engine for SCHR Levels strategies"""
@@ -27,8 +29,8 @@ class SCHRBacktester:
                     strategy: str = 'simple') -> Dict[str, Any]:
         """Run backtesting analysis"""
         try:
-            # Load data
-            data = self._load_data(symbol, timeframe)
+            # Load data (row groups outside the date range are skipped)
+            data = self._load_data(symbol, timeframe, start_date, end_date)
             
             # Filter by date range
             if start_date:
@@ -71,7 +73,8 @@ class SCHRBacktester:
             self.logger.error(f"Backtesting failed: {e}")
             raise
     
-    def _load_data(self, symbol: str, timeframe: str) -> pd.DataFrame:
+    def _load_data(self, symbol: str, timeframe: str,
+                   start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
         """Load and prepare data for backtesting"""
         import os
         
@@ -81,7 +84,7 @@ class SCHRBacktester:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Data file not found: {file_path}")
         
-        df = pd.read_parquet(file_path)
+        df = read_parquet_data(file_path, start=start_date, end=end_date)
         
         # Set datetime index
         if 'Date' in df.columns:
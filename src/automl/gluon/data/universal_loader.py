@@ -15,6 +15,8 @@ import logging
 from datetime import datetime
 import warnings
 
+from src.data.parquet_reader import read_parquet_data
+
 warnings.filterwarnings('ignore')
 
 logger = logging.getLogger(__name__)
@@ -57,18 +59,22 @@ class UniversalDataLoader:
         logger.info(f"Discovered {len(discovered_files)} data files")
         return discovered_files
     
-    def load_parquet(self, file_path: Union[str, Path]) -> pd.DataFrame:
+    def load_parquet(self, file_path: Union[str, Path], columns: Optional[List[str]] = None,
+                     start=None, end=None) -> pd.DataFrame:
         """
         Load parquet file with optimization.
         
         Args:
             file_path: Path to parquet file
+            columns: Columns to load (None loads all)
+            start: First timestamp to load (inclusive)
+            end: Last timestamp to load (inclusive)
             
         Returns:
             Loaded DataFrame
         """
         try:
-            df = pd.read_parquet(file_path)
+            df = read_parquet_data(file_path, columns=columns, start=start, end=end)
             logger.info(f"Loaded parquet file: {file_path} ({len(df)} rows, {len(df.columns)} columns)")
             return df
         except Exception as e:
@@ -10,6 +10,8 @@ import numpy as np
 import logging
 from typing import Dict, Any, Optional, List
 
+from src.data.parquet_reader import read_parquet_data
+
 
 class DataLoader:
     """Handles data loading and preprocessing"""
@@ -18,8 +20,9 @@ class DataLoader:
         self.data_path = data_path
         self.logger = logging.getLogger(__name__)
     
-    def load_schr_data(self, symbol: str, timeframe: str) -> pd.DataFrame:
-        """Load SCHR Levels data from parquet files"""
+    def load_schr_data(self, symbol: str, timeframe: str, columns: Optional[List[str]] = None,
+                       start=None, end=None) -> pd.DataFrame:
+        """Load SCHR Levels data from parquet files, optionally only some columns or a date range"""
         try:
             filename = f"CSVExport_{symbol}_PERIOD_{timeframe}.parquet"
             file_path = os.path.join(self.data_path, filename)
@@ -27,7 +30,7 @@ class DataLoader:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"Data file not found: {file_path}")
             
-            df = pd.read_parquet(file_path)
+            df = read_parquet_data(file_path, columns=columns, start=start, end=end)
             self.logger.info(f"Loaded {len(df)} records for {symbol} {timeframe}")
             
             return df
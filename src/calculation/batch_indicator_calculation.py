@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# src/calculation/batch_indicator_calculation.py
+
+"""
+Single-pass calculation of several indicators over one OHLCV frame.
+
+The OHLCV columns, HL/Pressure/PV and the intermediates shared between
+indicators (returns, true range, EMAs of the same span) are computed once.
+Every rule runs on a lightweight frame whose columns reference the shared
+base arrays, and only the columns a rule produces are collected into the
+combined result, so the input frame is never copied per rule.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.common import logger
+from src.common.constants import TradingRule, EMPTY_VALUE
+from .core_calculations import calculate_hl, calculate_pressure, calculate_pv
+from .indicator import get_output_columns
+from .indicator_calculation import RULE_ALIASES_MAP, calculation_volume_column
+from .indicators.shared_intermediates import shared_intermediates
+from .rules import apply_trading_rule
+from .indicator_parameters import parse_rule_parameters
+
+# Generic rule output columns written by every apply_rule_* function
+RULE_OUTPUT_COLUMNS = ['PPrice1', 'PColor1', 'PPrice2', 'PColor2', 'Direction', 'Diff']
+
+# Rules that do not use HL/Pressure/PV
+_RSI_RULES = [TradingRule.RSI, TradingRule.RSI_Momentum, TradingRule.RSI_Divergence]
+
+# Rules that only pass raw data through
+_PASSTHROUGH_RULES = [TradingRule.OHLCV, TradingRule.AUTO]
+
+
+def resolve_trading_rule(rule_str: str) -> tuple[TradingRule, dict]:
+    """
+    Resolves one rule string (e.g. 'rsi', 'macd:12,26,9,close') to a TradingRule.
+
+    Args:
+        rule_str (str): Rule name or alias, optionally with parameters.
+
+    Returns:
+        tuple: (TradingRule, parameters dict)
+    """
+    rule_name, params = rule_str.strip(), {}
+    if ':' in rule_name:
+        rule_name, params = parse_rule_parameters(rule_name)
+    rule_name_str = RULE_ALIASES_MAP.get(rule_name.upper(), rule_name)
+    # Accept member names case-insensitively ('kelly', 'supertrend', ...)
+    members = {name.upper(): name for name in TradingRule.__members__}
+    rule_name_str = members.get(rule_name_str.upper(), rule_name_str)
+    try:
+        return TradingRule[rule_name_str], params
+    except KeyError:
+        raise ValueError(f"Invalid rule name or alias '{rule_str}'")
+
+
+def _unique_label(label: str, used_labels: set) -> str:
+    """Returns label, or label_2, label_3, ... if it is already used."""
+    if label not in used_labels:
+        return label
+    suffix = 2
+    while f"{label}_{suffix}" in used_labels:
+        suffix += 1
+    return f"{label}_{suffix}"
+
+
+def calculate_indicators_batch(
+    ohlcv_df: pd.DataFrame,
+    point: float,
+    rules: list,
+    price_type: str = 'close',
+) -> tuple[pd.DataFrame, list]:
+    """
+    Calculates several indicators over one OHLCV frame in a single pass.
+
+    Generic rule outputs (PPrice1, PColor1, ..., Diff) are stored as
+    '<LABEL>_<column>' where LABEL is the TradingRule name (suffixed with _2, _3
+    for repeated rules). The first rule's generic outputs are also stored under
+    the plain names, so plotting and trading metrics work on it unchanged.
+    Indicator-specific columns keep their names unless an earlier rule already
+    produced a column with the same name, in which case they are prefixed too.
+
+    Args:
+        ohlcv_df (pd.DataFrame): DataFrame with 'Open', 'High', 'Low', 'Close' and
+                                 'Volume' or 'TickVolume'. Not modified.
+        point (float): Instrument point size. Cannot be zero.
+        rules (list): Rule strings ('rsi', 'macd:12,26,9,close', ...) or TradingRule members.
+        price_type (str): Default price type for rules without an explicit one.
+
+    Returns:
+        tuple: (result_df, selected_rules) with one combined DataFrame and the
+               resolved TradingRule of every requested rule, in order.
+    """
+    if ohlcv_df is None or ohlcv_df.empty:
+        raise ValueError("No data available for calculation")
+    if not rules:
+        raise ValueError("At least one rule is required for batch calculation")
+    if point == 0:
+        raise ValueError("Point size cannot be zero.")
+
+    base_cols = ['Open', 'High', 'Low', 'Close']
+    if not all(col in ohlcv_df.columns for col in base_cols):
+        raise ValueError(f"Input DataFrame must contain columns: {base_cols}")
+    volume_col = 'Volume' if 'Volume' in ohlcv_df.columns else 'TickVolume'
+    if volume_col not in ohlcv_df.columns:
+        raise ValueError("Input DataFrame must contain either 'Volume' or 'TickVolume' column")
+
+    resolved = []
+    for rule in rules:
+        if isinstance(rule, TradingRule):
+            resolved.append((rule, {}))
+        else:
+            resolved.append(resolve_trading_rule(rule))
+
+    source_df = ohlcv_df
+    if source_df.index.duplicated().any():
+        logger.print_warning(f"Warning: Found {source_df.index.duplicated().sum()} duplicate indices. Removing duplicates to prevent calculation errors.")
+        source_df = source_df[~source_df.index.duplicated(keep='first')]
+
+    # --- Shared base columns (referenced, not copied) ---
+    # One base per volume column: volume-based rules read 'Volume', the other rules
+    # 'TickVolume', the same selection as the single-rule calculation
+    needs_pressure = any(rule not in _RSI_RULES + _PASSTHROUGH_RULES for rule, _ in resolved)
+    bases = {}
+
+    def base_for(rule):
+        volume_col = calculation_volume_column(source_df.columns, rule)
+        if volume_col not in bases:
+            base = {col: source_df[col] for col in base_cols}
+            base['Volume'] = source_df[volume_col]
+            if needs_pressure:
+                base['HL'] = calculate_hl(base['High'].shift(1), base['Low'].shift(1), point)
+                base['Pressure'] = calculate_pressure(base['Volume'].shift(1), base['HL'].shift(1))
+                base['PV'] = calculate_pv(base['Pressure'], base['Pressure'].shift(1))
+            bases[volume_col] = base
+        return bases[volume_col]
+
+    outputs = {}
+    used_labels = set()
+    selected_rules = []
+    with shared_intermediates() as cache:
+        for rule, params in resolved:
+            selected_rules.append(rule)
+            if rule in _PASSTHROUGH_RULES:
+                continue
+
+            rule_params = dict(params)
+            rule_price_type = rule_params.pop('price_type', price_type)
+
+            base = base_for(rule)
+            rule_df = pd.DataFrame(base, index=source_df.index, copy=False)
+            rule_df['PPrice1'] = rule_df['Open']
+            rule_df['PColor1'] = EMPTY_VALUE
+            rule_df['PPrice2'] = rule_df['Open']
+            rule_df['PColor2'] = EMPTY_VALUE
+            rule_df['Direction'] = EMPTY_VALUE
+            rule_df['Diff'] = EMPTY_VALUE
+
+            rule_df = apply_trading_rule(rule_df, rule, point, rule_price_type, **rule_params)
+
+            label = _unique_label(rule.name, used_labels)
+            used_labels.add(label)
+            first_rule = len(used_labels) == 1
+            for col in get_output_columns(rule):
+                if col in base or col not in rule_df.columns:
+                    continue
+                values = rule_df[col]
+                if col in RULE_OUTPUT_COLUMNS:
+                    values = values.replace(EMPTY_VALUE, np.nan)
+                    if first_rule:
+                        outputs[col] = values
+                    outputs[f"{label}_{col}"] = values
+                elif col in outputs:
+                    outputs[f"{label}_{col}"] = values
+                else:
+                    outputs[col] = values
+        logger.print_debug(f"Batch calculation reused {cache.hits} shared intermediates ({cache.misses} computed)")
+
+    # Shared columns of the first rule, like its generic outputs under the plain names
+    base = base_for(selected_rules[0])
+    result_df = pd.DataFrame({**base, **outputs}, index=source_df.index, copy=False)
+    return result_df, selected_rules
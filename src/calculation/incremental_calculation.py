@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+# src/calculation/incremental_calculation.py
+
+"""
+Incremental (append-only) indicator recalculation for growing data caches.
+
+A full calculation records the state of the indicator's recursive parts (EMA
+accumulators of EMA/RSI/ATR, SAR and SuperTrend trend state) at a checkpoint
+``warmup`` bars before the last bar. The state is stored next to the exported
+indicator parquet file. On the next refresh only a tail of the data is
+recalculated: ``warmup`` bars before the checkpoint rebuild the rolling
+windows, the recursions resume from the saved state, and only the bars after
+the previously exported last bar are appended to the stored result.
+
+Rules whose values depend on the whole history (e.g. MACD scaling by the
+global histogram maximum, Monte Carlo return statistics) are always
+recalculated in full.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.common import logger
+from src.common.constants import TradingRule
+from .batch_indicator_calculation import resolve_trading_rule
+from .indicator_calculation import calculate_indicator
+from .indicators.resumable_state import ResumeStateMismatch, resumable_checkpoint
+
+STATE_VERSION = 1
+
+# Rules that can be recalculated incrementally and their default period
+INCREMENTAL_RULES = {
+    TradingRule.EMA: 20,
+    TradingRule.SMA: 20,
+    TradingRule.RSI: 14,
+    TradingRule.RSI_Momentum: 14,
+    TradingRule.ATR: 14,
+    TradingRule.Bollinger_Bands: 20,
+    TradingRule.SAR: 1,
+    TradingRule.SuperTrend: 10,
+}
+
+# Extra bars for signal logic looking back over indicator values (shifts, ATR_Signal 20-bar mean)
+_SIGNAL_LOOKBACK = 25
+
+_FINGERPRINT_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+
+def incremental_warmup(rule: TradingRule, params: dict) -> int:
+    """
+    Number of bars needed before a resume point to rebuild windowed values.
+
+    Args:
+        rule (TradingRule): Indicator rule
+        params (dict): Parsed rule parameters
+
+    Returns:
+        int: Warm-up length in bars
+    """
+    periods = [INCREMENTAL_RULES.get(rule, 0)]
+    periods += [value for value in params.values()
+                if isinstance(value, (int, np.integer)) and not isinstance(value, bool)]
+    return int(max(periods)) + _SIGNAL_LOOKBACK
+
+
+def state_file_path(parquet_file) -> Path:
+    """Returns the state file stored next to an exported indicator parquet file."""
+    parquet_file = Path(parquet_file)
+    return parquet_file.with_name(f"{parquet_file.stem}.state.json")
+
+
+def load_indicator_state(parquet_file):
+    """
+    Loads a previously exported indicator result and its saved state.
+
+    Args:
+        parquet_file: Exported indicator parquet file
+
+    Returns:
+        tuple: (previous_result_df, state) or (None, None) when unavailable
+    """
+    parquet_file = Path(parquet_file)
+    state_file = state_file_path(parquet_file)
+    if not parquet_file.exists() or not state_file.exists():
+        return None, None
+    try:
+        with open(state_file, 'r') as f:
+            state = json.load(f)
+        if state.get('version') != STATE_VERSION:
+            return None, None
+        previous = pd.read_parquet(parquet_file)
+        if 'DateTime' in previous.columns:
+            previous = previous.set_index('DateTime')
+            previous.index.name = None
+        return previous, state
+    except Exception as e:
+        logger.print_warning(f"Could not load indicator state from {state_file}: {e}")
+        return None, None
+
+
+def save_indicator_state(parquet_file, state: dict) -> Path:
+    """
+    Writes the indicator state next to the exported parquet file.
+
+    Args:
+        parquet_file: Exported indicator parquet file
+        state (dict): State returned by calculate_indicator_incremental
+
+    Returns:
+        Path: Written state file
+    """
+    state_file = state_file_path(parquet_file)
+    tmp_file = state_file.with_name(state_file.name + '.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_file, state_file)
+    return state_file
+
+
+def _fingerprint(df: pd.DataFrame, start: int, stop: int) -> str:
+    """Hash of the OHLC values the resumed calculation depends on."""
+    values = np.ascontiguousarray(df[_FINGERPRINT_COLUMNS].iloc[start:stop].to_numpy(dtype=np.float64))
+    return hashlib.sha1(values.tobytes()).hexdigest()
+
+
+def _build_state(args, rule: TradingRule, point_size: float, warmup: int,
+                 result_df: pd.DataFrame, records: list):
+    if len(result_df) < 2 * warmup:
+        return None
+    checkpoint_pos = len(result_df) - warmup
+    return {
+        'version': STATE_VERSION,
+        'rule': args.rule,
+        'selected_rule': rule.name,
+        'price_type': getattr(args, 'price_type', 'close'),
+        'point': float(point_size),
+        'warmup': warmup,
+        'rows': len(result_df),
+        'checkpoint_time': result_df.index[checkpoint_pos].isoformat(),
+        'last_time': result_df.index[-1].isoformat(),
+        'fingerprint': _fingerprint(result_df, checkpoint_pos - warmup, len(result_df)),
+        'seeds': records,
+    }
+
+
+def _resume(args, ohlcv_df, point_size, rule, warmup, previous_result, state):
+    """Recalculates the bars after the saved state; None when the state cannot be used."""
+    if (state.get('rule') != args.rule or state.get('selected_rule') != rule.name
+            or state.get('price_type') != getattr(args, 'price_type', 'close')
+            or state.get('point') != float(point_size) or state.get('warmup') != warmup):
+        return None
+    if not isinstance(ohlcv_df.index, pd.DatetimeIndex) or ohlcv_df.index.duplicated().any():
+        return None
+
+    checkpoint_time = pd.Timestamp(state['checkpoint_time'])
+    last_time = pd.Timestamp(state['last_time'])
+    if checkpoint_time not in ohlcv_df.index or last_time not in ohlcv_df.index:
+        return None
+    checkpoint_pos = ohlcv_df.index.get_loc(checkpoint_time)
+    last_pos = ohlcv_df.index.get_loc(last_time)
+    tail_start = checkpoint_pos - warmup
+    if tail_start < 0:
+        return None
+    # Bars the tail calculation reuses must be unchanged
+    if (_fingerprint(ohlcv_df, tail_start, last_pos + 1) != state['fingerprint']
+            or len(previous_result) != state['rows'] or previous_result.index[-1] != last_time):
+        return None
+
+    if last_pos == len(ohlcv_df) - 1:
+        return previous_result, state, 0
+
+    tail_df = ohlcv_df.iloc[tail_start:]
+    try:
+        with resumable_checkpoint(start=warmup, seeds=state['seeds'], record_from_end=warmup) as checkpoint:
+            tail_result, _ = calculate_indicator(args, tail_df, point_size)
+    except ResumeStateMismatch as e:
+        logger.print_debug(f"Incremental state rejected: {e}")
+        return None
+    if tail_result is None or not checkpoint.complete:
+        return None
+
+    new_rows = tail_result.iloc[last_pos - tail_start + 1:]
+    if set(new_rows.columns) != set(previous_result.columns):
+        return None
+    previous_result.index = previous_result.index.astype(new_rows.index.dtype)
+    previous_result.index.name = new_rows.index.name
+    result_df = pd.concat([previous_result[new_rows.columns], new_rows])
+    new_state = _build_state(args, rule, point_size, warmup, result_df,
+                             checkpoint.records) if checkpoint.resumable else None
+    return result_df, new_state, len(new_rows)
+
+
+def calculate_indicator_incremental(args, ohlcv_df: pd.DataFrame, point_size: float,
+                                    previous_result: pd.DataFrame = None, state: dict = None):
+    """
+    Calculates an indicator, reusing a previous result and state when possible.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments (rule, price_type, mode).
+        ohlcv_df (pd.DataFrame): Full OHLCV history (previous bars plus new bars).
+        point_size (float): Determined point size.
+        previous_result (pd.DataFrame, optional): Previously exported indicator result.
+        state (dict, optional): State saved with ``previous_result``.
+
+    Returns:
+        tuple: (result_df, selected_rule, state, computed_rows). ``state`` is None for
+               rules that cannot be recalculated incrementally. ``computed_rows`` is the
+               number of bars appended, or the full length after a full calculation.
+    """
+    try:
+        rule, params = resolve_trading_rule(args.rule)
+    except (ValueError, SystemExit):
+        rule, params = None, {}
+
+    if rule not in INCREMENTAL_RULES:
+        result_df, selected_rule = calculate_indicator(args, ohlcv_df, point_size)
+        return result_df, selected_rule, None, 0 if result_df is None else len(result_df)
+
+    warmup = incremental_warmup(rule, params)
+    if previous_result is not None and state is not None:
+        resumed = _resume(args, ohlcv_df, point_size, rule, warmup, previous_result, state)
+        if resumed is not None:
+            result_df, new_state, computed_rows = resumed
+            setattr(rule, 'original_rule_with_params', args.rule)
+            logger.print_info(f"Incremental update: {computed_rows} new bar(s) calculated, {len(result_df) - computed_rows} reused")
+            return result_df, rule, new_state, computed_rows
+        logger.print_info("Saved indicator state does not match the data, recalculating full history")
+
+    with resumable_checkpoint(record_from_end=warmup) as checkpoint:
+        result_df, selected_rule = calculate_indicator(args, ohlcv_df, point_size)
+    new_state = None
+    if result_df is not None and checkpoint.resumable and not ohlcv_df.index.duplicated().any():
+        new_state = _build_state(args, selected_rule, point_size, warmup, result_df, checkpoint.records)
+    return result_df, selected_rule, new_state, 0 if result_df is None else len(result_df)
+
+
+def calculate_indicator_for_export(args, ohlcv_df: pd.DataFrame, point_size: float, data_info: dict):
+    """
+    Calculates the indicator for a parquet export run.
+
+    With ``--incremental`` the previously exported file and its state are reused so
+    only new bars are calculated. The returned state should be saved with
+    save_indicator_state() once the export has been written.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+        ohlcv_df (pd.DataFrame): Full OHLCV history.
+        point_size (float): Determined point size.
+        data_info (dict): Information about the data source (used for the export path).
+
+    Returns:
+        tuple: (result_df, selected_rule, state)
+    """
+    from src.export.parquet_export import get_indicator_parquet_path
+
+    previous_result, state = None, None
+    if getattr(args, 'incremental', False):
+        try:
+            rule, _ = resolve_trading_rule(args.rule)
+            previous_result, state = load_indicator_state(get_indicator_parquet_path(data_info, rule, args))
+        except ValueError:
+            pass
+    result_df, selected_rule, new_state, _ = calculate_indicator_incremental(
+        args, ohlcv_df, point_size, previous_result, state
+    )
+    return result_df, selected_rule, new_state
@@ -17,6 +17,107 @@ from .core_calculations import (
 )
 from .rules import apply_trading_rule
 
+# --- Output Column Selection ---
+def get_output_columns(tr_num: TradingRule) -> list:
+    """
+    Returns the ordered list of columns kept in the result for a trading rule.
+
+    Args:
+        tr_num (TradingRule): Applied trading rule.
+
+    Returns:
+        list: Column names (base OHLCV, intermediates, rule outputs and
+              indicator-specific columns). Callers filter to existing columns.
+    """
+    # Define expected output columns
+    output_columns = [
+        'Open', 'High', 'Low', 'Close', 'Volume',                       # Original Data (Volume renamed)
+        'HL', 'Pressure', 'PV',                                         # Intermediate Calculations
+        'PPrice1', 'PColor1', 'PPrice2', 'PColor2', 'Direction', 'Diff' # Final Outputs
+    ]
+    
+    # Add RSI-specific columns for RSI rules
+    if tr_num in [TradingRule.RSI, TradingRule.RSI_Momentum, TradingRule.RSI_Divergence]:
+        rsi_columns = ['RSI', 'RSI_Signal', 'RSI_Price_Type']
+        if tr_num == TradingRule.RSI_Momentum:
+            rsi_columns.append('RSI_Momentum')
+        output_columns.extend(rsi_columns)
+    
+    # Add WAVE-specific columns for WAVE rules
+    if tr_num == TradingRule.Wave:
+        wave_columns = ['_Signal', '_Direction', '_LastSignal', 'ecore1', 'ecore2', 
+                       'wave1', 'fastline1', 'wave2', 'fastline2', 'Wave1', 'Wave2',
+                       '_Plot_Color', '_Plot_Wave', '_Plot_FastLine', 'MA_Line']
+        output_columns.extend(wave_columns)
+    
+    # Add CCI-specific columns for CCI rules
+    if tr_num == TradingRule.CCI:
+        cci_columns = ['CCI', 'CCI_Signal', 'CCI_Price_Type']
+        output_columns.extend(cci_columns)
+    
+    # Add Stochastic-specific columns for Stochastic rules
+    if tr_num == TradingRule.Stochastic:
+        stoch_columns = ['Stoch_K', 'Stoch_D', 'Stoch_Signal', 'Stoch_Price_Type']
+        output_columns.extend(stoch_columns)
+    
+    # Add EMA-specific columns for EMA rules
+    if tr_num == TradingRule.EMA:
+        ema_columns = ['EMA', 'EMA_Signal', 'EMA_Price_Type']
+        output_columns.extend(ema_columns)
+    
+    # Add Bollinger Bands-specific columns for BB rules
+    if tr_num == TradingRule.Bollinger_Bands:
+        bb_columns = ['BB_Upper', 'BB_Middle', 'BB_Lower', 'BB_Signal', 'BB_Price_Type']
+        output_columns.extend(bb_columns)
+    
+    # Add ATR-specific columns for ATR rules
+    if tr_num == TradingRule.ATR:
+        atr_columns = ['ATR', 'ATR_Signal', 'ATR_Price_Type']
+        output_columns.extend(atr_columns)
+    
+    # Add VWAP-specific columns for VWAP rules
+    if tr_num == TradingRule.VWAP:
+        vwap_columns = ['VWAP', 'VWAP_Signal', 'VWAP_Price_Type']
+        output_columns.extend(vwap_columns)
+    
+    # Add Pivot Points-specific columns for Pivot rules
+    if tr_num == TradingRule.Pivot_Points:
+        pivot_columns = ['Pivot_PP', 'Pivot_R1', 'Pivot_S1', 'Pivot_Signal', 'Pivot_Price_Type']
+        output_columns.extend(pivot_columns)
+    
+    # Add PutCallRatio-specific columns for PutCallRatio rules
+    if tr_num == TradingRule.PutCallRatio:
+        putcall_columns = ['PutCallRatio', 'PutCallRatio_Signal', 'PutCallRatio_Price_Type']
+        output_columns.extend(putcall_columns)
+    
+    # Add COT-specific columns for COT rules
+    if tr_num == TradingRule.COT:
+        cot_columns = ['COT', 'COT_Signal', 'COT_Price_Type']
+        output_columns.extend(cot_columns)
+    
+    # Add MACD-specific columns for MACD rules
+    if tr_num == TradingRule.MACD:
+        macd_columns = ['MACD_Line', 'MACD_Signal', 'MACD_Histogram', 'MACD_Price_Type']
+        output_columns.extend(macd_columns)
+    
+    # Add HMA-specific columns for HMA rules
+    if tr_num == TradingRule.HMA:
+        hma_columns = ['HMA', 'HMA_Signal', 'HMA_Price_Type']
+        output_columns.extend(hma_columns)
+    
+    # Add TSF-specific columns for TSF rules
+    if tr_num == TradingRule.TSForecast:
+        tsf_columns = ['TSForecast', 'TSForecast_Signal', 'TSForecast_Price_Type']
+        output_columns.extend(tsf_columns)
+    
+    # Add Monte Carlo-specific columns for Monte Carlo rules
+    if tr_num == TradingRule.MonteCarlo:
+        monte_columns = ['MonteCarlo', 'MonteCarlo_Signal', 'MonteCarlo_Histogram', 'MonteCarlo_Upper', 'MonteCarlo_Lower', 'MonteCarlo_Price_Type']
+        output_columns.extend(monte_columns)
+
+    return output_columns
+
+
 # --- Main Calculation Orchestrator ---
 def calculate_pressure_vector(
     df: pd.DataFrame,
@@ -133,92 +234,8 @@ def calculate_pressure_vector(
 
 
     # --- Select and return final columns ---
-    # Define expected output columns
-    output_columns = [
-        'Open', 'High', 'Low', 'Close', 'Volume',                       # Original Data (Volume renamed)
-        'HL', 'Pressure', 'PV',                                         # Intermediate Calculations
-        'PPrice1', 'PColor1', 'PPrice2', 'PColor2', 'Direction', 'Diff' # Final Outputs
-    ]
-    
-    # Add RSI-specific columns for RSI rules
-    if tr_num in [TradingRule.RSI, TradingRule.RSI_Momentum, TradingRule.RSI_Divergence]:
-        rsi_columns = ['RSI', 'RSI_Signal', 'RSI_Price_Type']
-        if tr_num == TradingRule.RSI_Momentum:
-            rsi_columns.append('RSI_Momentum')
-        output_columns.extend(rsi_columns)
-    
-    # Add WAVE-specific columns for WAVE rules
-    if tr_num == TradingRule.Wave:
-        wave_columns = ['_Signal', '_Direction', '_LastSignal', 'ecore1', 'ecore2', 
-                       'wave1', 'fastline1', 'wave2', 'fastline2', 'Wave1', 'Wave2',
-                       '_Plot_Color', '_Plot_Wave', '_Plot_FastLine', 'MA_Line']
-        output_columns.extend(wave_columns)
-    
-    # Add CCI-specific columns for CCI rules
-    if tr_num == TradingRule.CCI:
-        cci_columns = ['CCI', 'CCI_Signal', 'CCI_Price_Type']
-        output_columns.extend(cci_columns)
-    
-    # Add Stochastic-specific columns for Stochastic rules
-    if tr_num == TradingRule.Stochastic:
-        stoch_columns = ['Stoch_K', 'Stoch_D', 'Stoch_Signal', 'Stoch_Price_Type']
-        output_columns.extend(stoch_columns)
-    
-    # Add EMA-specific columns for EMA rules
-    if tr_num == TradingRule.EMA:
-        ema_columns = ['EMA', 'EMA_Signal', 'EMA_Price_Type']
-        output_columns.extend(ema_columns)
-    
-    # Add Bollinger Bands-specific columns for BB rules
-    if tr_num == TradingRule.Bollinger_Bands:
-        bb_columns = ['BB_Upper', 'BB_Middle', 'BB_Lower', 'BB_Signal', 'BB_Price_Type']
-        output_columns.extend(bb_columns)
-    
-    # Add ATR-specific columns for ATR rules
-    if tr_num == TradingRule.ATR:
-        atr_columns = ['ATR', 'ATR_Signal', 'ATR_Price_Type']
-        output_columns.extend(atr_columns)
-    
-    # Add VWAP-specific columns for VWAP rules
-    if tr_num == TradingRule.VWAP:
-        vwap_columns = ['VWAP', 'VWAP_Signal', 'VWAP_Price_Type']
-        output_columns.extend(vwap_columns)
-    
-    # Add Pivot Points-specific columns for Pivot rules
-    if tr_num == TradingRule.Pivot_Points:
-        pivot_columns = ['Pivot_PP', 'Pivot_R1', 'Pivot_S1', 'Pivot_Signal', 'Pivot_Price_Type']
-        output_columns.extend(pivot_columns)
-    
-    # Add PutCallRatio-specific columns for PutCallRatio rules
-    if tr_num == TradingRule.PutCallRatio:
-        putcall_columns = ['PutCallRatio', 'PutCallRatio_Signal', 'PutCallRatio_Price_Type']
-        output_columns.extend(putcall_columns)
-    
-    # Add COT-specific columns for COT rules
-    if tr_num == TradingRule.COT:
-        cot_columns = ['COT', 'COT_Signal', 'COT_Price_Type']
-        output_columns.extend(cot_columns)
-    
-    # Add MACD-specific columns for MACD rules
-    if tr_num == TradingRule.MACD:
-        macd_columns = ['MACD_Line', 'MACD_Signal', 'MACD_Histogram', 'MACD_Price_Type']
-        output_columns.extend(macd_columns)
-    
-    # Add HMA-specific columns for HMA rules
-    if tr_num == TradingRule.HMA:
-        hma_columns = ['HMA', 'HMA_Signal', 'HMA_Price_Type']
-        output_columns.extend(hma_columns)
-    
-    # Add TSF-specific columns for TSF rules
-    if tr_num == TradingRule.TSForecast:
-        tsf_columns = ['TSForecast', 'TSForecast_Signal', 'TSForecast_Price_Type']
-        output_columns.extend(tsf_columns)
-    
-    # Add Monte Carlo-specific columns for Monte Carlo rules
-    if tr_num == TradingRule.MonteCarlo:
-        monte_columns = ['MonteCarlo', 'MonteCarlo_Signal', 'MonteCarlo_Histogram', 'MonteCarlo_Upper', 'MonteCarlo_Lower', 'MonteCarlo_Price_Type']
-        output_columns.extend(monte_columns)
-    
+    output_columns = get_output_columns(tr_num)
+
     # Filter to only columns that actually exist in the DataFrame
     final_columns = [col for col in output_columns if col in df_out.columns]
 
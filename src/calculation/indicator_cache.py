@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+# src/calculation/indicator_cache.py
+
+"""
+Disk-backed cache of indicator results (calculate_pressure_vector output).
+
+Results are stored as Parquet files named by a content-addressed key built
+from a hash of the input OHLCV frame, the TradingRule, the point size, the
+parsed indicator parameters and a hash of the calculation source code, so a
+changed input bar, parameter or indicator implementation never returns a
+stale result. The cache directory is bounded in size: every hit refreshes the
+file's modification time and the least recently used files are evicted when
+the total size exceeds the limit.
+"""
+
+import hashlib
+import json
+import os
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.common import logger
+from src.common.constants import TradingRule
+from .indicator import calculate_pressure_vector
+from .indicators.resumable_state import active_checkpoint
+
+DEFAULT_CACHE_DIR = Path("data/cache/indicator_results")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Parameter values that have a stable text form for the cache key
+_KEY_VALUE_TYPES = (str, int, float, bool, type(None), Enum)
+
+_CODE_VERSION: Optional[str] = None
+
+
+def code_version() -> str:
+    """
+    Hash of the calculation source code (src/calculation and the shared constants).
+
+    Computed once per process; any edit to an indicator changes every cache key.
+
+    Returns:
+        str: Hex digest
+    """
+    global _CODE_VERSION
+    if _CODE_VERSION is None:
+        calc_dir = Path(__file__).resolve().parent
+        files = sorted(calc_dir.rglob("*.py")) + [calc_dir.parent / "common" / "constants.py"]
+        digest = hashlib.sha1()
+        for path in files:
+            if path.is_file():
+                digest.update(str(path.relative_to(calc_dir.parent)).encode())
+                digest.update(path.read_bytes())
+        _CODE_VERSION = digest.hexdigest()
+    return _CODE_VERSION
+
+
+def data_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Content hash of a frame (index, column names and all values).
+
+    Args:
+        df (pd.DataFrame): Input data
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha1()
+    digest.update(json.dumps([str(col) for col in df.columns]).encode())
+    digest.update(json.dumps([str(dtype) for dtype in df.dtypes] + [str(df.index.dtype)]).encode())
+    for values in [df.index] + [df[col] for col in df.columns]:
+        if isinstance(values.dtype, pd.DatetimeTZDtype):
+            values = values.tz_convert('UTC').tz_localize(None) if isinstance(values, pd.Index) \
+                else values.dt.tz_convert('UTC').dt.tz_localize(None)
+        array = values.to_numpy()
+        if array.dtype.kind in 'biufmM':
+            # Raw bytes of numeric/datetime data hash faster than hash_pandas_object
+            digest.update(np.ascontiguousarray(array).view(np.uint8).tobytes())
+        else:
+            digest.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def result_cache_key(df: pd.DataFrame, tr_num: TradingRule, point: float,
+                     price_type: str = 'close', **kwargs) -> Optional[str]:
+    """
+    Builds the cache key of one calculate_pressure_vector call.
+
+    Args:
+        df (pd.DataFrame): Input OHLCV frame
+        tr_num (TradingRule): Trading rule
+        point (float): Point size
+        price_type (str): Price type
+        **kwargs: Parsed indicator parameters
+
+    Returns:
+        str or None: Hex key, or None when a parameter has no stable text form
+    """
+    if not all(isinstance(value, _KEY_VALUE_TYPES) for value in kwargs.values()):
+        return None
+    params = {name: repr(value) for name, value in sorted(kwargs.items())}
+    payload = json.dumps({
+        'code': code_version(),
+        'data': data_fingerprint(df),
+        'rule': tr_num.name if isinstance(tr_num, TradingRule) else repr(tr_num),
+        'point': repr(float(point)),
+        'price_type': price_type,
+        'params': params,
+    }, sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class IndicatorResultCache:
+    """Size-bounded LRU cache of indicator result frames stored as Parquet files."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.parquet"
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Returns the cached frame for a key and marks it as recently used.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            pd.DataFrame or None: Cached result, None on a miss or unreadable file
+        """
+        path = self._path(key)
+        try:
+            df = pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.print_debug(f"Dropping unreadable indicator cache file {path.name}: {e}")
+            try: os.remove(path)
+            except OSError: pass
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """
+        Stores a result frame and evicts least recently used entries over the size limit.
+
+        Args:
+            key (str): Cache key
+            df (pd.DataFrame): Result to store
+
+        Returns:
+            bool: True when the frame was written
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path, index=True)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.print_debug(f"Could not cache indicator result: {e}")
+            try: os.remove(tmp_path)
+            except OSError: pass
+            return False
+        self.evict()
+        return True
+
+    def evict(self):
+        """Deletes least recently used files until the cache fits in max_bytes."""
+        entries = []
+        for path in self.cache_dir.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """Deletes every cached result."""
+        for path in self.cache_dir.glob("*.parquet"):
+            try: os.remove(path)
+            except OSError: pass
+
+
+_DEFAULT_CACHE: Optional[IndicatorResultCache] = None
+
+
+def get_result_cache() -> IndicatorResultCache:
+    """Returns the process-wide cache stored in data/cache/indicator_results."""
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = IndicatorResultCache()
+    return _DEFAULT_CACHE
+
+
+def cached_calculate_pressure_vector(df: pd.DataFrame, point: float,
+                                     tr_num: TradingRule = TradingRule.PV_HighLow,
+                                     price_type: str = 'close',
+                                     cache: Optional[IndicatorResultCache] = None,
+                                     calculate_fn: Optional[Callable[..., pd.DataFrame]] = None,
+                                     **kwargs) -> pd.DataFrame:
+    """
+    calculate_pressure_vector() with results served from the indicator result cache.
+
+    The cache is bypassed inside a resumable_checkpoint() block, where the
+    calculation itself has to run to record the recursion state.
+
+    Args:
+        df (pd.DataFrame): Input OHLCV frame
+        point (float): Instrument point size
+        tr_num (TradingRule): Trading rule
+        price_type (str): Price type
+        cache (IndicatorResultCache, optional): Cache to use (default: get_result_cache())
+        calculate_fn (Callable, optional): Calculation run on a miss (default: calculate_pressure_vector)
+        **kwargs: Parsed indicator parameters
+
+    Returns:
+        pd.DataFrame: Indicator result
+    """
+    calculate_fn = calculate_fn or calculate_pressure_vector
+    if active_checkpoint() is not None:
+        return calculate_fn(df=df, point=point, tr_num=tr_num, price_type=price_type, **kwargs)
+
+    cache = cache or get_result_cache()
+    key = result_cache_key(df, tr_num, point, price_type, **kwargs)
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.print_debug(f"Indicator result for {getattr(tr_num, 'name', tr_num)} loaded from cache")
+            return cached
+
+    result_df = calculate_fn(df=df, point=point, tr_num=tr_num, price_type=price_type, **kwargs)
+    if key is not None and result_df is not None and not result_df.empty:
+        cache.put(key, result_df)
+    return result_df
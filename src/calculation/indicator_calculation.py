@@ -13,8 +13,88 @@ from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 # Import the main calculation function from indicator module
 from .indicator import calculate_pressure_vector
+from .indicator_cache import cached_calculate_pressure_vector
 from .rules import apply_trading_rule
-from src.cli.cli import parse_indicator_parameters
+from .indicator_parameters import parse_rule_parameters
+
+# Map rule aliases (upper-case CLI names) to TradingRule member names
+RULE_ALIASES_MAP = {
+    'PHLD': 'Predict_High_Low_Direction', 
+    'PV': 'Pressure_Vector', 
+    'SR': 'Support_Resistants',
+    'RSI': 'RSI',
+    'RSI_MOM': 'RSI_Momentum',
+    'RSI_DIV': 'RSI_Divergence',
+    'RSI_MOMENTUM': 'RSI_Momentum',
+    'RSI_DIVERGENCE': 'RSI_Divergence',
+    'CCI': 'CCI',
+    'STOCH': 'Stochastic',
+    'EMA': 'EMA',
+    'SMA': 'SMA',
+    'BB': 'Bollinger_Bands',
+    'ATR': 'ATR',
+    'VWAP': 'VWAP',
+    'PIVOT': 'Pivot_Points',
+    # Momentum indicators
+    'MACD': 'MACD',
+    'STOCHOSC': 'StochOscillator',
+    'STOCHOSCILLATOR': 'StochOscillator',
+    # Predictive indicators
+    'HMA': 'HMA',
+    'TSF': 'TSForecast',
+    # Probability indicators
+    'MC': 'MonteCarlo',
+    'MONTE': 'MonteCarlo',
+    'KELLY': 'Kelly',
+    # Sentiment indicators
+    'FG': 'FearGreed',
+    'feargreed': 'FearGreed',
+    'fg': 'FearGreed',
+    'FEARGREED': 'FearGreed',
+    'COT': 'COT',
+    'PCR': 'PutCallRatio',
+    'PUTCALLRATIO': 'PutCallRatio',
+    'putcallratio': 'PutCallRatio',
+    'cot': 'COT',
+    # Support/Resistance indicators
+    'DONCHAIN': 'Donchain',
+    'FIBO': 'FiboRetr',
+    # Volume indicators
+    'OBV': 'OBV',
+    # Volatility indicators
+    'STDEV': 'StDev',
+    # Trend indicators
+    'ADX': 'ADX',
+    'SAR': 'SAR',
+    'SUPERTREND': 'SuperTrend',
+    'WAVE': 'Wave'
+}
+
+# Volume-based indicators need the real Volume column, the other rules use TickVolume
+VOLUME_BASED_RULES = (TradingRule.OBV, TradingRule.VWAP, TradingRule.COT, TradingRule.PutCallRatio)
+
+
+def calculation_volume_column(columns, rule: TradingRule) -> str:
+    """
+    Returns the volume column a rule is calculated from.
+
+    Volume-based rules use 'Volume', the other rules 'TickVolume'; either falls
+    back to the other column when the frame has only one of them.
+    """
+    preferred, fallback = ('Volume', 'TickVolume') if rule in VOLUME_BASED_RULES else ('TickVolume', 'Volume')
+    return preferred if preferred in columns else fallback
+
+
+def calculation_input_frame(ohlcv_df: pd.DataFrame, rule: TradingRule) -> pd.DataFrame:
+    """
+    Returns a copy of ohlcv_df with only the rule's volume column, named 'Volume'
+    for volume-based rules and 'TickVolume' for the other rules.
+    """
+    volume_col = calculation_volume_column(ohlcv_df.columns, rule)
+    other_cols = [col for col in ('Volume', 'TickVolume') if col != volume_col and col in ohlcv_df.columns]
+    target = 'Volume' if rule in VOLUME_BASED_RULES else 'TickVolume'
+    return ohlcv_df.drop(columns=other_cols).rename(columns={volume_col: target})
+
 
 # Definition of the calculate_indicator function
 def calculate_indicator(args, ohlcv_df: pd.DataFrame, point_size: float):
@@ -40,7 +120,7 @@ def calculate_indicator(args, ohlcv_df: pd.DataFrame, point_size: float):
     
     if ':' in rule_input_str:
         try:
-            indicator_name, indicator_params = parse_indicator_parameters(rule_input_str)
+            indicator_name, indicator_params = parse_rule_parameters(rule_input_str)
             # Update the rule name to the parsed indicator name (always in uppercase)
             rule_input_str = indicator_name.upper()
         except Exception as e:
@@ -56,57 +136,7 @@ def calculate_indicator(args, ohlcv_df: pd.DataFrame, point_size: float):
     setattr(args, 'original_rule_with_params', original_rule_with_params)
     
     # Map rule aliases to full names
-    rule_aliases_map = {
-        'PHLD': 'Predict_High_Low_Direction', 
-        'PV': 'Pressure_Vector', 
-        'SR': 'Support_Resistants',
-        'RSI': 'RSI',
-        'RSI_MOM': 'RSI_Momentum',
-        'RSI_DIV': 'RSI_Divergence',
-        'RSI_MOMENTUM': 'RSI_Momentum',
-        'RSI_DIVERGENCE': 'RSI_Divergence',
-        'CCI': 'CCI',
-        'STOCH': 'Stochastic',
-        'EMA': 'EMA',
-        'SMA': 'SMA',
-        'BB': 'Bollinger_Bands',
-        'ATR': 'ATR',
-        'VWAP': 'VWAP',
-        'PIVOT': 'Pivot_Points',
-        # Momentum indicators
-        'MACD': 'MACD',
-        'STOCHOSC': 'StochOscillator',
-        'STOCHOSCILLATOR': 'StochOscillator',
-        # Predictive indicators
-        'HMA': 'HMA',
-        'TSF': 'TSForecast',
-        # Probability indicators
-        'MC': 'MonteCarlo',
-        'MONTE': 'MonteCarlo',
-        'KELLY': 'Kelly',
-        # Sentiment indicators
-        'FG': 'FearGreed',
-        'feargreed': 'FearGreed',
-        'fg': 'FearGreed',
-        'FEARGREED': 'FearGreed',
-        'COT': 'COT',
-            'PCR': 'PutCallRatio',
-    'PUTCALLRATIO': 'PutCallRatio',
-    'putcallratio': 'PutCallRatio',
-    'cot': 'COT',
-        # Support/Resistance indicators
-        'DONCHAIN': 'Donchain',
-        'FIBO': 'FiboRetr',
-        # Volume indicators
-        'OBV': 'OBV',
-        # Volatility indicators
-        'STDEV': 'StDev',
-        # Trend indicators
-        'ADX': 'ADX',
-        'SAR': 'SAR',
-        'SUPERTREND': 'SuperTrend',
-        'WAVE': 'Wave'
-    }
+    rule_aliases_map = RULE_ALIASES_MAP
     rule_name_str = rule_aliases_map.get(rule_input_str.upper(), rule_input_str)
     try:
         selected_rule = TradingRule[rule_name_str]
@@ -122,14 +152,8 @@ def calculate_indicator(args, ohlcv_df: pd.DataFrame, point_size: float):
     if not all(col in ohlcv_df.columns for col in required_cols_indicator):
         raise ValueError(f"DataFrame missing required columns for calculation: {required_cols_indicator}. Has: {ohlcv_df.columns.tolist()}")
 
-    # Create a copy for calculation that preserves the Volume column for volume-based indicators
-    ohlcv_df_calc_input = ohlcv_df.copy()
-    
-    # Only rename Volume to TickVolume for non-volume-based indicators
-    # Volume-based indicators (OBV, VWAP, COT, PutCallRatio, etc.) need the Volume column
-    volume_based_indicators = ['OBV', 'VWAP', 'COT', 'PUTCALLRATIO', 'PCR']
-    if rule_input_str.upper() not in volume_based_indicators:
-        ohlcv_df_calc_input = ohlcv_df.rename(columns={'Volume': 'TickVolume'}, errors='ignore')
+    # Create a copy for calculation with the one volume column the rule is calculated from
+    ohlcv_df_calc_input = calculation_input_frame(ohlcv_df, selected_rule)
 
     # Store original MQL5 results before calculation if mode is csv
     pressure_mql5 = None
@@ -150,6 +174,14 @@ def calculate_indicator(args, ohlcv_df: pd.DataFrame, point_size: float):
 
     # --- Calculation Call ---
     result_df = None  # Initialize result_df
+    # CLI runs (whose parser defines --no-indicator-cache) reuse results of earlier runs on
+    # unchanged data from the indicator result cache; other callers always recalculate
+    use_cache = hasattr(args, 'no_indicator_cache') and args.no_indicator_cache is False
+
+    def calculate_fn(**calc_kwargs):
+        if use_cache:
+            return cached_calculate_pressure_vector(calculate_fn=calculate_pressure_vector, **calc_kwargs)
+        return calculate_pressure_vector(**calc_kwargs)
     try:
         # Special handling for OHLCV rule - don't calculate indicators, just return raw data
         if selected_rule == TradingRule.OHLCV:
@@ -160,8 +192,8 @@ def calculate_indicator(args, ohlcv_df: pd.DataFrame, point_size: float):
         
         # Special handling for AUTO rule - calculate indicators but return all columns for display
         if selected_rule == TradingRule.AUTO:
-            result_df = calculate_pressure_vector(
-                df=ohlcv_df_calc_input.copy(),
+            result_df = calculate_fn(
+                df=ohlcv_df_calc_input,
                 point=point_size,
                 tr_num=selected_rule,
                 price_type=getattr(args, 'price_type', 'close'),
@@ -186,8 +218,8 @@ def calculate_indicator(args, ohlcv_df: pd.DataFrame, point_size: float):
         for param_name, param_value in indicator_params.items():
             setattr(modified_args, param_name, param_value)
 
-        result_df = calculate_pressure_vector(
-            df=ohlcv_df_calc_input.copy(),
+        result_df = calculate_fn(
+            df=ohlcv_df_calc_input,
             point=point_size,
             tr_num=selected_rule,
             **indicator_params
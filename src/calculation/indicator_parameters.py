@@ -0,0 +1,712 @@
+# -*- coding: utf-8 -*-
+# src/calculation/indicator_parameters.py
+
+"""
+Parsers for parameterized indicator rules ('rsi:14,30,70,close', ...).
+
+Shared by the CLI and the calculation modules (batch calculation, parameter
+sweep, walk-forward analysis). Invalid rules raise ValueError; the CLI wraps
+parse_rule_parameters to show the indicator's help and exit instead.
+All comments are in English.
+"""
+
+from src.calculation.indicators.trend.wave_ind import ENUM_MOM_TR, ENUM_GLOBAL_TR
+
+
+def parse_rsi_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse RSI parameters: period,oversold,overbought,price_type"""
+    params = params_str.split(',')
+    if len(params) != 4:
+        raise ValueError(f"RSI requires exactly 4 parameters: period,oversold,overbought,price_type. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values like 14.0
+        oversold = float(params[1].strip())
+        overbought = float(params[2].strip())
+        price_type = params[3].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid RSI parameters: {params_str}. Error: {e}")
+    
+    # Validate period
+    if period <= 0:
+        raise ValueError(f"RSI period must be a positive integer, got: {period}")
+    
+    # Validate thresholds
+    if oversold < 0 or oversold > 100:
+        raise ValueError(f"RSI oversold must be between 0 and 100, got: {oversold}")
+    
+    if overbought < 0 or overbought > 100:
+        raise ValueError(f"RSI overbought must be between 0 and 100, got: {overbought}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"RSI price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'rsi', {
+        'rsi_period': period,
+        'oversold': oversold,
+        'overbought': overbought,
+        'price_type': price_type
+    }
+
+
+def parse_rsi_momentum_parameters(params_str: str) -> tuple[str, dict]:
+    # Exactly the same parameters as RSI, but different name
+    name, params = parse_rsi_parameters(params_str)
+    return 'rsi_mom', params
+
+
+def parse_rsi_divergence_parameters(params_str: str) -> tuple[str, dict]:
+    # Exactly the same parameters as RSI, but different name
+    name, params = parse_rsi_parameters(params_str)
+    return 'rsi_div', params
+
+
+def parse_macd_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse MACD parameters: fast_period,slow_period,signal_period,price_type"""
+    params = params_str.split(',')
+    if len(params) != 4:
+        raise ValueError(f"MACD requires exactly 4 parameters: fast_period,slow_period,signal_period,price_type. Got: {params_str}")
+    
+    try:
+        fast_period = int(float(params[0].strip()))  # Handle float values
+        slow_period = int(float(params[1].strip()))
+        signal_period = int(float(params[2].strip()))
+        price_type = params[3].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid MACD parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"MACD price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'macd', {
+        'macd_fast': fast_period,
+        'macd_slow': slow_period,
+        'macd_signal': signal_period,
+        'price_type': price_type
+    }
+
+
+def parse_stoch_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Stochastic parameters: k_period,d_period,price_type"""
+    params = params_str.split(',')
+    if len(params) != 3:
+        raise ValueError(f"Stochastic requires exactly 3 parameters: k_period,d_period,price_type. Got: {params_str}")
+    
+    try:
+        k_period = int(float(params[0].strip()))  # Handle float values
+        d_period = int(float(params[1].strip()))
+        price_type = params[2].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid Stochastic parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"Stochastic price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'stoch', {
+        'stoch_k_period': k_period,
+        'stoch_d_period': d_period,
+        'price_type': price_type
+    }
+
+
+def parse_ema_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse EMA parameters: period,price_type"""
+    params = params_str.split(',')
+    if len(params) != 2:
+        raise ValueError(f"EMA requires exactly 2 parameters: period,price_type. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        price_type = params[1].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid EMA parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"EMA price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'ema', {
+        'ema_period': period,
+        'price_type': price_type
+    }
+
+
+def parse_sma_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse SMA parameters: period,price_type"""
+    params = params_str.split(',')
+    if len(params) != 2:
+        raise ValueError(f"SMA requires exactly 2 parameters: period,price_type. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        price_type = params[1].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid SMA parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"SMA price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'sma', {
+        'sma_period': period,
+        'price_type': price_type
+    }
+
+def parse_wave_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Wave parameters: long1,fast1,trend1,tr1,long2,fast2,trend2,tr2,global_tr,sma_period,price_type"""
+    params = params_str.split(',')
+    if len(params) != 11:
+        raise ValueError(f"Wave requires exactly 11 parameters: long1,fast1,trend1,tr1,long2,fast2,trend2,tr2,global_tr,sma_period,price_type. Got: {params_str}")
+
+    try:
+        long1 = int(float(params[0].strip())) # Handle float values like 14.0
+        fast1 = int(float(params[1].strip()))
+        trend1 = int(float(params[2].strip()))
+        tr1_str = params[3].strip().upper()
+        if tr1_str == 'FAST':
+            tr1 = ENUM_MOM_TR.TR_Fast
+        elif tr1_str == 'ZONE':
+            tr1 = ENUM_MOM_TR.TR_Zone
+        elif tr1_str == 'STRONGTREND':
+            tr1 = ENUM_MOM_TR.TR_StrongTrend
+        elif tr1_str == 'WEAKTREND':
+            tr1 = ENUM_MOM_TR.TR_WeakTrend
+        elif tr1_str == 'FASTZONEREVERSE':
+            tr1 = ENUM_MOM_TR.TR_FastZoneReverse
+        elif tr1_str == 'BETTERTREND':
+            tr1 = ENUM_MOM_TR.TR_BetterTrend
+        elif tr1_str == 'BETTERFAST':
+            tr1 = ENUM_MOM_TR.TR_BetterFast
+        elif tr1_str == 'ROST':
+            tr1 = ENUM_MOM_TR.TR_Rost
+        elif tr1_str == 'TRENDROST':
+            tr1 = ENUM_MOM_TR.TR_TrendRost
+        elif tr1_str == 'BETTERTRENDROST':
+            tr1 = ENUM_MOM_TR.TR_BetterTrendRost
+        else:
+            raise ValueError(f"Invalid tr1 value: {tr1_str}")
+        
+        long2 = int(float(params[4].strip()))
+        fast2 = int(float(params[5].strip()))
+        trend2 = int(float(params[6].strip()))
+        
+        tr2_str = params[7].strip().upper()
+        if tr2_str == 'FAST':
+            tr2 = ENUM_MOM_TR.TR_Fast
+        elif tr2_str == 'ZONE':
+            tr2 = ENUM_MOM_TR.TR_Zone
+        elif tr2_str == 'STRONGTREND':
+            tr2 = ENUM_MOM_TR.TR_StrongTrend
+        elif tr2_str == 'WEAKTREND':
+            tr2 = ENUM_MOM_TR.TR_WeakTrend
+        elif tr2_str == 'FASTZONEREVERSE':
+            tr2 = ENUM_MOM_TR.TR_FastZoneReverse
+        elif tr2_str == 'BETTERTREND':
+            tr2 = ENUM_MOM_TR.TR_BetterTrend
+        elif tr2_str == 'BETTERFAST':
+            tr2 = ENUM_MOM_TR.TR_BetterFast
+        elif tr2_str == 'ROST':
+            tr2 = ENUM_MOM_TR.TR_Rost
+        elif tr2_str == 'TRENDROST':
+            tr2 = ENUM_MOM_TR.TR_TrendRost
+        elif tr2_str == 'BETTERTRENDROST':
+            tr2 = ENUM_MOM_TR.TR_BetterTrendRost
+        else:
+            raise ValueError(f"Invalid tr2 value: {tr2_str}")
+        
+        global_tr_str = params[8].strip().upper()
+        if global_tr_str == 'PRIME':
+            global_tr = ENUM_GLOBAL_TR.G_TR_PRIME
+        elif global_tr_str == 'REVERSE':
+            global_tr = ENUM_GLOBAL_TR.G_TR_REVERSE
+        elif global_tr_str == 'PRIMEZONE':
+            global_tr = ENUM_GLOBAL_TR.G_TR_PRIME_ZONE
+        elif global_tr_str == 'REVERSEZONE':
+            global_tr = ENUM_GLOBAL_TR.G_TR_REVERSE_ZONE
+        elif global_tr_str == 'NEWZONE':
+            global_tr = ENUM_GLOBAL_TR.G_TR_NEW_ZONE
+        elif global_tr_str == 'LONGZONE':
+            global_tr = ENUM_GLOBAL_TR.G_TR_LONG_ZONE
+        elif global_tr_str == 'LONGZONEREVERSE':
+            global_tr = ENUM_GLOBAL_TR.G_TR_LONG_ZONE_REVERSE
+        else:
+            raise ValueError(f"Invalid global_tr value: {global_tr_str}")
+        sma_period = int(float(params[9].strip()))
+        price_type = params[10].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid Wave parameters: {params_str}. Error: {e}")
+
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"Wave price_type must be 'open' or 'close', got: {price_type}")
+
+    return 'wave', {
+        'long1': long1,
+        'fast1': fast1,
+        'trend1': trend1,
+        'tr1': tr1,
+        'long2': long2,
+        'fast2': fast2,
+        'trend2': trend2,
+        'tr2': tr2,
+        'global_tr': global_tr,
+        'sma_period': sma_period,
+        'price_type': price_type
+    }
+
+
+def parse_bb_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Bollinger Bands parameters: period,std_dev,price_type"""
+    params = params_str.split(',')
+    if len(params) != 3:
+        raise ValueError(f"Bollinger Bands requires exactly 3 parameters: period,std_dev,price_type. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        std_dev = float(params[1].strip())
+        price_type = params[2].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid Bollinger Bands parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"Bollinger Bands price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'bb', {
+        'bb_period': period,
+        'bb_std_dev': std_dev,
+        'price_type': price_type
+    }
+
+
+def parse_atr_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse ATR parameters: period"""
+    params = params_str.split(',')
+    if len(params) != 1:
+        raise ValueError(f"ATR requires exactly 1 parameter: period. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid ATR parameters: {params_str}. Error: {e}")
+    
+    return 'atr', {
+        'atr_period': period
+    }
+
+
+def parse_cci_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse CCI parameters: period,price_type"""
+    params = params_str.split(',')
+    if len(params) != 2:
+        raise ValueError(f"CCI requires exactly 2 parameters: period,price_type. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        price_type = params[1].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid CCI parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"CCI price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'cci', {
+        'cci_period': period,
+        'price_type': price_type
+    }
+
+
+def parse_vwap_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse VWAP parameters: price_type"""
+    params = params_str.split(',')
+    if len(params) != 1:
+        raise ValueError(f"VWAP requires exactly 1 parameter: price_type. Got: {params_str}")
+    
+    try:
+        price_type = params[0].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid VWAP parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"VWAP price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'vwap', {
+        'price_type': price_type
+    }
+
+
+def parse_pivot_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Pivot Points parameters: price_type"""
+    params = params_str.split(',')
+    if len(params) != 1:
+        raise ValueError(f"Pivot Points requires exactly 1 parameter: price_type. Got: {params_str}")
+    
+    try:
+        price_type = params[0].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid Pivot Points parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"Pivot Points price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'pivot', {
+        'price_type': price_type
+    }
+
+
+def parse_hma_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse HMA parameters: period,price_type"""
+    params = params_str.split(',')
+    if len(params) != 2:
+        raise ValueError(f"HMA requires exactly 2 parameters: period,price_type. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        price_type = params[1].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid HMA parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"HMA price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'hma', {
+        'hma_period': period,
+        'price_type': price_type
+    }
+
+
+def parse_tsf_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse TSF parameters: period,price_type"""
+    params = params_str.split(',')
+    if len(params) != 2:
+        raise ValueError(f"TSF requires exactly 2 parameters: period,price_type. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        price_type = params[1].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid TSF parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"TSF price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'tsf', {
+        'tsforecast_period': period,
+        'price_type': price_type
+    }
+
+
+def parse_monte_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Monte Carlo parameters: simulations,period"""
+    params = params_str.split(',')
+    if len(params) != 2:
+        raise ValueError(f"Monte Carlo requires exactly 2 parameters: simulations,period. Got: {params_str}")
+    
+    try:
+        simulations = int(float(params[0].strip()))  # Handle float values
+        period = int(float(params[1].strip()))
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid Monte Carlo parameters: {params_str}. Error: {e}")
+    
+    return 'monte', {
+        'simulations': simulations,
+        'period': period
+    }
+
+
+def parse_kelly_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Kelly Criterion parameters: period"""
+    params = params_str.split(',')
+    if len(params) != 1:
+        raise ValueError(f"Kelly Criterion requires exactly 1 parameter: period. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid Kelly Criterion parameters: {params_str}. Error: {e}")
+    
+    return 'kelly', {
+        'kelly_period': period
+    }
+
+
+def parse_donchain_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Donchian Channels parameters: period"""
+    params = params_str.split(',')
+    if len(params) != 1:
+        raise ValueError(f"Donchian Channels requires exactly 1 parameter: period. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid Donchian Channels parameters: {params_str}. Error: {e}")
+    
+    return 'donchain', {
+        'donchain_period': period
+    }
+
+
+def parse_fibo_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Fibonacci Retracements parameters: levels or 'all'"""
+    params = params_str.split(',')
+    if len(params) < 1:
+        raise ValueError(f"Fibonacci Retracements requires at least 1 parameter: levels or 'all'. Got: {params_str}")
+    
+    # Check if first parameter is 'all'
+    if params[0].strip().lower() == 'all':
+        # Use all standard Fibonacci levels
+        levels = [0.236, 0.382, 0.5, 0.618, 0.786]
+    else:
+        # Parse custom Fibonacci levels
+        try:
+            levels = [float(p.strip()) for p in params]
+        except (ValueError, IndexError) as e:
+            raise ValueError(f"Invalid Fibonacci Retracements parameters: {params_str}. Error: {e}")
+    
+    return 'fibo', {
+        'fib_levels': levels
+    }
+
+
+def parse_obv_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse OBV parameters: none required"""
+    # Allow empty parameters after colon (e.g., "obv:")
+    if params_str.strip():
+        raise ValueError(f"OBV does not require parameters. Got: {params_str}")
+    
+    return 'obv', {}
+
+
+def parse_stdev_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Standard Deviation parameters: period,price_type"""
+    # Handle empty string case
+    if not params_str.strip():
+        raise ValueError("Standard Deviation requires exactly 2 parameters: period,price_type.")
+    
+    params = params_str.split(',')
+    if len(params) != 2:
+        raise ValueError(f"Standard Deviation requires exactly 2 parameters: period,price_type. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        price_type = params[1].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid Standard Deviation parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"Standard Deviation price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'stdev', {
+        'stdev_period': period,
+        'price_type': price_type
+    }
+
+
+def parse_adx_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse ADX parameters: period"""
+    params = params_str.split(',')
+    if len(params) != 1:
+        raise ValueError(f"ADX requires exactly 1 parameter: period. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid ADX parameters: {params_str}. Error: {e}")
+    
+    return 'adx', {
+        'adx_period': period
+    }
+
+
+def parse_sar_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse SAR parameters: acceleration,maximum"""
+    params = params_str.split(',')
+    if len(params) != 2:
+        raise ValueError(f"SAR requires exactly 2 parameters: acceleration,maximum. Got: {params_str}")
+    
+    try:
+        acceleration = float(params[0].strip())
+        maximum = float(params[1].strip())
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid SAR parameters: {params_str}. Error: {e}")
+    
+    return 'sar', {
+        'sar_acceleration': acceleration,
+        'sar_maximum': maximum
+    }
+
+
+def parse_supertrend_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse SuperTrend parameters: period,multiplier[,price_type]"""
+    # Handle empty string case
+    if not params_str.strip():
+        raise ValueError("SuperTrend requires exactly 2-3 parameters: period,multiplier[,price_type].")
+    params = params_str.split(',')
+    if len(params) < 2 or len(params) > 3:
+        raise ValueError(f"SuperTrend requires exactly 2-3 parameters: period,multiplier[,price_type]. Got: {params_str}")
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        multiplier = float(params[1].strip())
+        price_type = params[2].strip().lower() if len(params) > 2 else 'close'
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid SuperTrend parameters: {params_str}. Error: {e}")
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"SuperTrend price_type must be 'open' or 'close', got: {price_type}")
+    return 'supertrend', {
+        'supertrend_period': period,
+        'multiplier': multiplier,
+        'price_type': price_type
+    }
+
+
+def parse_putcallratio_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Put/Call Ratio parameters: period,price_type[,bullish_threshold,bearish_threshold]"""
+    params = params_str.split(',')
+    if len(params) < 2 or len(params) > 4:
+        raise ValueError(f"Put/Call Ratio requires 2-4 parameters: period,price_type[,bullish_threshold,bearish_threshold]. Got: {params_str}")
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        price_type = params[1].strip().lower()
+        bullish_threshold = float(params[2].strip()) if len(params) > 2 else 60.0
+        bearish_threshold = float(params[3].strip()) if len(params) > 3 else 40.0
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid Put/Call Ratio parameters: {params_str}. Error: {e}")
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"Put/Call Ratio price_type must be 'open' or 'close', got: {price_type}")
+    return 'putcallratio', {
+        'putcall_period': period,
+        'price_type': price_type,
+        'bullish_threshold': bullish_threshold,
+        'bearish_threshold': bearish_threshold
+    }
+
+
+def parse_cot_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse COT parameters: period,price_type"""
+    params = params_str.split(',')
+    if len(params) != 2:
+        raise ValueError(f"COT requires exactly 2 parameters: period,price_type. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        price_type = params[1].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid COT parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"COT price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'cot', {
+        'cot_period': period,
+        'price_type': price_type
+    }
+
+
+def parse_feargreed_parameters(params_str: str) -> tuple[str, dict]:
+    """Parse Fear & Greed parameters: period,price_type"""
+    params = params_str.split(',')
+    if len(params) != 2:
+        raise ValueError(f"Fear & Greed requires exactly 2 parameters: period,price_type. Got: {params_str}")
+    
+    try:
+        period = int(float(params[0].strip()))  # Handle float values
+        price_type = params[1].strip().lower()
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid Fear & Greed parameters: {params_str}. Error: {e}")
+    
+    if price_type not in ['open', 'close']:
+        raise ValueError(f"Fear & Greed price_type must be 'open' or 'close', got: {price_type}")
+    
+    return 'feargreed', {
+        'feargreed_period': period,
+        'price_type': price_type
+    }
+
+
+def parse_rule_parameters(rule_str: str) -> tuple[str, dict]:
+    """
+    Parse indicator rule string in format 'indicator:param1,param2,param3,param4'.
+
+    Args:
+        rule_str (str): Rule string like 'rsi:14,30,70,open' or 'rsi'
+
+    Returns:
+        tuple: (indicator_name, parameters_dict)
+
+    Raises:
+        ValueError: If the rule format, the indicator or its parameters are invalid
+    """
+    if ':' not in rule_str:
+        # No parameters provided, return indicator name and empty dict
+        return rule_str.lower(), {}
+
+    # Split by ':' to separate indicator name from parameters
+    parts = rule_str.split(':', 1)
+    if len(parts) != 2:
+        raise ValueError(f"Invalid rule format: {rule_str}")
+    
+    indicator_name = parts[0].lower().strip()
+    params_str = parts[1].strip()
+    
+    # Parse parameters based on indicator type
+    if indicator_name in ['stoch', 'stochastic', 'stochoscillator']:
+        # Always parse as stoch and return 'stoch' as indicator name
+        _, params = parse_stoch_parameters(params_str)
+        return 'stoch', params
+    elif indicator_name in ['monte', 'montecarlo', 'mc']:
+        # Always parse as monte and return 'monte' as indicator name
+        _, params = parse_monte_parameters(params_str)
+        return 'monte', params
+    elif indicator_name in ['feargreed', 'fg']:
+        # Always parse as feargreed and return 'feargreed' as indicator name
+        _, params = parse_feargreed_parameters(params_str)
+        return 'feargreed', params
+    elif indicator_name in ['tsf', 'tsforecast']:
+        # Always parse as tsf and return 'tsf' as indicator name
+        _, params = parse_tsf_parameters(params_str)
+        return 'tsf', params
+    elif indicator_name == 'rsi':
+        return parse_rsi_parameters(params_str)
+    elif indicator_name == 'rsi_mom':
+        return parse_rsi_momentum_parameters(params_str)
+    elif indicator_name == 'rsi_div':
+        return parse_rsi_divergence_parameters(params_str)
+    elif indicator_name == 'macd':
+        return parse_macd_parameters(params_str)
+    elif indicator_name == 'ema':
+        return parse_ema_parameters(params_str)
+    elif indicator_name == 'sma':
+        return parse_sma_parameters(params_str)
+    elif indicator_name == 'bb':
+        return parse_bb_parameters(params_str)
+    elif indicator_name == 'atr':
+        return parse_atr_parameters(params_str)
+    elif indicator_name == 'cci':
+        return parse_cci_parameters(params_str)
+    elif indicator_name == 'vwap':
+        return parse_vwap_parameters(params_str)
+    elif indicator_name == 'pivot':
+        return parse_pivot_parameters(params_str)
+    elif indicator_name == 'hma':
+        return parse_hma_parameters(params_str)
+    elif indicator_name == 'kelly':
+        return parse_kelly_parameters(params_str)
+    elif indicator_name == 'donchain':
+        return parse_donchain_parameters(params_str)
+    elif indicator_name == 'fibo':
+        return parse_fibo_parameters(params_str)
+    elif indicator_name == 'obv':
+        return parse_obv_parameters(params_str)
+    elif indicator_name == 'stdev':
+        return parse_stdev_parameters(params_str)
+    elif indicator_name == 'adx':
+        return parse_adx_parameters(params_str)
+    elif indicator_name == 'sar':
+        return parse_sar_parameters(params_str)
+    elif indicator_name == 'supertrend':
+        return parse_supertrend_parameters(params_str)
+    elif indicator_name == 'putcallratio':
+        return parse_putcallratio_parameters(params_str)
+    elif indicator_name == 'cot':
+        return parse_cot_parameters(params_str)
+    elif indicator_name == 'wave':
+        return parse_wave_parameters(params_str)
+    else:
+        # Unknown indicator
+        raise ValueError(f"Unknown indicator: {indicator_name}")
@@ -20,6 +20,7 @@ import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 from ..base_indicator import BaseIndicator, PriceType
+from ..shared_intermediates import ewm_mean
 
 
 def calculate_macd(price_series: pd.Series, fast_period: int = 12, slow_period: int = 26, 
@@ -44,8 +45,8 @@ def calculate_macd(price_series: pd.Series, fast_period: int = 12, slow_period:
         return pd.Series(index=price_series.index, dtype=float), pd.Series(index=price_series.index, dtype=float), pd.Series(index=price_series.index, dtype=float)
     
     # Calculate fast and slow EMAs
-    fast_ema = price_series.ewm(span=fast_period, adjust=False).mean()
-    slow_ema = price_series.ewm(span=slow_period, adjust=False).mean()
+    fast_ema = ewm_mean(price_series, fast_period)
+    slow_ema = ewm_mean(price_series, slow_period)
     
     # Calculate MACD line
     macd_line = fast_ema - slow_ema
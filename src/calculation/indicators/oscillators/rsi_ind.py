@@ -21,6 +21,7 @@ import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 from enum import Enum
+from ..shared_intermediates import ewm_mean
 
 
 class PriceType(Enum):
@@ -55,8 +56,8 @@ def calculate_rsi(price_series: pd.Series, period: int = 14) -> pd.Series:
     losses = -delta.where(delta < 0, 0)
     
     # Calculate average gains and losses using exponential moving average
-    avg_gains = gains.ewm(span=period, adjust=False).mean()
-    avg_losses = losses.ewm(span=period, adjust=False).mean()
+    avg_gains = ewm_mean(gains, period)
+    avg_losses = ewm_mean(losses, period)
     
     # Calculate RS and RSI
     rs = avg_gains / avg_losses
@@ -38,6 +38,8 @@ import pandas as pd
 import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
+from ..shared_intermediates import ewm_mean, memoized, price_delta
+from ..resumable_state import active_checkpoint
 from enum import Enum
 
 
@@ -65,22 +67,27 @@ def calculate_rsi(price_series: pd.Series, period: int = 14) -> pd.Series:
         logger.print_warning(f"Not enough data for RSI calculation. Need at least {period + 1} points, got {len(price_series)}")
         return pd.Series(index=price_series.index, dtype=float)
     
-    # Calculate price changes
-    delta = price_series.diff()
-    
-    # Separate gains and losses
-    gains = delta.where(delta > 0, 0)
-    losses = -delta.where(delta < 0, 0)
-    
-    # Calculate average gains and losses using exponential moving average
-    avg_gains = gains.ewm(span=period, adjust=False).mean()
-    avg_losses = losses.ewm(span=period, adjust=False).mean()
-    
-    # Calculate RS and RSI
-    rs = avg_gains / avg_losses
-    rsi = 100 - (100 / (1 + rs))
-    
-    return rsi
+    def _compute() -> pd.Series:
+        # Calculate price changes (shared by all RSI periods on the same prices)
+        delta = price_delta(price_series)
+        
+        # Separate gains and losses
+        gains = delta.where(delta > 0, 0)
+        losses = -delta.where(delta < 0, 0)
+        
+        # Calculate average gains and losses using exponential moving average
+        avg_gains = ewm_mean(gains, period)
+        avg_losses = ewm_mean(losses, period)
+        
+        # Calculate RS and RSI
+        rs = avg_gains / avg_losses
+        return 100 - (100 / (1 + rs))
+    
+    if active_checkpoint() is not None:
+        # Incremental recalculation records the EMA state, so always compute
+        return _compute()
+    # Reused by RSI variants that only differ in thresholds (batch and sweep runs)
+    return memoized('rsi', (price_series,), (period,), _compute)
 
 
 def calculate_rsi_signals(rsi_values: pd.Series, overbought: float = 70, oversold: float = 30) -> pd.Series:
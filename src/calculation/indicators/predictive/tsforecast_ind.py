@@ -20,6 +20,7 @@ import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 from ..base_indicator import BaseIndicator, PriceType
+from ..rolling_engine import rolling_linreg_forecast
 
 
 def calculate_tsforecast(price_series: pd.Series, period: int = 14) -> pd.Series:
@@ -42,22 +43,9 @@ def calculate_tsforecast(price_series: pd.Series, period: int = 14) -> pd.Series
     
     forecast_values = pd.Series(index=price_series.index, dtype=float)
     
-    for i in range(period, len(price_series)):
-        # Get the window of data
-        window = price_series.iloc[i-period:i]
-        
-        # Create time index for regression
-        x = np.arange(len(window))
-        y = window.values
-        
-        # Simple linear regression
-        if len(y) > 1:
-            slope, intercept = np.polyfit(x, y, 1)
-            # Forecast next value
-            forecast = slope * len(window) + intercept
-            forecast_values.iloc[i] = forecast
-        else:
-            forecast_values.iloc[i] = y[0] if len(y) == 1 else np.nan
+    # Regress every window price[i-period:i] at once and forecast bar i
+    values = price_series.to_numpy(dtype=float)
+    forecast_values.iloc[period:] = rolling_linreg_forecast(values[:-1], period)
     
     return forecast_values
 
@@ -20,6 +20,8 @@ import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 from ..base_indicator import BaseIndicator, PriceType
+from ..rolling_engine import rolling_win_loss_stats
+from ..shared_intermediates import pct_returns
 
 
 def calculate_kelly(price_series: pd.Series, period: int = 20) -> pd.Series:
@@ -41,7 +43,7 @@ def calculate_kelly(price_series: pd.Series, period: int = 20) -> pd.Series:
         return pd.Series(index=price_series.index, dtype=float)
     
     # Calculate price changes
-    price_changes = price_series.pct_change(fill_method=None).dropna()
+    price_changes = pct_returns(price_series).dropna()
     
     if len(price_changes) < period:
         logger.print_warning("Not enough price change data for Kelly calculation")
@@ -49,38 +51,31 @@ def calculate_kelly(price_series: pd.Series, period: int = 20) -> pd.Series:
     
     kelly_values = pd.Series(index=price_series.index, dtype=float)
     
-    for i in range(period, len(price_changes)):
-        # Get window of price changes
-        window = price_changes.iloc[i-period:i]
-        
-        # Calculate wins and losses
-        wins = window[window > 0]
-        losses = window[window < 0]
-        
-        if len(wins) == 0 or len(losses) == 0:
-            kelly_values.iloc[i] = 0.0
-            continue
-        
-        # Calculate win probability
-        win_prob = len(wins) / len(window)
-        
-        # Calculate average win and loss
-        avg_win = wins.mean()
-        avg_loss = abs(losses.mean())
+    # Win/loss statistics for every window price_changes[i-period:i] at once
+    changes = price_changes.to_numpy(dtype=float)
+    win_count, win_sum, loss_count, loss_sum = rolling_win_loss_stats(changes[:-1], period)
+    if len(win_count) == 0:
+        return kelly_values
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Win probability and average win / loss
+        win_prob = win_count / period
+        avg_win = win_sum / win_count
+        avg_loss = np.abs(loss_sum / loss_count)
         
         # Kelly formula: f = (bp - q) / b
         # where: b = odds received, p = probability of win, q = probability of loss
-        if avg_loss > 0:
-            b = avg_win / avg_loss  # odds received
-            p = win_prob
-            q = 1 - p
-            
-            kelly_fraction = (b * p - q) / b
-            # Cap Kelly fraction to reasonable range (0 to 0.25)
-            kelly_fraction = max(0, min(0.25, kelly_fraction))
-            kelly_values.iloc[i] = kelly_fraction
-        else:
-            kelly_values.iloc[i] = 0.0
+        b = avg_win / avg_loss
+        kelly_fraction = (b * win_prob - (1 - win_prob)) / b
+    
+    # Cap Kelly fraction to reasonable range (0 to 0.25)
+    kelly_fraction = np.clip(kelly_fraction, 0.0, 0.25)
+    
+    # No wins or no losses in the window means no edge
+    no_edge = (win_count == 0) | (loss_count == 0) | ~(avg_loss > 0)
+    kelly_fraction[no_edge] = 0.0
+    
+    kelly_values.iloc[period:period + len(kelly_fraction)] = kelly_fraction
     
     return kelly_values
 
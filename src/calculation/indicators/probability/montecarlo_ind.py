@@ -20,9 +20,12 @@ import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 from ..base_indicator import BaseIndicator, PriceType
+from ..rolling_engine import make_rng, simulate_median_growth
+from ..shared_intermediates import pct_returns
 
 
-def calculate_montecarlo(price_series: pd.Series, simulations: int = 1000, period: int = 20) -> pd.Series:
+def calculate_montecarlo(price_series: pd.Series, simulations: int = 1000, period: int = 20,
+                         seed: int = None) -> pd.Series:
     """
     Calculates Monte Carlo simulation results.
     
@@ -30,6 +33,7 @@ def calculate_montecarlo(price_series: pd.Series, simulations: int = 1000, perio
         price_series (pd.Series): Series of prices (Open or Close)
         simulations (int): Number of simulations (default: 1000)
         period (int): Forecast period (default: 20)
+        seed (int, optional): Random seed; None follows the global np.random state
     
     Returns:
         pd.Series: Monte Carlo forecast values
@@ -42,7 +46,7 @@ def calculate_montecarlo(price_series: pd.Series, simulations: int = 1000, perio
         return pd.Series(index=price_series.index, dtype=float)
     
     # Calculate returns
-    returns = price_series.pct_change(fill_method=None).dropna()
+    returns = pct_returns(price_series).dropna()
     
     if len(returns) < 5:
         logger.print_warning("Not enough return data for Monte Carlo simulation")
@@ -55,21 +59,17 @@ def calculate_montecarlo(price_series: pd.Series, simulations: int = 1000, perio
     # Initialize result series
     mc_forecast = pd.Series(index=price_series.index, dtype=float)
     
-    # For each point, run Monte Carlo simulation
-    for i in range(period, len(price_series)):
-        current_price = price_series.iloc[i-1]
-        
-        # Run simulations
-        simulated_prices = []
-        for _ in range(simulations):
-            # Generate random returns
-            random_returns = np.random.normal(mean_return, std_return, period)
-            # Calculate simulated price
-            simulated_price = current_price * np.prod(1 + random_returns)
-            simulated_prices.append(simulated_price)
-        
-        # Use median of simulations as forecast
-        mc_forecast.iloc[i] = np.median(simulated_prices)
+    # For each point, simulate `simulations` paths of `period` returns (drawn in blocks)
+    n_points = len(price_series) - period
+    if n_points <= 0:
+        return mc_forecast
+    current_prices = price_series.to_numpy(dtype=float)[period - 1:-1]
+    median_growth = simulate_median_growth(
+        n_points, simulations, period, mean_return, std_return, rng=make_rng(seed)
+    )
+    
+    # Use median of simulations as forecast
+    mc_forecast.iloc[period:] = current_prices * median_growth
     
     return mc_forecast
 
@@ -159,7 +159,7 @@ def calculate_montecarlo_signals(price_series: pd.Series, mc_forecast: pd.Series
 
 def apply_rule_montecarlo(df: pd.DataFrame, point: float, 
                           simulations: int = 1000, period: int = 20,
-                          price_type: PriceType = PriceType.CLOSE):
+                          price_type: PriceType = PriceType.CLOSE, seed: int = None):
     """
     Applies Monte Carlo rule logic to calculate trading signals and price levels.
     
@@ -169,6 +169,7 @@ def apply_rule_montecarlo(df: pd.DataFrame, point: float,
         simulations (int): Number of simulations
         period (int): Forecast period
         price_type (PriceType): Price type to use for calculation (OPEN or CLOSE)
+        seed (int, optional): Random seed for reproducible simulations
     
     Returns:
         pd.DataFrame: DataFrame with Monte Carlo calculations and signals
@@ -182,7 +183,7 @@ def apply_rule_montecarlo(df: pd.DataFrame, point: float,
         price_name = "Close"
     
     # Calculate Monte Carlo forecast
-    df['MonteCarlo'] = calculate_montecarlo(price_series, simulations, period)
+    df['MonteCarlo'] = calculate_montecarlo(price_series, simulations, period, seed=seed)
     
     # Calculate signal line (EMA of forecast)
     df['MonteCarlo_Signal'] = calculate_montecarlo_signal_line(df['MonteCarlo'], signal_period=9)
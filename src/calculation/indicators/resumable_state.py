@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# src/calculation/indicators/resumable_state.py
+
+"""
+Saved state of recursive indicator computations (EMA-style accumulators,
+SAR and SuperTrend trend state) for incremental recalculation.
+
+Recursive computations run through ``run_resumable()``. Outside of a
+``resumable_checkpoint()`` block they simply compute over the whole series.
+Inside the block each computation reports its state at the checkpoint
+position (``record_from_end`` bars before the end) and, when seeds from a
+previous run are given, starts from the saved state at position ``start``
+instead of bar zero. States are consumed in call order, which is
+deterministic for a given rule, and every seed is checked against the kind
+and parameters of the computation that consumes it.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class ResumeStateMismatch(ValueError):
+    """Saved state does not match the computations of the current run."""
+
+
+class ResumableCheckpoint:
+    """Records and replays recursion states in call order."""
+
+    def __init__(self, start: int = 0, seeds: Optional[List] = None,
+                 record_from_end: Optional[int] = None):
+        self.start = start
+        self.record_from_end = record_from_end
+        self.records: List = []
+        self._seeds = list(seeds) if seeds is not None else None
+        self._next_seed = 0
+
+    @property
+    def resuming(self) -> bool:
+        return self._seeds is not None
+
+    @property
+    def complete(self) -> bool:
+        """True when every saved seed has been consumed."""
+        return self._seeds is None or self._next_seed == len(self._seeds)
+
+    @property
+    def resumable(self) -> bool:
+        """True when every recorded computation produced a usable state."""
+        return all(record[2] is not None for record in self.records)
+
+    def run(self, kind: str, params: Sequence, n: int,
+            compute: Callable[[int, Optional[list], int], tuple]):
+        """
+        Run one recursive computation, resuming and recording its state.
+
+        Args:
+            kind (str): Name of the computation (e.g. 'ewm_mean', 'sar')
+            params (Sequence): JSON-serializable parameters of the computation
+            n (int): Length of the input series
+            compute (Callable): ``compute(start, seed, checkpoint)`` returning
+                ``(result, state_at_checkpoint)``
+
+        Returns:
+            Result of ``compute``
+        """
+        params = list(params)
+        start, seed = 0, None
+        if self._seeds is not None:
+            if self._next_seed >= len(self._seeds):
+                raise ResumeStateMismatch(f"No saved state for '{kind}'")
+            saved_kind, saved_params, seed = self._seeds[self._next_seed]
+            if saved_kind != kind or list(saved_params) != params or seed is None:
+                raise ResumeStateMismatch(f"Saved state '{saved_kind}{saved_params}' cannot resume '{kind}{params}'")
+            self._next_seed += 1
+            start = self.start
+
+        checkpoint = -1
+        if self.record_from_end is not None and n - self.record_from_end >= start:
+            checkpoint = n - self.record_from_end
+        result, state = compute(start, seed, checkpoint)
+        self.records.append([kind, params, state])
+        return result
+
+
+_ACTIVE_CHECKPOINT: ContextVar[Optional[ResumableCheckpoint]] = ContextVar('resumable_checkpoint', default=None)
+
+
+@contextmanager
+def resumable_checkpoint(start: int = 0, seeds: Optional[List] = None,
+                         record_from_end: Optional[int] = None) -> Iterator[ResumableCheckpoint]:
+    """
+    Record (and optionally resume) recursion states for the enclosed calculation.
+
+    Args:
+        start (int): Position of the first bar whose saved state is in ``seeds``
+        seeds (list, optional): ``records`` of a previous run to resume from
+        record_from_end (int, optional): Record states this many bars before the end
+
+    Yields:
+        ResumableCheckpoint: Active checkpoint; ``records`` holds the new states
+    """
+    checkpoint = ResumableCheckpoint(start, seeds, record_from_end)
+    token = _ACTIVE_CHECKPOINT.set(checkpoint)
+    try:
+        yield checkpoint
+    finally:
+        _ACTIVE_CHECKPOINT.reset(token)
+
+
+def active_checkpoint() -> Optional[ResumableCheckpoint]:
+    """Returns the checkpoint of the enclosing resumable_checkpoint() block, if any."""
+    return _ACTIVE_CHECKPOINT.get()
+
+
+def run_resumable(kind: str, params: Sequence, n: int,
+                  compute: Callable[[int, Optional[list], int], tuple]):
+    """
+    Run a recursive computation through the active checkpoint, if any.
+
+    Args:
+        kind (str): Name of the computation
+        params (Sequence): JSON-serializable parameters
+        n (int): Length of the input series
+        compute (Callable): ``compute(start, seed, checkpoint) -> (result, state)``
+
+    Returns:
+        Result of ``compute``
+    """
+    checkpoint = _ACTIVE_CHECKPOINT.get()
+    if checkpoint is None:
+        return compute(0, None, -1)[0]
+    return checkpoint.run(kind, params, n, compute)
+
+
+def resumable_ewm_mean(series: pd.Series, span: int) -> pd.Series:
+    """
+    ``series.ewm(span=span, adjust=False).mean()`` that can resume from a saved value.
+
+    With ``adjust=False`` the EMA only depends on its previous value, so replacing
+    the input at the resume position by the saved EMA reproduces the full-history
+    result exactly. A state recorded on a missing input is not resumable (pandas
+    then carries extra decay weight), which forces a full recalculation.
+
+    Args:
+        series (pd.Series): Input values
+        span (int): EMA span
+
+    Returns:
+        pd.Series: EMA values (NaN before the resume position)
+    """
+    def _compute(start, seed, checkpoint):
+        if seed is None:
+            result = series.ewm(span=span, adjust=False).mean()
+        else:
+            values = series.to_numpy(dtype=np.float64, copy=True)
+            values[start] = seed[0]
+            out = np.full(len(values), np.nan)
+            out[start:] = pd.Series(values[start:]).ewm(span=span, adjust=False).mean().to_numpy()
+            result = pd.Series(out, index=series.index, name=series.name)
+        state = None
+        if checkpoint >= 0:
+            value = float(result.iloc[checkpoint])
+            if not (np.isnan(series.iloc[checkpoint]) and not np.isnan(value)):
+                state = [value]
+        return result, state
+
+    return run_resumable('ewm_mean', [int(span)], len(series), _compute)
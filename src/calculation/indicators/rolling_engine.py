@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# src/calculation/indicators/rolling_engine.py
+
+"""
+Shared rolling-window engine for windowed indicators.
+
+Windows are exposed as strided views (``sliding_window_view``) so no window is
+ever copied, and every window is computed at once with array operations.
+Work is split into fixed-size blocks of windows so peak memory stays bounded
+by ``max_block_bytes`` regardless of series length. Random draws are batched
+per block and come from a seeded ``np.random.Generator``.
+"""
+
+from typing import Callable, Iterator, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Upper bound for temporary arrays created while processing one block
+DEFAULT_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def block_ranges(n_items: int, bytes_per_item: int,
+                 max_block_bytes: int = DEFAULT_BLOCK_BYTES) -> Iterator[Tuple[int, int]]:
+    """
+    Split ``n_items`` into consecutive [start, stop) blocks that fit the memory budget.
+
+    Args:
+        n_items (int): Number of items (windows, bars, simulations) to process
+        bytes_per_item (int): Temporary bytes needed per item
+        max_block_bytes (int): Memory budget per block
+
+    Yields:
+        tuple: (start, stop) indices of each block
+    """
+    block_size = max(1, int(max_block_bytes // max(1, bytes_per_item)))
+    for start in range(0, n_items, block_size):
+        yield start, min(start + block_size, n_items)
+
+
+def make_rng(seed: Optional[int] = None) -> np.random.Generator:
+    """
+    Create the random generator used by the engine.
+
+    Args:
+        seed (int, optional): Explicit seed. When None, the generator is seeded from
+            the legacy global NumPy state, so ``np.random.seed(...)`` still makes
+            results reproducible.
+
+    Returns:
+        np.random.Generator: Seeded generator
+    """
+    if seed is None:
+        seed = int(np.random.randint(0, 2**31 - 1))
+    return np.random.default_rng(seed)
+
+
+def rolling_window_apply(values: np.ndarray, window: int,
+                         func: Callable[[np.ndarray], np.ndarray],
+                         max_block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """
+    Apply a row-wise reduction to every window of ``values``.
+
+    Args:
+        values (np.ndarray): 1D input values
+        window (int): Window length
+        func (Callable): Receives a (rows, window) block of windows and returns one
+            value per row
+        max_block_bytes (int): Memory budget per block
+
+    Returns:
+        np.ndarray: Result for window ``k`` (``values[k:k + window]``) at position ``k``;
+            length is ``len(values) - window + 1`` (empty when there is no full window)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n_windows = len(values) - window + 1
+    if window <= 0 or n_windows <= 0:
+        return np.empty(0, dtype=np.float64)
+
+    windows = sliding_window_view(values, window)
+    result = np.empty(n_windows, dtype=np.float64)
+    # func may build a few temporaries of the block's size
+    for start, stop in block_ranges(n_windows, 4 * window * 8, max_block_bytes):
+        result[start:stop] = func(windows[start:stop])
+    return result
+
+
+def rolling_linreg_forecast(values: np.ndarray, window: int,
+                            max_block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """
+    One-step-ahead least-squares line forecast for every window.
+
+    For window ``y[0..window-1]`` regressed on ``x = 0..window-1`` the forecast is the
+    fitted line evaluated at ``x = window`` (same as ``np.polyfit(x, y, 1)``).
+
+    Args:
+        values (np.ndarray): 1D input values
+        window (int): Regression window length
+        max_block_bytes (int): Memory budget per block
+
+    Returns:
+        np.ndarray: Forecast per window (see rolling_window_apply for alignment)
+    """
+    if window == 1:
+        return rolling_window_apply(values, 1, lambda block: block[:, 0], max_block_bytes)
+
+    x_centered = np.arange(window, dtype=np.float64) - (window - 1) / 2.0
+    sxx = float(np.dot(x_centered, x_centered))
+    # Distance from the mean of x to the forecast point x = window
+    step = window - (window - 1) / 2.0
+
+    def _forecast(block: np.ndarray) -> np.ndarray:
+        mean_y = block.mean(axis=1)
+        slope = (block @ x_centered) / sxx
+        return mean_y + slope * step
+
+    return rolling_window_apply(values, window, _forecast, max_block_bytes)
+
+
+def rolling_win_loss_stats(values: np.ndarray, window: int,
+                           max_block_bytes: int = DEFAULT_BLOCK_BYTES
+                           ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count and sum positive and negative values in every window.
+
+    Args:
+        values (np.ndarray): 1D input values (e.g. returns)
+        window (int): Window length
+        max_block_bytes (int): Memory budget per block
+
+    Returns:
+        tuple: (win_count, win_sum, loss_count, loss_sum) arrays, one value per window
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n_windows = len(values) - window + 1
+    if window <= 0 or n_windows <= 0:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty.copy(), empty.copy(), empty.copy()
+
+    windows = sliding_window_view(values, window)
+    win_count = np.empty(n_windows, dtype=np.float64)
+    win_sum = np.empty(n_windows, dtype=np.float64)
+    loss_count = np.empty(n_windows, dtype=np.float64)
+    loss_sum = np.empty(n_windows, dtype=np.float64)
+    for start, stop in block_ranges(n_windows, 4 * window * 8, max_block_bytes):
+        block = windows[start:stop]
+        wins = block > 0
+        losses = block < 0
+        win_count[start:stop] = wins.sum(axis=1)
+        loss_count[start:stop] = losses.sum(axis=1)
+        win_sum[start:stop] = np.where(wins, block, 0.0).sum(axis=1)
+        loss_sum[start:stop] = np.where(losses, block, 0.0).sum(axis=1)
+    return win_count, win_sum, loss_count, loss_sum
+
+
+def simulate_median_growth(n_points: int, simulations: int, steps: int,
+                           mean: float, std: float,
+                           rng: Optional[np.random.Generator] = None,
+                           max_block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """
+    Median compounded growth factor of normally distributed return paths.
+
+    For each of ``n_points`` independent experiments, ``simulations`` paths of
+    ``steps`` returns ~ N(mean, std) are drawn and the median of ``prod(1 + r)``
+    is returned. Draws for a whole block of points are generated in one call.
+
+    Args:
+        n_points (int): Number of independent experiments (e.g. bars)
+        simulations (int): Paths per experiment
+        steps (int): Returns per path
+        mean (float): Mean of the return distribution
+        std (float): Standard deviation of the return distribution
+        rng (np.random.Generator, optional): Generator to draw from (see make_rng)
+        max_block_bytes (int): Memory budget per block
+
+    Returns:
+        np.ndarray: Median growth factor per experiment
+    """
+    if rng is None:
+        rng = make_rng()
+    result = np.empty(n_points, dtype=np.float64)
+    for start, stop in block_ranges(n_points, simulations * steps * 8, max_block_bytes):
+        paths = rng.normal(mean, std, size=(stop - start, simulations, steps))
+        paths += 1.0
+        growth = np.prod(paths, axis=2)
+        result[start:stop] = np.median(growth, axis=1)
+    return result
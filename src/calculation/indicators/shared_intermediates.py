@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# src/calculation/indicators/shared_intermediates.py
+
+"""
+Memoization of intermediates shared between indicators (returns, true range,
+EMAs of the same span).
+
+Outside of a ``shared_intermediates()`` block every helper simply computes its
+result. Inside the block results are cached by the memory buffer of the source
+column(s), so several indicators computed over the same OHLCV columns (see
+src/calculation/batch_indicator_calculation.py) reuse one computation. Cached
+source arrays are kept alive for the lifetime of the block, so a buffer address
+can never be reused by another array while its entry exists. A nested block
+without its own cache keeps using the enclosing one, so a caller can share
+intermediates across several batch calculations (see parameter_sweep).
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Hashable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .resumable_state import active_checkpoint, resumable_ewm_mean
+
+
+class IntermediateCache:
+    """Cache of computed Series keyed by (kind, params, source buffers)."""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[pd.Series, list]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _buffer_key(series: pd.Series) -> Tuple:
+        values = series.to_numpy()
+        return (values.__array_interface__['data'][0], values.shape,
+                values.strides, values.dtype.str)
+
+    def get_or_compute(self, kind: str, sources: Sequence[pd.Series], params: Tuple,
+                       compute: Callable[[], pd.Series]) -> pd.Series:
+        """
+        Return the cached result for ``kind``/``params`` over ``sources`` or compute it.
+
+        Args:
+            kind (str): Name of the intermediate (e.g. 'ewm_mean')
+            sources (Sequence[pd.Series]): Input columns the result depends on
+            params (tuple): Hashable parameters of the computation
+            compute (Callable): Computes the result when it is not cached
+
+        Returns:
+            pd.Series: Result aligned to the index of the first source. A fresh
+                Series is returned on every call, so callers may modify it freely.
+        """
+        key = (kind, params) + tuple(self._buffer_key(s) for s in sources)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            result = compute()
+            # Pin the source buffers so their addresses stay unique while cached
+            self._entries[key] = (result, [s.to_numpy() for s in sources])
+            return result.copy()
+        self.hits += 1
+        cached = entry[0]
+        return pd.Series(cached.to_numpy(copy=True), index=sources[0].index, name=cached.name)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_ACTIVE_CACHE: ContextVar[Optional[IntermediateCache]] = ContextVar('shared_intermediates_cache', default=None)
+
+
+@contextmanager
+def shared_intermediates(cache: Optional[IntermediateCache] = None) -> Iterator[IntermediateCache]:
+    """
+    Enable memoization of shared intermediates for the enclosed calculations.
+
+    Args:
+        cache (IntermediateCache, optional): Cache to use; by default the enclosing
+            block's cache, or a new one outside of any block
+
+    Yields:
+        IntermediateCache: The active cache (exposes ``hits``/``misses``)
+    """
+    outer = _ACTIVE_CACHE.get()
+    if cache is None and outer is not None:
+        # Nested block: the enclosing block owns (and clears) the cache
+        yield outer
+        return
+    cache = cache if cache is not None else IntermediateCache()
+    token = _ACTIVE_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE_CACHE.reset(token)
+        cache.clear()
+
+
+def memoized(kind: str, sources: Sequence[pd.Series], params: Tuple,
+             compute: Callable[[], pd.Series]) -> pd.Series:
+    """
+    Compute an intermediate, reusing the active cache when one is enabled.
+
+    Args:
+        kind (str): Name of the intermediate
+        sources (Sequence[pd.Series]): Input columns the result depends on
+        params (tuple): Hashable parameters of the computation
+        compute (Callable): Computes the result
+
+    Returns:
+        pd.Series: Computed or cached result
+    """
+    cache = _ACTIVE_CACHE.get()
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(kind, sources, params, compute)
+
+
+def ewm_mean(series: pd.Series, span: int) -> pd.Series:
+    """
+    Exponential moving average ``series.ewm(span=span, adjust=False).mean()``.
+
+    Args:
+        series (pd.Series): Input values
+        span (int): EMA span
+
+    Returns:
+        pd.Series: EMA values
+    """
+    if active_checkpoint() is not None:
+        # Incremental recalculation: resume from the saved EMA value
+        return resumable_ewm_mean(series, span)
+    return memoized('ewm_mean', (series,), (span,),
+                    lambda: series.ewm(span=span, adjust=False).mean())
+
+
+def price_delta(series: pd.Series) -> pd.Series:
+    """
+    Bar-to-bar change ``series.diff()`` (first value is NaN).
+
+    Args:
+        series (pd.Series): Price series
+
+    Returns:
+        pd.Series: Differences aligned to the input index
+    """
+    return memoized('price_delta', (series,), (), series.diff)
+
+
+def pct_returns(series: pd.Series) -> pd.Series:
+    """
+    Simple returns ``series.pct_change(fill_method=None)`` (first value is NaN).
+
+    Args:
+        series (pd.Series): Price series
+
+    Returns:
+        pd.Series: Returns aligned to the input index
+    """
+    return memoized('pct_returns', (series,), (),
+                    lambda: series.pct_change(fill_method=None))
+
+
+def true_range(df: pd.DataFrame) -> pd.Series:
+    """
+    True Range: max(High - Low, |High - prev Close|, |Low - prev Close|).
+
+    Args:
+        df (pd.DataFrame): DataFrame with 'High', 'Low' and 'Close' columns
+
+    Returns:
+        pd.Series: True Range values
+    """
+    def _compute() -> pd.Series:
+        high = df['High']
+        low = df['Low']
+        close_prev = df['Close'].shift(1)
+        tr1 = high - low
+        tr2 = np.abs(high - close_prev)
+        tr3 = np.abs(low - close_prev)
+        return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+    return memoized('true_range', (df['High'], df['Low'], df['Close']), (), _compute)
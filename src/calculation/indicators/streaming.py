@@ -0,0 +1,999 @@
+# -*- coding: utf-8 -*-
+# src/calculation/indicators/streaming.py
+
+"""
+Streaming (bar-by-bar) versions of the causal indicators for live data.
+
+Each indicator keeps only the state it needs and exposes ``update(bar)``,
+which consumes one bar and returns the indicator values for it as a dict
+keyed by the same column names the batch indicators write (``EMA``,
+``RSI``, ``BB_Upper``, ...). Work per bar is O(1) (amortized O(1) for the
+Donchian channel and Stochastic; O(period) for CCI, HMA and TSForecast, whose
+batch formulas recompute each window), so a live subscriber does not
+recalculate the whole frame on every update.
+
+Recursive indicators (EMA, RSI, ATR, MACD, SAR, VWAP, Pivot Points) reproduce
+the batch results exactly; indicators built on rolling windows (SMA, Bollinger
+Bands, SuperTrend, smoothed OBV, Donchian, CCI, Stochastic, HMA, StDev, ADX,
+TSForecast) match them to floating-point precision.
+
+The PV family, RSI momentum/divergence, StochOscillator, Wave, Monte Carlo,
+Kelly, Fibonacci retracement and the sentiment indicators (Fear & Greed, COT,
+Put/Call Ratio) have no streaming version yet and are calculated on whole frames.
+
+Bars can be dicts, ``pd.Series`` rows or any mapping with ``Open``, ``High``,
+``Low``, ``Close`` and ``Volume`` keys (lower-case keys, as returned by the
+live exchange feeds, are accepted too).
+"""
+
+import math
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.common.constants import TradingRule, NOTRADE, BUY, SELL
+from .base_indicator import PriceType
+
+_NAN = float('nan')
+
+
+def _bar_value(bar, name: str) -> float:
+    """Reads one OHLCV field from a bar, accepting 'Close' or 'close' keys."""
+    try:
+        value = bar[name]
+    except (KeyError, IndexError, TypeError):
+        value = bar[name.lower()]
+    return _NAN if value is None else float(value)
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """Float division with NumPy semantics (inf/NaN instead of ZeroDivisionError)."""
+    if denominator == 0.0:
+        if numerator == 0.0 or math.isnan(numerator):
+            return _NAN
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+def _cross_signal(price: float, value: float, prev_price: float, prev_value: float) -> float:
+    """BUY/SELL when the price crosses the indicator line (same rule as the batch signals)."""
+    if price > value and prev_price <= prev_value:
+        return BUY
+    if price < value and prev_price >= prev_value:
+        return SELL
+    return NOTRADE
+
+
+class _EwmMean:
+    """``Series.ewm(span=span, adjust=False).mean()`` one value at a time (pandas arithmetic)."""
+
+    def __init__(self, span: int):
+        # Same alpha as pandas (via center of mass) so the arithmetic is identical
+        self.alpha = 1.0 / (1.0 + (span - 1) / 2.0)
+        self.reset()
+
+    def reset(self):
+        self.value = _NAN
+        self._old_wt = 1.0
+
+    def update(self, x: float) -> float:
+        if math.isnan(self.value):
+            if not math.isnan(x):
+                self.value = x
+            return self.value
+        self._old_wt *= 1.0 - self.alpha
+        if not math.isnan(x):
+            if self.value != x:
+                self.value = (self._old_wt * self.value + self.alpha * x) / (self._old_wt + self.alpha)
+            self._old_wt = 1.0
+        return self.value
+
+
+class _RollingWindow:
+    """Rolling mean/sample std over a fixed window; NaN until the window holds ``period`` valid values."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.reset()
+
+    def reset(self):
+        self._values = deque()
+        self._nan_count = 0
+        self._count = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+
+    def _add(self, x: float):
+        self._count += 1
+        delta = x - self._mean
+        self._mean += delta / self._count
+        self._ssqdm += delta * (x - self._mean)
+
+    def _remove(self, x: float):
+        self._count -= 1
+        if self._count == 0:
+            self._mean = 0.0
+            self._ssqdm = 0.0
+            return
+        delta = x - self._mean
+        self._mean -= delta / self._count
+        self._ssqdm -= delta * (x - self._mean)
+
+    def update(self, x: float):
+        """Adds a value and returns (mean, std) of the current window."""
+        self._values.append(x)
+        if math.isnan(x):
+            self._nan_count += 1
+        else:
+            self._add(x)
+        if len(self._values) > self.period:
+            old = self._values.popleft()
+            if math.isnan(old):
+                self._nan_count -= 1
+            else:
+                self._remove(old)
+        if len(self._values) < self.period or self._nan_count:
+            return _NAN, _NAN
+        variance = max(self._ssqdm, 0.0) / (self._count - 1) if self._count > 1 else _NAN
+        return self._mean, math.sqrt(variance)
+
+
+class StreamingIndicator:
+    """Base class for bar-by-bar indicators."""
+
+    name = ''
+
+    def __init__(self, price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if isinstance(price_type, str):
+            price_type = PriceType.OPEN if price_type.lower() == 'open' else PriceType.CLOSE
+        self.price_type = price_type
+
+    def price(self, bar) -> float:
+        """Returns the bar's Open or Close, depending on ``price_type``."""
+        return _bar_value(bar, 'Open' if self.price_type == PriceType.OPEN else 'Close')
+
+    def update(self, bar) -> Dict[str, float]:
+        """
+        Consumes one bar.
+
+        Args:
+            bar: Mapping with 'Open', 'High', 'Low', 'Close', 'Volume' keys
+
+        Returns:
+            dict: Indicator values for this bar
+        """
+        raise NotImplementedError
+
+    def reset(self):
+        """Forgets all consumed bars."""
+        raise NotImplementedError
+
+
+class _LineCrossIndicator(StreamingIndicator):
+    """Shared signal logic for indicators drawn as one line crossed by the price."""
+
+    def reset(self):
+        self._prev_price = _NAN
+        self._prev_value = _NAN
+
+    def _with_signal(self, price: float, value: float) -> Dict[str, float]:
+        signal = _cross_signal(price, value, self._prev_price, self._prev_value)
+        self._prev_price, self._prev_value = price, value
+        return {self.name: value, f"{self.name}_Signal": signal}
+
+
+class StreamingEMA(_LineCrossIndicator):
+    """Exponential Moving Average (same values as ``calculate_ema``)."""
+
+    name = 'EMA'
+
+    def __init__(self, period: int = 20, price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period <= 0:
+            raise ValueError("EMA period must be positive")
+        super().__init__(price_type)
+        self.period = period
+        self._ema = _EwmMean(period)
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._ema.reset()
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        return self._with_signal(price, self._ema.update(price))
+
+
+class StreamingSMA(_LineCrossIndicator):
+    """Simple Moving Average (same values as ``calculate_sma``)."""
+
+    name = 'SMA'
+
+    def __init__(self, period: int = 20, price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period <= 0:
+            raise ValueError("SMA period must be positive")
+        super().__init__(price_type)
+        self.period = period
+        self._window = _RollingWindow(period)
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._window.reset()
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        mean, _ = self._window.update(price)
+        return self._with_signal(price, mean)
+
+
+class StreamingRSI(StreamingIndicator):
+    """Relative Strength Index (same values as ``calculate_rsi``)."""
+
+    name = 'RSI'
+
+    def __init__(self, period: int = 14, oversold: float = 30, overbought: float = 70,
+                 price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period <= 0:
+            raise ValueError("RSI period must be positive")
+        super().__init__(price_type)
+        self.period = period
+        self.oversold = oversold
+        self.overbought = overbought
+        self._gains = _EwmMean(period)
+        self._losses = _EwmMean(period)
+        self.reset()
+
+    def reset(self):
+        self._gains.reset()
+        self._losses.reset()
+        self._prev_price = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        delta = price - self._prev_price
+        self._prev_price = price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else -0.0
+        avg_gain = self._gains.update(gain)
+        avg_loss = self._losses.update(loss)
+        rsi = 100 - _divide(100, 1 + _divide(avg_gain, avg_loss))
+
+        signal = NOTRADE
+        if rsi >= self.overbought:
+            signal = SELL
+        if rsi <= self.oversold:
+            signal = BUY
+        return {'RSI': rsi, 'RSI_Signal': signal}
+
+
+class StreamingATR(StreamingIndicator):
+    """Average True Range (same values as ``calculate_atr``)."""
+
+    name = 'ATR'
+
+    def __init__(self, period: int = 14):
+        if period <= 0:
+            raise ValueError("ATR period must be positive")
+        super().__init__()
+        self.period = period
+        self._atr = _EwmMean(period)
+        self.reset()
+
+    def reset(self):
+        self._atr.reset()
+        self._prev_close = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        high, low, close = _bar_value(bar, 'High'), _bar_value(bar, 'Low'), _bar_value(bar, 'Close')
+        tr = _true_range(high, low, self._prev_close)
+        self._prev_close = close
+        return {'ATR': self._atr.update(tr)}
+
+
+def _true_range(high: float, low: float, prev_close: float) -> float:
+    # NaN-skipping max, like pd.concat([...], axis=1).max(axis=1)
+    candidates = [v for v in (high - low, abs(high - prev_close), abs(low - prev_close)) if not math.isnan(v)]
+    return max(candidates) if candidates else _NAN
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    """Bollinger Bands (same values as ``calculate_bollinger_bands``)."""
+
+    name = 'Bollinger_Bands'
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0,
+                 price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period <= 0:
+            raise ValueError("Bollinger Bands period must be positive")
+        super().__init__(price_type)
+        self.period = period
+        self.std_dev = std_dev
+        self._window = _RollingWindow(period)
+        self.reset()
+
+    def reset(self):
+        self._window.reset()
+        self._prev_price = _NAN
+        self._prev_upper = _NAN
+        self._prev_lower = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        middle, std = self._window.update(price)
+        upper = middle + std * self.std_dev
+        lower = middle - std * self.std_dev
+
+        signal = NOTRADE
+        if price <= lower and self._prev_price > self._prev_lower:
+            signal = BUY
+        if price >= upper and self._prev_price < self._prev_upper:
+            signal = SELL
+        self._prev_price, self._prev_upper, self._prev_lower = price, upper, lower
+        return {'BB_Upper': upper, 'BB_Middle': middle, 'BB_Lower': lower, 'BB_Signal': signal}
+
+
+class StreamingMACD(StreamingIndicator):
+    """MACD line, signal line and histogram (same values as ``calculate_macd``)."""
+
+    name = 'MACD'
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9,
+                 price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if fast_period <= 0 or slow_period <= 0 or signal_period <= 0:
+            raise ValueError("All periods must be positive")
+        super().__init__(price_type)
+        self._fast = _EwmMean(fast_period)
+        self._slow = _EwmMean(slow_period)
+        self._signal = _EwmMean(signal_period)
+        self.reset()
+
+    def reset(self):
+        self._fast.reset()
+        self._slow.reset()
+        self._signal.reset()
+        self._prev_line = _NAN
+        self._prev_signal = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        line = self._fast.update(price) - self._slow.update(price)
+        signal_line = self._signal.update(line)
+
+        signal = NOTRADE
+        if line > signal_line and self._prev_line <= self._prev_signal:
+            signal = BUY
+        elif line < signal_line and self._prev_line >= self._prev_signal:
+            signal = SELL
+        self._prev_line, self._prev_signal = line, signal_line
+        return {'MACD_Line': line, 'MACD_Signal': signal_line,
+                'MACD_Histogram': line - signal_line, 'MACD_Trading_Signal': signal}
+
+
+class StreamingSAR(_LineCrossIndicator):
+    """Parabolic SAR (same recurrence as ``sar_kernel``)."""
+
+    name = 'SAR'
+
+    def __init__(self, acceleration: float = 0.02, maximum: float = 0.2,
+                 price_type: Union[PriceType, str] = PriceType.CLOSE):
+        super().__init__(price_type)
+        self.acceleration = acceleration
+        self.maximum = maximum
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._sar = None
+        self._ep = _NAN
+        self._af = self.acceleration
+        self._trend = 1
+        self._prev_high = _NAN
+        self._prev_low = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        high, low = _bar_value(bar, 'High'), _bar_value(bar, 'Low')
+        if self._sar is None:
+            value, self._ep, self._af, self._trend = low, high, self.acceleration, 1
+        else:
+            prev_sar, prev_ep, prev_af = self._sar, self._ep, self._af
+            value = prev_sar + prev_af * (prev_ep - prev_sar)
+            if self._trend == 1:
+                if high > prev_ep:
+                    self._ep = high
+                    self._af = min(prev_af + self.acceleration, self.maximum)
+                else:
+                    self._ep = low
+                    self._af = self.acceleration
+                    self._trend = -1
+                if value > self._prev_low:
+                    value = self._prev_low
+                if value > low:
+                    value = low
+            else:
+                if low < prev_ep:
+                    self._ep = low
+                    self._af = min(prev_af + self.acceleration, self.maximum)
+                else:
+                    self._ep = high
+                    self._af = self.acceleration
+                    self._trend = 1
+                if value < self._prev_high:
+                    value = self._prev_high
+                if value < high:
+                    value = high
+        self._sar = value
+        self._prev_high, self._prev_low = high, low
+        return self._with_signal(self.price(bar), value)
+
+
+class StreamingSuperTrend(StreamingIndicator):
+    """SuperTrend (same values as ``calculate_supertrend``)."""
+
+    name = 'SuperTrend'
+
+    def __init__(self, period: int = 10, multiplier: float = 3.0,
+                 price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period <= 0 or multiplier <= 0:
+            raise ValueError("Period and multiplier must be positive")
+        super().__init__(price_type)
+        self.period = period
+        self.multiplier = multiplier
+        self._tr_window = _RollingWindow(period)
+        self.reset()
+
+    def reset(self):
+        self._tr_window.reset()
+        self._prev_close = _NAN
+        self._supertrend = None
+        self._trend = 1.0
+
+    def update(self, bar) -> Dict[str, float]:
+        high, low, close = _bar_value(bar, 'High'), _bar_value(bar, 'Low'), _bar_value(bar, 'Close')
+        atr, _ = self._tr_window.update(_true_range(high, low, self._prev_close))
+        self._prev_close = close
+        upper = (high + low) / 2 + self.multiplier * atr
+        lower = (high + low) / 2 - self.multiplier * atr
+
+        prev_trend = self._trend
+        if self._supertrend is None:
+            self._supertrend, self._trend = lower, 1.0
+        elif self._trend == 1.0:
+            if close <= self._supertrend:
+                self._supertrend, self._trend = upper, -1.0
+            else:
+                self._supertrend = lower if not lower < self._supertrend else self._supertrend
+        else:
+            if close >= self._supertrend:
+                self._supertrend, self._trend = lower, 1.0
+            else:
+                self._supertrend = upper if not upper > self._supertrend else self._supertrend
+
+        signal = NOTRADE
+        if self._trend == 1.0 and prev_trend == -1.0:
+            signal = BUY
+        elif self._trend == -1.0 and prev_trend == 1.0:
+            signal = SELL
+        return {'SuperTrend': self._supertrend, 'SuperTrend_Direction': self._trend,
+                'SuperTrend_Signal': signal}
+
+
+class StreamingOBV(StreamingIndicator):
+    """On Balance Volume, smoothed over ``period`` bars (same values as ``calculate_obv``)."""
+
+    name = 'OBV'
+
+    def __init__(self, period: int = 20, price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period <= 0:
+            raise ValueError("OBV period must be positive")
+        super().__init__(price_type)
+        self.period = period
+        self._window = _RollingWindow(period)
+        self.reset()
+
+    def reset(self):
+        self._window.reset()
+        self._obv = None
+        self._prev_price = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        price, volume = self.price(bar), _bar_value(bar, 'Volume')
+        if self._obv is None:
+            self._obv = volume
+        elif price > self._prev_price:
+            self._obv = self._obv + volume
+        elif price < self._prev_price:
+            self._obv = self._obv - volume
+        self._prev_price = price
+        if self.period > 1:
+            value, _ = self._window.update(self._obv)
+        else:
+            value = self._obv
+        return {'OBV': value}
+
+
+class StreamingVWAP(StreamingIndicator):
+    """Cumulative Volume Weighted Average Price (same values as ``calculate_vwap``)."""
+
+    name = 'VWAP'
+
+    def __init__(self, price_type: Union[PriceType, str] = PriceType.CLOSE):
+        super().__init__(price_type)
+        self.reset()
+
+    def reset(self):
+        self._cumulative_pv = 0.0
+        self._cumulative_volume = 0.0
+
+    def update(self, bar) -> Dict[str, float]:
+        price, volume = self.price(bar), _bar_value(bar, 'Volume')
+        pv = price * volume
+        # cumsum skips missing values but reports NaN on their rows
+        if not math.isnan(volume):
+            self._cumulative_volume += volume
+        if math.isnan(pv) or math.isnan(volume):
+            return {'VWAP': _NAN}
+        self._cumulative_pv += pv
+        return {'VWAP': _divide(self._cumulative_pv, self._cumulative_volume)}
+
+
+class _MonotonicExtreme:
+    """Rolling max (or min) over a fixed window with amortized O(1) updates."""
+
+    def __init__(self, period: int, maximum: bool):
+        self.period = period
+        self.maximum = maximum
+        self.reset()
+
+    def reset(self):
+        self._candidates = deque()
+        self._position = 0
+        self._last_nan = -1
+
+    def update(self, x: float) -> float:
+        position = self._position
+        self._position += 1
+        if math.isnan(x):
+            self._last_nan = position
+        else:
+            while self._candidates and (self._candidates[-1][1] <= x if self.maximum
+                                        else self._candidates[-1][1] >= x):
+                self._candidates.pop()
+            self._candidates.append((position, x))
+        while self._candidates and self._candidates[0][0] <= position - self.period:
+            self._candidates.popleft()
+        if position + 1 < self.period or self._last_nan > position - self.period:
+            return _NAN
+        return self._candidates[0][1]
+
+
+class StreamingDonchian(StreamingIndicator):
+    """Donchian Channel (same values as ``calculate_donchain``)."""
+
+    name = 'Donchain'
+
+    def __init__(self, period: int = 20, price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period <= 0:
+            raise ValueError("Donchian Channel period must be positive")
+        super().__init__(price_type)
+        self.period = period
+        self._upper = _MonotonicExtreme(period, maximum=True)
+        self._lower = _MonotonicExtreme(period, maximum=False)
+        self.reset()
+
+    def reset(self):
+        self._upper.reset()
+        self._lower.reset()
+        self._prev_price = _NAN
+        self._prev_upper = _NAN
+        self._prev_lower = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        upper = self._upper.update(_bar_value(bar, 'High'))
+        lower = self._lower.update(_bar_value(bar, 'Low'))
+
+        signal = NOTRADE
+        if price > upper and self._prev_price <= self._prev_upper:
+            signal = BUY
+        if price < lower and self._prev_price >= self._prev_lower:
+            signal = SELL
+        self._prev_price, self._prev_upper, self._prev_lower = price, upper, lower
+        return {'Donchain_Upper': upper, 'Donchain_Middle': (upper + lower) / 2,
+                'Donchain_Lower': lower, 'Donchain_Signal': signal}
+
+
+
+def _full_window(window: deque) -> Optional[np.ndarray]:
+    """Window values as an array once it holds ``maxlen`` values, else None."""
+    if len(window) < window.maxlen:
+        return None
+    return np.fromiter(window, dtype=float, count=len(window))
+
+
+def _wma(window: deque) -> float:
+    """Linearly weighted mean of a full window (same as ``np.average(x, weights=1..n)``)."""
+    values = _full_window(window)
+    if values is None or np.isnan(values).any():
+        return _NAN
+    return float(np.average(values, weights=np.arange(1, len(values) + 1)))
+
+
+class StreamingCCI(StreamingIndicator):
+    """Commodity Channel Index (same values as ``calculate_cci``); O(period) per bar."""
+
+    name = 'CCI'
+
+    def __init__(self, period: int = 20, constant: float = 0.015, overbought: float = 100,
+                 oversold: float = -100, price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period <= 0:
+            raise ValueError("CCI period must be positive")
+        super().__init__(price_type)
+        self.period = period
+        self.constant = constant
+        self.overbought = overbought
+        self.oversold = oversold
+        self.reset()
+
+    def reset(self):
+        self._window = deque(maxlen=self.period)
+        self._prev_cci = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        self._window.append(price)
+        values = _full_window(self._window)
+        cci = _NAN
+        if values is not None and not np.isnan(values).any():
+            mean = values.mean()
+            mean_deviation = np.mean(np.abs(values - mean))
+            cci = _divide(price - mean, self.constant * mean_deviation)
+
+        signal = NOTRADE
+        if cci > self.oversold and self._prev_cci <= self.oversold:
+            signal = BUY
+        if cci < self.overbought and self._prev_cci >= self.overbought:
+            signal = SELL
+        self._prev_cci = cci
+        return {'CCI': cci, 'CCI_Signal': signal}
+
+
+class StreamingStochastic(StreamingIndicator):
+    """Stochastic %K and %D (same values as ``calculate_stochastic``)."""
+
+    name = 'Stochastic'
+
+    def __init__(self, k_period: int = 14, d_period: int = 3, slowing: int = 3,
+                 overbought: float = 80, oversold: float = 20,
+                 price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if k_period <= 0 or d_period <= 0 or slowing <= 0:
+            raise ValueError("All periods must be positive")
+        super().__init__(price_type)
+        self.overbought = overbought
+        self.oversold = oversold
+        self._highest = _MonotonicExtreme(k_period, maximum=True)
+        self._lowest = _MonotonicExtreme(k_period, maximum=False)
+        self._k_window = _RollingWindow(slowing)
+        self._d_window = _RollingWindow(d_period)
+        self.reset()
+
+    def reset(self):
+        self._highest.reset()
+        self._lowest.reset()
+        self._k_window.reset()
+        self._d_window.reset()
+        self._prev_k = _NAN
+        self._prev_d = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        highest = self._highest.update(_bar_value(bar, 'High'))
+        lowest = self._lowest.update(_bar_value(bar, 'Low'))
+        denominator = highest - lowest
+        # No range (or no full window yet) gives NaN
+        raw_k = min(max((price - lowest) / denominator * 100, 0.0), 100.0) if denominator > 1e-10 else _NAN
+        k, _ = self._k_window.update(raw_k)
+        k = min(max(k, 0.0), 100.0) if not math.isnan(k) else k
+        d, _ = self._d_window.update(k)
+        d = min(max(d, 0.0), 100.0) if not math.isnan(d) else d
+
+        signal = NOTRADE
+        if k > d and self._prev_k <= self._prev_d and k < self.oversold:
+            signal = BUY
+        if k < d and self._prev_k >= self._prev_d and k > self.overbought:
+            signal = SELL
+        self._prev_k, self._prev_d = k, d
+        return {'Stoch_K': k, 'Stoch_D': d, 'Stoch_Signal': signal}
+
+
+class StreamingHMA(_LineCrossIndicator):
+    """Hull Moving Average (same values as ``calculate_hma``); O(period) per bar."""
+
+    name = 'HMA'
+
+    def __init__(self, period: int = 20, price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period < 2:
+            raise ValueError("HMA period must be at least 2")
+        super().__init__(price_type)
+        self.period = period
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._half = deque(maxlen=int(self.period / 2))
+        self._full = deque(maxlen=self.period)
+        self._raw = deque(maxlen=int(math.sqrt(self.period)))
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        self._half.append(price)
+        self._full.append(price)
+        self._raw.append(2 * _wma(self._half) - _wma(self._full))
+        return self._with_signal(price, _wma(self._raw))
+
+
+class StreamingStDev(StreamingIndicator):
+    """Standard deviation of returns (same values as ``calculate_stdev``)."""
+
+    name = 'StDev'
+
+    def __init__(self, period: int = 20, high_volatility_threshold: float = 0.02,
+                 low_volatility_threshold: float = 0.005,
+                 price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period <= 0:
+            raise ValueError("Standard Deviation period must be positive")
+        super().__init__(price_type)
+        self.period = period
+        self.high_volatility_threshold = high_volatility_threshold
+        self.low_volatility_threshold = low_volatility_threshold
+        self._window = _RollingWindow(period)
+        self.reset()
+
+    def reset(self):
+        self._window.reset()
+        self._prev_price = _NAN
+        self._prev_return = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        ret = _divide(price, self._prev_price) - 1.0
+        self._prev_price = price
+        # The batch version drops missing returns before the rolling window
+        stdev = _NAN if math.isnan(ret) else self._window.update(ret)[1]
+
+        signal = NOTRADE
+        if stdev < self.low_volatility_threshold and ret > 0 and ret > self._prev_return:
+            signal = BUY
+        if stdev > self.high_volatility_threshold and ret < 0 and ret < self._prev_return:
+            signal = SELL
+        self._prev_return = ret
+        return {'StDev': stdev, 'StDev_Signal': signal}
+
+
+class StreamingADX(StreamingIndicator):
+    """ADX with +DI and -DI (same values as ``calculate_adx``)."""
+
+    name = 'ADX'
+
+    def __init__(self, period: int = 14, adx_threshold: float = 25):
+        if period <= 0:
+            raise ValueError("ADX period must be positive")
+        super().__init__()
+        self.period = period
+        self.adx_threshold = adx_threshold
+        self._tr = _RollingWindow(period)
+        self._plus_dm = _RollingWindow(period)
+        self._minus_dm = _RollingWindow(period)
+        self._dx = _RollingWindow(period)
+        self.reset()
+
+    def reset(self):
+        for window in (self._tr, self._plus_dm, self._minus_dm, self._dx):
+            window.reset()
+        self._prev_high = _NAN
+        self._prev_low = _NAN
+        self._prev_close = _NAN
+        self._prev_plus_di = _NAN
+        self._prev_minus_di = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        high, low, close = _bar_value(bar, 'High'), _bar_value(bar, 'Low'), _bar_value(bar, 'Close')
+        up_move = high - self._prev_high
+        down_move = self._prev_low - low
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+        tr_smooth, _ = self._tr.update(_true_range(high, low, self._prev_close))
+        self._prev_high, self._prev_low, self._prev_close = high, low, close
+
+        plus_di = 100 * _divide(self._plus_dm.update(plus_dm)[0], tr_smooth)
+        minus_di = 100 * _divide(self._minus_dm.update(minus_dm)[0], tr_smooth)
+        adx, _ = self._dx.update(100 * _divide(abs(plus_di - minus_di), plus_di + minus_di))
+
+        signal = NOTRADE
+        if plus_di > minus_di and adx > self.adx_threshold and plus_di > self._prev_plus_di:
+            signal = BUY
+        if minus_di > plus_di and adx > self.adx_threshold and minus_di > self._prev_minus_di:
+            signal = SELL
+        self._prev_plus_di, self._prev_minus_di = plus_di, minus_di
+        return {'ADX': adx, 'ADX_PlusDI': plus_di, 'ADX_MinusDI': minus_di, 'ADX_Signal': signal}
+
+
+class StreamingPivot(StreamingIndicator):
+    """Pivot point, R1 and S1 of the previous bar (same values as ``calculate_pivot_points``)."""
+
+    name = 'Pivot_Points'
+
+    def __init__(self, price_type: Union[PriceType, str] = PriceType.CLOSE):
+        super().__init__(price_type)
+        self.reset()
+
+    def reset(self):
+        self._prev_bar = (_NAN, _NAN, _NAN)
+        self._prev_price = _NAN
+        self._prev_r1 = _NAN
+        self._prev_s1 = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        prev_high, prev_low, prev_close = self._prev_bar
+        pivot = (prev_high + prev_low + prev_close) / 3
+        r1 = 2 * pivot - prev_low
+        s1 = 2 * pivot - prev_high
+        self._prev_bar = (_bar_value(bar, 'High'), _bar_value(bar, 'Low'), price)
+
+        signal = NOTRADE
+        if price > s1 and self._prev_price <= self._prev_s1:
+            signal = BUY
+        if price < r1 and self._prev_price >= self._prev_r1:
+            signal = SELL
+        self._prev_price, self._prev_r1, self._prev_s1 = price, r1, s1
+        return {'Pivot_PP': pivot, 'Pivot_R1': r1, 'Pivot_S1': s1, 'Pivot_Signal': signal}
+
+
+class StreamingTSForecast(StreamingIndicator):
+    """Time Series Forecast (same values as ``calculate_tsforecast``); O(period) per bar."""
+
+    name = 'TSForecast'
+
+    def __init__(self, period: int = 14, price_type: Union[PriceType, str] = PriceType.CLOSE):
+        if period <= 0:
+            raise ValueError("TSForecast period must be positive")
+        super().__init__(price_type)
+        self.period = period
+        # Least-squares line over x = 0..period-1, evaluated at x = period
+        self._x_centered = np.arange(period, dtype=np.float64) - (period - 1) / 2.0
+        self._sxx = float(np.dot(self._x_centered, self._x_centered))
+        self._step = period - (period - 1) / 2.0
+        self.reset()
+
+    def reset(self):
+        self._window = deque(maxlen=self.period)
+        self._prev_forecast = _NAN
+
+    def update(self, bar) -> Dict[str, float]:
+        price = self.price(bar)
+        # The forecast of this bar only uses the preceding bars
+        values = _full_window(self._window)
+        forecast = _NAN
+        if values is not None:
+            if self.period == 1:
+                forecast = float(values[0])
+            else:
+                forecast = float(values.mean() + (values @ self._x_centered) / self._sxx * self._step)
+        self._window.append(price)
+
+        signal = NOTRADE
+        if price < forecast and forecast > self._prev_forecast:
+            signal = BUY
+        if price > forecast and forecast < self._prev_forecast:
+            signal = SELL
+        self._prev_forecast = forecast
+        return {'TSForecast': forecast, 'TSForecast_Signal': signal}
+
+# TradingRule -> (streaming class, {rule parameter: constructor argument})
+STREAMING_INDICATORS = {
+    TradingRule.EMA: (StreamingEMA, {'ema_period': 'period'}),
+    TradingRule.SMA: (StreamingSMA, {'sma_period': 'period'}),
+    TradingRule.RSI: (StreamingRSI, {'rsi_period': 'period'}),
+    TradingRule.ATR: (StreamingATR, {'atr_period': 'period'}),
+    TradingRule.Bollinger_Bands: (StreamingBollingerBands, {'bb_period': 'period', 'bb_std_dev': 'std_dev'}),
+    TradingRule.MACD: (StreamingMACD, {'macd_fast': 'fast_period', 'macd_slow': 'slow_period',
+                                       'macd_signal': 'signal_period'}),
+    TradingRule.SAR: (StreamingSAR, {'sar_acceleration': 'acceleration', 'sar_maximum': 'maximum'}),
+    TradingRule.SuperTrend: (StreamingSuperTrend, {'supertrend_period': 'period'}),
+    TradingRule.OBV: (StreamingOBV, {'obv_period': 'period'}),
+    TradingRule.VWAP: (StreamingVWAP, {}),
+    TradingRule.Donchain: (StreamingDonchian, {'donchain_period': 'period'}),
+    TradingRule.CCI: (StreamingCCI, {'cci_period': 'period'}),
+    TradingRule.Stochastic: (StreamingStochastic, {'stoch_k_period': 'k_period', 'stoch_d_period': 'd_period'}),
+    TradingRule.HMA: (StreamingHMA, {'hma_period': 'period'}),
+    TradingRule.StDev: (StreamingStDev, {'stdev_period': 'period'}),
+    TradingRule.ADX: (StreamingADX, {'adx_period': 'period'}),
+    TradingRule.Pivot_Points: (StreamingPivot, {}),
+    TradingRule.TSForecast: (StreamingTSForecast, {'tsforecast_period': 'period'}),
+}
+
+
+def create_streaming_indicator(rule: Union[str, TradingRule]) -> StreamingIndicator:
+    """
+    Creates a streaming indicator from a rule string such as 'rsi:14,30,70,close'.
+
+    Args:
+        rule (str | TradingRule): Rule name or alias with optional parameters
+
+    Returns:
+        StreamingIndicator: New indicator with no consumed bars
+    """
+    from src.calculation.batch_indicator_calculation import resolve_trading_rule
+
+    trading_rule, params = (rule, {}) if isinstance(rule, TradingRule) else resolve_trading_rule(rule)
+    if trading_rule not in STREAMING_INDICATORS:
+        supported = ', '.join(r.name for r in STREAMING_INDICATORS)
+        raise ValueError(f"Rule '{trading_rule.name}' has no streaming version. Supported: {supported}")
+    cls, arg_names = STREAMING_INDICATORS[trading_rule]
+    kwargs = {arg_names.get(key, key): value for key, value in params.items()}
+    return cls(**kwargs)
+
+
+class StreamingPipeline:
+    """
+    Runs several streaming indicators over the same bars.
+
+    ``update(bar)`` feeds one bar to every indicator. ``process_frame(df)`` feeds
+    only the rows newer than the last processed bar, so it can be given the whole
+    polled frame on every refresh.
+
+    Indicators cannot take back a bar they consumed, so by default the last row of
+    each polled frame (the bar that is still forming) is held back until it closes.
+    """
+
+    def __init__(self, indicators: Iterable[Union[StreamingIndicator, str]], closed_bars_only: bool = True):
+        """
+        Args:
+            indicators: StreamingIndicator objects or rule strings
+            closed_bars_only (bool): Hold back the last row of each frame (the bar
+                that is still forming) until a newer row arrives. Pass False only
+                for frames of closed bars, e.g. history replays.
+        """
+        self.indicators: List[StreamingIndicator] = [
+            create_streaming_indicator(ind) if isinstance(ind, (str, TradingRule)) else ind
+            for ind in indicators
+        ]
+        self.closed_bars_only = closed_bars_only
+        self.last_index = None
+
+    def reset(self):
+        for indicator in self.indicators:
+            indicator.reset()
+        self.last_index = None
+
+    def update(self, bar) -> Dict[str, float]:
+        """Feeds one bar to every indicator and returns their merged values."""
+        values = {}
+        for indicator in self.indicators:
+            values.update(indicator.update(bar))
+        return values
+
+    def process_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Feeds the rows of ``df`` that come after the last processed bar.
+
+        Args:
+            df (pd.DataFrame): OHLCV frame with a sorted index
+
+        Returns:
+            pd.DataFrame: The new rows with the indicator values appended as columns
+                          (empty when there are no new bars)
+        """
+        new_rows = df if self.last_index is None else df[df.index > self.last_index]
+        if self.closed_bars_only and len(new_rows):
+            new_rows = new_rows.iloc[:-1]
+        if new_rows.empty:
+            return new_rows.copy()
+
+        records = [self.update(bar) for bar in new_rows.to_dict('records')]
+        self.last_index = new_rows.index[-1]
+        values = pd.DataFrame.from_records(records, index=new_rows.index)
+        return pd.concat([new_rows, values], axis=1)
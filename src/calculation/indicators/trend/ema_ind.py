@@ -19,6 +19,7 @@ import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 from ..base_indicator import BaseIndicator, PriceType
+from ..shared_intermediates import ewm_mean
 
 
 def calculate_ema(price_series: pd.Series, period: int = 20) -> pd.Series:
@@ -39,8 +40,8 @@ def calculate_ema(price_series: pd.Series, period: int = 20) -> pd.Series:
         logger.print_warning(f"Not enough data for EMA calculation. Need at least {period} points, got {len(price_series)}")
         return pd.Series(index=price_series.index, dtype=float)
     
-    # Calculate EMA using pandas ewm
-    ema = price_series.ewm(span=period, adjust=False).mean()
+    # Calculate EMA using pandas ewm (shared with MACD when batched)
+    ema = ewm_mean(price_series, period)
     
     return ema
 
@@ -20,6 +20,8 @@ import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 from ..base_indicator import BaseIndicator, PriceType
+from .trend_kernels import sar_kernel_resumable
+from ..resumable_state import run_resumable
 
 
 def calculate_sar(df: pd.DataFrame, acceleration: float = 0.02, maximum: float = 0.2) -> pd.Series:
@@ -41,70 +43,16 @@ def calculate_sar(df: pd.DataFrame, acceleration: float = 0.02, maximum: float =
         logger.print_warning("Not enough data for SAR calculation. Need at least 2 points")
         return pd.Series(index=df.index, dtype=float)
     
-    high_prices = df['High']
-    low_prices = df['Low']
-    
-    # Initialize SAR
-    sar = pd.Series(index=df.index, dtype=float)
-    ep = pd.Series(index=df.index, dtype=float)  # Extreme Point
-    af = pd.Series(index=df.index, dtype=float)  # Acceleration Factor
-    trend = pd.Series(index=df.index, dtype=int)  # 1 for uptrend, -1 for downtrend
-    
-    # Initialize first values
-    sar.iloc[0] = low_prices.iloc[0]
-    ep.iloc[0] = high_prices.iloc[0]
-    af.iloc[0] = acceleration
-    trend.iloc[0] = 1  # Start with uptrend
-    
-    # Calculate SAR
-    for i in range(1, len(df)):
-        if trend.iloc[i-1] == 1:  # Uptrend
-            # Check if trend continues
-            if high_prices.iloc[i] > ep.iloc[i-1]:
-                # Trend continues
-                ep.iloc[i] = high_prices.iloc[i]
-                af.iloc[i] = min(af.iloc[i-1] + acceleration, maximum)
-                trend.iloc[i] = 1
-            else:
-                # Trend reverses
-                ep.iloc[i] = low_prices.iloc[i]
-                af.iloc[i] = acceleration
-                trend.iloc[i] = -1
-            
-            # Calculate SAR for uptrend
-            sar.iloc[i] = sar.iloc[i-1] + af.iloc[i-1] * (ep.iloc[i-1] - sar.iloc[i-1])
-            
-            # SAR should not be above the previous low
-            if sar.iloc[i] > low_prices.iloc[i-1]:
-                sar.iloc[i] = low_prices.iloc[i-1]
-            
-            # SAR should not be above the current low
-            if sar.iloc[i] > low_prices.iloc[i]:
-                sar.iloc[i] = low_prices.iloc[i]
-                
-        else:  # Downtrend
-            # Check if trend continues
-            if low_prices.iloc[i] < ep.iloc[i-1]:
-                # Trend continues
-                ep.iloc[i] = low_prices.iloc[i]
-                af.iloc[i] = min(af.iloc[i-1] + acceleration, maximum)
-                trend.iloc[i] = -1
-            else:
-                # Trend reverses
-                ep.iloc[i] = high_prices.iloc[i]
-                af.iloc[i] = acceleration
-                trend.iloc[i] = 1
-            
-            # Calculate SAR for downtrend
-            sar.iloc[i] = sar.iloc[i-1] + af.iloc[i-1] * (ep.iloc[i-1] - sar.iloc[i-1])
-            
-            # SAR should not be below the previous high
-            if sar.iloc[i] < high_prices.iloc[i-1]:
-                sar.iloc[i] = high_prices.iloc[i-1]
-            
-            # SAR should not be below the current high
-            if sar.iloc[i] < high_prices.iloc[i]:
-                sar.iloc[i] = high_prices.iloc[i]
+    # Run the SAR recurrence on plain arrays (Numba JIT when available),
+    # resuming from the saved trend state during incremental recalculation
+    high_values = df['High'].to_numpy()
+    low_values = df['Low'].to_numpy()
+    sar_values = run_resumable(
+        'sar', [float(acceleration), float(maximum)], len(df),
+        lambda start, seed, checkpoint: sar_kernel_resumable(
+            high_values, low_values, acceleration, maximum, start, seed, checkpoint)
+    )
+    sar = pd.Series(sar_values, index=df.index)
     
     return sar
 
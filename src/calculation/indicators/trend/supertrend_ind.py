@@ -20,6 +20,8 @@ import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 from ..base_indicator import BaseIndicator, PriceType
+from .trend_kernels import supertrend_kernel
+from ..resumable_state import run_resumable
 
 
 def calculate_supertrend(df: pd.DataFrame, period: int = 10, multiplier: float = 3.0) -> tuple[pd.Series, pd.Series]:
@@ -56,38 +58,21 @@ def calculate_supertrend(df: pd.DataFrame, period: int = 10, multiplier: float =
     basic_upper = (high_prices + low_prices) / 2 + multiplier * atr
     basic_lower = (high_prices + low_prices) / 2 - multiplier * atr
     
-    # Initialize SuperTrend
-    supertrend = pd.Series(index=df.index, dtype=float)
-    trend = pd.Series(index=df.index, dtype=int)  # 1 for uptrend, -1 for downtrend
-    
-    # Initialize first values
-    supertrend.iloc[0] = basic_lower.iloc[0]
-    trend.iloc[0] = 1  # Start with uptrend
-    
-    # Calculate SuperTrend
-    for i in range(1, len(df)):
-        if trend.iloc[i-1] == 1:  # Previous trend was up
-            if close_prices.iloc[i] <= supertrend.iloc[i-1]:
-                # Trend reverses to down
-                supertrend.iloc[i] = basic_upper.iloc[i]
-                trend.iloc[i] = -1
-            else:
-                # Trend continues up
-                supertrend.iloc[i] = basic_lower.iloc[i]
-                if supertrend.iloc[i] < supertrend.iloc[i-1]:
-                    supertrend.iloc[i] = supertrend.iloc[i-1]
-                trend.iloc[i] = 1
-        else:  # Previous trend was down
-            if close_prices.iloc[i] >= supertrend.iloc[i-1]:
-                # Trend reverses to up
-                supertrend.iloc[i] = basic_lower.iloc[i]
-                trend.iloc[i] = 1
-            else:
-                # Trend continues down
-                supertrend.iloc[i] = basic_upper.iloc[i]
-                if supertrend.iloc[i] > supertrend.iloc[i-1]:
-                    supertrend.iloc[i] = supertrend.iloc[i-1]
-                trend.iloc[i] = -1
+    # Run the band-switching recurrence on plain arrays (Numba JIT when available),
+    # resuming from the saved trend state during incremental recalculation
+    def _run_kernel(start, seed, checkpoint):
+        values = supertrend_kernel(close_prices.to_numpy(), basic_upper.to_numpy(),
+                                   basic_lower.to_numpy(), start, seed)
+        state = None
+        if checkpoint >= 0:
+            state = [float(values[0][checkpoint]), float(values[1][checkpoint])]
+        return values, state
+
+    supertrend_values, trend_values = run_resumable(
+        'supertrend', [int(period), float(multiplier)], len(df), _run_kernel
+    )
+    supertrend = pd.Series(supertrend_values, index=df.index)
+    trend = pd.Series(trend_values, index=df.index)  # 1 for uptrend, -1 for downtrend
     
     return supertrend, trend
 
@@ -0,0 +1,660 @@
+# -*- coding: utf-8 -*-
+# src/calculation/indicators/trend/trend_kernels.py
+
+"""
+Array kernels for the recursive trend indicators (SAR, SuperTrend, Wave).
+
+Each kernel is written once as a plain index loop. When Numba is installed the
+loop is JIT-compiled and run on float64 NumPy arrays. Otherwise a vectorized
+NumPy fallback is used: the Wave trading rules are evaluated with array masks,
+SuperTrend ratchets its bands with ``np.maximum/minimum.accumulate`` between
+trend flips, and SAR derives its trend, extreme point and acceleration factor
+from High/Low comparisons and settles the SAR values in a few array sweeps.
+
+Both paths perform exactly the same IEEE-754 float64 operations in the same
+order as the original pandas loops, so results are bit-for-bit identical. The
+zero-seeded exponential smoothings feed each rounded output into the next one,
+which no window or cumsum formulation reproduces exactly, so the fallback keeps
+them as tight loops over Python floats.
+"""
+
+from bisect import bisect_left
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Signal values (mirrors src.common.constants, kept local for the JIT)
+_NOTRADE = 0.0
+_BUY = 1.0
+_SELL = 2.0
+
+# Integer codes for ENUM_MOM_TR rules understood by tr_switch_kernel
+TR_CODE_NONE = -1
+TR_CODE_FAST = 0
+TR_CODE_ZONE = 1
+TR_CODE_STRONG_TREND = 2
+TR_CODE_WEAK_TREND = 3
+TR_CODE_FAST_ZONE_REVERSE = 4
+TR_CODE_BETTER_TREND = 5
+TR_CODE_BETTER_FAST = 6
+
+
+def _sar_loop(high, low, acceleration, maximum, sar, start, initial, checkpoint, state):
+    n = len(high)
+    for i in range(start):
+        sar[i] = np.nan
+    if initial[3] == 0.0:
+        sar[start] = low[start]
+        ep = high[start]
+        af = acceleration
+        trend = 1
+    else:
+        # Resume from a saved (sar, ep, af, trend) state
+        sar[start] = initial[0]
+        ep = initial[1]
+        af = initial[2]
+        trend = 1 if initial[3] > 0 else -1
+    if checkpoint == start:
+        state[0] = sar[start]
+        state[1] = ep
+        state[2] = af
+        state[3] = trend
+    for i in range(start + 1, n):
+        prev_sar = sar[i - 1]
+        prev_ep = ep
+        prev_af = af
+        if trend == 1:
+            if high[i] > prev_ep:
+                ep = high[i]
+                af = min(prev_af + acceleration, maximum)
+            else:
+                ep = low[i]
+                af = acceleration
+                trend = -1
+            value = prev_sar + prev_af * (prev_ep - prev_sar)
+            if value > low[i - 1]:
+                value = low[i - 1]
+            if value > low[i]:
+                value = low[i]
+        else:
+            if low[i] < prev_ep:
+                ep = low[i]
+                af = min(prev_af + acceleration, maximum)
+            else:
+                ep = high[i]
+                af = acceleration
+                trend = 1
+            value = prev_sar + prev_af * (prev_ep - prev_sar)
+            if value < high[i - 1]:
+                value = high[i - 1]
+            if value < high[i]:
+                value = high[i]
+        sar[i] = value
+        if i == checkpoint:
+            state[0] = value
+            state[1] = ep
+            state[2] = af
+            state[3] = trend
+
+
+def _supertrend_loop(close, basic_upper, basic_lower, supertrend, trend, start, initial):
+    n = len(close)
+    for i in range(start):
+        supertrend[i] = np.nan
+        trend[i] = np.nan
+    if initial[1] == 0.0:
+        supertrend[start] = basic_lower[start]
+        trend[start] = 1.0
+    else:
+        # Resume from a saved (supertrend, trend) state
+        supertrend[start] = initial[0]
+        trend[start] = initial[1]
+    for i in range(start + 1, n):
+        if trend[i - 1] == 1.0:
+            if close[i] <= supertrend[i - 1]:
+                supertrend[i] = basic_upper[i]
+                trend[i] = -1.0
+            else:
+                value = basic_lower[i]
+                if value < supertrend[i - 1]:
+                    value = supertrend[i - 1]
+                supertrend[i] = value
+                trend[i] = 1.0
+        else:
+            if close[i] >= supertrend[i - 1]:
+                supertrend[i] = basic_lower[i]
+                trend[i] = 1.0
+            else:
+                value = basic_upper[i]
+                if value > supertrend[i - 1]:
+                    value = supertrend[i - 1]
+                supertrend[i] = value
+                trend[i] = -1.0
+
+
+def _smooth_loop(source, alpha, out):
+    n = len(source)
+    out[0] = 0.0
+    for i in range(1, n):
+        out[i] = out[i - 1] + alpha * (source[i] - out[i - 1])
+
+
+def _draw_lines_loop(ecore, div_fast, div_dir, wave, fastline):
+    n = len(ecore)
+    wave[0] = 0.0
+    fastline[0] = 0.0
+    for i in range(1, n):
+        wave[i] = wave[i - 1] + div_fast * (ecore[i] - wave[i - 1])
+        fastline[i] = fastline[i - 1] + div_dir * (wave[i] - fastline[i - 1])
+
+
+def _tr_switch_loop(rule, wave, fastline, prev_signal, prev_wave, colors):
+    n = len(wave)
+    for i in range(n):
+        colors[i] = _NOTRADE
+    cur_signal = prev_signal
+    cur_wave = prev_wave
+    for i in range(1, n):
+        w = wave[i]
+        f = fastline[i]
+        if rule == 1:
+            colors[i] = _BUY if w > 0 else _SELL
+        elif rule == 0:
+            colors[i] = _BUY if w > f else _SELL
+        elif rule == 2:
+            if w > 0:
+                colors[i] = _BUY if w > f else _NOTRADE
+            else:
+                colors[i] = _SELL if w < f else _NOTRADE
+        elif rule == 3:
+            if w > 0:
+                colors[i] = _BUY if w < f else _NOTRADE
+            else:
+                colors[i] = _SELL if w > f else _NOTRADE
+        elif rule == 4:
+            if w > 0:
+                colors[i] = _SELL if w < f else _NOTRADE
+            else:
+                colors[i] = _BUY if w > f else _NOTRADE
+        elif rule == 5:
+            w_prev = wave[i - 1]
+            if w_prev < 0 and w > 0:
+                if w > f:
+                    cur_signal = _BUY
+                    cur_wave = w
+                    colors[i] = _BUY
+            elif w_prev > 0 and w < 0:
+                if w < f:
+                    cur_signal = _SELL
+                    cur_wave = w
+                    colors[i] = _SELL
+            elif w > f:
+                if cur_signal == _BUY and w > cur_wave:
+                    colors[i] = _BUY
+                    cur_wave = w
+            elif w < f:
+                if cur_signal == _SELL and w < cur_wave:
+                    colors[i] = _SELL
+                    cur_wave = w
+        elif rule == 6:
+            w_prev = wave[i - 1]
+            # First signals in positive/negative zones
+            if w_prev < 0 and w > 0:
+                if w > f:
+                    cur_signal = _BUY
+                    cur_wave = w
+                    colors[i] = _BUY
+                    continue
+            elif w_prev > 0 and w < 0:
+                if w < f:
+                    cur_signal = _SELL
+                    cur_wave = w
+                    colors[i] = _SELL
+                    continue
+            # Second signals in same zone
+            if w > f and cur_signal == _BUY:
+                if w > cur_wave:
+                    colors[i] = _BUY
+                    cur_wave = w
+                else:
+                    colors[i] = _SELL
+                continue
+            if w < f and cur_signal == _SELL:
+                if w < cur_wave:
+                    colors[i] = _SELL
+                    cur_wave = w
+                else:
+                    colors[i] = _BUY
+                continue
+            # Reverse signals
+            if w < 0 and w > f:
+                colors[i] = _BUY
+            elif w > 0 and w < f:
+                colors[i] = _SELL
+
+
+if NUMBA_AVAILABLE:
+    _sar_impl = njit(cache=True)(_sar_loop)
+    _supertrend_impl = njit(cache=True)(_supertrend_loop)
+    _smooth_impl = njit(cache=True)(_smooth_loop)
+    _draw_lines_impl = njit(cache=True)(_draw_lines_loop)
+    _tr_switch_impl = njit(cache=True)(_tr_switch_loop)
+
+
+def _af_steps(first, acceleration, maximum):
+    # Acceleration factors after 0, 1, 2, ... consecutive new extremes, up to saturation
+    steps = [first]
+    while True:
+        step = min(steps[-1] + acceleration, maximum)
+        if step == steps[-1] or step != step:
+            return np.array(steps + [step], dtype=np.float64)
+        steps.append(step)
+
+
+def _two_state_trend(first, rising, falling):
+    # An uptrend continues on a rising high and a downtrend on a falling low, so a bar
+    # with only one of them forces the trend, both keep it and neither flips it
+    forced = rising != falling
+    flips = np.cumsum(~(rising | falling))
+    last = np.maximum.accumulate(np.where(forced, np.arange(len(rising)), -1))
+    anchor = np.maximum(last, 0)
+    base = np.where(last >= 0, rising[anchor], first)
+    since = flips - np.where(last >= 0, flips[anchor], 0)
+    return base ^ (since % 2 == 1)
+
+
+def _sar_numpy(high, low, acceleration, maximum, start, initial, checkpoint):
+    n = len(high)
+    sar = np.full(n, np.nan)
+    state = [0.0] * 4
+    if initial[3] == 0.0:
+        sar[start], ep0, af0, up0 = low[start], high[start], acceleration, True
+    else:
+        sar[start], ep0, af0, up0 = initial[0], initial[1], initial[2], initial[3] > 0
+
+    up = np.empty(n, dtype=bool)
+    ep = np.empty(n, dtype=np.float64)
+    af = np.empty(n, dtype=np.float64)
+    up[start], ep[start], af[start] = up0, ep0, af0
+    if start + 1 < n:
+        first = start + 1
+        extended = high[first] > ep0 if up0 else low[first] < ep0
+        up[first] = up0 == extended
+        up[first + 1:] = _two_state_trend(up[first], high[first + 1:] > high[first:-1],
+                                          low[first + 1:] < low[first:-1])
+        ep[first:] = np.where(up[first:], high[first:], low[first:])
+
+        # af restarts at every trend flip and grows with each bar of the run
+        positions = np.arange(first, n)
+        flipped = up[first:] != up[start:-1]
+        last_flip = np.maximum.accumulate(np.where(flipped, positions, -1))
+        resumed_steps = _af_steps(af0, acceleration, maximum)
+        flip_steps = _af_steps(acceleration, acceleration, maximum)
+        af[first:] = np.where(
+            last_flip < 0,
+            resumed_steps[np.minimum(positions - start, len(resumed_steps) - 1)],
+            flip_steps[np.minimum(positions - last_flip, len(flip_steps) - 1)]
+        )
+
+        # The SAR value depends on its own rounded predecessor, so solve the recurrence as
+        # a fixed point: start from every bar clamped to its bound and re-evaluate only the
+        # bars whose predecessor changed. Most bars clamp, so a few sweeps settle it; when
+        # long unclamped runs exhaust the budget the rest is finished sequentially.
+        rising = up[start:-1]
+        steps = af[start:-1]
+        extremes = ep[start:-1]
+        bounds = np.where(rising, np.fmin(low[start:-1], low[first:]), np.fmax(high[start:-1], high[first:]))
+        sar[first:] = bounds
+        active = np.arange(first, n)
+        budget = 2 * (n - first)
+        while len(active) and budget > 0:
+            k = active - first
+            prev = sar[active - 1]
+            value = prev + steps[k] * (extremes[k] - prev)
+            value = np.where(rising[k], np.where(value > bounds[k], bounds[k], value),
+                             np.where(value < bounds[k], bounds[k], value))
+            changed = value.view(np.int64) != sar[active].view(np.int64)
+            budget -= len(active)
+            sar[active[changed]] = value[changed]
+            active = active[changed] + 1
+            active = active[active < n]
+        if len(active):
+            # Every bar before the first unsettled one already satisfies the recurrence
+            settled = int(active[0])
+            values = []
+            value = float(sar[settled - 1])
+            for rising_bar, step, extreme, bound in zip(
+                    rising[settled - first:].tolist(), steps[settled - first:].tolist(),
+                    extremes[settled - first:].tolist(), bounds[settled - first:].tolist()):
+                value = value + step * (extreme - value)
+                if rising_bar:
+                    if value > bound:
+                        value = bound
+                elif value < bound:
+                    value = bound
+                values.append(value)
+            sar[settled:] = values
+
+    if start <= checkpoint < n:
+        state = [float(sar[checkpoint]), float(ep[checkpoint]), float(af[checkpoint]),
+                 1.0 if up[checkpoint] else -1.0]
+    return sar, state
+
+
+def _ratchet(seed, values, upward, gaps):
+    # Band that never moves against the trend: a value behind the previous one is
+    # replaced by it, and a NaN value (offsets in ``gaps``) restarts the ratchet
+    accumulate = np.maximum.accumulate if upward else np.minimum.accumulate
+    if not gaps:
+        # fmax/fmin also cover a NaN seed, which the first value simply replaces
+        return (np.fmax if upward else np.fmin)(accumulate(values), seed)
+    out = np.empty(len(values), dtype=np.float64)
+    lo = 0
+    for gap in [*gaps, len(values)]:
+        if gap > lo:
+            piece = values[lo:gap]
+            if np.isnan(seed):
+                out[lo:gap] = accumulate(piece)
+            else:
+                out[lo:gap] = accumulate(np.concatenate(([seed], piece)))[1:]
+        if gap < len(values):
+            out[gap] = np.nan
+        seed = np.nan
+        lo = gap + 1
+    return out
+
+
+def _supertrend_numpy(close, basic_upper, basic_lower, start, initial):
+    n = len(close)
+    supertrend = np.full(n, np.nan)
+    trend = np.full(n, np.nan)
+    if initial[1] == 0.0:
+        supertrend[start] = basic_lower[start]
+        trend[start] = 1.0
+    else:
+        supertrend[start] = initial[0]
+        trend[start] = initial[1]
+
+    # Ratchet the active band in growing chunks until the close crosses it, then flip
+    gaps = {True: np.flatnonzero(np.isnan(basic_lower)).tolist(),
+            False: np.flatnonzero(np.isnan(basic_upper)).tolist()}
+    pos = start
+    up = trend[start] == 1.0
+    width = 128
+    while pos < n - 1:
+        end = min(n, pos + 1 + width)
+        band_gaps = gaps[up]
+        first_gap = bisect_left(band_gaps, pos + 1)
+        band = _ratchet(supertrend[pos], (basic_lower if up else basic_upper)[pos + 1:end], up,
+                        [g - pos - 1 for g in band_gaps[first_gap:bisect_left(band_gaps, end, first_gap)]])
+        previous = np.concatenate(([supertrend[pos]], band[:-1]))
+        crossed = close[pos + 1:end] <= previous if up else close[pos + 1:end] >= previous
+        run = int(np.argmax(crossed))
+        if not crossed[run]:
+            run = len(crossed)
+        supertrend[pos + 1:pos + 1 + run] = band[:run]
+        trend[pos + 1:pos + 1 + run] = 1.0 if up else -1.0
+        if run == len(crossed):
+            pos = end - 1
+            width *= 2
+            continue
+        pos += run + 1
+        up = not up
+        supertrend[pos] = basic_lower[pos] if up else basic_upper[pos]
+        trend[pos] = 1.0 if up else -1.0
+        width = 128
+    return supertrend, trend
+
+
+def _segment_records(segment, values, seeds):
+    # True where a value exceeds its segment seed and every earlier value of the same
+    # segment; integer ranks keep the running maximum exact while the segment id in the
+    # high digits restarts it for every segment. A NaN seed is never exceeded.
+    seeds = np.where(np.isnan(seeds), np.inf, seeds)
+    used = np.unique(segment)
+    ids = np.concatenate((used, segment))
+    order = np.argsort(ids, kind='stable')
+    ranks = np.unique(np.concatenate((seeds[used], values))[order], return_inverse=True)[1]
+    keys = ids[order].astype(np.int64) * (int(ranks.max()) + 1) + ranks
+    record = np.empty(len(keys), dtype=bool)
+    record[0] = False
+    record[1:] = keys[1:] > np.maximum.accumulate(keys)[:-1]
+    merged = np.empty(len(keys), dtype=bool)
+    merged[order] = record
+    return merged[len(used):]
+
+
+def _tr_zone_numpy(rule, wave, above, below, prev_signal, prev_wave):
+    # TR_BetterTrend / TR_BetterFast: zone crossings confirmed by the fastline open a
+    # signal, later bars of the zone are compared with the running wave extreme
+    w = wave[1:]
+    positive = w > 0
+    negative = w < 0
+    cross_up = (wave[:-1] < 0) & positive
+    cross_down = (wave[:-1] > 0) & negative
+    start_buy = cross_up & above
+    start_sell = cross_down & below
+    opened = start_buy | start_sell
+    if rule == TR_CODE_BETTER_TREND:
+        colors = np.full(len(w), _NOTRADE)
+        rising = ~(cross_up | cross_down) & above
+        falling = ~(cross_up | cross_down) & below
+    else:
+        # Reverse signals unless the bar is handled by the zone's own signal
+        colors = np.where(negative & above, _BUY, np.where(positive & below, _SELL, _NOTRADE))
+        rising = ~opened & above
+        falling = ~opened & below
+    colors[start_buy] = _BUY
+    colors[start_sell] = _SELL
+
+    # Each confirmed crossing opens a new segment with its own signal and extreme
+    opens = np.flatnonzero(opened)
+    segment = np.cumsum(opened)
+    signals = np.concatenate(([prev_signal], np.where(start_buy[opens], _BUY, _SELL)))
+    extremes = np.concatenate(([prev_wave], w[opens]))
+    for signal, mask, sign, hit, miss in ((_BUY, rising, 1.0, _BUY, _SELL),
+                                          (_SELL, falling, -1.0, _SELL, _BUY)):
+        positions = np.flatnonzero(mask & (signals[segment] == signal))
+        if not len(positions):
+            continue
+        record = _segment_records(segment[positions], sign * w[positions], sign * extremes)
+        if rule == TR_CODE_BETTER_TREND:
+            colors[positions[record]] = hit
+        else:
+            colors[positions] = np.where(record, hit, miss)
+    return colors
+
+
+def _tr_switch_numpy(rule, wave, fastline, prev_signal, prev_wave):
+    colors = np.full(len(wave), _NOTRADE)
+    if len(wave) < 2:
+        return colors
+    w = wave[1:]
+    above = w > fastline[1:]
+    below = w < fastline[1:]
+    positive = w > 0
+    if rule == TR_CODE_ZONE:
+        colors[1:] = np.where(positive, _BUY, _SELL)
+    elif rule == TR_CODE_FAST:
+        colors[1:] = np.where(above, _BUY, _SELL)
+    elif rule == TR_CODE_STRONG_TREND:
+        colors[1:] = np.where(positive, np.where(above, _BUY, _NOTRADE), np.where(below, _SELL, _NOTRADE))
+    elif rule == TR_CODE_WEAK_TREND:
+        colors[1:] = np.where(positive, np.where(below, _BUY, _NOTRADE), np.where(above, _SELL, _NOTRADE))
+    elif rule == TR_CODE_FAST_ZONE_REVERSE:
+        colors[1:] = np.where(positive, np.where(below, _SELL, _NOTRADE), np.where(above, _BUY, _NOTRADE))
+    elif rule in (TR_CODE_BETTER_TREND, TR_CODE_BETTER_FAST):
+        colors[1:] = _tr_zone_numpy(rule, wave, above, below, prev_signal, prev_wave)
+    return colors
+
+
+def _as_float64(values) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def sar_kernel(high, low, acceleration: float, maximum: float) -> np.ndarray:
+    """
+    Parabolic SAR recurrence over High/Low arrays.
+
+    Args:
+        high: High prices (array-like, at least 1 element)
+        low: Low prices (array-like, same length as high)
+        acceleration (float): Acceleration factor step
+        maximum (float): Maximum acceleration factor
+
+    Returns:
+        np.ndarray: SAR values (float64)
+    """
+    return sar_kernel_resumable(high, low, acceleration, maximum)[0]
+
+
+def sar_kernel_resumable(high, low, acceleration: float, maximum: float,
+                         start: int = 0, initial=None, checkpoint: int = -1):
+    """
+    Parabolic SAR recurrence that can start from, and report, a saved state.
+
+    Args:
+        high: High prices (array-like)
+        low: Low prices (array-like, same length as high)
+        acceleration (float): Acceleration factor step
+        maximum (float): Maximum acceleration factor
+        start (int): Position where the recurrence starts; earlier values are NaN
+        initial (list, optional): (sar, ep, af, trend) after bar ``start``; when None
+            the recurrence is seeded from the bar itself
+        checkpoint (int): Position whose state is returned (-1 for none)
+
+    Returns:
+        tuple: (sar values, [sar, ep, af, trend] at ``checkpoint`` or None)
+    """
+    high = _as_float64(high)
+    low = _as_float64(low)
+    acceleration = float(acceleration)
+    maximum = float(maximum)
+    init = np.zeros(4, dtype=np.float64) if initial is None else _as_float64(initial)
+    state = np.zeros(4, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        sar = np.empty(len(high), dtype=np.float64)
+        _sar_impl(high, low, acceleration, maximum, sar, int(start), init, int(checkpoint), state)
+    elif acceleration > 0:
+        sar, state = _sar_numpy(high, low, acceleration, maximum, int(start), init, int(checkpoint))
+    else:
+        # Non-positive steps never saturate the acceleration factor, run the plain loop
+        sar = [0.0] * len(high)
+        state = state.tolist()
+        _sar_loop(high.tolist(), low.tolist(), acceleration, maximum, sar,
+                  int(start), init.tolist(), int(checkpoint), state)
+        sar = np.array(sar, dtype=np.float64)
+    return sar, ([float(v) for v in state] if checkpoint >= start else None)
+
+
+def supertrend_kernel(close, basic_upper, basic_lower,
+                      start: int = 0, initial=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    SuperTrend band-switching recurrence.
+
+    Args:
+        close: Close prices
+        basic_upper: Basic upper band (mid + multiplier * ATR)
+        basic_lower: Basic lower band (mid - multiplier * ATR)
+        start (int): Position where the recurrence starts; earlier values are NaN
+        initial (list, optional): (supertrend, trend) at bar ``start`` to resume from
+
+    Returns:
+        tuple: (supertrend, trend) float64 arrays, trend is 1.0 (up) or -1.0 (down)
+    """
+    close = _as_float64(close)
+    basic_upper = _as_float64(basic_upper)
+    basic_lower = _as_float64(basic_lower)
+    init = np.zeros(2, dtype=np.float64) if initial is None else _as_float64(initial)
+    n = len(close)
+    if NUMBA_AVAILABLE:
+        supertrend = np.empty(n, dtype=np.float64)
+        trend = np.empty(n, dtype=np.float64)
+        _supertrend_impl(close, basic_upper, basic_lower, supertrend, trend, int(start), init)
+        return supertrend, trend
+    return _supertrend_numpy(close, basic_upper, basic_lower, int(start), init)
+
+
+def smooth_kernel(source, alpha: float) -> np.ndarray:
+    """
+    Zero-seeded exponential smoothing: out[0] = 0, out[i] = out[i-1] + alpha * (source[i] - out[i-1]).
+
+    Args:
+        source: Input values
+        alpha (float): Smoothing factor
+
+    Returns:
+        np.ndarray: Smoothed values (float64)
+    """
+    source = _as_float64(source)
+    if len(source) == 0:
+        return source.copy()
+    alpha = float(alpha)
+    if NUMBA_AVAILABLE:
+        out = np.empty(len(source), dtype=np.float64)
+        _smooth_impl(source, alpha, out)
+        return out
+    out = [0.0] * len(source)
+    _smooth_loop(source.tolist(), alpha, out)
+    return np.array(out, dtype=np.float64)
+
+
+def draw_lines_kernel(ecore, div_fast: float, div_dir: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Wave and fastline smoothing of an ECORE series in a single pass.
+
+    Args:
+        ecore: ECORE values
+        div_fast (float): Smoothing factor for the wave line
+        div_dir (float): Smoothing factor for the fastline (applied to wave)
+
+    Returns:
+        tuple: (wave, fastline) float64 arrays
+    """
+    ecore = _as_float64(ecore)
+    n = len(ecore)
+    if n == 0:
+        return ecore.copy(), ecore.copy()
+    div_fast = float(div_fast)
+    div_dir = float(div_dir)
+    if NUMBA_AVAILABLE:
+        wave = np.empty(n, dtype=np.float64)
+        fastline = np.empty(n, dtype=np.float64)
+        _draw_lines_impl(ecore, div_fast, div_dir, wave, fastline)
+        return wave, fastline
+    wave = [0.0] * n
+    fastline = [0.0] * n
+    _draw_lines_loop(ecore.tolist(), div_fast, div_dir, wave, fastline)
+    return np.array(wave, dtype=np.float64), np.array(fastline, dtype=np.float64)
+
+
+def tr_switch_kernel(rule_code: int, wave, fastline,
+                     prev_signal: float, prev_wave: float) -> np.ndarray:
+    """
+    Wave trading-rule switch over wave/fastline arrays.
+
+    Args:
+        rule_code (int): One of the TR_CODE_* constants; unknown codes yield NOTRADE
+        wave: Wave values
+        fastline: Fastline values
+        prev_signal (float): Initial previous signal for the stateful rules
+        prev_wave (float): Initial previous wave value for the stateful rules
+
+    Returns:
+        np.ndarray: Signal colors (NOTRADE/BUY/SELL) as float64
+    """
+    wave = _as_float64(wave)
+    fastline = _as_float64(fastline)
+    rule_code = int(rule_code)
+    prev_signal = float(prev_signal)
+    prev_wave = float(prev_wave)
+    if NUMBA_AVAILABLE:
+        colors = np.empty(len(wave), dtype=np.float64)
+        _tr_switch_impl(rule_code, wave, fastline, prev_signal, prev_wave, colors)
+        return colors
+    return _tr_switch_numpy(rule_code, wave, fastline, prev_signal, prev_wave)
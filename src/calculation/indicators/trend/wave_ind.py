@@ -56,6 +56,11 @@ import pandas as pd
 from src.calculation.indicators.base_indicator import PriceType
 from src.common import logger
 from src.common.constants import BUY,SELL,NOTRADE
+from src.calculation.indicators.trend.trend_kernels import (
+    smooth_kernel, draw_lines_kernel, tr_switch_kernel,
+    TR_CODE_NONE, TR_CODE_FAST, TR_CODE_ZONE, TR_CODE_STRONG_TREND, TR_CODE_WEAK_TREND,
+    TR_CODE_FAST_ZONE_REVERSE, TR_CODE_BETTER_TREND, TR_CODE_BETTER_FAST
+)
 
 
 """Trading Rules for Wave Momentum"""
@@ -96,6 +101,17 @@ class ENUM_GLOBAL_TR(Enum):
     G_TR_LONG_ZONE_REVERSE = "Long Zone Reverse"
 
 
+# Kernel codes for the trading rules handled by tr_switch_kernel
+_TR_RULE_CODES = {
+    ENUM_MOM_TR.TR_Fast: TR_CODE_FAST,
+    ENUM_MOM_TR.TR_Zone: TR_CODE_ZONE,
+    ENUM_MOM_TR.TR_StrongTrend: TR_CODE_STRONG_TREND,
+    ENUM_MOM_TR.TR_WeakTrend: TR_CODE_WEAK_TREND,
+    ENUM_MOM_TR.TR_FastZoneReverse: TR_CODE_FAST_ZONE_REVERSE,
+    ENUM_MOM_TR.TR_BetterTrend: TR_CODE_BETTER_TREND,
+    ENUM_MOM_TR.TR_BetterFast: TR_CODE_BETTER_FAST,
+}
+
 
 @dataclass
 class WaveParameters:
@@ -188,16 +204,12 @@ def calculate_ecore(div_long: float, price: pd.Series) -> pd.Series:
         pd.Series: Calculated ECORE values
     """
 
-    # Initialize ECORE series with zeros
-    ecore = pd.Series(0.0, index=price.index)
-
     # Calculate initial diff
     prev_price = price.shift(1)
     diff = (price / prev_price - 1) * 100
 
-    # Calculate ECORE recursively
-    for i in range(1, len(price)):
-        ecore.loc[ecore.index[i]] = ecore.iloc[i - 1] + div_long * (diff.iloc[i] - ecore.iloc[i - 1])
+    # Calculate ECORE recursively on plain arrays (Numba JIT when available)
+    ecore = pd.Series(smooth_kernel(diff.to_numpy(), div_long), index=price.index)
 
     return ecore
 
@@ -215,12 +227,9 @@ def calc_draw_lines(div_fast: float, div_dir: float, ecore: pd.Series) -> tuple[
     :return: A tuple of two pandas Series, where the first element is the 'wave' series and the
         second element is the 'fastline' series.
     """
-    wave = pd.Series(0.0, index=ecore.index)
-    fastline = pd.Series(0.0, index=ecore.index)
-
-    for i in range(1, len(ecore)):
-        wave.loc[wave.index[i]] = wave.iloc[i - 1] + div_fast * (ecore.iloc[i] - wave.iloc[i - 1])
-        fastline.loc[fastline.index[i]] = fastline.iloc[i - 1] + div_dir * (wave.iloc[i] - fastline.iloc[i - 1])
+    wave_values, fastline_values = draw_lines_kernel(ecore.to_numpy(), div_fast, div_dir)
+    wave = pd.Series(wave_values, index=ecore.index)
+    fastline = pd.Series(fastline_values, index=ecore.index)
 
     return wave, fastline
 
@@ -241,129 +250,15 @@ def tr_switch(tr_rule: ENUM_MOM_TR, wave: pd.Series, fastline: pd.Series,
         colors: Series to store signal colors/values 
     """
 
-    #
-    colors = pd.Series(NOTRADE, index=wave.index)
-    
-    # Initialize previous values for tracking
-    current_prev_signal = prev_signal
-    current_prev_wave = prev_wave
-
     if len(wave) != len(fastline):
         raise ValueError("wave and fastline must have same length")
 
-    for index in range(1, len(wave)):
-        if tr_rule == ENUM_MOM_TR.TR_Zone:
-            colors.loc[colors.index[index]] = BUY if wave.iloc[index] > 0 else SELL
-
-        elif tr_rule == ENUM_MOM_TR.TR_Fast:
-            colors.loc[colors.index[index]] = BUY if wave.iloc[index] > fastline.iloc[index] else SELL
-
-        elif tr_rule == ENUM_MOM_TR.TR_StrongTrend:
-            if wave.iloc[index] > 0:
-                # PlusZone
-                if wave.iloc[index] > fastline.iloc[index]:
-                    colors.loc[colors.index[index]] = BUY
-                else:
-                    colors.loc[colors.index[index]] = NOTRADE
-            else:
-                # MinusZone 
-                if wave.iloc[index] < fastline.iloc[index]:
-                    colors.loc[colors.index[index]] = SELL
-                else:
-                    colors.loc[colors.index[index]] = NOTRADE
-
-        elif tr_rule == ENUM_MOM_TR.TR_WeakTrend:
-            if wave.iloc[index] > 0:
-                # PlusZone
-                if wave.iloc[index] < fastline.iloc[index]:
-                    colors.loc[colors.index[index]] = BUY
-                else:
-                    colors.loc[colors.index[index]] = NOTRADE
-            else:
-                # MinusZone
-                if wave.iloc[index] > fastline.iloc[index]:
-                    colors.loc[colors.index[index]] = SELL
-                else:
-                    colors.loc[colors.index[index]] = NOTRADE
-
-        elif tr_rule == ENUM_MOM_TR.TR_FastZoneReverse:
-            if wave.iloc[index] > 0:
-                # PlusZone
-                if wave.iloc[index] < fastline.iloc[index]:
-                    colors.loc[colors.index[index]] = SELL
-                else:
-                    colors.loc[colors.index[index]] = NOTRADE
-            else:
-                # MinusZone
-                if wave.iloc[index] > fastline.iloc[index]:
-                    colors.loc[colors.index[index]] = BUY
-                else:
-                    colors.loc[colors.index[index]] = NOTRADE
-
-        elif tr_rule == ENUM_MOM_TR.TR_BetterTrend:
-            if (wave.iloc[index - 1] < 0) and (wave.iloc[index] > 0):
-                if wave.iloc[index] > fastline.iloc[index]:
-                    current_prev_signal = BUY
-                    current_prev_wave = wave.iloc[index]
-                    colors.loc[colors.index[index]] = BUY
-            elif (wave.iloc[index - 1] > 0) and (wave.iloc[index] < 0):
-                if wave.iloc[index] < fastline.iloc[index]:
-                    current_prev_signal = SELL
-                    current_prev_wave = wave.iloc[index]
-                    colors.loc[colors.index[index]] = SELL
-            elif wave.iloc[index] > fastline.iloc[index]:
-                if current_prev_signal == BUY and wave.iloc[index] > current_prev_wave:
-                    colors.loc[colors.index[index]] = BUY
-                    current_prev_wave = wave.iloc[index]
-            elif wave.iloc[index] < fastline.iloc[index]:
-                if current_prev_signal == SELL and wave.iloc[index] < current_prev_wave:
-                    colors.loc[colors.index[index]] = SELL
-                    current_prev_wave = wave.iloc[index]
-            else:
-                colors.loc[colors.index[index]] = NOTRADE
-
-        elif tr_rule == ENUM_MOM_TR.TR_BetterFast:
-            # First signals in positive/negative zones
-            if (wave.iloc[index - 1] < 0) and (wave.iloc[index] > 0):
-                if wave.iloc[index] > fastline.iloc[index]:
-                    current_prev_signal = BUY
-                    current_prev_wave = wave.iloc[index]
-                    colors.loc[colors.index[index]] = BUY
-                    continue
-            elif (wave.iloc[index - 1] > 0) and (wave.iloc[index] < 0):
-                if wave.iloc[index] < fastline.iloc[index]:
-                    current_prev_signal = SELL
-                    current_prev_wave = wave.iloc[index]
-                    colors.loc[colors.index[index]] = SELL
-                    continue
-
-            # Second signals in same zone
-            if wave.iloc[index] > fastline.iloc[index]:
-                if current_prev_signal == BUY:
-                    if wave.iloc[index] > current_prev_wave:
-                        colors.loc[colors.index[index]] = BUY
-                        current_prev_wave = wave.iloc[index]
-                    else:
-                        colors.loc[colors.index[index]] = SELL
-                    continue
-
-            if wave.iloc[index] < fastline.iloc[index]:
-                if current_prev_signal == SELL:
-                    if wave.iloc[index] < current_prev_wave:
-                        colors.loc[colors.index[index]] = SELL
-                        current_prev_wave = wave.iloc[index]
-                    else:
-                        colors.loc[colors.index[index]] = BUY
-                    continue
-
-            # Reverse signals
-            if (wave.iloc[index] < 0) and (wave.iloc[index] > fastline.iloc[index]):
-                colors.loc[colors.index[index]] = BUY
-                continue
-
-            if (wave.iloc[index] > 0) and (wave.iloc[index] < fastline.iloc[index]):
-                colors.loc[colors.index[index]] = SELL
-                continue
+    # Rules without a kernel implementation (Rost family) leave every bar at NOTRADE
+    rule_code = _TR_RULE_CODES.get(tr_rule, TR_CODE_NONE)
+    colors = pd.Series(
+        tr_switch_kernel(rule_code, wave.to_numpy(), fastline.to_numpy(), prev_signal, prev_wave),
+        index=wave.index,
+    )
 
     return colors
 
@@ -20,6 +20,7 @@ import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 from ..base_indicator import BaseIndicator, PriceType
+from ..shared_intermediates import ewm_mean, true_range
 
 
 def calculate_true_range(df: pd.DataFrame) -> pd.Series:
@@ -32,22 +33,12 @@ def calculate_true_range(df: pd.DataFrame) -> pd.Series:
     Returns:
         pd.Series: True Range values
     """
-    high = df['High']
-    low = df['Low']
-    close_prev = df['Close'].shift(1)
-    
     # True Range is the greatest of:
     # 1. Current High - Current Low
     # 2. |Current High - Previous Close|
     # 3. |Current Low - Previous Close|
-    
-    tr1 = high - low
-    tr2 = np.abs(high - close_prev)
-    tr3 = np.abs(low - close_prev)
-    
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    
-    return true_range
+    # Computed once per OHLC frame when several indicators share it
+    return true_range(df)
 
 
 def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -72,7 +63,7 @@ def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     true_range = calculate_true_range(df)
     
     # Calculate ATR using exponential moving average
-    atr = true_range.ewm(span=period, adjust=False).mean()
+    atr = ewm_mean(true_range, period)
     
     return atr
 
@@ -20,6 +20,7 @@ import numpy as np
 from src.common import logger
 from src.common.constants import TradingRule, NOTRADE, BUY, SELL, EMPTY_VALUE
 from ..base_indicator import BaseIndicator, PriceType
+from ..shared_intermediates import pct_returns
 
 
 def calculate_stdev(price_series: pd.Series, period: int = 20) -> pd.Series:
@@ -41,7 +42,7 @@ def calculate_stdev(price_series: pd.Series, period: int = 20) -> pd.Series:
         return pd.Series(index=price_series.index, dtype=float)
     
     # Calculate price changes
-    price_changes = price_series.pct_change(fill_method=None).dropna()
+    price_changes = pct_returns(price_series).dropna()
     
     if len(price_changes) < period:
         logger.print_warning("Not enough price change data for Standard Deviation calculation")
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+# src/calculation/parameter_sweep.py
+
+"""
+Parameter sweep for indicator rules.
+
+A sweep spec uses the CLI rule syntax ('rsi:14,30,70,close') where every
+parameter may be a '|' separated list or an inclusive 'start..stop[..step]'
+range, e.g. 'rsi:7..21..7,20|30,70|80,close'. The spec expands to one rule
+string per combination; each is parsed by the same parse_*_parameters
+functions as --rule, so any indicator can be swept.
+
+Every combination is calculated with calculate_indicators_batch and its
+Direction signal is scored with the vectorized backtest. Each chunk of
+combinations runs inside one shared_intermediates() block, so e.g. the price
+differences of all RSI periods, or the RSI of one period for all thresholds,
+are computed once per chunk. A single worker evaluates all combinations as
+one chunk.
+
+With several workers the combinations are split into contiguous chunks
+(neighbours share most parameters) that run in a process pool. The OHLCV columns are
+placed in one shared memory block that every worker maps read-only, so the
+data is not pickled to each task.
+"""
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.common import logger
+from src.common.constants import NOTRADE
+from .indicator_parameters import parse_rule_parameters
+from .batch_indicator_calculation import calculate_indicators_batch
+from .indicators.shared_intermediates import shared_intermediates
+from .trade_ledger import resolve_signal_values
+from .vectorized_backtest import run_vectorized_backtest
+
+SWEEP_METRICS = ['sharpe_ratio', 'total_return_pct', 'max_drawdown_pct', 'win_rate_pct']
+
+DEFAULT_SWEEP_DIR = Path('data/sweeps')
+
+# Chunks per worker: enough to balance uneven chunks, few enough to keep reuse per chunk
+_CHUNKS_PER_WORKER = 4
+
+_OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Shared OHLCV frame of a pool worker (set by _attach_shared_ohlcv)
+_WORKER_DATA: Dict[str, object] = {}
+
+
+def _expand_values(token: str) -> List[str]:
+    """Expands one parameter token: a value, 'a|b|c' or 'start..stop[..step]'."""
+    token = token.strip()
+    if '..' in token:
+        parts = [part.strip() for part in token.split('..')]
+        if len(parts) not in (2, 3):
+            raise ValueError(f"Invalid range '{token}', expected start..stop or start..stop..step")
+        is_int = all(part.lstrip('+-').isdigit() for part in parts)
+        start, stop = float(parts[0]), float(parts[1])
+        step = float(parts[2]) if len(parts) == 3 else 1.0
+        if step <= 0 or stop < start:
+            raise ValueError(f"Invalid range '{token}', expected start <= stop and a positive step")
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        values = start + step * np.arange(count)
+        if is_int:
+            return [str(int(value)) for value in values]
+        return [f"{round(value, 10):g}" for value in values]
+    if '|' in token:
+        return [value.strip() for value in token.split('|') if value.strip()]
+    return [token]
+
+
+def expand_sweep_spec(spec: str) -> List[str]:
+    """
+    Expands a sweep spec into rule strings, one per parameter combination.
+
+    Args:
+        spec (str): Rule with parameter lists/ranges, e.g. 'rsi:7..21..7,20|30,70|80,close'
+
+    Returns:
+        list: Rule strings such as 'rsi:7,20,70,close', in product order
+    """
+    if ':' not in spec:
+        raise ValueError(f"Sweep spec '{spec}' has no parameters, expected e.g. 'rsi:7..21..7,30,70,close'")
+    name, params_str = spec.split(':', 1)
+    grid = [_expand_values(token) for token in params_str.split(',')]
+    rule_strings = [f"{name.strip()}:{','.join(combo)}" for combo in itertools.product(*grid)]
+    for rule_str in rule_strings:
+        # Fail early on invalid parameters
+        try:
+            parse_rule_parameters(rule_str)
+        except ValueError as e:
+            raise ValueError(f"Invalid parameters in sweep combination '{rule_str}': {e}") from None
+    return rule_strings
+
+
+def _evaluate_chunk(ohlcv_df: pd.DataFrame, point: float, rule_strings: Sequence[str],
+                    commission: float, short_on_sell: bool) -> tuple[pd.DataFrame, Dict[str, str]]:
+    """Backtests the Direction signal of every rule string; returns (summary, errors)."""
+    signals = np.full((len(ohlcv_df), len(rule_strings)), NOTRADE)
+    errors = {}
+    evaluated = []
+    with shared_intermediates():
+        for j, rule_str in enumerate(rule_strings):
+            try:
+                result_df, _ = calculate_indicators_batch(ohlcv_df, point, [rule_str])
+                values = resolve_signal_values(result_df, 'Direction')
+                if values is not None:
+                    signals[:, j] = values
+                evaluated.append(j)
+            except Exception as e:
+                errors[rule_str] = str(e)
+
+    labels = [rule_strings[j] for j in evaluated]
+    backtest = run_vectorized_backtest(ohlcv_df['Close'].to_numpy(dtype=np.float64), signals[:, evaluated],
+                                       commission=commission, short_on_sell=short_on_sell, param_labels=labels)
+    return backtest.summary(), errors
+
+
+def _share_ohlcv(ohlcv_df: pd.DataFrame) -> tuple[shared_memory.SharedMemory, dict]:
+    """Copies the OHLCV columns (and a datetime index) into one shared memory block."""
+    n_rows, n_cols = len(ohlcv_df), len(_OHLCV_COLUMNS)
+    is_datetime = isinstance(ohlcv_df.index, pd.DatetimeIndex)
+    size = max(8 * n_rows * (n_cols + (1 if is_datetime else 0)), 1)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    values = np.ndarray((n_rows, n_cols), dtype=np.float64, buffer=shm.buf)
+    for i, col in enumerate(_OHLCV_COLUMNS):
+        values[:, i] = ohlcv_df[col].to_numpy(dtype=np.float64)
+    tz = None
+    if is_datetime:
+        index_values = np.ndarray((n_rows,), dtype=np.int64, buffer=shm.buf, offset=8 * n_rows * n_cols)
+        index_values[:] = ohlcv_df.index.as_unit('ns').asi8
+        tz = str(ohlcv_df.index.tz) if ohlcv_df.index.tz is not None else None
+    meta = {'name': shm.name, 'n_rows': n_rows, 'is_datetime': is_datetime, 'tz': tz}
+    return shm, meta
+
+
+def _frame_from_shared(shm: shared_memory.SharedMemory, meta: dict) -> pd.DataFrame:
+    """Read-only OHLCV frame over a shared memory block created by _share_ohlcv."""
+    n_rows, n_cols = meta['n_rows'], len(_OHLCV_COLUMNS)
+    values = np.ndarray((n_rows, n_cols), dtype=np.float64, buffer=shm.buf)
+    values.flags.writeable = False
+    if meta['is_datetime']:
+        index_values = np.ndarray((n_rows,), dtype=np.int64, buffer=shm.buf, offset=8 * n_rows * n_cols)
+        index = pd.DatetimeIndex(index_values.view('M8[ns]'))
+        if meta['tz'] is not None:
+            index = index.tz_localize('UTC').tz_convert(meta['tz'])
+    else:
+        index = pd.RangeIndex(n_rows)
+    return pd.DataFrame(values, index=index, columns=_OHLCV_COLUMNS, copy=False)
+
+
+def _attach_shared_ohlcv(meta: dict) -> None:
+    """Pool initializer: maps the shared OHLCV block once per worker."""
+    shm = shared_memory.SharedMemory(name=meta['name'])
+    _WORKER_DATA['shm'] = shm  # Keep the mapping alive for the worker's lifetime
+    _WORKER_DATA['df'] = _frame_from_shared(shm, meta)
+
+
+def _evaluate_chunk_in_worker(point: float, rule_strings: Sequence[str], commission: float,
+                              short_on_sell: bool) -> tuple[pd.DataFrame, Dict[str, str]]:
+    return _evaluate_chunk(_WORKER_DATA['df'], point, rule_strings, commission, short_on_sell)
+
+
+def _chunk(items: Sequence[str], n_chunks: int) -> List[List[str]]:
+    """Splits items into at most n_chunks contiguous chunks of similar size."""
+    size = max(1, math.ceil(len(items) / max(n_chunks, 1)))
+    return [list(items[i:i + size]) for i in range(0, len(items), size)]
+
+
+def run_parameter_sweep(ohlcv_df: pd.DataFrame, point: float, rule_strings: Sequence[str],
+                        workers: int = 1, metric: str = 'sharpe_ratio', commission: float = 0.0,
+                        short_on_sell: bool = False) -> pd.DataFrame:
+    """
+    Evaluates every rule string and ranks the combinations by ``metric``.
+
+    Args:
+        ohlcv_df (pd.DataFrame): OHLCV data ('Volume' or 'TickVolume'). Not modified.
+        point (float): Instrument point size
+        rule_strings (Sequence[str]): Rule strings, e.g. from expand_sweep_spec
+        workers (int): Worker processes; 1 evaluates in this process
+        metric (str): Ranking metric, one of SWEEP_METRICS (higher is better)
+        commission (float): Backtest commission as a fraction of traded notional
+        short_on_sell (bool): Go short on SELL instead of flat
+
+    Returns:
+        pd.DataFrame: One row per evaluated combination with rank, rule, the parsed
+            parameters and the backtest summary, sorted by rank
+    """
+    if metric not in SWEEP_METRICS:
+        raise ValueError(f"Unknown sweep metric '{metric}', expected one of {SWEEP_METRICS}")
+    if not rule_strings:
+        raise ValueError("No parameter combinations to evaluate")
+    if ohlcv_df is None or ohlcv_df.empty:
+        raise ValueError("No data available for the parameter sweep")
+    volume_col = 'Volume' if 'Volume' in ohlcv_df.columns else 'TickVolume'
+    missing = [col for col in ['Open', 'High', 'Low', 'Close', volume_col] if col not in ohlcv_df.columns]
+    if missing:
+        raise ValueError(f"Input DataFrame is missing columns: {missing}")
+
+    # Only the OHLCV columns are needed; duplicates would change the signal length
+    data = ohlcv_df[['Open', 'High', 'Low', 'Close', volume_col]].set_axis(_OHLCV_COLUMNS, axis=1)
+    if data.index.duplicated().any():
+        data = data[~data.index.duplicated(keep='first')]
+
+    workers = max(1, min(workers, len(rule_strings), os.cpu_count() or 1))
+    summaries, errors = [], {}
+
+    if workers == 1:
+        # One chunk: every combination reuses the intermediates of the others
+        summary, errors = _evaluate_chunk(data, point, rule_strings, commission, short_on_sell)
+        summaries.append(summary)
+    else:
+        chunks = _chunk(rule_strings, workers * _CHUNKS_PER_WORKER)
+        shm, meta = _share_ohlcv(data)
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_ohlcv,
+                                     initargs=(meta,)) as executor:
+                futures = [executor.submit(_evaluate_chunk_in_worker, point, chunk, commission, short_on_sell)
+                           for chunk in chunks]
+                for future in as_completed(futures):
+                    summary, chunk_errors = future.result()
+                    summaries.append(summary)
+                    errors.update(chunk_errors)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    for rule_str, error in errors.items():
+        logger.print_warning(f"Sweep: {rule_str} failed: {error}")
+
+    summary = pd.concat(summaries) if summaries else pd.DataFrame(columns=SWEEP_METRICS)
+    params = pd.DataFrame([parse_rule_parameters(rule_str)[1] for rule_str in summary.index],
+                          index=summary.index)
+    results = pd.concat([params, summary], axis=1).rename_axis('rule').reset_index()
+    # Keep the expansion order among equal scores so ranking is deterministic
+    order = {rule_str: i for i, rule_str in enumerate(rule_strings)}
+    results['_order'] = results['rule'].map(order)
+    results = results.sort_values([metric, '_order'], ascending=[False, True], na_position='last',
+                                  kind='mergesort').drop(columns='_order').reset_index(drop=True)
+    results.insert(0, 'rank', np.arange(1, len(results) + 1))
+    return results
+
+
+def write_sweep_results(results: pd.DataFrame, output_path: Optional[str] = None,
+                        rule_name: str = 'sweep') -> Path:
+    """
+    Writes ranked sweep results to parquet.
+
+    Args:
+        results (pd.DataFrame): Output of run_parameter_sweep
+        output_path (str, optional): Target file; by default
+            data/sweeps/<rule_name>_sweep_<timestamp>.parquet
+        rule_name (str): Rule name used in the default file name
+
+    Returns:
+        Path: Written file
+    """
+    if output_path is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        path = DEFAULT_SWEEP_DIR / f"{rule_name}_sweep_{timestamp}.parquet"
+    else:
+        path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    results.to_parquet(path, index=False)
+    return path
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# src/calculation/trade_ledger.py
+
+"""
+Vectorized trade ledger built from an indicator signal column.
+
+The long-only position logic used by the trading metrics is:
+- a BUY signal opens a position, or closes the open one and re-enters at the
+  same bar (reversal);
+- a SELL signal closes the open position;
+- bars whose price (or volume, when given) is missing or not positive are skipped;
+- a position still open at the end is closed at the last price.
+
+After every BUY the position is open and after every SELL it is flat, so a
+trade closes at each signal event that directly follows a BUY event. This
+turns the bar-by-bar state machine into a few array operations over the
+event positions.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.common.constants import BUY, SELL, NOTRADE
+
+# Columns tried when the requested signal column is missing (Wave and others)
+ALTERNATIVE_SIGNAL_COLUMNS = ['_Signal', '_Direction', 'Direction', 'Signal']
+
+_STRING_SIGNAL_MAP = {'buy': BUY, 'sell': SELL, 'notrade': NOTRADE, '0': NOTRADE, '1': BUY, '2': SELL}
+
+
+@dataclass
+class TradeLedger:
+    """Closed trades and per-bar strategy returns of one signal series."""
+    entry_positions: np.ndarray   # Bar position of each entry
+    exit_positions: np.ndarray    # Bar position of each exit
+    entry_prices: np.ndarray
+    exit_prices: np.ndarray
+    returns: np.ndarray           # Trade returns in percent
+    holding_bars: np.ndarray      # Bars between entry and exit
+    bar_returns: np.ndarray       # Fractional return of every bar after the first (0 when flat)
+    volumes: Optional[np.ndarray] = None  # Mean of entry and exit volume, when built with volumes
+
+    @property
+    def num_trades(self) -> int:
+        return len(self.returns)
+
+    @classmethod
+    def empty(cls, with_volumes: bool = False) -> 'TradeLedger':
+        """Ledger without trades (missing signal column or invalid data)."""
+        ints, floats = np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+        return cls(ints, ints.copy(), floats, floats.copy(), floats.copy(), ints.copy(), floats.copy(),
+                   floats.copy() if with_volumes else None)
+
+
+def resolve_signal_values(df: pd.DataFrame, signal_col: str) -> Optional[np.ndarray]:
+    """
+    Returns the signal column as BUY/SELL/NOTRADE values.
+
+    Falls back to the alternative signal columns when ``signal_col`` is missing,
+    maps string signals ('buy', 'sell', '1', ...) and truncates numeric signals
+    to integers with NaN treated as NOTRADE.
+
+    Args:
+        df (pd.DataFrame): Data with a signal column
+        signal_col (str): Preferred signal column
+
+    Returns:
+        np.ndarray or None: Signal values, None when no signal column exists
+    """
+    actual_signal_col = signal_col
+    if signal_col not in df.columns:
+        for col in ALTERNATIVE_SIGNAL_COLUMNS:
+            if col in df.columns:
+                actual_signal_col = col
+                break
+        else:
+            return None
+
+    signals = df[actual_signal_col].fillna(0)
+    if signals.dtype == 'object':
+        signals = signals.str.lower().map(_STRING_SIGNAL_MAP).fillna(NOTRADE)
+    else:
+        signals = signals.astype(int)
+    return signals.to_numpy(dtype=np.float64)
+
+
+def build_trade_ledger(prices, signals, volumes=None) -> TradeLedger:
+    """
+    Builds the trade ledger in one pass over the price and signal arrays.
+
+    Args:
+        prices (array-like): Prices (e.g. Close)
+        signals (array-like): BUY/SELL/NOTRADE values (see resolve_signal_values)
+        volumes (array-like, optional): Volumes; bars without a positive volume are
+            skipped and each trade records the mean of its entry and exit volume
+
+    Returns:
+        TradeLedger: Trades and per-bar returns
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    signals = np.asarray(signals, dtype=np.float64)
+    n = len(prices)
+    if n == 0:
+        return TradeLedger.empty(with_volumes=volumes is not None)
+
+    price_ok = ~np.isnan(prices) & (prices > 0)
+    valid = np.zeros(n, dtype=bool)
+    valid[1:] = price_ok[1:] & price_ok[:-1]
+    end_ok = bool(price_ok[-1])
+    if volumes is not None:
+        volumes = np.asarray(volumes, dtype=np.float64)
+        volume_ok = ~np.isnan(volumes) & (volumes > 0)
+        valid &= volume_ok
+        end_ok = end_ok and bool(volume_ok[-1])
+
+    is_buy = valid & (signals == BUY)
+    is_sell = valid & (signals == SELL)
+    events = np.flatnonzero(is_buy | is_sell)
+    event_is_buy = is_buy[events]
+
+    # A trade closes at every event that follows a BUY event
+    closing = np.flatnonzero(event_is_buy[:-1]) + 1
+    entry_positions = events[closing - 1]
+    exit_positions = events[closing]
+    if len(events) and event_is_buy[-1] and end_ok:
+        entry_positions = np.append(entry_positions, events[-1])
+        exit_positions = np.append(exit_positions, n - 1)
+
+    entry_prices = prices[entry_positions]
+    exit_prices = prices[exit_positions]
+    returns = (exit_prices - entry_prices) / entry_prices * 100
+
+    # Position state before each bar: state after the last earlier event
+    state = np.full(n, np.nan)
+    state[is_buy] = 1.0
+    state[is_sell] = 0.0
+    last_event = np.maximum.accumulate(np.where(np.isnan(state), -1, np.arange(n)))
+    state_after = np.where(last_event >= 0, state[np.maximum(last_event, 0)], 0.0)
+    state_before = np.concatenate(([0.0], state_after[:-1]))
+    held = valid & (is_buy | (state_before == 1.0))
+
+    bar_returns = np.zeros(n - 1)
+    held_bars = held[1:]
+    bar_returns[held_bars] = (prices[1:][held_bars] - prices[:-1][held_bars]) / prices[:-1][held_bars]
+
+    trade_volumes = None
+    if volumes is not None:
+        trade_volumes = (volumes[entry_positions] + volumes[exit_positions]) / 2
+
+    return TradeLedger(
+        entry_positions=entry_positions,
+        exit_positions=exit_positions,
+        entry_prices=entry_prices,
+        exit_prices=exit_prices,
+        returns=returns,
+        holding_bars=exit_positions - entry_positions,
+        bar_returns=bar_returns,
+        volumes=trade_volumes,
+    )
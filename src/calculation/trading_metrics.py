@@ -11,6 +11,46 @@ import numpy as np
 from typing import Dict, Tuple, Optional
 from src.common import logger
 from src.common.constants import BUY, SELL, NOTRADE
+from .trade_ledger import TradeLedger, build_trade_ledger, resolve_signal_values
+
+# Monte Carlo bootstrap defaults
+DEFAULT_MC_SIMULATIONS = 1000
+MC_BLOCK_BYTES = 64 * 1024 * 1024  # Memory bound of one block of resampled trades
+
+
+def bootstrap_final_returns(trade_returns, n_simulations: int = DEFAULT_MC_SIMULATIONS,
+                            seed: Optional[int] = None,
+                            max_block_bytes: int = MC_BLOCK_BYTES) -> np.ndarray:
+    """
+    Bootstraps compounded strategy returns by resampling trades with replacement.
+    
+    Each simulation draws len(trade_returns) trades and compounds them. The
+    simulations are drawn as (block x n_trades) index matrices whose size stays
+    under max_block_bytes, so 100k simulations need no more memory than a few.
+    
+    Args:
+        trade_returns (array-like): Trade returns in percent
+        n_simulations (int): Number of simulations
+        seed (int, optional): Random seed for reproducible results
+        max_block_bytes (int): Memory bound of one block of resampled trades
+    
+    Returns:
+        np.ndarray: Final compounded return of every simulation (fraction, 0.1 = +10%)
+    """
+    growth = 1 + np.asarray(trade_returns, dtype=np.float64) / 100
+    n_trades = len(growth)
+    results = np.empty(n_simulations)
+    if n_trades == 0 or n_simulations <= 0:
+        return results[:0]
+    
+    rng = np.random.default_rng(seed)
+    # Index matrix (int64) plus gathered growth factors (float64) per row
+    block_rows = max(1, min(n_simulations, max_block_bytes // (16 * n_trades)))
+    for start in range(0, n_simulations, block_rows):
+        stop = min(start + block_rows, n_simulations)
+        sample = rng.integers(0, n_trades, size=(stop - start, n_trades))
+        results[start:stop] = growth[sample].prod(axis=1) - 1
+    return results
 
 
 class TradingMetricsCalculator:
@@ -18,14 +58,20 @@ class TradingMetricsCalculator:
     Comprehensive trading metrics calculator for strategy evaluation.
     """
     
-    def __init__(self, risk_free_rate: float = 0.02):
+    def __init__(self, risk_free_rate: float = 0.02,
+                 mc_simulations: int = DEFAULT_MC_SIMULATIONS,
+                 mc_seed: Optional[int] = None):
         """
         Initialize the trading metrics calculator.
         
         Args:
             risk_free_rate (float): Annual risk-free rate (default: 2%)
+            mc_simulations (int): Monte Carlo simulations (default: 1000)
+            mc_seed (int, optional): Monte Carlo random seed (default: None, not reproducible)
         """
         self.risk_free_rate = risk_free_rate
+        self.mc_simulations = mc_simulations
+        self.mc_seed = mc_seed
     
     def calculate_all_metrics(self, df: pd.DataFrame, 
                             price_col: str = 'Close',
@@ -57,33 +103,37 @@ class TradingMetricsCalculator:
             # Calculate trade counts
             buy_count, sell_count, total_trades = self._calculate_trade_counts(df, signal_col)
             
+            # Build the trade ledger once; all trade and return metrics share it
+            ledger = self.build_ledger(df, price_col, signal_col)
+            
             # Calculate basic metrics
-            win_ratio = self._calculate_win_ratio(df, price_col, signal_col)
-            risk_reward_ratio = self._calculate_risk_reward_ratio(df, price_col, signal_col)
-            profit_factor = self._calculate_profit_factor(df, price_col, signal_col)
+            win_ratio = self._calculate_win_ratio(df, price_col, signal_col, ledger=ledger)
+            risk_reward_ratio = self._calculate_risk_reward_ratio(df, price_col, signal_col, ledger=ledger)
+            profit_factor = self._calculate_profit_factor(df, price_col, signal_col, ledger=ledger)
             
             # Calculate risk-adjusted returns
-            sharpe_ratio = self._calculate_sharpe_ratio(df, price_col, signal_col)
-            sortino_ratio = self._calculate_sortino_ratio(df, price_col, signal_col)
+            sharpe_ratio = self._calculate_sharpe_ratio(df, price_col, signal_col, ledger=ledger)
+            sortino_ratio = self._calculate_sortino_ratio(df, price_col, signal_col, ledger=ledger)
             
             # Calculate probability metrics
-            probability_risk_ratio = self._calculate_probability_risk_ratio(df, price_col, signal_col)
+            probability_risk_ratio = self._calculate_probability_risk_ratio(df, price_col, signal_col, ledger=ledger)
             
             # Calculate additional important metrics
-            max_drawdown = self._calculate_max_drawdown(df, price_col, signal_col)
-            total_return = self._calculate_total_return(df, price_col, signal_col)
-            volatility = self._calculate_volatility(df, price_col, signal_col)
+            max_drawdown = self._calculate_max_drawdown(df, price_col, signal_col, ledger=ledger)
+            total_return = self._calculate_total_return(df, price_col, signal_col, ledger=ledger)
+            volatility = self._calculate_volatility(df, price_col, signal_col, ledger=ledger)
             calmar_ratio = self._calculate_calmar_ratio(total_return, max_drawdown)
             
             # Calculate ML and probability analysis metrics
             ml_metrics = self._calculate_ml_metrics(df, price_col, signal_col)
             
             # Calculate Monte Carlo simulation metrics
-            monte_carlo_metrics = self._calculate_monte_carlo_metrics(df, price_col, signal_col)
+            monte_carlo_metrics = self._calculate_monte_carlo_metrics(df, price_col, signal_col, ledger=ledger)
             
             # Calculate strategy-specific metrics
             strategy_metrics = self._calculate_strategy_metrics(df, price_col, signal_col, 
-                                                             lot_size, risk_reward_ratio, fee_per_trade)
+                                                             lot_size, risk_reward_ratio, fee_per_trade,
+                                                             ledger=ledger)
             
             # Calculate volume-weighted metrics if volume data is available
             volume_metrics = {}
@@ -117,15 +167,44 @@ class TradingMetricsCalculator:
             logger.print_error(f"Error calculating trading metrics: {e}")
             return self._get_empty_metrics()
     
-    def _calculate_win_ratio(self, df: pd.DataFrame, price_col: str, signal_col: str) -> float:
+    def build_ledger(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                     volume_col: Optional[str] = None) -> TradeLedger:
+        """
+        Build the trade ledger (trades and per-bar returns) shared by the metrics.
+        
+        Args:
+            df (pd.DataFrame): DataFrame with price and signal columns
+            price_col (str): Column name for price data
+            signal_col (str): Column name for trading signals
+            volume_col (str, optional): Volume column; bars without volume are skipped
+        
+        Returns:
+            TradeLedger: Ledger, empty when the signal column is missing or invalid
+        """
+        try:
+            signals = resolve_signal_values(df, signal_col)
+            if signals is None:
+                logger.print_debug(f"Signal column '{signal_col}' not found. Available columns: {list(df.columns)}")
+                return TradeLedger.empty(with_volumes=volume_col is not None)
+            volumes = df[volume_col] if volume_col is not None else None
+            return build_trade_ledger(df[price_col], signals, volumes)
+        except Exception as e:
+            logger.print_debug(f"Error extracting trades: {e}")
+            return TradeLedger.empty(with_volumes=volume_col is not None)
+    
+    def _ledger(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                ledger: Optional[TradeLedger]) -> TradeLedger:
+        return ledger if ledger is not None else self.build_ledger(df, price_col, signal_col)
+    
+    def _calculate_win_ratio(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                             ledger: Optional[TradeLedger] = None) -> float:
         """Calculate win ratio (percentage of profitable trades)."""
         try:
-            trades = self._extract_trades(df, price_col, signal_col)
-            if not trades:
+            trades = self._ledger(df, price_col, signal_col, ledger).returns
+            if len(trades) == 0:
                 return 0.0
             
-            winning_trades = [trade for trade in trades if trade > 0]
-            return len(winning_trades) / len(trades) * 100
+            return np.count_nonzero(trades > 0) / len(trades) * 100
             
         except Exception as e:
             logger.print_debug(f"Error calculating win ratio: {e}")
@@ -147,17 +226,18 @@ class TradingMetricsCalculator:
             logger.print_debug(f"Error calculating trade counts: {e}")
             return 0, 0, 0
     
-    def _calculate_risk_reward_ratio(self, df: pd.DataFrame, price_col: str, signal_col: str) -> float:
+    def _calculate_risk_reward_ratio(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                                     ledger: Optional[TradeLedger] = None) -> float:
         """Calculate risk-reward ratio (average win / average loss)."""
         try:
-            trades = self._extract_trades(df, price_col, signal_col)
-            if not trades:
+            trades = self._ledger(df, price_col, signal_col, ledger).returns
+            if len(trades) == 0:
                 return 0.0
             
-            winning_trades = [trade for trade in trades if trade > 0]
-            losing_trades = [trade for trade in trades if trade < 0]
+            winning_trades = trades[trades > 0]
+            losing_trades = trades[trades < 0]
             
-            if not winning_trades or not losing_trades:
+            if len(winning_trades) == 0 or len(losing_trades) == 0:
                 return 0.0
             
             avg_win = np.mean(winning_trades)
@@ -169,15 +249,16 @@ class TradingMetricsCalculator:
             logger.print_debug(f"Error calculating risk-reward ratio: {e}")
             return 0.0
     
-    def _calculate_profit_factor(self, df: pd.DataFrame, price_col: str, signal_col: str) -> float:
+    def _calculate_profit_factor(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                                 ledger: Optional[TradeLedger] = None) -> float:
         """Calculate profit factor (gross profit / gross loss)."""
         try:
-            trades = self._extract_trades(df, price_col, signal_col)
-            if not trades:
+            trades = self._ledger(df, price_col, signal_col, ledger).returns
+            if len(trades) == 0:
                 return 0.0
             
-            gross_profit = sum(trade for trade in trades if trade > 0)
-            gross_loss = abs(sum(trade for trade in trades if trade < 0))
+            gross_profit = trades[trades > 0].sum()
+            gross_loss = abs(trades[trades < 0].sum())
             
             return gross_profit / gross_loss if gross_loss > 0 else 0.0
             
@@ -185,10 +266,11 @@ class TradingMetricsCalculator:
             logger.print_debug(f"Error calculating profit factor: {e}")
             return 0.0
     
-    def _calculate_sharpe_ratio(self, df: pd.DataFrame, price_col: str, signal_col: str) -> float:
+    def _calculate_sharpe_ratio(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                                ledger: Optional[TradeLedger] = None) -> float:
         """Calculate Sharpe ratio (risk-adjusted return)."""
         try:
-            returns = self._calculate_returns(df, price_col, signal_col)
+            returns = self._calculate_returns(df, price_col, signal_col, ledger=ledger)
             if len(returns) < 2:
                 return 0.0
             
@@ -206,10 +288,11 @@ class TradingMetricsCalculator:
             logger.print_debug(f"Error calculating Sharpe ratio: {e}")
             return 0.0
     
-    def _calculate_sortino_ratio(self, df: pd.DataFrame, price_col: str, signal_col: str) -> float:
+    def _calculate_sortino_ratio(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                                 ledger: Optional[TradeLedger] = None) -> float:
         """Calculate Sortino ratio (downside risk-adjusted return)."""
         try:
-            returns = self._calculate_returns(df, price_col, signal_col)
+            returns = self._calculate_returns(df, price_col, signal_col, ledger=ledger)
             if len(returns) < 2:
                 return 0.0
             
@@ -232,18 +315,16 @@ class TradingMetricsCalculator:
             logger.print_debug(f"Error calculating Sortino ratio: {e}")
             return 0.0
     
-    def _calculate_probability_risk_ratio(self, df: pd.DataFrame, price_col: str, signal_col: str) -> float:
+    def _calculate_probability_risk_ratio(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                                          ledger: Optional[TradeLedger] = None) -> float:
         """Calculate probability risk ratio (probability of profit / probability of loss)."""
         try:
-            trades = self._extract_trades(df, price_col, signal_col)
-            if not trades:
+            trades = self._ledger(df, price_col, signal_col, ledger).returns
+            if len(trades) == 0:
                 return 0.0
             
-            winning_trades = [trade for trade in trades if trade > 0]
-            losing_trades = [trade for trade in trades if trade < 0]
-            
-            prob_profit = len(winning_trades) / len(trades)
-            prob_loss = len(losing_trades) / len(trades)
+            prob_profit = np.count_nonzero(trades > 0) / len(trades)
+            prob_loss = np.count_nonzero(trades < 0) / len(trades)
             
             return prob_profit / prob_loss if prob_loss > 0 else 0.0
             
@@ -251,10 +332,11 @@ class TradingMetricsCalculator:
             logger.print_debug(f"Error calculating probability risk ratio: {e}")
             return 0.0
     
-    def _calculate_max_drawdown(self, df: pd.DataFrame, price_col: str, signal_col: str) -> float:
+    def _calculate_max_drawdown(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                                ledger: Optional[TradeLedger] = None) -> float:
         """Calculate maximum drawdown percentage."""
         try:
-            cumulative_returns = self._calculate_cumulative_returns(df, price_col, signal_col)
+            cumulative_returns = self._calculate_cumulative_returns(df, price_col, signal_col, ledger=ledger)
             if len(cumulative_returns) < 2:
                 return 0.0
             
@@ -268,10 +350,11 @@ class TradingMetricsCalculator:
             logger.print_debug(f"Error calculating max drawdown: {e}")
             return 0.0
     
-    def _calculate_total_return(self, df: pd.DataFrame, price_col: str, signal_col: str) -> float:
+    def _calculate_total_return(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                                ledger: Optional[TradeLedger] = None) -> float:
         """Calculate total return percentage."""
         try:
-            cumulative_returns = self._calculate_cumulative_returns(df, price_col, signal_col)
+            cumulative_returns = self._calculate_cumulative_returns(df, price_col, signal_col, ledger=ledger)
             if len(cumulative_returns) < 2:
                 return 0.0
             
@@ -282,10 +365,11 @@ class TradingMetricsCalculator:
             logger.print_debug(f"Error calculating total return: {e}")
             return 0.0
     
-    def _calculate_volatility(self, df: pd.DataFrame, price_col: str, signal_col: str) -> float:
+    def _calculate_volatility(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                              ledger: Optional[TradeLedger] = None) -> float:
         """Calculate annualized volatility."""
         try:
-            returns = self._calculate_returns(df, price_col, signal_col)
+            returns = self._calculate_returns(df, price_col, signal_col, ledger=ledger)
             if len(returns) < 2:
                 return 0.0
             
@@ -310,20 +394,17 @@ class TradingMetricsCalculator:
     def _calculate_volume_metrics(self, df: pd.DataFrame, price_col: str, signal_col: str, volume_col: str) -> Dict[str, float]:
         """Calculate volume-weighted metrics."""
         try:
-            trades = self._extract_trades_with_volume(df, price_col, signal_col, volume_col)
-            if not trades:
+            ledger = self.build_ledger(df, price_col, signal_col, volume_col)
+            if ledger.num_trades == 0:
                 return {}
             
             # Volume-weighted average trade
-            total_volume = sum(volume for _, volume in trades)
-            volume_weighted_return = sum(return_val * volume for return_val, volume in trades) / total_volume
+            returns, volumes = ledger.returns, ledger.volumes
+            total_volume = volumes.sum()
+            volume_weighted_return = (returns * volumes).sum() / total_volume
             
             # Volume-weighted win ratio
-            winning_trades = [(ret, vol) for ret, vol in trades if ret > 0]
-            losing_trades = [(ret, vol) for ret, vol in trades if ret < 0]
-            
-            winning_volume = sum(vol for _, vol in winning_trades)
-            losing_volume = sum(vol for _, vol in losing_trades)
+            winning_volume = volumes[returns > 0].sum()
             
             volume_win_ratio = winning_volume / total_volume * 100 if total_volume > 0 else 0.0
             
@@ -338,227 +419,23 @@ class TradingMetricsCalculator:
     
     def _extract_trades(self, df: pd.DataFrame, price_col: str, signal_col: str) -> list:
         """Extract individual trade returns from the data."""
-        try:
-            trades = []
-            in_position = False
-            entry_price = 0.0
-            
-            # Handle different signal column formats
-            actual_signal_col = signal_col
-            if signal_col not in df.columns:
-                # Try alternative signal columns for Wave and other indicators
-                alternative_cols = ['_Signal', '_Direction', 'Direction', 'Signal']
-                for col in alternative_cols:
-                    if col in df.columns:
-                        actual_signal_col = col
-                        break
-                else:
-                    logger.print_debug(f"Signal column '{signal_col}' not found. Available columns: {list(df.columns)}")
-                    return []
-            
-            # Get signal values (handle both numeric and string formats)
-            signals = df[actual_signal_col].fillna(0)
-            
-            # Convert signals to standard format if needed
-            if signals.dtype == 'object':
-                # Handle string signals
-                signal_map = {'buy': BUY, 'sell': SELL, 'notrade': NOTRADE, '0': NOTRADE, '1': BUY, '2': SELL}
-                signals = signals.str.lower().map(signal_map).fillna(NOTRADE)
-            else:
-                # Handle numeric signals
-                signals = signals.astype(int)
-            
-            for i in range(1, len(df)):
-                current_signal = signals.iloc[i]
-                current_price = df[price_col].iloc[i]
-                prev_price = df[price_col].iloc[i-1]
-                
-                # Skip if price data is invalid
-                if pd.isna(current_price) or pd.isna(prev_price) or current_price <= 0 or prev_price <= 0:
-                    continue
-                
-                # Check for entry signals (BUY = 1)
-                if not in_position and current_signal == BUY:
-                    in_position = True
-                    entry_price = current_price
-                
-                # Check for exit signals (SELL = 2) or position reversal
-                elif in_position and current_signal == SELL:
-                    # Calculate trade return
-                    trade_return = (current_price - entry_price) / entry_price * 100
-                    trades.append(trade_return)
-                    in_position = False  # Exit position
-                
-                # Handle position reversal (new BUY signal while in position)
-                elif in_position and current_signal == BUY:
-                    # Close current position and open new one
-                    trade_return = (current_price - entry_price) / entry_price * 100
-                    trades.append(trade_return)
-                    entry_price = current_price  # New position entry price
-            
-            # Close any remaining open position at the end
-            if in_position and len(df) > 0:
-                final_price = df[price_col].iloc[-1]
-                if not pd.isna(final_price) and final_price > 0:
-                    trade_return = (final_price - entry_price) / entry_price * 100
-                    trades.append(trade_return)
-            
-            return trades
-            
-        except Exception as e:
-            logger.print_debug(f"Error extracting trades: {e}")
-            return []
+        return self.build_ledger(df, price_col, signal_col).returns.tolist()
     
     def _extract_trades_with_volume(self, df: pd.DataFrame, price_col: str, signal_col: str, volume_col: str) -> list:
         """Extract individual trade returns with volume data."""
-        try:
-            trades = []
-            in_position = False
-            entry_price = 0.0
-            entry_volume = 0.0
-            
-            # Handle different signal column formats
-            actual_signal_col = signal_col
-            if signal_col not in df.columns:
-                # Try alternative signal columns for Wave and other indicators
-                alternative_cols = ['_Signal', '_Direction', 'Direction', 'Signal']
-                for col in alternative_cols:
-                    if col in df.columns:
-                        actual_signal_col = col
-                        break
-                else:
-                    logger.print_debug(f"Signal column '{signal_col}' not found. Available columns: {list(df.columns)}")
-                    return []
-            
-            # Get signal values (handle both numeric and string formats)
-            signals = df[actual_signal_col].fillna(0)
-            
-            # Convert signals to standard format if needed
-            if signals.dtype == 'object':
-                # Handle string signals
-                signal_map = {'buy': BUY, 'sell': SELL, 'notrade': NOTRADE, '0': NOTRADE, '1': BUY, '2': SELL}
-                signals = signals.str.lower().map(signal_map).fillna(NOTRADE)
-            else:
-                # Handle numeric signals
-                signals = signals.astype(int)
-            
-            for i in range(1, len(df)):
-                current_signal = signals.iloc[i]
-                current_price = df[price_col].iloc[i]
-                current_volume = df[volume_col].iloc[i]
-                prev_price = df[price_col].iloc[i-1]
-                
-                # Skip if price or volume data is invalid
-                if (pd.isna(current_price) or pd.isna(prev_price) or 
-                    current_price <= 0 or prev_price <= 0 or 
-                    pd.isna(current_volume) or current_volume <= 0):
-                    continue
-                
-                # Check for entry signals (BUY = 1)
-                if not in_position and current_signal == BUY:
-                    in_position = True
-                    entry_price = current_price
-                    entry_volume = current_volume
-                
-                # Check for exit signals (SELL = 2)
-                elif in_position and current_signal == SELL:
-                    # Calculate trade return
-                    trade_return = (current_price - entry_price) / entry_price * 100
-                    avg_volume = (entry_volume + current_volume) / 2
-                    trades.append((trade_return, avg_volume))
-                    in_position = False  # Exit position
-                
-                # Handle position reversal (new BUY signal while in position)
-                elif in_position and current_signal == BUY:
-                    # Close current position and open new one
-                    trade_return = (current_price - entry_price) / entry_price * 100
-                    avg_volume = (entry_volume + current_volume) / 2
-                    trades.append((trade_return, avg_volume))
-                    entry_price = current_price  # New position entry price
-                    entry_volume = current_volume
-            
-            # Close any remaining open position at the end
-            if in_position and len(df) > 0:
-                final_price = df[price_col].iloc[-1]
-                final_volume = df[volume_col].iloc[-1]
-                if (not pd.isna(final_price) and final_price > 0 and 
-                    not pd.isna(final_volume) and final_volume > 0):
-                    trade_return = (final_price - entry_price) / entry_price * 100
-                    avg_volume = (entry_volume + final_volume) / 2
-                    trades.append((trade_return, avg_volume))
-            
-            return trades
-            
-        except Exception as e:
-            logger.print_debug(f"Error extracting trades with volume: {e}")
-            return []
+        ledger = self.build_ledger(df, price_col, signal_col, volume_col)
+        return list(zip(ledger.returns.tolist(), ledger.volumes.tolist()))
     
-    def _calculate_returns(self, df: pd.DataFrame, price_col: str, signal_col: str) -> pd.Series:
+    def _calculate_returns(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                           ledger: Optional[TradeLedger] = None) -> pd.Series:
         """Calculate daily returns based on trading signals."""
-        try:
-            returns = []
-            in_position = False
-            
-            # Handle different signal column formats
-            actual_signal_col = signal_col
-            if signal_col not in df.columns:
-                # Try alternative signal columns for Wave and other indicators
-                alternative_cols = ['_Signal', '_Direction', 'Direction', 'Signal']
-                for col in alternative_cols:
-                    if col in df.columns:
-                        actual_signal_col = col
-                        break
-                else:
-                    logger.print_debug(f"Signal column '{signal_col}' not found. Available columns: {list(df.columns)}")
-                    return pd.Series()
-            
-            # Get signal values (handle both numeric and string formats)
-            signals = df[actual_signal_col].fillna(0)
-            
-            # Convert signals to standard format if needed
-            if signals.dtype == 'object':
-                # Handle string signals
-                signal_map = {'buy': BUY, 'sell': SELL, 'notrade': NOTRADE, '0': NOTRADE, '1': BUY, '2': SELL}
-                signals = signals.str.lower().map(signal_map).fillna(NOTRADE)
-            else:
-                # Handle numeric signals
-                signals = signals.astype(int)
-            
-            for i in range(1, len(df)):
-                current_signal = signals.iloc[i]
-                current_price = df[price_col].iloc[i]
-                prev_price = df[price_col].iloc[i-1]
-                
-                # Skip if price data is invalid
-                if pd.isna(current_price) or pd.isna(prev_price) or current_price <= 0 or prev_price <= 0:
-                    returns.append(0.0)
-                    continue
-                
-                # Check for entry signals (BUY = 1)
-                if not in_position and current_signal == BUY:
-                    in_position = True
-                
-                # Calculate return if in position
-                if in_position:
-                    daily_return = (current_price - prev_price) / prev_price
-                    returns.append(daily_return)
-                else:
-                    returns.append(0.0)
-                
-                # Check for exit signals (SELL = 2)
-                if in_position and current_signal == SELL:
-                    in_position = False
-            
-            return pd.Series(returns)
-            
-        except Exception as e:
-            logger.print_debug(f"Error calculating returns: {e}")
-            return pd.Series()
+        return pd.Series(self._ledger(df, price_col, signal_col, ledger).bar_returns)
     
-    def _calculate_cumulative_returns(self, df: pd.DataFrame, price_col: str, signal_col: str) -> pd.Series:
+    def _calculate_cumulative_returns(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                                      ledger: Optional[TradeLedger] = None) -> pd.Series:
         """Calculate cumulative returns based on trading signals."""
         try:
-            returns = self._calculate_returns(df, price_col, signal_col)
+            returns = self._calculate_returns(df, price_col, signal_col, ledger=ledger)
             if returns.empty:
                 return pd.Series()
             
@@ -622,7 +499,8 @@ class TradingMetricsCalculator:
             logger.print_debug(f"Error calculating ML metrics: {e}")
             return {}
     
-    def _calculate_monte_carlo_metrics(self, df: pd.DataFrame, price_col: str, signal_col: str) -> Dict[str, float]:
+    def _calculate_monte_carlo_metrics(self, df: pd.DataFrame, price_col: str, signal_col: str,
+                                       ledger: Optional[TradeLedger] = None) -> Dict[str, float]:
         """Calculate Monte Carlo simulation metrics for strategy robustness."""
         try:
             metrics = {}
@@ -631,23 +509,14 @@ class TradingMetricsCalculator:
                 return metrics
             
             # Extract trade returns
-            trades = self._extract_trades(df, price_col, signal_col)
+            trades = self._ledger(df, price_col, signal_col, ledger).returns.tolist()
             if not trades:
                 return metrics
             
-            # Monte Carlo simulation parameters (reduced for performance)
-            n_simulations = 100  # Reduced from 1000 to 100 for faster execution
-            n_trades = len(trades)
-            
-            # Run Monte Carlo simulations
-            simulation_results = []
-            for _ in range(n_simulations):
-                # Randomly sample trades with replacement
-                sample_trades = np.random.choice(trades, size=n_trades, replace=True)
-                cumulative_return = np.cumprod(1 + np.array(sample_trades) / 100)
-                simulation_results.append(cumulative_return[-1] - 1)
-            
-            simulation_results = np.array(simulation_results)
+            # Run Monte Carlo simulations (batched bootstrap of the trades)
+            simulation_results = bootstrap_final_returns(trades, self.mc_simulations, self.mc_seed)
+            if len(simulation_results) == 0:
+                return metrics
             
             # Calculate Monte Carlo metrics
             metrics['mc_expected_return'] = np.mean(simulation_results) * 100
@@ -680,16 +549,18 @@ class TradingMetricsCalculator:
                 return 0.0
             
             # Calculate pattern consistency using rolling windows
-            pattern_scores = []
             window_size = min(10, len(signals) // 2)
             
-            for i in range(window_size, len(signals)):
-                window = signals.iloc[i-window_size:i]
-                # Calculate consistency as percentage of same consecutive signals
-                consistency = (window.diff() == 0).mean()
-                pattern_scores.append(consistency)
+            # Consistency of window [i-w, i) is the share of same consecutive signals
+            # inside it: unchanged pairs ending at i-w+1 .. i-1, divided by w
+            values = signals.to_numpy()
+            unchanged = np.zeros(len(values))
+            unchanged[1:] = values[1:] == values[:-1]
+            cumulative = np.concatenate(([0.0], np.cumsum(unchanged)))
+            ends = np.arange(window_size, len(values))
+            pattern_scores = (cumulative[ends] - cumulative[ends - window_size + 1]) / window_size
             
-            return np.mean(pattern_scores) * 100 if pattern_scores else 0.0
+            return np.mean(pattern_scores) * 100 if len(pattern_scores) else 0.0
             
         except Exception as e:
             logger.print_debug(f"Error calculating pattern consistency: {e}")
@@ -712,13 +583,11 @@ class TradingMetricsCalculator:
             
             # Calculate average distance between signals
             signal_indices = active_signals.index
-            distances = []
+            distances = signal_indices[1:] - signal_indices[:-1]
+            if isinstance(distances, pd.TimedeltaIndex):
+                distances = distances.days
             
-            for i in range(1, len(signal_indices)):
-                distance = signal_indices[i] - signal_indices[i-1]
-                distances.append(distance.days if hasattr(distance, 'days') else distance)
-            
-            avg_distance = np.mean(distances) if distances else 0
+            avg_distance = np.mean(distances) if len(distances) else 0
             clustering_score = 1 / (1 + avg_distance) if avg_distance > 0 else 1.0
             
             return clustering_score * 100
@@ -784,13 +653,14 @@ class TradingMetricsCalculator:
             return 0.0
     
     def _calculate_strategy_metrics(self, df: pd.DataFrame, price_col: str, signal_col: str,
-                                  lot_size: float, risk_reward_ratio: float, fee_per_trade: float) -> Dict[str, float]:
+                                  lot_size: float, risk_reward_ratio: float, fee_per_trade: float,
+                                  ledger: Optional[TradeLedger] = None) -> Dict[str, float]:
         """Calculate strategy-specific metrics with position sizing and fees."""
         try:
             metrics = {}
             
             # Extract trades
-            trades = self._extract_trades(df, price_col, signal_col)
+            trades = self._ledger(df, price_col, signal_col, ledger).returns.tolist()
             if not trades:
                 # Return default metrics when no trades are found
                 return {
@@ -952,7 +822,9 @@ def calculate_trading_metrics(df: pd.DataFrame,
                             volume_col: Optional[str] = 'Volume',
                             lot_size: float = 1.0,
                             risk_reward_ratio: float = 2.0,
-                            fee_per_trade: float = 0.07) -> Dict[str, float]:
+                            fee_per_trade: float = 0.07,
+                            mc_simulations: int = DEFAULT_MC_SIMULATIONS,
+                            mc_seed: Optional[int] = None) -> Dict[str, float]:
     """
     Calculate comprehensive trading metrics for the given data.
     
@@ -964,10 +836,12 @@ def calculate_trading_metrics(df: pd.DataFrame,
         lot_size (float): Position size (default: 1.0)
         risk_reward_ratio (float): Risk to reward ratio (default: 2.0)
         fee_per_trade (float): Fee per trade in percentage (default: 0.07)
+        mc_simulations (int): Monte Carlo simulations (default: 1000)
+        mc_seed (int, optional): Monte Carlo random seed (default: None)
     
     Returns:
         Dict[str, float]: Dictionary containing all calculated metrics
     """
-    calculator = TradingMetricsCalculator()
+    calculator = TradingMetricsCalculator(mc_simulations=mc_simulations, mc_seed=mc_seed)
     return calculator.calculate_all_metrics(df, price_col, signal_col, volume_col, 
                                           lot_size, risk_reward_ratio, fee_per_trade) 
\ No newline at end of file
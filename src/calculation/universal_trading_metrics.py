@@ -14,7 +14,7 @@ import signal
 import time
 from src.common import logger
 from src.common.constants import BUY, SELL, NOTRADE
-from src.calculation.trading_metrics import calculate_trading_metrics
+from src.calculation.trading_metrics import calculate_trading_metrics, DEFAULT_MC_SIMULATIONS
 
 
 class TimeoutError(Exception):
@@ -32,7 +32,8 @@ class UniversalTradingMetrics:
     """
     
     def __init__(self, lot_size: float = 1.0, risk_reward_ratio: float = 2.0, 
-                 fee_per_trade: float = 0.07, timeout_seconds: int = 30):
+                 fee_per_trade: float = 0.07, timeout_seconds: int = 30,
+                 mc_simulations: int = DEFAULT_MC_SIMULATIONS, mc_seed: Optional[int] = None):
         """
         Initialize the universal trading metrics calculator.
         
@@ -41,11 +42,15 @@ class UniversalTradingMetrics:
             risk_reward_ratio (float): Risk to reward ratio (default: 2.0)
             fee_per_trade (float): Fee per trade in percentage (default: 0.07)
             timeout_seconds (int): Timeout in seconds for calculations (default: 30)
+            mc_simulations (int): Monte Carlo simulations (default: 1000)
+            mc_seed (int, optional): Monte Carlo random seed (default: None)
         """
         self.lot_size = lot_size
         self.risk_reward_ratio = risk_reward_ratio
         self.fee_per_trade = fee_per_trade
         self.timeout_seconds = timeout_seconds
+        self.mc_simulations = mc_simulations
+        self.mc_seed = mc_seed
     
     def calculate_and_display_metrics(self, df: pd.DataFrame, rule: Union[str, object], 
                                     price_col: str = 'Close', signal_col: str = 'Direction',
@@ -97,7 +102,9 @@ class UniversalTradingMetrics:
                     volume_col=volume_col,
                     lot_size=self.lot_size,
                     risk_reward_ratio=self.risk_reward_ratio,
-                    fee_per_trade=self.fee_per_trade
+                    fee_per_trade=self.fee_per_trade,
+                    mc_simulations=self.mc_simulations,
+                    mc_seed=self.mc_seed
                 )
                 
                 # Display metrics in console
@@ -623,7 +630,9 @@ class UniversalTradingMetrics:
 def display_universal_trading_metrics(df: pd.DataFrame, rule: Union[str, object], 
                                     lot_size: float = 1.0, risk_reward_ratio: float = 2.0, 
                                     fee_per_trade: float = 0.07, signal_col: str = 'Direction',
-                                    timeout_seconds: int = 30) -> Dict[str, float]:
+                                    timeout_seconds: int = 30,
+                                    mc_simulations: int = DEFAULT_MC_SIMULATIONS,
+                                    mc_seed: Optional[int] = None) -> Dict[str, float]:
     """
     Universal function to calculate and display trading metrics for any rule type.
     
@@ -635,9 +644,12 @@ def display_universal_trading_metrics(df: pd.DataFrame, rule: Union[str, object]
         fee_per_trade (float): Fee per trade in percentage (default: 0.07)
         signal_col (str): Column name for trading signals (default: 'Direction')
         timeout_seconds (int): Timeout in seconds for calculations (default: 30)
+        mc_simulations (int): Monte Carlo simulations (default: 1000)
+        mc_seed (int, optional): Monte Carlo random seed (default: None)
     
     Returns:
         Dict[str, float]: Dictionary containing all calculated metrics
     """
-    calculator = UniversalTradingMetrics(lot_size, risk_reward_ratio, fee_per_trade, timeout_seconds)
+    calculator = UniversalTradingMetrics(lot_size, risk_reward_ratio, fee_per_trade, timeout_seconds,
+                                         mc_simulations=mc_simulations, mc_seed=mc_seed)
     return calculator.calculate_and_display_metrics(df, rule, signal_col=signal_col) 
\ No newline at end of file
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# src/calculation/vectorized_backtest.py
+
+"""
+Vectorized signal-to-equity backtest for indicator rule outputs.
+
+Turns BUY/SELL/NOTRADE signal columns (PColor1, PColor2, Direction) into
+positions, equity, drawdown and trades with array operations only:
+- a BUY signal sets the position to long, a SELL signal to flat (or short
+  with ``short_on_sell=True``), NOTRADE keeps the previous position;
+- a signal acts at the close of its bar, so the position earns the return
+  of the following bars;
+- a fixed commission (fraction of traded notional) is charged on every
+  position change, a reversal counting as two units of turnover;
+- a position still open at the end is closed at the last price.
+
+Signals may be 2D (bars x parameter sets): every column is an independent
+backtest over the same prices, so many parameter sets are evaluated in one
+call.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from src.common.constants import BUY, SELL
+from src.calculation.trade_ledger import resolve_signal_values
+
+TRADE_COLUMNS = ['param_set', 'entry_bar', 'exit_bar', 'side', 'entry_price', 'exit_price',
+                 'return_pct', 'is_open']
+
+
+@dataclass
+class VectorBacktestResult:
+    """Backtest arrays of shape (n_bars, n_sets) and the trades of all parameter sets."""
+    positions: np.ndarray     # Position after each bar's signal (1 long, 0 flat, -1 short)
+    bar_returns: np.ndarray   # Net strategy return of each bar (0 on the first bar)
+    equity: np.ndarray
+    drawdown: np.ndarray      # Fraction below the running equity peak (<= 0)
+    trades: pd.DataFrame      # One row per trade, see TRADE_COLUMNS
+    param_labels: list
+    initial_capital: float = 1.0
+    index: Optional[pd.Index] = None
+
+    @property
+    def n_sets(self) -> int:
+        return self.positions.shape[1]
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Per parameter set metrics.
+
+        Returns:
+            pd.DataFrame: total_return_pct, max_drawdown_pct, sharpe_ratio, num_trades,
+                win_rate_pct and exposure_pct indexed by parameter set
+        """
+        n_bars = self.positions.shape[0]
+        total_return = (self.equity[-1] / self.initial_capital - 1) * 100 if n_bars else np.zeros(self.n_sets)
+
+        returns = self.bar_returns[1:]
+        if len(returns) > 1:
+            mean, std = returns.mean(axis=0), returns.std(axis=0, ddof=1)
+            sharpe = np.divide(mean, std, out=np.zeros(self.n_sets), where=std > 0) * np.sqrt(252)
+        else:
+            sharpe = np.zeros(self.n_sets)
+
+        labels = pd.Index(self.param_labels, tupleize_cols=False, name='param_set')
+        set_codes = labels.get_indexer(self.trades['param_set'])
+        num_trades = np.bincount(set_codes, minlength=self.n_sets)
+        wins = np.bincount(set_codes, weights=(self.trades['return_pct'].to_numpy() > 0), minlength=self.n_sets)
+        win_rate = np.divide(wins * 100, num_trades, out=np.zeros(self.n_sets), where=num_trades > 0)
+
+        return pd.DataFrame({
+            'total_return_pct': total_return,
+            'max_drawdown_pct': self.drawdown.min(axis=0) * 100 if n_bars else np.zeros(self.n_sets),
+            'sharpe_ratio': sharpe,
+            'num_trades': num_trades,
+            'win_rate_pct': win_rate,
+            'exposure_pct': (self.positions != 0).mean(axis=0) * 100 if n_bars else np.zeros(self.n_sets),
+        }, index=labels)
+
+    def equity_frame(self) -> pd.DataFrame:
+        """Equity curves as a DataFrame with one column per parameter set."""
+        return pd.DataFrame(self.equity, index=self.index, columns=self.param_labels)
+
+
+def signals_to_positions(signals, short_on_sell: bool = False) -> np.ndarray:
+    """
+    Forward-fills BUY/SELL events into positions.
+
+    Args:
+        signals (array-like): BUY/SELL/NOTRADE values, 1D or (bars x parameter sets)
+        short_on_sell (bool): Go short on SELL instead of flat
+
+    Returns:
+        np.ndarray: Positions with the same shape as ``signals``
+    """
+    signals = np.asarray(signals, dtype=np.float64)
+    one_d = signals.ndim == 1
+    if one_d:
+        signals = signals[:, None]
+
+    target = np.full(signals.shape, np.nan)
+    target[signals == BUY] = 1.0
+    target[signals == SELL] = -1.0 if short_on_sell else 0.0
+
+    # Row of the last event at or before each bar (-1 before the first event)
+    rows = np.where(np.isnan(target), -1, np.arange(len(signals))[:, None])
+    last_event = np.maximum.accumulate(rows, axis=0) if len(rows) else rows
+    positions = np.take_along_axis(target, np.maximum(last_event, 0), axis=0)
+    positions[last_event < 0] = 0.0
+    return positions[:, 0] if one_d else positions
+
+
+def _extract_trades(positions: np.ndarray, prices: np.ndarray, param_labels: list) -> pd.DataFrame:
+    """Finds the runs of constant non-zero position of every parameter set."""
+    n_bars = positions.shape[0]
+    if n_bars == 0:
+        return pd.DataFrame(columns=TRADE_COLUMNS)
+
+    by_set = positions.T
+    previous = np.zeros_like(by_set)
+    previous[:, 1:] = by_set[:, :-1]
+    following = np.zeros_like(by_set)
+    following[:, :-1] = by_set[:, 1:]
+    held = by_set != 0
+
+    # Row-major nonzero keeps starts and ends in the same (set, bar) order
+    set_ids, entry_bars = np.nonzero(held & (by_set != previous))
+    _, last_bars = np.nonzero(held & (by_set != following))
+    exit_bars = np.minimum(last_bars + 1, n_bars - 1)
+
+    side = by_set[set_ids, entry_bars]
+    labels = pd.Index(param_labels, tupleize_cols=False).to_numpy(dtype=object)
+    entry_prices = prices[entry_bars]
+    exit_prices = prices[exit_bars]
+    return pd.DataFrame({
+        'param_set': labels[set_ids],
+        'entry_bar': entry_bars,
+        'exit_bar': exit_bars,
+        'side': side.astype(np.int64),
+        'entry_price': entry_prices,
+        'exit_price': exit_prices,
+        'return_pct': side * (exit_prices - entry_prices) / entry_prices * 100,
+        'is_open': last_bars == n_bars - 1,
+    }, columns=TRADE_COLUMNS)
+
+
+def run_vectorized_backtest(prices, signals, commission: float = 0.0, short_on_sell: bool = False,
+                            initial_capital: float = 1.0, param_labels: Optional[Sequence] = None,
+                            index: Optional[pd.Index] = None) -> VectorBacktestResult:
+    """
+    Backtests one or many signal columns against a price series.
+
+    Args:
+        prices (array-like): Prices (e.g. Close), one per bar
+        signals (array-like): BUY/SELL/NOTRADE values, 1D or (bars x parameter sets)
+        commission (float): Commission as a fraction of traded notional
+        short_on_sell (bool): Go short on SELL instead of flat
+        initial_capital (float): Starting equity
+        param_labels (sequence, optional): Label of each parameter set (default 0..n_sets-1)
+        index (pd.Index, optional): Bar index kept for equity_frame()
+
+    Returns:
+        VectorBacktestResult: Positions, returns, equity, drawdown and trades
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    signals = np.asarray(signals, dtype=np.float64)
+    if signals.ndim == 1:
+        signals = signals[:, None]
+    if signals.ndim != 2 or len(signals) != len(prices):
+        raise ValueError(f"signals must have {len(prices)} rows, got shape {signals.shape}")
+
+    n_sets = signals.shape[1]
+    param_labels = list(range(n_sets)) if param_labels is None else list(param_labels)
+    if len(param_labels) != n_sets:
+        raise ValueError(f"Expected {n_sets} parameter labels, got {len(param_labels)}")
+
+    positions = signals_to_positions(signals, short_on_sell=short_on_sell)
+
+    price_returns = np.zeros(len(prices))
+    if len(prices) > 1:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_returns[1:] = prices[1:] / prices[:-1] - 1
+        price_returns[~np.isfinite(price_returns)] = 0.0
+
+    previous = np.zeros_like(positions)
+    previous[1:] = positions[:-1]
+    bar_returns = previous * price_returns[:, None] - commission * np.abs(positions - previous)
+
+    equity = initial_capital * np.cumprod(1 + bar_returns, axis=0)
+    drawdown = equity / np.maximum.accumulate(equity, axis=0) - 1 if len(equity) else equity.copy()
+
+    return VectorBacktestResult(
+        positions=positions,
+        bar_returns=bar_returns,
+        equity=equity,
+        drawdown=drawdown,
+        trades=_extract_trades(positions, prices, param_labels),
+        param_labels=param_labels,
+        initial_capital=initial_capital,
+        index=index,
+    )
+
+
+def backtest_signal_frame(df: pd.DataFrame, signal_cols: Union[str, List[str]] = 'Direction',
+                          price_col: str = 'Close', **kwargs) -> VectorBacktestResult:
+    """
+    Backtests signal columns of an indicator result frame.
+
+    Each signal column is one parameter set labelled by its name. A missing
+    single column falls back to the alternative signal columns of the trade
+    ledger (_Signal, _Direction, ...).
+
+    Args:
+        df (pd.DataFrame): Indicator output with a price column
+        signal_cols (str or list): Signal column(s), e.g. 'Direction' or ['PColor1', 'PColor2']
+        price_col (str): Price column
+        **kwargs: Passed to run_vectorized_backtest
+
+    Returns:
+        VectorBacktestResult: Backtest of every signal column
+    """
+    if price_col not in df.columns:
+        raise ValueError(f"Price column '{price_col}' not found")
+    if isinstance(signal_cols, str):
+        signal_cols = [signal_cols]
+
+    columns = []
+    for col in signal_cols:
+        values = resolve_signal_values(df, col)
+        if values is None:
+            raise ValueError(f"Signal column '{col}' not found")
+        columns.append(values)
+
+    kwargs.setdefault('param_labels', list(signal_cols))
+    kwargs.setdefault('index', df.index)
+    return run_vectorized_backtest(df[price_col].to_numpy(dtype=np.float64), np.column_stack(columns), **kwargs)
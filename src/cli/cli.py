@@ -11,7 +11,20 @@ import sys  # Import sys for exit
 import src.cli.cli_examples as cli_examples
 from colorama import init, Fore, Style
 
-from src.calculation.indicators.trend.wave_ind import ENUM_MOM_TR, ENUM_GLOBAL_TR
+# Rule parameter parsers live in src.calculation; imported here for the CLI and its callers
+from src.calculation.indicator_parameters import (
+    parse_rsi_parameters, parse_rsi_momentum_parameters, parse_rsi_divergence_parameters,
+    parse_macd_parameters, parse_stoch_parameters, parse_ema_parameters, parse_sma_parameters,
+    parse_wave_parameters, parse_bb_parameters, parse_atr_parameters, parse_cci_parameters,
+    parse_vwap_parameters, parse_pivot_parameters, parse_hma_parameters, parse_tsf_parameters,
+    parse_monte_parameters, parse_kelly_parameters, parse_donchain_parameters,
+    parse_fibo_parameters, parse_adx_parameters, parse_sar_parameters,
+    parse_putcallratio_parameters, parse_cot_parameters, parse_feargreed_parameters,
+    parse_rule_parameters,
+    parse_obv_parameters as _parse_obv_parameters,
+    parse_stdev_parameters as _parse_stdev_parameters,
+    parse_supertrend_parameters as _parse_supertrend_parameters,
+)
 from src.cli.indicators_search import IndicatorSearcher
 
 # Initialize colorama for cross-platform colored output
@@ -172,11 +185,14 @@ def parse_arguments():
     # --- Data Source Specific Options Group ---
     data_source_group = parser.add_argument_group('Data Source Options')
     # CSV options
-    csv_group = data_source_group.add_mutually_exclusive_group()
-    csv_group.add_argument('--csv-file', metavar='PATH',
-                          help="Path to input CSV file (required for 'csv' mode)")
-    csv_group.add_argument('--csv-folder', metavar='PATH',
-                          help="Path to folder containing CSV files for batch processing (required for 'csv' mode)")
+    csv_group = parser.add_argument_group('CSV Options')
+    csv_source_group = csv_group.add_mutually_exclusive_group()
+    csv_source_group.add_argument('--csv-file', metavar='PATH',
+                                  help="Path to input CSV file (required for 'csv' mode)")
+    csv_source_group.add_argument('--csv-folder', metavar='PATH',
+                                  help="Path to folder containing CSV files for batch processing (required for 'csv' mode)")
+    csv_group.add_argument('--workers', metavar='N', type=int, default=1,
+                           help="Parallel worker processes for --csv-folder conversion (also used by --sweep). Default: 1")
     # API options (Yahoo Finance / Polygon.io / Binance)
     data_source_group.add_argument('--ticker', metavar='SYMBOL',
                                    help="Ticker symbol. Examples: 'EURUSD=X' (yfinance), 'AAPL' (polygon), 'BTCUSDT' (binance)")
@@ -211,6 +227,28 @@ def parse_arguments():
         default=default_rule_name,
         help=f"Trading rule to apply. Default: {default_rule_name}. Aliases: PHLD=Predict_High_Low_Direction, PV=Pressure_Vector, SR=Support_Resistants, BB=Bollinger_Bands."
     )
+    indicator_group.add_argument(
+        '--rules', metavar='LIST',
+        help="Calculate several indicators in one pass over the same data. Comma or semicolon separated, "
+             "parameters allowed. Example: --rules rsi,macd,bb,atr or --rules 'rsi:14,30,70,close;ema:50,close'. "
+             "The first rule is used for plotting and trading metrics"
+    )
+    indicator_group.add_argument(
+        '--sweep', metavar='SPEC',
+        help="Evaluate every parameter combination of one indicator and rank them by a backtest of its Direction "
+             "signal (long on BUY, flat on SELL, --strategy fee per trade). Parameters may be 'a|b|c' lists or "
+             "'start..stop[..step]' ranges. Example: --sweep 'rsi:7..21..7,20|30,70|80,close'. "
+             "Uses --workers processes; ranked results are written to data/sweeps/"
+    )
+    indicator_group.add_argument(
+        '--sweep-metric', metavar='METRIC', default='sharpe_ratio',
+        choices=['sharpe_ratio', 'total_return_pct', 'max_drawdown_pct', 'win_rate_pct'],
+        help="Ranking metric for --sweep: sharpe_ratio, total_return_pct, max_drawdown_pct, win_rate_pct. Default: sharpe_ratio"
+    )
+    indicator_group.add_argument(
+        '--sweep-output', metavar='PATH',
+        help="Parquet file for the ranked --sweep results. Default: data/sweeps/<indicator>_sweep_<timestamp>.parquet"
+    )
     
     # Strategy parameters
     indicator_group.add_argument(
@@ -218,6 +256,14 @@ def parse_arguments():
         metavar='LOT,RISK_REWARD,FEE',
         help="Strategy parameters: lot_size,risk_reward_ratio,fee_per_trade. Example: --strategy 1,2,0.07 means lot=1.0, risk:reward=2:1, fee=0.07%%. Default: 1.0,2.0,0.07"
     )
+    indicator_group.add_argument(
+        '--mc-sims', metavar='N', type=int, default=1000,
+        help="Monte Carlo simulations for the trading metrics robustness check. Default: 1000"
+    )
+    indicator_group.add_argument(
+        '--mc-seed', metavar='N', type=int, default=None,
+        help="Random seed for reproducible Monte Carlo metrics. Default: random"
+    )
 
     # Add price type selection for indicators that support it
     indicator_group.add_argument(
@@ -275,6 +321,12 @@ def parse_arguments():
     output_group.add_argument('--export-indicators-info',
                               action='store_true',
                               help="Export indicator metadata to JSON format (data/indicators/metadata/)")
+    output_group.add_argument('--incremental',
+                              action='store_true',
+                              help="With --export-parquet: reuse the previous export and its saved indicator state, calculating only bars added since then")
+    output_group.add_argument('--no-indicator-cache',
+                              action='store_true',
+                              help="Always recalculate the indicator instead of reusing a cached result (data/cache/indicator_results/)")
 
     # --- Other Options Group ---
     other_group = parser.add_argument_group('Other Options')
@@ -404,23 +456,9 @@ def parse_arguments():
     # --- Post-parsing validation ---
     effective_mode = 'yfinance' if args.mode == 'yf' else args.mode
 
-    # Normalize stoch aliases to 'stoch:'
+    # Normalize stoch/monte/fg/tsf aliases
     if args.rule:
-        if args.rule.lower().startswith('stochastic:'):
-            args.rule = 'stoch:' + args.rule.split(':', 1)[1]
-        elif args.rule.lower().startswith('stochoscillator:'):
-            args.rule = 'stoch:' + args.rule.split(':', 1)[1]
-        # Monte Carlo aliases
-        elif args.rule.lower().startswith('montecarlo:'):
-            args.rule = 'monte:' + args.rule.split(':', 1)[1]
-        elif args.rule.lower().startswith('mc:'):
-            args.rule = 'monte:' + args.rule.split(':', 1)[1]
-        # Fear & Greed aliases
-        elif args.rule.lower().startswith('fg:'):
-            args.rule = 'feargreed:' + args.rule.split(':', 1)[1]
-        # Time Series Forecast aliases
-        elif args.rule.lower().startswith('tsforecast:'):
-            args.rule = 'tsf:' + args.rule.split(':', 1)[1]
+        args.rule = normalize_rule_alias(args.rule)
 
     # Validate rule argument
     if args.rule:
@@ -472,6 +510,32 @@ def parse_arguments():
                 else:
                     parser.error(f"Invalid rule '{args.rule}'. Use one of {all_rule_choices}")
 
+    # Validate multi-indicator rules list
+    if getattr(args, 'rules', None):
+        if args.rule != default_rule_name:
+            parser.error("--rule and --rules cannot be used together. Put all indicators into --rules.")
+        try:
+            args.rules = split_rules_argument(args.rules)
+        except ValueError as e:
+            parser.error(str(e))
+        # The first rule drives plotting, metrics and export naming
+        args.rule = args.rules[0]
+
+    # Validate parameter sweep
+    if getattr(args, 'sweep', None):
+        if effective_mode == 'show':
+            # show mode renders cached files and never reaches the sweep step
+            parser.error("--sweep is not supported in show mode")
+        if args.rule != default_rule_name or getattr(args, 'rules', None):
+            parser.error("--sweep cannot be used together with --rule or --rules")
+        if args.workers < 1:
+            parser.error("argument --workers must be at least 1")
+        from src.calculation.parameter_sweep import expand_sweep_spec
+        try:
+            args.sweep_rules = expand_sweep_spec(args.sweep)
+        except ValueError as e:
+            parser.error(f"Invalid --sweep: {e}")
+
     # Handle interactive mode
     if effective_mode == 'interactive':
         from src.cli.interactive_mode import start_interactive_mode
@@ -502,6 +566,8 @@ def parse_arguments():
             parser.error("cannot specify both --csv-file and --csv-folder")
         if args.point is None:
             parser.error("argument --point is required when mode is 'csv'")
+        if args.workers < 1:
+            parser.error("argument --workers must be at least 1")
 
     # Check requirements for API modes (yfinance, polygon, binance, exrate)
     api_modes = ['yfinance', 'polygon', 'binance', 'exrate']
@@ -563,6 +629,9 @@ def parse_arguments():
     if effective_mode == 'show' and hasattr(args, 'show_rule') and args.show_rule:
         args.rule = args.show_rule
 
+    if args.mc_sims < 1:
+        parser.error("argument --mc-sims must be at least 1")
+
     # Parse strategy parameters
     if args.strategy:
         try:
@@ -1004,733 +1073,46 @@ def show_indicator_help(indicator_name: str):
     print()
 
 
-def parse_rsi_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse RSI parameters: period,oversold,overbought,price_type"""
-    params = params_str.split(',')
-    if len(params) != 4:
-        raise ValueError(f"RSI requires exactly 4 parameters: period,oversold,overbought,price_type. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values like 14.0
-        oversold = float(params[1].strip())
-        overbought = float(params[2].strip())
-        price_type = params[3].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid RSI parameters: {params_str}. Error: {e}")
-    
-    # Validate period
-    if period <= 0:
-        raise ValueError(f"RSI period must be a positive integer, got: {period}")
-    
-    # Validate thresholds
-    if oversold < 0 or oversold > 100:
-        raise ValueError(f"RSI oversold must be between 0 and 100, got: {oversold}")
-    
-    if overbought < 0 or overbought > 100:
-        raise ValueError(f"RSI overbought must be between 0 and 100, got: {overbought}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"RSI price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'rsi', {
-        'rsi_period': period,
-        'oversold': oversold,
-        'overbought': overbought,
-        'price_type': price_type
-    }
-
-
-def parse_rsi_momentum_parameters(params_str: str) -> tuple[str, dict]:
-    # Exactly the same parameters as RSI, but different name
-    name, params = parse_rsi_parameters(params_str)
-    return 'rsi_mom', params
-
-
-def parse_rsi_divergence_parameters(params_str: str) -> tuple[str, dict]:
-    # Exactly the same parameters as RSI, but different name
-    name, params = parse_rsi_parameters(params_str)
-    return 'rsi_div', params
-
-
-def parse_macd_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse MACD parameters: fast_period,slow_period,signal_period,price_type"""
-    params = params_str.split(',')
-    if len(params) != 4:
-        raise ValueError(f"MACD requires exactly 4 parameters: fast_period,slow_period,signal_period,price_type. Got: {params_str}")
-    
-    try:
-        fast_period = int(float(params[0].strip()))  # Handle float values
-        slow_period = int(float(params[1].strip()))
-        signal_period = int(float(params[2].strip()))
-        price_type = params[3].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid MACD parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"MACD price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'macd', {
-        'macd_fast': fast_period,
-        'macd_slow': slow_period,
-        'macd_signal': signal_period,
-        'price_type': price_type
-    }
-
-
-def parse_stoch_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse Stochastic parameters: k_period,d_period,price_type"""
-    params = params_str.split(',')
-    if len(params) != 3:
-        raise ValueError(f"Stochastic requires exactly 3 parameters: k_period,d_period,price_type. Got: {params_str}")
-    
-    try:
-        k_period = int(float(params[0].strip()))  # Handle float values
-        d_period = int(float(params[1].strip()))
-        price_type = params[2].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid Stochastic parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"Stochastic price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'stoch', {
-        'stoch_k_period': k_period,
-        'stoch_d_period': d_period,
-        'price_type': price_type
-    }
-
-
-def parse_ema_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse EMA parameters: period,price_type"""
-    params = params_str.split(',')
-    if len(params) != 2:
-        raise ValueError(f"EMA requires exactly 2 parameters: period,price_type. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        price_type = params[1].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid EMA parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"EMA price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'ema', {
-        'ema_period': period,
-        'price_type': price_type
-    }
-
-
-def parse_sma_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse SMA parameters: period,price_type"""
-    params = params_str.split(',')
-    if len(params) != 2:
-        raise ValueError(f"SMA requires exactly 2 parameters: period,price_type. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        price_type = params[1].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid SMA parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"SMA price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'sma', {
-        'sma_period': period,
-        'price_type': price_type
-    }
-
-def parse_wave_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse Wave parameters: long1,fast1,trend1,tr1,long2,fast2,trend2,tr2,global_tr,sma_period,price_type"""
-    params = params_str.split(',')
-    if len(params) != 11:
-        raise ValueError(f"Wave requires exactly 11 parameters: long1,fast1,trend1,tr1,long2,fast2,trend2,tr2,global_tr,sma_period,price_type. Got: {params_str}")
-
-    try:
-        long1 = int(float(params[0].strip())) # Handle float values like 14.0
-        fast1 = int(float(params[1].strip()))
-        trend1 = int(float(params[2].strip()))
-        tr1_str = params[3].strip().upper()
-        if tr1_str == 'FAST':
-            tr1 = ENUM_MOM_TR.TR_Fast
-        elif tr1_str == 'ZONE':
-            tr1 = ENUM_MOM_TR.TR_Zone
-        elif tr1_str == 'STRONGTREND':
-            tr1 = ENUM_MOM_TR.TR_StrongTrend
-        elif tr1_str == 'WEAKTREND':
-            tr1 = ENUM_MOM_TR.TR_WeakTrend
-        elif tr1_str == 'FASTZONEREVERSE':
-            tr1 = ENUM_MOM_TR.TR_FastZoneReverse
-        elif tr1_str == 'BETTERTREND':
-            tr1 = ENUM_MOM_TR.TR_BetterTrend
-        elif tr1_str == 'BETTERFAST':
-            tr1 = ENUM_MOM_TR.TR_BetterFast
-        elif tr1_str == 'ROST':
-            tr1 = ENUM_MOM_TR.TR_Rost
-        elif tr1_str == 'TRENDROST':
-            tr1 = ENUM_MOM_TR.TR_TrendRost
-        elif tr1_str == 'BETTERTRENDROST':
-            tr1 = ENUM_MOM_TR.TR_BetterTrendRost
-        else:
-            raise ValueError(f"Invalid tr1 value: {tr1_str}")
-        
-        long2 = int(float(params[4].strip()))
-        fast2 = int(float(params[5].strip()))
-        trend2 = int(float(params[6].strip()))
-        
-        tr2_str = params[7].strip().upper()
-        if tr2_str == 'FAST':
-            tr2 = ENUM_MOM_TR.TR_Fast
-        elif tr2_str == 'ZONE':
-            tr2 = ENUM_MOM_TR.TR_Zone
-        elif tr2_str == 'STRONGTREND':
-            tr2 = ENUM_MOM_TR.TR_StrongTrend
-        elif tr2_str == 'WEAKTREND':
-            tr2 = ENUM_MOM_TR.TR_WeakTrend
-        elif tr2_str == 'FASTZONEREVERSE':
-            tr2 = ENUM_MOM_TR.TR_FastZoneReverse
-        elif tr2_str == 'BETTERTREND':
-            tr2 = ENUM_MOM_TR.TR_BetterTrend
-        elif tr2_str == 'BETTERFAST':
-            tr2 = ENUM_MOM_TR.TR_BetterFast
-        elif tr2_str == 'ROST':
-            tr2 = ENUM_MOM_TR.TR_Rost
-        elif tr2_str == 'TRENDROST':
-            tr2 = ENUM_MOM_TR.TR_TrendRost
-        elif tr2_str == 'BETTERTRENDROST':
-            tr2 = ENUM_MOM_TR.TR_BetterTrendRost
-        else:
-            raise ValueError(f"Invalid tr2 value: {tr2_str}")
-        
-        global_tr_str = params[8].strip().upper()
-        if global_tr_str == 'PRIME':
-            global_tr = ENUM_GLOBAL_TR.G_TR_PRIME
-        elif global_tr_str == 'REVERSE':
-            global_tr = ENUM_GLOBAL_TR.G_TR_REVERSE
-        elif global_tr_str == 'PRIMEZONE':
-            global_tr = ENUM_GLOBAL_TR.G_TR_PRIME_ZONE
-        elif global_tr_str == 'REVERSEZONE':
-            global_tr = ENUM_GLOBAL_TR.G_TR_REVERSE_ZONE
-        elif global_tr_str == 'NEWZONE':
-            global_tr = ENUM_GLOBAL_TR.G_TR_NEW_ZONE
-        elif global_tr_str == 'LONGZONE':
-            global_tr = ENUM_GLOBAL_TR.G_TR_LONG_ZONE
-        elif global_tr_str == 'LONGZONEREVERSE':
-            global_tr = ENUM_GLOBAL_TR.G_TR_LONG_ZONE_REVERSE
-        else:
-            raise ValueError(f"Invalid global_tr value: {global_tr_str}")
-        sma_period = int(float(params[9].strip()))
-        price_type = params[10].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid Wave parameters: {params_str}. Error: {e}")
-
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"Wave price_type must be 'open' or 'close', got: {price_type}")
-
-    return 'wave', {
-        'long1': long1,
-        'fast1': fast1,
-        'trend1': trend1,
-        'tr1': tr1,
-        'long2': long2,
-        'fast2': fast2,
-        'trend2': trend2,
-        'tr2': tr2,
-        'global_tr': global_tr,
-        'sma_period': sma_period,
-        'price_type': price_type
-    }
-
-
-def parse_bb_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse Bollinger Bands parameters: period,std_dev,price_type"""
-    params = params_str.split(',')
-    if len(params) != 3:
-        raise ValueError(f"Bollinger Bands requires exactly 3 parameters: period,std_dev,price_type. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        std_dev = float(params[1].strip())
-        price_type = params[2].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid Bollinger Bands parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"Bollinger Bands price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'bb', {
-        'bb_period': period,
-        'bb_std_dev': std_dev,
-        'price_type': price_type
-    }
-
-
-def parse_atr_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse ATR parameters: period"""
-    params = params_str.split(',')
-    if len(params) != 1:
-        raise ValueError(f"ATR requires exactly 1 parameter: period. Got: {params_str}")
-    
+def _parse_or_show_help(parser, indicator_name: str, params_str: str) -> tuple[str, dict]:
+    """Run a parameter parser, printing the error and the indicator's help and exiting on invalid input."""
     try:
-        period = int(float(params[0].strip()))  # Handle float values
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid ATR parameters: {params_str}. Error: {e}")
-    
-    return 'atr', {
-        'atr_period': period
-    }
-
-
-def parse_cci_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse CCI parameters: period,price_type"""
-    params = params_str.split(',')
-    if len(params) != 2:
-        raise ValueError(f"CCI requires exactly 2 parameters: period,price_type. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        price_type = params[1].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid CCI parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"CCI price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'cci', {
-        'cci_period': period,
-        'price_type': price_type
-    }
-
-
-def parse_vwap_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse VWAP parameters: price_type"""
-    params = params_str.split(',')
-    if len(params) != 1:
-        raise ValueError(f"VWAP requires exactly 1 parameter: price_type. Got: {params_str}")
-    
-    try:
-        price_type = params[0].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid VWAP parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"VWAP price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'vwap', {
-        'price_type': price_type
-    }
-
-
-def parse_pivot_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse Pivot Points parameters: price_type"""
-    params = params_str.split(',')
-    if len(params) != 1:
-        raise ValueError(f"Pivot Points requires exactly 1 parameter: price_type. Got: {params_str}")
-    
-    try:
-        price_type = params[0].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid Pivot Points parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"Pivot Points price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'pivot', {
-        'price_type': price_type
-    }
-
-
-def parse_hma_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse HMA parameters: period,price_type"""
-    params = params_str.split(',')
-    if len(params) != 2:
-        raise ValueError(f"HMA requires exactly 2 parameters: period,price_type. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        price_type = params[1].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid HMA parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"HMA price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'hma', {
-        'hma_period': period,
-        'price_type': price_type
-    }
-
-
-def parse_tsf_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse TSF parameters: period,price_type"""
-    params = params_str.split(',')
-    if len(params) != 2:
-        raise ValueError(f"TSF requires exactly 2 parameters: period,price_type. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        price_type = params[1].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid TSF parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"TSF price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'tsf', {
-        'tsforecast_period': period,
-        'price_type': price_type
-    }
-
-
-def parse_monte_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse Monte Carlo parameters: simulations,period"""
-    params = params_str.split(',')
-    if len(params) != 2:
-        raise ValueError(f"Monte Carlo requires exactly 2 parameters: simulations,period. Got: {params_str}")
-    
-    try:
-        simulations = int(float(params[0].strip()))  # Handle float values
-        period = int(float(params[1].strip()))
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid Monte Carlo parameters: {params_str}. Error: {e}")
-    
-    return 'monte', {
-        'simulations': simulations,
-        'period': period
-    }
-
-
-def parse_kelly_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse Kelly Criterion parameters: period"""
-    params = params_str.split(',')
-    if len(params) != 1:
-        raise ValueError(f"Kelly Criterion requires exactly 1 parameter: period. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid Kelly Criterion parameters: {params_str}. Error: {e}")
-    
-    return 'kelly', {
-        'kelly_period': period
-    }
-
-
-def parse_donchain_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse Donchian Channels parameters: period"""
-    params = params_str.split(',')
-    if len(params) != 1:
-        raise ValueError(f"Donchian Channels requires exactly 1 parameter: period. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid Donchian Channels parameters: {params_str}. Error: {e}")
-    
-    return 'donchain', {
-        'donchain_period': period
-    }
-
-
-def parse_fibo_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse Fibonacci Retracements parameters: levels or 'all'"""
-    params = params_str.split(',')
-    if len(params) < 1:
-        raise ValueError(f"Fibonacci Retracements requires at least 1 parameter: levels or 'all'. Got: {params_str}")
-    
-    # Check if first parameter is 'all'
-    if params[0].strip().lower() == 'all':
-        # Use all standard Fibonacci levels
-        levels = [0.236, 0.382, 0.5, 0.618, 0.786]
-    else:
-        # Parse custom Fibonacci levels
-        try:
-            levels = [float(p.strip()) for p in params]
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Invalid Fibonacci Retracements parameters: {params_str}. Error: {e}")
-    
-    return 'fibo', {
-        'fib_levels': levels
-    }
+        return parser(params_str)
+    except ValueError as e:
+        print(f"\n[ERROR] {e}\n")
+        show_indicator_help(indicator_name)
+        sys.exit(1)
 
 
 def parse_obv_parameters(params_str: str) -> tuple[str, dict]:
     """Parse OBV parameters: none required"""
-    from .cli import show_indicator_help
-    # Allow empty parameters after colon (e.g., "obv:")
-    if params_str.strip():
-        # If there are actual parameters, show enhanced help
-        print(f"\n[ERROR] OBV does not require parameters. Got: {params_str}\n")
-        show_indicator_help('obv')
-        import sys
-        sys.exit(1)
-    
-    return 'obv', {}
+    return _parse_or_show_help(_parse_obv_parameters, 'obv', params_str)
 
 
 def parse_stdev_parameters(params_str: str) -> tuple[str, dict]:
     """Parse Standard Deviation parameters: period,price_type"""
-    from .cli import show_indicator_help
-    # Handle empty string case
-    if not params_str.strip():
-        print("\n[ERROR] Standard Deviation requires exactly 2 parameters: period,price_type.\n")
-        show_indicator_help('stdev')
-        import sys
-        sys.exit(1)
-    
-    params = params_str.split(',')
-    if len(params) != 2:
-        print(f"\n[ERROR] Standard Deviation requires exactly 2 parameters: period,price_type. Got: {params_str}\n")
-        show_indicator_help('stdev')
-        import sys
-        sys.exit(1)
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        price_type = params[1].strip().lower()
-    except (ValueError, IndexError) as e:
-        print(f"\n[ERROR] Invalid Standard Deviation parameters: {params_str}. Error: {e}\n")
-        show_indicator_help('stdev')
-        import sys
-        sys.exit(1)
-    
-    if price_type not in ['open', 'close']:
-        print(f"\n[ERROR] Standard Deviation price_type must be 'open' or 'close', got: {price_type}\n")
-        show_indicator_help('stdev')
-        import sys
-        sys.exit(1)
-    
-    return 'stdev', {
-        'stdev_period': period,
-        'price_type': price_type
-    }
-
-
-def parse_adx_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse ADX parameters: period"""
-    params = params_str.split(',')
-    if len(params) != 1:
-        raise ValueError(f"ADX requires exactly 1 parameter: period. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid ADX parameters: {params_str}. Error: {e}")
-    
-    return 'adx', {
-        'adx_period': period
-    }
-
-
-def parse_sar_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse SAR parameters: acceleration,maximum"""
-    params = params_str.split(',')
-    if len(params) != 2:
-        raise ValueError(f"SAR requires exactly 2 parameters: acceleration,maximum. Got: {params_str}")
-    
-    try:
-        acceleration = float(params[0].strip())
-        maximum = float(params[1].strip())
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid SAR parameters: {params_str}. Error: {e}")
-    
-    return 'sar', {
-        'sar_acceleration': acceleration,
-        'sar_maximum': maximum
-    }
+    return _parse_or_show_help(_parse_stdev_parameters, 'stdev', params_str)
 
 
 def parse_supertrend_parameters(params_str: str) -> tuple[str, dict]:
     """Parse SuperTrend parameters: period,multiplier[,price_type]"""
-    from .cli import show_indicator_help
-    # Handle empty string case
-    if not params_str.strip():
-        print("\n[ERROR] SuperTrend requires exactly 2-3 parameters: period,multiplier[,price_type].\n")
-        show_indicator_help('supertrend')
-        import sys
-        sys.exit(1)
-    params = params_str.split(',')
-    if len(params) < 2 or len(params) > 3:
-        print(f"\n[ERROR] SuperTrend requires exactly 2-3 parameters: period,multiplier[,price_type]. Got: {params_str}\n")
-        show_indicator_help('supertrend')
-        import sys
-        sys.exit(1)
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        multiplier = float(params[1].strip())
-        price_type = params[2].strip().lower() if len(params) > 2 else 'close'
-    except (ValueError, IndexError) as e:
-        print(f"\n[ERROR] Invalid SuperTrend parameters: {params_str}. Error: {e}\n")
-        show_indicator_help('supertrend')
-        import sys
-        sys.exit(1)
-    if price_type not in ['open', 'close']:
-        print(f"\n[ERROR] SuperTrend price_type must be 'open' or 'close', got: {price_type}\n")
-        show_indicator_help('supertrend')
-        import sys
-        sys.exit(1)
-    return 'supertrend', {
-        'supertrend_period': period,
-        'multiplier': multiplier,
-        'price_type': price_type
-    }
-
-
-def parse_putcallratio_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse Put/Call Ratio parameters: period,price_type[,bullish_threshold,bearish_threshold]"""
-    params = params_str.split(',')
-    if len(params) < 2 or len(params) > 4:
-        raise ValueError(f"Put/Call Ratio requires 2-4 parameters: period,price_type[,bullish_threshold,bearish_threshold]. Got: {params_str}")
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        price_type = params[1].strip().lower()
-        bullish_threshold = float(params[2].strip()) if len(params) > 2 else 60.0
-        bearish_threshold = float(params[3].strip()) if len(params) > 3 else 40.0
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid Put/Call Ratio parameters: {params_str}. Error: {e}")
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"Put/Call Ratio price_type must be 'open' or 'close', got: {price_type}")
-    return 'putcallratio', {
-        'putcall_period': period,
-        'price_type': price_type,
-        'bullish_threshold': bullish_threshold,
-        'bearish_threshold': bearish_threshold
-    }
-
-
-def parse_cot_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse COT parameters: period,price_type"""
-    params = params_str.split(',')
-    if len(params) != 2:
-        raise ValueError(f"COT requires exactly 2 parameters: period,price_type. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        price_type = params[1].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid COT parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"COT price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'cot', {
-        'cot_period': period,
-        'price_type': price_type
-    }
-
-
-def parse_feargreed_parameters(params_str: str) -> tuple[str, dict]:
-    """Parse Fear & Greed parameters: period,price_type"""
-    params = params_str.split(',')
-    if len(params) != 2:
-        raise ValueError(f"Fear & Greed requires exactly 2 parameters: period,price_type. Got: {params_str}")
-    
-    try:
-        period = int(float(params[0].strip()))  # Handle float values
-        price_type = params[1].strip().lower()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid Fear & Greed parameters: {params_str}. Error: {e}")
-    
-    if price_type not in ['open', 'close']:
-        raise ValueError(f"Fear & Greed price_type must be 'open' or 'close', got: {price_type}")
-    
-    return 'feargreed', {
-        'feargreed_period': period,
-        'price_type': price_type
-    }
+    return _parse_or_show_help(_parse_supertrend_parameters, 'supertrend', params_str)
 
 
 def parse_indicator_parameters(rule_str: str) -> tuple[str, dict]:
     """
     Parse indicator rule string in format 'indicator:param1,param2,param3,param4'.
-    
+
+    Shows the indicator's help and exits on invalid rules; non-CLI code uses
+    src.calculation.indicator_parameters.parse_rule_parameters, which raises ValueError.
+
     Args:
         rule_str (str): Rule string like 'rsi:14,30,70,open' or 'rsi'
-    
+
     Returns:
         tuple: (indicator_name, parameters_dict)
     """
-    if ':' not in rule_str:
-        # No parameters provided, return indicator name and empty dict
-        return rule_str.lower(), {}
-    
     try:
-        # Split by ':' to separate indicator name from parameters
-        parts = rule_str.split(':', 1)
-        if len(parts) != 2:
-            raise ValueError(f"Invalid rule format: {rule_str}")
-        
-        indicator_name = parts[0].lower().strip()
-        params_str = parts[1].strip()
-        
-        # Parse parameters based on indicator type
-        if indicator_name in ['stoch', 'stochastic', 'stochoscillator']:
-            # Always parse as stoch and return 'stoch' as indicator name
-            _, params = parse_stoch_parameters(params_str)
-            return 'stoch', params
-        elif indicator_name in ['monte', 'montecarlo', 'mc']:
-            # Always parse as monte and return 'monte' as indicator name
-            _, params = parse_monte_parameters(params_str)
-            return 'monte', params
-        elif indicator_name in ['feargreed', 'fg']:
-            # Always parse as feargreed and return 'feargreed' as indicator name
-            _, params = parse_feargreed_parameters(params_str)
-            return 'feargreed', params
-        elif indicator_name in ['tsf', 'tsforecast']:
-            # Always parse as tsf and return 'tsf' as indicator name
-            _, params = parse_tsf_parameters(params_str)
-            return 'tsf', params
-        elif indicator_name == 'rsi':
-            return parse_rsi_parameters(params_str)
-        elif indicator_name == 'rsi_mom':
-            return parse_rsi_momentum_parameters(params_str)
-        elif indicator_name == 'rsi_div':
-            return parse_rsi_divergence_parameters(params_str)
-        elif indicator_name == 'macd':
-            return parse_macd_parameters(params_str)
-        elif indicator_name == 'ema':
-            return parse_ema_parameters(params_str)
-        elif indicator_name == 'sma':
-            return parse_sma_parameters(params_str)
-        elif indicator_name == 'bb':
-            return parse_bb_parameters(params_str)
-        elif indicator_name == 'atr':
-            return parse_atr_parameters(params_str)
-        elif indicator_name == 'cci':
-            return parse_cci_parameters(params_str)
-        elif indicator_name == 'vwap':
-            return parse_vwap_parameters(params_str)
-        elif indicator_name == 'pivot':
-            return parse_pivot_parameters(params_str)
-        elif indicator_name == 'hma':
-            return parse_hma_parameters(params_str)
-        elif indicator_name == 'kelly':
-            return parse_kelly_parameters(params_str)
-        elif indicator_name == 'donchain':
-            return parse_donchain_parameters(params_str)
-        elif indicator_name == 'fibo':
-            return parse_fibo_parameters(params_str)
-        elif indicator_name == 'obv':
-            return parse_obv_parameters(params_str)
-        elif indicator_name == 'stdev':
-            return parse_stdev_parameters(params_str)
-        elif indicator_name == 'adx':
-            return parse_adx_parameters(params_str)
-        elif indicator_name == 'sar':
-            return parse_sar_parameters(params_str)
-        elif indicator_name == 'supertrend':
-            return parse_supertrend_parameters(params_str)
-        elif indicator_name == 'putcallratio':
-            return parse_putcallratio_parameters(params_str)
-        elif indicator_name == 'cot':
-            return parse_cot_parameters(params_str)
-        elif indicator_name == 'wave':
-            return parse_wave_parameters(params_str)
-        else:
-            # Unknown indicator, show help and raise error
-            raise ValueError(f"Unknown indicator: {indicator_name}")
-            
+        return parse_rule_parameters(rule_str)
     except Exception as e:
         # Show cool help for parameterized indicators on any parsing error
         from .error_handling import show_enhanced_indicator_help
@@ -1739,3 +1121,79 @@ def parse_indicator_parameters(rule_str: str) -> tuple[str, dict]:
         # After showing help, exit with error
         import sys
         sys.exit(1)
+
+
+
+# Indicator names that may start a rule inside a --rules list
+_RULES_LIST_NAMES = {name.lower() for name in TradingRule.__members__} | {
+    'phld', 'pv', 'sr', 'rsi_mom', 'rsi_div', 'macd', 'stoch', 'stochastic', 'stochoscillator',
+    'ema', 'sma', 'bb', 'atr', 'cci', 'vwap', 'pivot', 'hma', 'tsf', 'tsforecast', 'monte',
+    'montecarlo', 'mc', 'kelly', 'putcallratio', 'pcr', 'cot', 'feargreed', 'fg', 'donchain',
+    'fibo', 'obv', 'stdev', 'adx', 'sar', 'supertrend', 'wave'
+}
+
+
+def normalize_rule_alias(rule_str: str) -> str:
+    """
+    Normalize parameterized rule aliases to the names used by the parameter parser.
+
+    Args:
+        rule_str (str): Rule string like 'stochastic:14,3,close' or 'mc:1000,20'
+
+    Returns:
+        str: Normalized rule string (e.g. 'stoch:14,3,close', 'monte:1000,20')
+    """
+    aliases = {
+        'stochastic': 'stoch',
+        'stochoscillator': 'stoch',
+        'montecarlo': 'monte',
+        'mc': 'monte',
+        'fg': 'feargreed',
+        'tsforecast': 'tsf',
+    }
+    if ':' not in rule_str:
+        return rule_str
+    name, params = rule_str.split(':', 1)
+    alias = aliases.get(name.lower())
+    return f"{alias}:{params}" if alias else rule_str
+
+
+def split_rules_argument(rules_str: str) -> list:
+    """
+    Split a --rules value into individual rule strings.
+
+    Rules are separated by ';' or ','. Because parameters are comma separated
+    too, a comma only starts a new rule when the next token is a known indicator
+    name: 'rsi:14,30,70,close,macd' -> ['rsi:14,30,70,close', 'macd'].
+
+    Args:
+        rules_str (str): Value of --rules
+
+    Returns:
+        list: Non-empty list of normalized rule strings
+
+    Raises:
+        ValueError: If the list is empty or contains an unknown indicator name
+    """
+    rules = []
+    # A ';' always ends the current rule
+    for group in rules_str.split(';'):
+        group_rules = []
+        for token in group.split(','):
+            token = token.strip()
+            if not token:
+                continue
+            name = token.split(':', 1)[0].lower()
+            if not group_rules or ':' in token or name in _RULES_LIST_NAMES:
+                group_rules.append(token)
+            else:
+                group_rules[-1] = f"{group_rules[-1]},{token}"
+        rules.extend(group_rules)
+    if not rules:
+        raise ValueError("--rules requires at least one indicator, e.g. --rules rsi,macd,bb,atr")
+
+    for rule in rules:
+        name = rule.split(':', 1)[0].lower()
+        if name not in _RULES_LIST_NAMES:
+            raise ValueError(f"Invalid indicator name '{name}' in --rules. Valid indicators: {', '.join(sorted(_RULES_LIST_NAMES))}")
+    return [normalize_rule_alias(rule) for rule in rules]
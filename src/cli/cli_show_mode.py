@@ -3,6 +3,8 @@
 
 from pathlib import Path
 import pyarrow.parquet as pq
+from src.data.parquet_reader import read_parquet_data, parquet_row_count
+from src.data.parquet_metadata import get_metadata_index
 import pandas as pd
 import sys
 import time  # Added for timing tracking
@@ -214,31 +216,27 @@ def count_files_by_source(args=None):
                     source_counts['other'] += 1
     return source_counts
 
-def get_parquet_metadata(file_path: Path) -> dict:
+def get_parquet_metadata(file_path: Path, include_rows: bool = True) -> dict:
     """
     Reads metadata (row count, columns, first/last row with all fields) from a Parquet file.
+
+    Only the footer, the first batch and the last row group are read, and the
+    result is kept in the persistent metadata index until the file changes.
+    With include_rows=False the date range comes from the footer statistics and
+    first_row/last_row are None.
     """
-    metadata = {'num_rows': -1, 'columns': [], 'first_row': None, 'last_row': None, 'first_date': None, 'last_date': None}
     try:
-        parquet_file = pq.ParquetFile(file_path)
-        metadata['num_rows'] = parquet_file.metadata.num_rows
-        metadata['columns'] = parquet_file.schema.names
-        if metadata['num_rows'] > 0:
-            df_head = pd.read_parquet(file_path).head(1)
-            if not df_head.empty:
-                metadata['first_row'] = df_head.iloc[0]
-                metadata['first_date'] = df_head.index[0] if isinstance(df_head.index, pd.DatetimeIndex) else df_head.iloc[0, 0]
-            if metadata['num_rows'] > 1:
-                df_tail = pd.read_parquet(file_path).tail(1)
-                if not df_tail.empty:
-                    metadata['last_row'] = df_tail.iloc[0]
-                    metadata['last_date'] = df_tail.index[0] if isinstance(df_tail.index, pd.DatetimeIndex) else df_tail.iloc[0, 0]
-            elif metadata['num_rows'] == 1:
-                metadata['last_row'] = metadata['first_row']
-                metadata['last_date'] = metadata['first_date']
+        return get_metadata_index().get_metadata(file_path, include_rows)
     except Exception as e:
         print(f"Warning: Could not read metadata for {file_path.name}. Error: {e}", file=sys.stderr)
-    return metadata
+    return {'num_rows': -1, 'columns': [], 'first_row': None, 'last_row': None, 'first_date': None, 'last_date': None}
+
+def _save_metadata_index():
+    """Writes the metadata index after a listing; failures only cost a re-read next time."""
+    try:
+        get_metadata_index().save()
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not save parquet metadata index. Error: {e}", file=sys.stderr)
 
 def _get_relevant_columns_for_rule(rule_name: str, all_columns=None) -> list:
     """
@@ -647,7 +645,7 @@ def _display_file_info(found_files):
     found_files.sort(key=lambda x: x['name'])
     print("-" * 40)
     for idx, file_info in enumerate(found_files):
-        metadata = get_parquet_metadata(file_info['path'])
+        metadata = get_parquet_metadata(file_info['path'], include_rows=len(found_files) == 1)
         file_info.update(metadata)
         print(f"[{idx}] {file_info['name']}")
         print(f"    Size: {file_info['size_mb']:.3f} MB")
@@ -695,6 +693,7 @@ def _display_file_info(found_files):
                     print(" | ".join(values))
                 else:
                     print(f"{file_info['last_row']}")
+    _save_metadata_index()
     print("-" * 40)
 
 def _extract_point_size(file_info):
@@ -735,9 +734,10 @@ def _handle_auto_display_mode(args, found_files, metrics):
     print(f"\n=== AUTO DISPLAY MODE ===")
     print(f"Loading file data and preparing to display all columns...")
     
-    # Track data loading time
+    # Track data loading time (the date range is pushed down to the parquet reader)
+    start, end = _extract_datetime_filter_args(args)
     t_load_start = time.perf_counter()
-    df = pd.read_parquet(found_files[0]['path'])
+    df = read_parquet_data(found_files[0]['path'], start=start, end=end)
     t_load_end = time.perf_counter()
     metrics["data_fetch_duration"] = t_load_end - t_load_start
     
@@ -748,7 +748,6 @@ def _handle_auto_display_mode(args, found_files, metrics):
     metrics["data_size_mb"] = metrics["data_size_bytes"] / (1024 * 1024)
     metrics["file_size_bytes"] = found_files[0]['path'].stat().st_size
     
-    start, end = _extract_datetime_filter_args(args)
     if start or end:
         df = _filter_dataframe_by_date(df, start, end)
 
@@ -863,9 +862,10 @@ def _handle_indicator_calculation_mode(args, found_files, metrics):
     print(f"\n=== INDICATOR CALCULATION MODE ===")
     print(f"Loading file data and calculating indicator '{args.rule}' ...")
     
-    # Track data loading time
+    # Track data loading time (the date range is pushed down to the parquet reader)
+    start, end = _extract_datetime_filter_args(args)
     t_load_start = time.perf_counter()
-    df = pd.read_parquet(found_files[0]['path'])
+    df = read_parquet_data(found_files[0]['path'], start=start, end=end)
     t_load_end = time.perf_counter()
     metrics["data_fetch_duration"] = t_load_end - t_load_start
     
@@ -877,7 +877,6 @@ def _handle_indicator_calculation_mode(args, found_files, metrics):
     metrics["file_size_bytes"] = found_files[0]['path'].stat().st_size
     
     # Apply date filtering if requested
-    start, end = _extract_datetime_filter_args(args)
     if start or end:
         df = _filter_dataframe_by_date(df, start, end)
     
@@ -927,7 +926,9 @@ def _handle_indicator_calculation_mode(args, found_files, metrics):
                 signal_col=signal_col,
                 lot_size=lot_size,
                 risk_reward_ratio=risk_reward_ratio,
-                fee_per_trade=fee_per_trade
+                fee_per_trade=fee_per_trade,
+                mc_simulations=getattr(args, 'mc_sims', 1000),
+                mc_seed=getattr(args, 'mc_seed', None)
             )
         else:
             print('WARNING: universal_trading_metrics not available for import')
@@ -1046,17 +1047,17 @@ def _handle_single_file_mode(args, found_files, metrics):
     """Handle single file mode without indicator calculation."""
     print(f"Found one file. Loading data and preparing to display...")
     try:
-        # Track data loading time for single file
+        # Track data loading time for single file (the date range is pushed down to the reader)
+        start, end = _extract_datetime_filter_args(args)
         t_load_start = time.perf_counter()
-        df = pd.read_parquet(found_files[0]['path'])
+        df = read_parquet_data(found_files[0]['path'], start=start, end=end)
         t_load_end = time.perf_counter()
         metrics["data_fetch_duration"] = t_load_end - t_load_start
         
         # Apply date filtering if requested
-        start, end = _extract_datetime_filter_args(args)
         if start or end:
             print(f"Applying date filtering to data...")
-            original_len = len(df)
+            original_len = parquet_row_count(found_files[0]['path'])
             df = _filter_dataframe_by_date(df, start, end)
             print(f"After date filtering: {len(df)} rows remaining (from {original_len})")
             
@@ -1228,12 +1229,18 @@ def _calculate_and_plot_indicator(args, df, data_info, file_info, point_size, me
     
     # Track indicator calculation time
     t_calc_start = time.perf_counter()
-    result_df, selected_rule = calculate_indicator(args, df, point_size)
+    indicator_state = None
+    if getattr(args, 'export_parquet', False):
+        # Records resumable state with the export (and reuses it with --incremental)
+        from src.calculation.incremental_calculation import calculate_indicator_for_export
+        result_df, selected_rule, indicator_state = calculate_indicator_for_export(args, df, point_size, data_info)
+    else:
+        result_df, selected_rule = calculate_indicator(args, df, point_size)
     t_calc_end = time.perf_counter()
     metrics["calc_duration"] = t_calc_end - t_calc_start
 
     # Export indicator data if requested
-    _handle_indicator_exports(args, result_df, data_info, selected_rule)
+    _handle_indicator_exports(args, result_df, data_info, selected_rule, indicator_state)
 
     # Draw plot with indicator
     estimated_point = True
@@ -1245,13 +1252,16 @@ def _calculate_and_plot_indicator(args, df, data_info, file_info, point_size, me
     
     return metrics
 
-def _handle_indicator_exports(args, result_df, data_info, selected_rule):
+def _handle_indicator_exports(args, result_df, data_info, selected_rule, indicator_state=None):
     """Handle indicator data exports if requested."""
     if hasattr(args, 'export_parquet') and args.export_parquet:
         print(f"Exporting indicator data to parquet file...")
         export_info = export_indicator_to_parquet(result_df, data_info, selected_rule, args)
         if export_info["success"]:
             print(f"Indicator data exported to: {export_info['output_file']}")
+            if indicator_state is not None:
+                from src.calculation.incremental_calculation import save_indicator_state
+                save_indicator_state(export_info['output_file'], indicator_state)
         else:
             print(f"Failed to export indicator data: {export_info['error_message']}")
     
@@ -1479,7 +1489,7 @@ def _display_indicator_file_list(found_files, metrics):
         format_files = [f for f in found_files if f['format'] == file_info['format']]
         if len(format_files) == 1:
             if file_info['format'] == 'parquet':
-                metadata = get_parquet_metadata(file_info['path'])
+                metadata = get_parquet_metadata(file_info['path'], include_rows=False)
                 if metadata['num_rows'] != -1:
                     print(f"    Rows: {metadata['num_rows']:,}")
                 print(f"    Columns ({len(metadata['columns'])}): {', '.join(metadata['columns'])}")
@@ -1493,6 +1503,7 @@ def _display_indicator_file_list(found_files, metrics):
                     metrics["columns_count"] = file_metrics.get("columns_count", 0)
                 metrics["data_size_mb"] += file_metrics.get("data_size_mb", 0)
 
+    _save_metadata_index()
     return metrics
 
 def handle_indicator_show_mode(args):
@@ -1670,7 +1681,8 @@ def _show_single_indicator_file(file_info, args):
         try:
             # Track data loading time
             load_start_time = time.time()
-            df = pd.read_parquet(file_path)
+            start, end = _extract_datetime_filter_args(args)
+            df = read_parquet_data(file_path, start=start, end=end)
             # === ADDED: if there's a DateTime column, make it the index ===
             if 'DateTime' in df.columns:
                 df['DateTime'] = pd.to_datetime(df['DateTime'], errors='coerce')
@@ -7,8 +7,9 @@ All comments are in English.
 """
 import os
 import glob
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 import pandas as pd
 from tqdm import tqdm
 
@@ -53,13 +54,76 @@ def find_csv_files_in_folder(folder_path: str) -> List[str]:
     return csv_files
 
 
+def _convert_csv_file(csv_file: str) -> Tuple[str, int, Optional[str]]:
+    """
+    Convert one MT5 CSV export to the Parquet cache.
+
+    Runs in worker processes, so only the row count is returned instead of the DataFrame.
+
+    Args:
+        csv_file (str): Path to the CSV file
+
+    Returns:
+        Tuple[str, int, Optional[str]]: (file name, converted rows, error message or None)
+    """
+    file_name = Path(csv_file).name
+    try:
+        # Use the existing CSV fetcher to process the file
+        # This will automatically handle Parquet caching
+        csv_column_mapping = {
+            'Open': 'Open,', 'High': 'High,', 'Low': 'Low,',
+            'Close': 'Close,', 'Volume': 'TickVolume,'
+        }
+        csv_datetime_column = 'DateTime,'
+
+        df = fetch_csv_data(
+            file_path=csv_file,
+            ohlc_columns=csv_column_mapping,
+            datetime_column=csv_datetime_column,
+            skiprows=1,
+            separator=','
+        )
+    except Exception as e:
+        return file_name, 0, f"Error processing {file_name}: {str(e)}"
+
+    if df is not None and not df.empty:
+        return file_name, len(df), None
+    return file_name, 0, f"Failed to process CSV file: {file_name}"
+
+
+def _iter_conversions(csv_files: List[str], workers: int,
+                      on_start: Optional[Callable[[str], None]] = None) -> Iterator[Tuple[str, int, Optional[str]]]:
+    """
+    Yields conversion results as files finish, in a process pool when workers > 1.
+
+    on_start is called with the file name before each sequential conversion.
+    """
+    if workers <= 1 or len(csv_files) <= 1:
+        for csv_file in csv_files:
+            if on_start is not None:
+                on_start(Path(csv_file).name)
+            yield _convert_csv_file(csv_file)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(csv_files))) as executor:
+        futures = {executor.submit(_convert_csv_file, csv_file): csv_file for csv_file in csv_files}
+        for future in as_completed(futures):
+            file_name = Path(futures[future]).name
+            try:
+                yield future.result()
+            except Exception as e:
+                # Worker process died (e.g. out of memory)
+                yield file_name, 0, f"Error processing {file_name}: {str(e)}"
+
+
 def process_csv_folder(args) -> Dict[str, Any]:
     """
     Process all CSV files in a folder and convert them to Parquet format.
     This function handles batch conversion of multiple CSV files with progress bar.
+    With args.workers > 1 the files are converted in parallel worker processes.
     
     Args:
-        args: Parsed command-line arguments containing csv_folder and point
+        args: Parsed command-line arguments containing csv_folder, point and workers
         
     Returns:
         Dict[str, Any]: Results dictionary with processing metrics
@@ -84,6 +148,9 @@ def process_csv_folder(args) -> Dict[str, Any]:
         return results
     
     results["total_files"] = len(csv_files)
+    workers = max(1, int(getattr(args, 'workers', 1) or 1))
+    if workers > 1:
+        print_info(f"Converting with {min(workers, len(csv_files))} worker processes")
     
     # Create progress bar
     with tqdm(total=len(csv_files), 
@@ -92,56 +159,29 @@ def process_csv_folder(args) -> Dict[str, Any]:
               bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}",
               colour="green") as pbar:
         
-        # Process each CSV file
-        for csv_file in csv_files:
+        # Sequential runs show the file being converted, parallel runs the last one finished
+        on_start = lambda file_name: pbar.set_postfix_str(f"Processing: {file_name}")
+        for file_name, rows, error_msg in _iter_conversions(csv_files, workers, on_start):
             results["processed_files"] += 1
-            file_name = Path(csv_file).name
-            
-            # Update progress bar with current file name
-            pbar.set_postfix_str(f"Processing: {file_name}")
-            
-            try:
-                # Create a temporary args object for this file
-                file_args = type('Args', (), {})()
-                file_args.csv_file = csv_file
-                file_args.point = args.point
-                
-                # Use the existing CSV fetcher to process the file
-                # This will automatically handle Parquet caching
-                csv_column_mapping = {
-                    'Open': 'Open,', 'High': 'High,', 'Low': 'Low,',
-                    'Close': 'Close,', 'Volume': 'TickVolume,'
-                }
-                csv_datetime_column = 'DateTime,'
-                
-                df = fetch_csv_data(
-                    file_path=csv_file,
-                    ohlc_columns=csv_column_mapping,
-                    datetime_column=csv_datetime_column,
-                    skiprows=1,
-                    separator=','
-                )
-                
-                if df is not None and not df.empty:
-                    results["successful_conversions"] += 1
-                    results["converted_files"].append(file_name)
-                    pbar.set_postfix_str(f"✅ {file_name} ({len(df):,} rows)")
-                else:
-                    results["failed_conversions"] += 1
-                    results["failed_files"].append(file_name)
-                    error_msg = f"Failed to process CSV file: {file_name}"
-                    results["error_messages"].append(error_msg)
-                    pbar.set_postfix_str(f"❌ {file_name} (failed)")
-                    
-            except Exception as e:
+            if error_msg is None:
+                results["successful_conversions"] += 1
+                results["converted_files"].append(file_name)
+                pbar.set_postfix_str(f"✅ {file_name} ({rows:,} rows)")
+            else:
                 results["failed_conversions"] += 1
                 results["failed_files"].append(file_name)
-                error_msg = f"Error processing {file_name}: {str(e)}"
                 results["error_messages"].append(error_msg)
-                pbar.set_postfix_str(f"❌ {file_name} (error)")
+                pbar.set_postfix_str(f"❌ {file_name} (failed)")
             
             # Update progress bar
             pbar.update(1)
+
+    # Workers finish in any order; keep the summary and error report in file order
+    file_order = {Path(csv_file).name: i for i, csv_file in enumerate(csv_files)}
+    results["converted_files"].sort(key=file_order.get)
+    errors = dict(zip(results["failed_files"], results["error_messages"]))
+    results["failed_files"].sort(key=file_order.get)
+    results["error_messages"] = [errors[file_name] for file_name in results["failed_files"]]
     
     # Print summary
     print_info(f"\n--- Batch Conversion Summary ---")
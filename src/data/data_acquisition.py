@@ -22,6 +22,8 @@ from .fetchers import (
 # Use relative import for logger functions
 from ..common.logger import print_info, print_warning, print_error, print_debug, print_success  # Added print_success
 from .gap_tracker import get_gap_tracker
+from .gap_index import find_gaps
+from .parquet_reader import read_parquet_data
 
 
 # Helper function to detect gaps in full requested range (including missing data outside cache)
@@ -129,29 +131,28 @@ def _detect_data_gaps(df: pd.DataFrame, start_dt: pd.Timestamp, end_dt: pd.Times
     if len(filtered_df) < 2:
         return gaps
     
-    # Calculate expected time differences
-    time_diffs = filtered_df.index.to_series().diff()
-    
     # Define what constitutes a gap (more than 1.5x the expected interval for M15)
     # This will catch gaps of 30+ minutes for M15 data
-    gap_threshold = interval_delta * 1.5
-    
-    # Find gaps
-    gap_indices = time_diffs[time_diffs > gap_threshold]
+    gap_index = find_gaps(filtered_df.index, freq=interval_delta, threshold=1.5)
     
-    for timestamp, diff in gap_indices.items():
+    for last_bar, next_bar in zip(gap_index.start_times(), gap_index.end_times()):
         # Calculate gap start and end
-        gap_start = timestamp - diff + interval_delta
-        gap_end = timestamp - interval_delta
+        gap_start = last_bar + interval_delta
+        gap_end = next_bar - interval_delta
         
         # Only include gaps that are within our requested range
         if gap_start >= start_dt and gap_end <= end_dt and gap_end > gap_start:
             gaps.append((gap_start, gap_end))
-            print_debug(f"Gap detected: {gap_start} to {gap_end} (duration: {diff})")
+            print_debug(f"Gap detected: {gap_start} to {gap_end} (duration: {next_bar - last_bar})")
     
     # Also check for large gaps that might span multiple days
     # This is a more aggressive check for major data gaps
     if len(filtered_df) > 0:
+        # Sorted index, so each month is a searchsorted slice instead of a full scan
+        index = filtered_df.index
+        if not index.is_monotonic_increasing:
+            index = index.sort_values()
+        
         # Check if we have data for each month in the range
         current_date = start_dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         end_date = end_dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
@@ -161,15 +162,17 @@ def _detect_data_gaps(df: pd.DataFrame, start_dt: pd.Timestamp, end_dt: pd.Times
             month_end = (current_date + pd.DateOffset(months=1)) - pd.Timedelta(minutes=15)
             
             # Check if we have data for this month
-            month_data = filtered_df[(filtered_df.index >= month_start) & (filtered_df.index <= month_end)]
+            first = index.searchsorted(month_start, side='left')
+            last = index.searchsorted(month_end, side='right')
+            month_rows = last - first
             
             # If we have very little data for a month (less than 10% of expected), consider it a gap
             expected_rows_per_month = (month_end - month_start).total_seconds() / (interval_delta.total_seconds())
-            if len(month_data) < expected_rows_per_month * 0.1:
-                if len(month_data) > 0:
+            if month_rows < expected_rows_per_month * 0.1:
+                if month_rows > 0:
                     # Find the actual data range in this month
-                    actual_start = month_data.index.min()
-                    actual_end = month_data.index.max()
+                    actual_start = index[first]
+                    actual_end = index[last - 1]
                     
                     # Check for gaps before and after the actual data
                     if actual_start > month_start + interval_delta:
@@ -394,7 +397,7 @@ def acquire_data(args) -> dict:
                 else:
                     print_info(f"Found existing API cache file: {cache_filepath}")
                     try:
-                        cached_df = pd.read_parquet(cache_filepath)
+                        cached_df = read_parquet_data(cache_filepath)
                         if not isinstance(cached_df.index, pd.DatetimeIndex) or cached_df.empty:
                             print_warning("Cache file invalid. Ignoring cache.")
                             cached_df = None
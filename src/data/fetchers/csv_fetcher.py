@@ -10,6 +10,14 @@ import numpy as np # Import numpy for np.nan
 
 # Use absolute import for print functions from the custom logger
 from src.common.logger import print_info, print_warning, print_error, print_debug
+from src.data.parquet_reader import read_parquet_data
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_CSV_AVAILABLE = True
+except ImportError:
+    PYARROW_CSV_AVAILABLE = False
 
 # --- Define Cache Directory ---
 try:
@@ -20,6 +28,79 @@ except NameError:
 CSV_CACHE_DIR = PROJECT_ROOT / "data" / "cache" / "csv_converted"
 # --- End Cache Directory Definition ---
 
+# Resolution pd.to_datetime gives parsed strings ('ns' before pandas 3, 'us' since),
+# so both CSV engines produce the same index dtype
+DATETIME_UNIT = getattr(pd.to_datetime(['2000.01.01 00:00'], format='%Y.%m.%d %H:%M'), 'unit', 'ns')
+
+
+def _write_parquet_atomic(df: pd.DataFrame, parquet_path: Path) -> None:
+    """
+    Writes the cache file through a temporary file in the same directory.
+
+    Readers and concurrent batch workers only ever see a complete file: the
+    temporary name is unique per process and is renamed over the target.
+    """
+    tmp_path = parquet_path.with_name(f".{parquet_path.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path, index=True)
+        os.replace(tmp_path, parquet_path)
+    finally:
+        if tmp_path.exists():
+            try: os.remove(tmp_path)
+            except OSError: pass
+
+
+def _read_csv_pyarrow(file_path, separator: str, datetime_col: str, float_columns, date_format: str) -> Optional[pd.DataFrame]:
+    """
+    Reads an MT5 export with pyarrow.csv (multithreaded, explicit column types).
+
+    The first line is skipped and the second is the header, like
+    ``pd.read_csv(header=1)``. Column names are cleaned of trailing commas up
+    front, the datetime column is parsed natively with ``date_format`` and the
+    price/volume columns are read as float64. Other columns are type-inferred.
+
+    Args:
+        file_path: CSV file
+        separator (str): Field delimiter (single character)
+        datetime_col (str): Cleaned name of the datetime column
+        float_columns: Cleaned names of columns to read as float64
+        date_format (str): strptime format of the datetime column
+
+    Returns:
+        pd.DataFrame or None: Frame with cleaned column names, or None when the
+        file needs the pandas reader (unparseable dates, ragged rows, quoting).
+    """
+    if len(separator) != 1:
+        return None
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        f.readline()
+        header_line = f.readline()
+    if not header_line:
+        return None
+
+    column_names = []
+    for i, name in enumerate(header_line.rstrip('\r\n').split(separator)):
+        name = name.strip().rstrip(',')
+        if name == '' or name in column_names:
+            name = f"Unnamed: {i}"
+        column_names.append(name)
+
+    column_types = {name: pa.float64() for name in column_names if name in float_columns}
+    if datetime_col in column_names:
+        column_types[datetime_col] = pa.timestamp(DATETIME_UNIT)
+    try:
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(skip_rows=2, column_names=column_names, use_threads=True),
+            parse_options=pa_csv.ParseOptions(delimiter=separator),
+            convert_options=pa_csv.ConvertOptions(column_types=column_types,
+                                                  timestamp_parsers=[date_format]),
+        )
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        print_debug(f"pyarrow CSV reader fell back to pandas for {file_path}: {e}")
+        return None
+    return table.to_pandas()
+
 
 # Function to fetch data from CSV with Parquet caching enhancement
 def fetch_csv_data(
@@ -31,6 +112,7 @@ def fetch_csv_data(
     date_format: Optional[str] = None,
     skiprows: int = 0, # Default to 0, but will use header=1 in read_csv
     separator: str = ',', # Default separator
+    engine: str = 'auto',
 ) -> pd.DataFrame:
     """
     Fetches data from a CSV file, handling various formats and standardizing column names.
@@ -47,6 +129,9 @@ def fetch_csv_data(
         date_format (Optional[str]): The strptime format string. Defaults to '%Y.%m.%d %H:%M'.
         skiprows (int): *NOTE: Parameter kept for signature, but header=1 is used internally.*
         separator (str): The delimiter used in the CSV file.
+        engine (str): 'pyarrow' for the multithreaded pyarrow.csv reader, 'pandas' for
+                      pd.read_csv, 'auto' (default) for pyarrow when installed. pyarrow falls
+                      back to pandas for files it cannot parse with the explicit schema.
 
     Returns:
         pd.DataFrame: DataFrame with standardized columns ('Open', 'High', 'Low', 'Close', 'Volume')
@@ -61,6 +146,7 @@ def fetch_csv_data(
 
     mapped_volume_key = 'Volume'
     required_std_cols = {'Open', 'High', 'Low', 'Close'}
+    potential_numeric_cols = ['predicted_low', 'predicted_high', 'pressure', 'pressure_vector']
 
     try:
         input_path = Path(file_path).resolve()
@@ -78,7 +164,7 @@ def fetch_csv_data(
 
         if parquet_path.is_file():
             try:
-                df = pd.read_parquet(parquet_path)
+                df = read_parquet_data(parquet_path)
                 if not required_std_cols.issubset(df.columns):
                     raise ValueError("Cached Parquet missing required OHLC columns.")
                 if not isinstance(df.index, pd.DatetimeIndex) or df.index.name != 'Timestamp':
@@ -90,12 +176,23 @@ def fetch_csv_data(
         # --- End Parquet Cache Check ---
 
         # --- CSV Reading Logic ---
-        df = pd.read_csv(
-            file_path,
-            header=1,
-            sep=separator,
-            low_memory=False
-        )
+        df = None
+        if engine in ('auto', 'pyarrow') and PYARROW_CSV_AVAILABLE:
+            float_columns = {str(v).strip().rstrip(',') for v in input_column_mapping_std_to_csv.values()}
+            df = _read_csv_pyarrow(
+                input_path,
+                separator,
+                str(input_datetime_col_csv).strip().rstrip(','),
+                float_columns | set(potential_numeric_cols),
+                date_format or '%Y.%m.%d %H:%M',
+            )
+        if df is None:
+            df = pd.read_csv(
+                file_path,
+                header=1,
+                sep=separator,
+                low_memory=False
+            )
 
         # --- Clean Actual Column Names ---
         original_columns = df.columns.tolist()
@@ -181,7 +278,6 @@ def fetch_csv_data(
             # Convert to float, coercing errors to NaN
             df[mapped_volume_key] = pd.to_numeric(df[mapped_volume_key], errors='coerce').astype(float)
 
-        potential_numeric_cols = ['predicted_low', 'predicted_high', 'pressure', 'pressure_vector']
         for col in potential_numeric_cols:
              if col in df.columns:
                  if df[col].dtype == object:
@@ -196,7 +292,7 @@ def fetch_csv_data(
         # --- Save Processed DataFrame to Parquet Cache ---
         if len(df) > 0:
              try:
-                 df.to_parquet(parquet_path, index=True)
+                 _write_parquet_atomic(df, parquet_path)
              except Exception as e:
                  print_error(f"CRITICAL: Failed to save data to Parquet cache {parquet_path}: {e}")
                  traceback.print_exc()
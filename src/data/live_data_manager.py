@@ -20,6 +20,8 @@ import numpy as np
 import json
 import ssl
 
+from src.calculation.indicators.streaming import StreamingPipeline
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -295,17 +297,28 @@ class LiveDataManager:
             logger.error(f"Error processing data: {e}")
             return pd.DataFrame()
     
-    def subscribe_to_data(self, config: DataConfig, callback: Callable):
-        """Subscribe to real-time data updates."""
+    def subscribe_to_data(self, config: DataConfig, callback: Callable,
+                          pipeline: Optional[StreamingPipeline] = None):
+        """Subscribe to real-time data updates.
+
+        Without a pipeline the callback receives the whole polled DataFrame. With a
+        StreamingPipeline (or a list of streaming indicators / rule strings) the
+        callback only receives the bars added since the previous update, with the
+        indicator values appended, and each bar is processed once.
+        """
         subscription_key = f"{config.source.value}_{config.symbol}_{config.interval}_{config.data_type.value}"
         
         if subscription_key not in self.subscribers:
             self.subscribers[subscription_key] = []
         
+        if pipeline is not None and not isinstance(pipeline, StreamingPipeline):
+            pipeline = StreamingPipeline(pipeline)
+        
         self.subscribers[subscription_key].append({
             'callback': callback,
             'config': config,
-            'last_update': time.time()
+            'last_update': time.time(),
+            'pipeline': pipeline
         })
         
         logger.info(f"Subscribed to {subscription_key}")
@@ -372,8 +385,14 @@ class LiveDataManager:
                 # Notify all subscribers
                 for subscriber in subscribers:
                     try:
-                        subscriber['callback'](result['data'], config)
+                        data = result['data']
+                        pipeline = subscriber.get('pipeline')
+                        if pipeline is not None and isinstance(data, pd.DataFrame):
+                            data = pipeline.process_frame(data)
                         subscriber['last_update'] = time.time()
+                        if pipeline is not None and data.empty:
+                            continue
+                        subscriber['callback'](data, config)
                     except Exception as e:
                         logger.error(f"Error in subscriber callback: {e}")
             else:
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# src/data/parquet_metadata.py
+
+"""
+Footer-based Parquet file metadata with a persistent index.
+
+Row counts and columns come from the Parquet footer, the date range from the
+min/max statistics of the first and last row groups, and the first/last row
+from decoding only the first batch and the last row group. Results are kept in
+a JSON index keyed by file path and invalidated when the file's modification
+time or size changes, so listing a directory of cached files does not open
+unchanged files again.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .parquet_reader import find_time_column
+
+DEFAULT_INDEX_FILE = Path("data/cache/parquet_metadata_index.json")
+INDEX_VERSION = 1
+
+
+def _empty_metadata() -> Dict[str, Any]:
+    return {'num_rows': -1, 'columns': [], 'first_row': None, 'last_row': None,
+            'first_date': None, 'last_date': None}
+
+
+def _statistics_value(parquet_file: pq.ParquetFile, row_group: int, column: str, attr: str):
+    """min/max statistic of a column in one row group, or None when not recorded."""
+    metadata = parquet_file.metadata.row_group(row_group)
+    for i in range(metadata.num_columns):
+        chunk = metadata.column(i)
+        if chunk.path_in_schema == column:
+            stats = chunk.statistics
+            if stats is None or not stats.has_min_max:
+                return None
+            return getattr(stats, attr)
+    return None
+
+
+def _row_date(df: pd.DataFrame):
+    """Date of a one-row frame, the same way show mode reports it."""
+    return df.index[0] if isinstance(df.index, pd.DatetimeIndex) else df.iloc[0, 0]
+
+
+def read_parquet_metadata(file_path: Union[str, Path], include_rows: bool = True) -> Dict[str, Any]:
+    """
+    Reads row count, columns, date range and optionally the first/last row.
+
+    Args:
+        file_path (str | Path): Parquet file
+        include_rows (bool): Also decode the first and last row (first batch and
+            last row group). When False only the footer is read.
+
+    Returns:
+        dict: num_rows, columns, first_row, last_row, first_date, last_date
+    """
+    metadata = _empty_metadata()
+    parquet_file = pq.ParquetFile(file_path)
+    metadata['num_rows'] = parquet_file.metadata.num_rows
+    metadata['columns'] = parquet_file.schema.names
+    num_row_groups = parquet_file.metadata.num_row_groups
+    if metadata['num_rows'] <= 0 or num_row_groups == 0:
+        return metadata
+
+    if include_rows:
+        first_batch = next(parquet_file.iter_batches(batch_size=1, use_pandas_metadata=True))
+        df_head = pa.Table.from_batches([first_batch]).to_pandas()
+        metadata['first_row'] = df_head.iloc[0]
+        metadata['first_date'] = _row_date(df_head)
+        if metadata['num_rows'] > 1:
+            df_tail = parquet_file.read_row_group(num_row_groups - 1, use_pandas_metadata=True).to_pandas().tail(1)
+            metadata['last_row'] = df_tail.iloc[0]
+            metadata['last_date'] = _row_date(df_tail)
+        else:
+            metadata['last_row'] = metadata['first_row']
+            metadata['last_date'] = metadata['first_date']
+        return metadata
+
+    schema = parquet_file.schema_arrow
+    time_col = find_time_column(schema)
+    if time_col is not None and pa.types.is_timestamp(schema.field(time_col).type):
+        first = _statistics_value(parquet_file, 0, time_col, 'min')
+        last = _statistics_value(parquet_file, num_row_groups - 1, time_col, 'max')
+        metadata['first_date'] = pd.Timestamp(first) if first is not None else None
+        metadata['last_date'] = pd.Timestamp(last) if last is not None else None
+    return metadata
+
+
+def _encode(value):
+    """Converts a metadata value into JSON, tagging timestamps and timedeltas (NaT becomes null)."""
+    if isinstance(value, pd.Series):
+        return {'$series': [[str(k), _encode(v)] for k, v in value.items()], 'name': _encode(value.name)}
+    if isinstance(value, (np.datetime64, np.timedelta64)):
+        value = pd.Timestamp(value) if isinstance(value, np.datetime64) else pd.Timedelta(value)
+    if value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return {'$ts': value.isoformat()}
+    if isinstance(value, pd.Timedelta):
+        return {'$td': value.isoformat()}
+    if hasattr(value, 'item') and not isinstance(value, (list, dict)):
+        return value.item()
+    return value
+
+
+def _decode(value):
+    if isinstance(value, dict):
+        if '$ts' in value:
+            return pd.Timestamp(value['$ts'])
+        if '$td' in value:
+            return pd.Timedelta(value['$td'])
+        if '$series' in value:
+            items = value['$series']
+            return pd.Series([_decode(v) for _, v in items], index=[k for k, _ in items],
+                             name=_decode(value.get('name')), dtype=object)
+    return value
+
+
+class ParquetMetadataIndex:
+    """Persistent metadata index invalidated by file modification time and size."""
+
+    def __init__(self, index_file: Union[str, Path] = DEFAULT_INDEX_FILE):
+        self.index_file = Path(index_file)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.entries = data.get('files', {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """Writes the index if it changed since it was loaded."""
+        if not self.dirty:
+            return
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_name(self.index_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w') as f:
+                # Values _encode does not know (e.g. Decimal, bytes) are stored as text
+                json.dump({'version': INDEX_VERSION, 'files': self.entries}, f, default=str)
+            os.replace(tmp_file, self.index_file)
+            self.dirty = False
+        finally:
+            # Never leave a partial index behind
+            if tmp_file.exists():
+                tmp_file.unlink()
+
+    def get_metadata(self, file_path: Union[str, Path], include_rows: bool = True) -> Dict[str, Any]:
+        """
+        Returns the file's metadata from the index, reading the footer on a miss.
+
+        Args:
+            file_path (str | Path): Parquet file
+            include_rows (bool): See read_parquet_metadata
+
+        Returns:
+            dict: Metadata (see read_parquet_metadata)
+        """
+        path = Path(file_path)
+        stat = path.stat()
+        key = str(path.resolve())
+        entry = self.entries.get(key)
+        if (entry is not None and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size
+                and (entry['has_rows'] or not include_rows)):
+            metadata = {name: _decode(value) for name, value in entry['metadata'].items()}
+            if not include_rows:
+                metadata['first_row'] = metadata['last_row'] = None
+            return metadata
+
+        metadata = read_parquet_metadata(path, include_rows)
+        self.entries[key] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'has_rows': include_rows,
+            'metadata': {name: _encode(value) for name, value in metadata.items()},
+        }
+        self.dirty = True
+        return metadata
+
+    def prune(self):
+        """Drops entries of files that no longer exist."""
+        missing = [key for key in self.entries if not os.path.exists(key)]
+        for key in missing:
+            del self.entries[key]
+        self.dirty = self.dirty or bool(missing)
+
+
+_DEFAULT_INDEX: Optional[ParquetMetadataIndex] = None
+
+
+def get_metadata_index() -> ParquetMetadataIndex:
+    """Returns the process-wide index stored in data/cache."""
+    global _DEFAULT_INDEX
+    if _DEFAULT_INDEX is None:
+        _DEFAULT_INDEX = ParquetMetadataIndex()
+    return _DEFAULT_INDEX
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# src/data/parquet_reader.py
+
+"""
+Shared Parquet reader with column projection and time-range pushdown.
+
+Callers that only need some columns or a date range pass them here instead of
+loading the whole file and filtering in pandas. Columns are projected by
+pyarrow, and the time range is turned into pyarrow ``filters`` so row groups
+whose min/max statistics fall outside the range are skipped without being
+decoded. The pandas index stored in the file (e.g. a DatetimeIndex) is always
+restored.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Column names checked (case-insensitively) when a file has no timestamp index
+TIME_COLUMN_CANDIDATES = ['DateTime', 'Timestamp', 'datetime', 'timestamp', 'Date', 'date', 'time', 'open_time', 'index']
+
+
+def _index_columns(schema: pa.Schema) -> List[str]:
+    """Stored pandas index columns (RangeIndex entries are not stored as columns)."""
+    pandas_metadata = schema.pandas_metadata or {}
+    return [col for col in pandas_metadata.get('index_columns', []) if isinstance(col, str)]
+
+
+def find_time_column(schema: pa.Schema, time_column: Optional[str] = None) -> Optional[str]:
+    """
+    Finds the column holding bar timestamps.
+
+    Args:
+        schema (pa.Schema): Arrow schema of the file
+        time_column (str, optional): Explicit column name
+
+    Returns:
+        str or None: Name of the timestamp column in the file
+    """
+    if time_column is not None:
+        return time_column if time_column in schema.names else None
+
+    timestamp_columns = [field.name for field in schema if pa.types.is_timestamp(field.type)]
+    for col in _index_columns(schema):
+        if col in timestamp_columns:
+            return col
+    lower_names = {name.lower(): name for name in schema.names}
+    for candidate in TIME_COLUMN_CANDIDATES:
+        name = lower_names.get(candidate.lower())
+        if name is not None:
+            return name
+    return timestamp_columns[0] if timestamp_columns else None
+
+
+def _bound(value, arrow_type: pa.DataType) -> pd.Timestamp:
+    """Converts a start/end value to a Timestamp comparable with the column."""
+    ts = pd.Timestamp(value)
+    tz = getattr(arrow_type, 'tz', None)
+    if tz is not None:
+        ts = ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
+    elif ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts
+
+
+def _filter_in_pandas(df: pd.DataFrame, time_column: str, start, end) -> pd.DataFrame:
+    """Fallback for time columns stored as strings or numbers."""
+    if time_column in df.columns:
+        times = pd.to_datetime(df[time_column], errors='coerce')
+    elif df.index.name == time_column or isinstance(df.index, pd.DatetimeIndex):
+        times = pd.Series(pd.to_datetime(df.index, errors='coerce'), index=df.index)
+    else:
+        return df
+    mask = pd.Series(True, index=df.index)
+    if start is not None:
+        mask &= times >= pd.Timestamp(start)
+    if end is not None:
+        mask &= times <= pd.Timestamp(end)
+    return df[mask.to_numpy()]
+
+
+def read_parquet_data(path: Union[str, Path],
+                      columns: Optional[Sequence[str]] = None,
+                      start=None,
+                      end=None,
+                      time_column: Optional[str] = None) -> pd.DataFrame:
+    """
+    Reads a Parquet file, loading only the requested columns and time range.
+
+    Args:
+        path (str | Path): Parquet file
+        columns (Sequence[str], optional): Columns to load (missing names are ignored).
+            The stored index and the time column are always included. None loads all.
+        start (optional): First timestamp to include (inclusive)
+        end (optional): Last timestamp to include (inclusive)
+        time_column (str, optional): Timestamp column used for start/end. Detected from
+            the stored index or common names (DateTime, Timestamp, ...) when omitted.
+
+    Returns:
+        pd.DataFrame: Loaded data with the stored index restored
+    """
+    schema = pq.read_schema(path)
+    time_col = find_time_column(schema, time_column) if (start is not None or end is not None) else None
+
+    read_columns = None
+    if columns is not None:
+        keep = set(columns) | set(_index_columns(schema))
+        if time_col is not None:
+            keep.add(time_col)
+        read_columns = [name for name in schema.names if name in keep]
+
+    filters = None
+    pandas_filter = False
+    if time_col is not None:
+        arrow_type = schema.field(time_col).type
+        if pa.types.is_timestamp(arrow_type):
+            filters = []
+            if start is not None:
+                filters.append((time_col, '>=', _bound(start, arrow_type)))
+            if end is not None:
+                filters.append((time_col, '<=', _bound(end, arrow_type)))
+        else:
+            pandas_filter = True
+
+    table = pq.read_table(path, columns=read_columns, filters=filters, use_pandas_metadata=True)
+    df = table.to_pandas()
+    if pandas_filter:
+        df = _filter_in_pandas(df, time_col, start, end)
+    return df
+
+
+def parquet_row_count(path: Union[str, Path]) -> int:
+    """Number of rows in a Parquet file, read from the footer only."""
+    return pq.ParquetFile(path).metadata.num_rows
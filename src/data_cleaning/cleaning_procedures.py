@@ -21,6 +21,8 @@ import logging
 from scipy import stats
 from sklearn.ensemble import IsolationForest
 
+from src.data.gap_index import find_gaps
+
 
 class CleaningProcedures:
     """Implements various data cleaning procedures for financial time series."""
@@ -49,37 +51,21 @@ class CleaningProcedures:
         
         for col in datetime_cols:
             try:
-                # Convert to datetime
-                dates = pd.to_datetime(data[col], errors='coerce')
-                valid_dates = dates.dropna().sort_values()
-                
-                if len(valid_dates) < 2:
+                # Steps over 1.5x the modal interval (50% tolerance)
+                gap_index = find_gaps(data[col], threshold=1.5)
+                if len(gap_index) == 0:
                     continue
-                
-                # Calculate expected frequency
-                time_diffs = valid_dates.diff().dropna()
-                if len(time_diffs) == 0:
-                    continue
-                
-                # Use median as expected frequency
-                expected_freq = time_diffs.median()
-                
-                # Check if expected_freq is valid (not zero or NaN)
-                if pd.isna(expected_freq) or expected_freq.total_seconds() == 0:
-                    continue
-                
-                # Find gaps
-                for i in range(1, len(valid_dates)):
-                    actual_diff = valid_dates.iloc[i] - valid_dates.iloc[i-1]
-                    if actual_diff > expected_freq * 1.5:  # 50% tolerance
-                        gaps.append({
-                            'column': col,
-                            'gap_start': valid_dates.iloc[i-1],
-                            'gap_end': valid_dates.iloc[i],
-                            'gap_duration': actual_diff,
-                            'expected_duration': expected_freq,
-                            'gap_size': actual_diff / expected_freq
-                        })
+                expected_freq = gap_index.frequency
+                for gap_start, gap_end in zip(gap_index.start_times(), gap_index.end_times()):
+                    actual_diff = gap_end - gap_start
+                    gaps.append({
+                        'column': col,
+                        'gap_start': gap_start,
+                        'gap_end': gap_end,
+                        'gap_duration': actual_diff,
+                        'expected_duration': expected_freq,
+                        'gap_size': actual_diff / expected_freq
+                    })
             except Exception as e:
                 self.logger.warning(f"Error detecting gaps in column {col}: {e}")
         
@@ -47,206 +47,51 @@ def gap_check(df, gap_summary, Fore, Style, datetime_col=None, freq=None, schema
     """
     Checks for gaps in a datetime column: finds abnormally large time intervals between consecutive records.
     If datetime_col is None, tries to auto-detect the first datetime column by dtype, name, or schema info.
-    freq can be set to expected frequency (e.g. '1H', '1D') for more precise gap detection.
+    freq can be set to expected frequency (e.g. '1H', '1D') for more precise gap detection;
+    otherwise the frequency is inferred from the most common interval and gaps are intervals
+    larger than twice that. The DataFrame is not modified.
     Adds info to gap_summary.
     """
     import pandas as pd
+    from src.data.gap_index import datetime_columns, find_gaps
+
     dt_col = None
-    # 1. Try explicit argument
     if datetime_col and datetime_col in df.columns:
         dt_col = datetime_col
-    # 2. Try dtype
-    if not dt_col:
-        for col in df.columns:
-            if pd.api.types.is_datetime64_any_dtype(df[col]):
-                dt_col = col
-                break
-    # 3. Try name
-    if not dt_col:
-        for col in df.columns:
-            if any(name in col.lower() for name in ["date", "time", "datetime", "timestamp"]):
-                try:
-                    if not pd.api.types.is_datetime64_any_dtype(df[col]):
-                        df[col] = pd.to_datetime(df[col], errors='coerce')
-                    if pd.api.types.is_datetime64_any_dtype(df[col]):
-                        dt_col = col
-                        break
-                except Exception:
-                    continue
-    # 4. Try schema info (case-insensitive match, partial match, try convert from int/float)
-    if not dt_col and schema_datetime_fields:
-        found_in_schema = False
-        for schema_col in schema_datetime_fields:
-            schema_col_norm = schema_col.lower().replace('_', '')
-            for col in df.columns:
-                col_norm = col.lower().replace('_', '')
-                if col_norm == schema_col_norm:
-                    found_in_schema = True
-                    try:
-                        if not pd.api.types.is_datetime64_any_dtype(df[col]):
-                            if pd.api.types.is_integer_dtype(df[col]) or pd.api.types.is_float_dtype(df[col]):
-                                try:
-                                    df[col] = pd.to_datetime(df[col], unit='s', errors='coerce')
-                                except Exception:
-                                    df[col] = pd.to_datetime(df[col], unit='ms', errors='coerce')
-                            else:
-                                df[col] = pd.to_datetime(df[col], errors='coerce')
-                        if pd.api.types.is_datetime64_any_dtype(df[col]):
-                            dt_col = col
-                            break
-                    except Exception:
-                        continue
-            if dt_col:
-                break
-        # Partial match if exact not found
-        if not dt_col:
-            for schema_col in schema_datetime_fields:
-                schema_col_norm = schema_col.lower().replace('_', '')
-                for col in df.columns:
-                    col_norm = col.lower().replace('_', '')
-                    if schema_col_norm in col_norm or col_norm in schema_col_norm:
-                        print(f"  {Fore.YELLOW}Gap Check: Using partial match for datetime column: '{col}' ~ '{schema_col}'{Style.RESET_ALL}")
-                        try:
-                            if not pd.api.types.is_datetime64_any_dtype(df[col]):
-                                df[col] = pd.to_datetime(df[col], errors='coerce')
-                            if pd.api.types.is_datetime64_any_dtype(df[col]):
-                                dt_col = col
-                                break
-                        except Exception:
-                            continue
-                if dt_col:
-                    break
-        if not found_in_schema:
+    else:
+        candidates = datetime_columns(df, schema_fields=schema_datetime_fields)
+        if candidates:
+            dt_col = candidates[0]
+        elif schema_datetime_fields:
             print(f"  {Fore.YELLOW}Gap Check: Columns from schema {schema_datetime_fields} not found in DataFrame columns {list(df.columns)}{Style.RESET_ALL}")
-    # 5. Try index if still not found
-    if not dt_col:
-        if pd.api.types.is_datetime64_any_dtype(df.index):
-            dt_col = None  # special marker: use index
-            print(f"  {Fore.YELLOW}Gap Check: Using DataFrame index as datetime column.{Style.RESET_ALL}")
-        else:
-            print(f"  {Fore.MAGENTA}Gap Check: No datetime-like column or index found (by dtype, name, or schema, tried columns: {list(df.columns)}, schema: {schema_datetime_fields}){Style.RESET_ALL}")
-            return
-    # Ensure sorted by datetime
     if dt_col is not None:
-        df_sorted = df.sort_values(dt_col)
-        datetimes = df_sorted[dt_col]
-        use_iloc = True
-    else:
-        df_sorted = df.sort_index()
-        datetimes = df_sorted.index
-        use_iloc = False
-    # Fix datetime column if needed
-    time_deltas = datetimes.diff().dropna()
-    if freq is not None:
-        expected = pd.to_timedelta(freq)
-        gaps = time_deltas[time_deltas > expected]
+        values = df[dt_col]
+    elif pd.api.types.is_datetime64_any_dtype(df.index):
+        values = df.index
+        print(f"  {Fore.YELLOW}Gap Check: Using DataFrame index as datetime column.{Style.RESET_ALL}")
     else:
-        expected = time_deltas.median()
-        gaps = time_deltas[time_deltas > expected * 2]
-    if not gaps.empty:
-        print(f"  {Fore.MAGENTA}Gap Check: Found {len(gaps)} gaps in '{dt_col if dt_col else 'index'}' (interval > {expected * 2}){Style.RESET_ALL}")
-        # Transform gaps to timedelta for better readability
-        import pandas as pd
-        gaps_series = pd.Series(gaps)
-        for i, (idx, delta) in enumerate(gaps_series.items()):
-            # idx is the index in datetimes where the gap is detected
-            try:
-                if use_iloc:
-                    # For non-datetime index - use iloc to get the previous and current elements
-                    curr_pos = datetimes.index.get_loc(idx)
-                    prev_time = datetimes.iloc[curr_pos - 1]
-                    curr_time = datetimes.iloc[curr_pos]
-                    # Calculate the real difference again
-                    delta = curr_time - prev_time
-                else:
-                    # For datetime index - use the index directly
-                    # The index is already sorted, so we can use it directly
+        print(f"  {Fore.MAGENTA}Gap Check: No datetime-like column or index found (by dtype, name, or schema, tried columns: {list(df.columns)}, schema: {schema_datetime_fields}){Style.RESET_ALL}")
+        return
+    column = dt_col if dt_col else 'index'
+    # Numeric schema fields hold epoch seconds
+    unit = 's' if pd.api.types.is_numeric_dtype(values) else None
 
-                    # Check if idx is a valid index in datetimes
-                    if isinstance(idx, (int, float)) and pd.api.types.is_datetime64_dtype(datetimes):
-                        # If idx is an integer, convert it to the corresponding datetime
-                        if idx >= 0 and idx < len(datetimes):
-                            curr_pos = int(idx)
-                            prev_pos = max(0, curr_pos - 1)
-                            if curr_pos > prev_pos:  # Not the first element
-                                prev_time = datetimes[prev_pos]
-                                curr_time = datetimes[curr_pos]
-                                # Calculate the real difference again
-                                delta = curr_time - prev_time
-                            else:
-                                # If this is the first element, take it twice
-                                prev_time = datetimes[0]
-                                curr_time = datetimes[0]
-                                delta = pd.Timedelta(0)
-                        else:
-                            raise ValueError(f"Index position {idx} out of bounds for DatetimeIndex of size {len(datetimes)}")
-                    elif idx in datetimes:
-                        curr_pos = datetimes.get_loc(idx)
-                        # Get the previous and current elements
-                        if curr_pos > 0:
-                            prev_time = datetimes[curr_pos - 1]
-                            curr_time = datetimes[curr_pos]
-                            # Get the real difference again
-                            delta = curr_time - prev_time
-                        else:
-                            # If this is the first element, take it twice
-                            prev_time = datetimes[0]
-                            curr_time = datetimes[0]
-                            delta = pd.Timedelta(0)
-                    else:
-                        # Search for the nearest index
-
-                        # Check if idx is a valid index in datetimes
-                        try:
-                            if pd.api.types.is_datetime64_dtype(datetimes) and not pd.api.types.is_datetime64_dtype(pd.Index([idx])):
-                                # Transform idx to datetime
-                                idx = pd.to_datetime(idx)
-                        except Exception:
-                            # If idx is not a valid datetime, try to convert it to a timestamp
-                            if isinstance(idx, (int, float)) and idx >= 0 and idx < len(datetimes):
-                                curr_pos = int(idx)
-                                prev_pos = max(0, curr_pos - 1)
-                                prev_time = datetimes[prev_pos]
-                                curr_time = datetimes[curr_pos]
-                                # Calculate the real difference again
-                                delta = curr_time - prev_time if curr_pos > prev_pos else pd.Timedelta(0)
-                                if i < 5:
-                                    print(f"    Gap from {prev_time} to {curr_time}: {delta}")
-                                gap_summary.append({'file': file_name, 'column': dt_col if dt_col else 'index', 'from': prev_time, 'to': curr_time, 'delta': delta})
-                                continue
-
-                        # Try to find the nearest index
-                        try:
-                            nearest_pos = datetimes.get_indexer([idx], method='nearest')[0]
-                            if nearest_pos >= 0:
-                                curr_pos = nearest_pos
-                                prev_pos = max(0, curr_pos - 1)
-                                prev_time = datetimes[prev_pos]
-                                curr_time = datetimes[curr_pos]
-                                # Calculate the real difference again
-                                delta = curr_time - prev_time if curr_pos > prev_pos else pd.Timedelta(0)
-                            else:
-                                # If the nearest position is negative, it means the index is not found
-                                raise ValueError(f"Index {idx} not found in datetime index and no nearest match")
-                        except Exception as e:
-                            # If the nearest position is negative, it means the index is not found
-                            if isinstance(idx, (int, float)):
-                                idx_pos = min(max(0, int(idx)), len(datetimes) - 1)
-                                prev_pos = max(0, idx_pos - 1)
-                                prev_time = datetimes[prev_pos]
-                                curr_time = datetimes[idx_pos]
-                                # Calculate the real difference again
-                                delta = curr_time - prev_time if idx_pos > prev_pos else pd.Timedelta(0)
-                            else:
-                                raise ValueError(f"Cannot process index {idx} of type {type(idx)} with datetime index")
-
-                if i < 5:
-                    print(f"    Gap from {prev_time} to {curr_time}: {delta}")
-                gap_summary.append({'file': file_name, 'column': dt_col if dt_col else 'index', 'from': prev_time, 'to': curr_time, 'delta': delta})
-            except Exception as e:
-                print(f"    {Fore.RED}Error processing gap at index {idx} (type {type(idx)}): {e}{Style.RESET_ALL}")
+    if freq is not None:
+        gaps = find_gaps(values, freq=freq, threshold=1.0, unit=unit)
+        limit = gaps.frequency
     else:
-        print(f"  {Fore.MAGENTA}Gap Check: No significant gaps found in '{dt_col if dt_col else 'index'}'.{Style.RESET_ALL}")
+        gaps = find_gaps(values, threshold=2.0, unit=unit)
+        limit = gaps.frequency * 2
+    if len(gaps) == 0:
+        print(f"  {Fore.MAGENTA}Gap Check: No significant gaps found in '{column}'.{Style.RESET_ALL}")
+        return
+    print(f"  {Fore.MAGENTA}Gap Check: Found {len(gaps)} gaps in '{column}' (interval > {limit}){Style.RESET_ALL}")
+    starts, ends = gaps.start_times(), gaps.end_times()
+    for i, (prev_time, curr_time) in enumerate(zip(starts, ends)):
+        delta = curr_time - prev_time
+        if i < 5:
+            print(f"    Gap from {prev_time} to {curr_time}: {delta}")
+        gap_summary.append({'file': file_name, 'column': column, 'from': prev_time, 'to': curr_time, 'delta': delta})
 
 def zero_check(df, zero_summary, Fore, Style, file_name=None):
     """
@@ -37,6 +37,10 @@ Flags:
     --clean-stats-logs         Remove all statistics log files
     --clean-reports            Remove all HTML report directories for all analyses
 
+    --streaming                Read files batch by batch with constant memory (no file limit)
+    --batch-rows N             Rows per batch in streaming mode (default: 65536)
+    --jobs N, -j N             Process N files in parallel worker processes (default: 1)
+
 Examples:
     # Basic usage
     ./eda --help
@@ -70,6 +74,12 @@ Examples:
     ./eda --clean-stats-logs
     ./eda --clean-reports
 
+    # Profile files of any size with constant memory
+    ./eda --streaming --data-quality-checks --all-stats
+
+    # Analyze files on 4 cores
+    ./eda --jobs 4 --data-quality-checks --all-stats
+
     # Combine analysis with fixing
     python eda_batch_check.py --data-quality-checks --fix-files --fix-all
     ./eda --data-quality-checks --fix-files --fix-all
@@ -129,6 +139,9 @@ import json
 import datetime
 from tqdm import tqdm  # Import tqdm for progress bars
 import gc  # For garbage collection
+import io
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 import psutil  # For memory monitoring
 
 # Initialize colorama for colored output
@@ -139,6 +152,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 
 # Import necessary modules
 from src.eda import file_info, folder_stats, data_quality, fix_files, basic_stats, correlation_analysis, feature_importance, stats_logger
+from src.eda import streaming_stats
 
 
 def check_memory_usage():
@@ -220,6 +234,8 @@ class StatsCollector:
             'has_seasonality': 0,
             'files_with_datetime': 0
         }
+        # Column profiles of all files merged in streaming mode
+        self.streaming_profile = None
 
     def update_descriptive_stats(self, file_path, desc_stats):
         self.descriptive_summary['files_analyzed'] += 1
@@ -277,6 +293,53 @@ class StatsCollector:
         if 'seasonality' in ts_stats and 'day_of_week' in ts_stats['seasonality'] and 'error' not in ts_stats['seasonality']['day_of_week']:
             self.time_series_summary['has_seasonality'] += 1
 
+    def merge(self, other):
+        """Merge a partial collector (e.g. returned by a worker process) into this one."""
+        for name in ('descriptive_summary', 'distribution_summary', 'outlier_summary', 'time_series_summary'):
+            summary = getattr(self, name)
+            for key, value in getattr(other, name).items():
+                if isinstance(value, list):
+                    summary[key].extend(value)
+                else:
+                    summary[key] += value
+        if other.streaming_profile is not None:
+            if self.streaming_profile is None:
+                self.streaming_profile = streaming_stats.FileProfile('all files')
+            self.streaming_profile.merge(other.streaming_profile)
+
+    def update_streaming_stats(self, file_path, profile, args):
+        """Update the summaries from a streamed FileProfile and merge it into the global profile."""
+        if args.descriptive_stats or args.all_stats:
+            self.update_descriptive_stats(file_path, profile.descriptive_stats())
+        else:
+            self.descriptive_summary['files_analyzed'] += 1
+            self.descriptive_summary['total_columns'] += len(profile.columns)
+        if args.distribution_analysis or args.all_stats:
+            self.update_distribution_stats(file_path, profile.distribution_analysis())
+        if args.outlier_analysis or args.all_stats:
+            self.update_outlier_stats(file_path, profile.outlier_analysis())
+        if profile.datetime_column() is not None:
+            self.time_series_summary['files_with_datetime'] += 1
+
+        if self.streaming_profile is None:
+            self.streaming_profile = streaming_stats.FileProfile('all files')
+        self.streaming_profile.merge(profile)
+
+    def print_streaming_summary(self):
+        """Print the column statistics merged over all streamed files."""
+        profile = self.streaming_profile
+        if profile is None:
+            return
+        print(f"\n{Fore.CYAN}Merged Column Statistics (streaming, all files):{Style.RESET_ALL}")
+        print(f"  • Rows: {profile.rows} in {profile.batches} batches")
+        for col, stats in profile.descriptive_stats().items():
+            if 'error' in stats:
+                print(f"  • {col}: {stats['error']}")
+                continue
+            print(f"  • {col}: mean={stats['mean']:.4f} std={stats['std']:.4f} "
+                  f"min={stats['min']:.4f} median={stats['median']:.4f} max={stats['max']:.4f} "
+                  f"missing={stats['missing']} ({stats['missing_pct']:.2f}%)")
+
     def print_global_summary(self, args):
         print("\n" + "="*80)
         print(f"{Fore.BLUE + Style.BRIGHT}GLOBAL STATISTICAL ANALYSIS SUMMARY{Style.RESET_ALL}")
@@ -285,6 +348,7 @@ class StatsCollector:
         print(f"\n{Fore.CYAN}Overall Statistics:{Style.RESET_ALL}")
         print(f"  • Files analyzed: {self.descriptive_summary['files_analyzed']}")
         print(f"  • Total columns examined: {self.descriptive_summary['total_columns']}")
+        self.print_streaming_summary()
 
         if args.descriptive_stats or args.all_stats:
             print(f"\n{Fore.CYAN}Descriptive Statistics Summary:{Style.RESET_ALL}")
@@ -355,6 +419,369 @@ class StatsCollector:
         print("   - Consider developing specialized features based on domain knowledge")
 
 
+def process_file(idx, file, total_files, args):
+    """
+    Run the requested checks and analyses on one file.
+
+    Everything the file contributes to the final summaries is collected in the
+    returned partial (plain lists/dicts and a StatsCollector), which the caller
+    merges with merge_file_partial. Used directly for sequential runs and in
+    worker processes for --jobs.
+
+    Returns:
+        dict: Partial summaries, per-file results and a partial StatsCollector
+    """
+    partial = {
+        'nan_summary': [],
+        'dupe_summary': [],
+        'gap_summary': [],
+        'zero_summary': [],
+        'negative_summary': [],
+        'inf_summary': [],
+        'basic_stats': [],
+        'descriptive_stats': [],
+        'distribution_analysis': [],
+        'outlier_analysis': [],
+        'time_series_analysis': [],
+        'processed_files': [],
+        'stats': StatsCollector(),
+        'output': None
+    }
+    nan_summary_all = partial['nan_summary']
+    dupe_summary_all = partial['dupe_summary']
+    gap_summary_all = partial['gap_summary']
+    zero_summary_all = partial['zero_summary']
+    negative_summary_all = partial['negative_summary']
+    inf_summary_all = partial['inf_summary']
+    basic_stats_results = partial['basic_stats']
+    desc_stats_results = partial['descriptive_stats']
+    dist_analysis_results = partial['distribution_analysis']
+    outlier_analysis_results = partial['outlier_analysis']
+    ts_analysis_results = partial['time_series_analysis']
+    processed_file_paths = partial['processed_files']
+    stats_collector = partial['stats']
+
+    # Streaming mode never loads a whole file, not even for its row and column counts
+    info = file_info.get_file_info(file, metadata_only=args.streaming)
+
+    # Data quality or statistical analysis modes
+    if (
+        args.data_quality_checks or args.nan_check or args.duplicate_check or args.gap_check or
+        args.zero_check or args.negative_check or args.inf_check or
+        args.descriptive_stats or args.distribution_analysis or args.outlier_analysis or
+        args.time_series_analysis or args.all_stats or args.basic_stats
+    ):
+        if 'error' in info:
+            print(f"\n\n{Fore.CYAN}[{idx}/{total_files}] File: {info.get('file_path')}{Style.RESET_ALL}")
+            print(f"  {Fore.RED}Error reading file:{Style.RESET_ALL} {info['error']}")
+            return partial
+
+        if args.streaming:
+            print(f"\n\n{Fore.CYAN}[{idx}/{total_files}] File: {info.get('file_path')}{Style.RESET_ALL}")
+            try:
+                profile = streaming_stats.profile_parquet_file(file, batch_rows=args.batch_rows)
+            except Exception as e:
+                print(f"  {Fore.RED}Error reading file:{Style.RESET_ALL} {e}")
+                return partial
+            processed_file_paths.append(file)
+            print(f"  {Fore.YELLOW}Streamed {profile.rows} rows in {profile.batches} batches{Style.RESET_ALL}")
+
+            # Data quality checks
+            if args.data_quality_checks or args.nan_check:
+                streaming_stats.nan_check(profile, nan_summary_all, Fore, Style)
+            if args.data_quality_checks or args.duplicate_check:
+                print(f"  {Fore.YELLOW}Duplicate Check: not available in streaming mode{Style.RESET_ALL}")
+            if args.data_quality_checks or args.gap_check:
+                streaming_stats.gap_check(profile, gap_summary_all, Fore, Style, file_name=info.get('file_path'))
+            if args.data_quality_checks or args.zero_check:
+                streaming_stats.zero_check(profile, zero_summary_all, Fore, Style, file_name=info.get('file_path'))
+            if args.data_quality_checks or args.negative_check:
+                streaming_stats.negative_check(profile, negative_summary_all, Fore, Style, file_name=info.get('file_path'))
+            if args.data_quality_checks or args.inf_check:
+                streaming_stats.inf_check(profile, inf_summary_all, Fore, Style, file_name=info.get('file_path'))
+
+            # Statistical analysis
+            if args.all_stats or args.basic_stats:
+                basic_stats_results.append(profile.basic_stats())
+            if args.all_stats or args.descriptive_stats or args.basic_stats:
+                desc_stats_result = profile.descriptive_stats()
+                desc_stats_results.append(desc_stats_result)
+                print(f"\n{Fore.BLUE + Style.BRIGHT}Descriptive Statistics for {info.get('file_path')}:{Style.RESET_ALL}")
+                basic_stats.print_descriptive_stats(desc_stats_result)
+            if args.all_stats or args.distribution_analysis:
+                dist_analysis_result = profile.distribution_analysis()
+                dist_analysis_results.append(dist_analysis_result)
+                print(f"\n{Fore.BLUE + Style.BRIGHT}Distribution Analysis for {info.get('file_path')}:{Style.RESET_ALL}")
+                basic_stats.print_distribution_analysis(dist_analysis_result)
+            if args.all_stats or args.outlier_analysis:
+                outlier_analysis_result = profile.outlier_analysis()
+                outlier_analysis_results.append(outlier_analysis_result)
+                print(f"\n{Fore.BLUE + Style.BRIGHT}Outlier Analysis for {info.get('file_path')}:{Style.RESET_ALL}")
+                basic_stats.print_outlier_analysis(outlier_analysis_result)
+            if args.all_stats or args.time_series_analysis:
+                print(f"  {Fore.YELLOW}Time Series Analysis: not available in streaming mode{Style.RESET_ALL}")
+
+            stats_collector.update_streaming_stats(file, profile, args)
+            print("\n")
+            return partial
+
+        # Read the DataFrame safely with memory monitoring
+        df = safe_read_parquet(file)
+        if df is None:
+            print(f"\n\n{Fore.CYAN}[{idx}/{total_files}] File: {info.get('file_path')}{Style.RESET_ALL}")
+            print(f"  {Fore.RED}Error reading file or memory limit exceeded{Style.RESET_ALL}")
+            return partial
+
+        if df is not None:
+            # Track this file for logging
+            processed_file_paths.append(file)
+
+            # Print file header with extra newlines for better separation
+            print(f"\n\n{Fore.CYAN}[{idx}/{total_files}] File: {info.get('file_path')}{Style.RESET_ALL}")
+
+            # Data quality checks
+            if args.data_quality_checks or args.nan_check:
+                data_quality.nan_check(df, nan_summary_all, Fore, Style)
+            if args.data_quality_checks or args.duplicate_check:
+                data_quality.duplicate_check(df, dupe_summary_all, Fore, Style)
+            if args.data_quality_checks or args.gap_check:
+                data_quality.gap_check(df, gap_summary_all, Fore, Style, schema_datetime_fields=info.get('datetime_or_timestamp_fields'), file_name=info.get('file_path'))
+            if args.data_quality_checks or args.zero_check:
+                data_quality.zero_check(df, zero_summary_all, Fore, Style, file_name=info.get('file_path'))
+            if args.data_quality_checks or args.negative_check:
+                data_quality.negative_check(df, negative_summary_all, Fore, Style, file_name=info.get('file_path'))
+            if args.data_quality_checks or args.inf_check:
+                data_quality.inf_check(df, inf_summary_all, Fore, Style, file_name=info.get('file_path'))
+
+            # Statistical analysis
+            if args.all_stats or args.basic_stats:
+                print(f"\n{Fore.BLUE + Style.BRIGHT}Basic Statistics for {info.get('file_path')}:{Style.RESET_ALL}")
+                # Add progress bar for column processing
+                columns = df.columns
+                with tqdm(total=len(columns), desc=f"Basic stats analysis", leave=False) as pbar:
+                    basic_stats_result = basic_stats.compute_basic_stats(df)
+                    pbar.update(len(columns))  # Update progress bar after computation
+
+                basic_stats_results.append(basic_stats_result)
+
+                # Group columns by type (similar to print_descriptive_stats)
+                column_groups = {}
+                for col in basic_stats_result.keys():
+                    # Group by OHLCV pattern
+                    if 'open' in col.lower() or 'high' in col.lower() or 'low' in col.lower() or 'close' in col.lower():
+                        group = 'price_ohlc'
+                    elif 'volume' in col.lower():
+                        group = 'volume'
+                    else:
+                        group = 'other'
+
+                    if group not in column_groups:
+                        column_groups[group] = []
+                    column_groups[group].append(col)
+
+                # Print each group
+                for group, columns in column_groups.items():
+                    if group == 'price_ohlc':
+                        print(f"\n\033[96mPrice Data (OHLC):\033[0m")
+                    elif group == 'volume':
+                        print(f"\n\033[96mVolume Data:\033[0m")
+                    else:
+                        print(f"\n\033[96mOther Data:\033[0m")
+
+                    # Print common metrics in rows for each column group
+                    metrics_to_show = ['mean', 'median', 'std', 'min', 'max', 'missing']
+                    for metric in metrics_to_show:
+                        values = []
+                        for col in columns:
+                            stats = basic_stats_result[col]
+                            if metric in stats:
+                                val = stats[metric]
+                                if isinstance(val, float):
+                                    values.append(f"{col}: {val:.4f}")
+                                else:
+                                    values.append(f"{col}: {val}")
+
+                        if values:
+                            print(f"  {metric.capitalize()}: {' | '.join(values)}")
+                    print()  # Extra line for readability
+
+                # Print basic stats summary
+                basic_stats.print_basic_stats_summary(basic_stats_result)
+
+            # Run more detailed statistical analyses
+            if args.all_stats or args.descriptive_stats:
+                print(f"\n{Fore.BLUE + Style.BRIGHT}Descriptive Statistics for {info.get('file_path')}:{Style.RESET_ALL}")
+                columns = df.select_dtypes(include=['number']).columns
+                with tqdm(total=len(columns), desc=f"Descriptive stats analysis", leave=False) as pbar:
+                    desc_stats_result = basic_stats.descriptive_stats(df)
+                    pbar.update(len(columns))  # Update progress bar after computation
+
+                desc_stats_results.append(desc_stats_result)
+                basic_stats.print_descriptive_stats(desc_stats_result)
+                # Update global stats
+                stats_collector.update_descriptive_stats(file, desc_stats_result)
+
+            if args.all_stats or args.distribution_analysis:
+                print(f"\n{Fore.BLUE + Style.BRIGHT}Distribution Analysis for {info.get('file_path')}:{Style.RESET_ALL}")
+                columns = df.select_dtypes(include=['number']).columns
+                with tqdm(total=len(columns), desc=f"Distribution analysis", leave=False) as pbar:
+                    dist_analysis_result = basic_stats.distribution_analysis(df)
+                    pbar.update(len(columns))  # Update progress bar after computation
+
+                dist_analysis_results.append(dist_analysis_result)
+                basic_stats.print_distribution_analysis(dist_analysis_result)
+                # Update global stats
+                stats_collector.update_distribution_stats(file, dist_analysis_result)
+
+            if args.all_stats or args.outlier_analysis:
+                print(f"\n{Fore.BLUE + Style.BRIGHT}Outlier Analysis for {info.get('file_path')}:{Style.RESET_ALL}")
+                columns = df.select_dtypes(include=['number']).columns
+                with tqdm(total=len(columns), desc=f"Outlier detection", leave=False) as pbar:
+                    outlier_analysis_result = basic_stats.outlier_analysis(df)
+                    pbar.update(len(columns))  # Update progress bar after computation
+
+                outlier_analysis_results.append(outlier_analysis_result)
+                basic_stats.print_outlier_analysis(outlier_analysis_result)
+                # Update global stats
+                stats_collector.update_outlier_stats(file, outlier_analysis_result)
+
+            if args.all_stats or args.time_series_analysis:
+                print(f"\n{Fore.BLUE + Style.BRIGHT}Time Series Analysis for {info.get('file_path')}:{Style.RESET_ALL}")
+                with tqdm(total=1, desc=f"Time series analysis", leave=False) as pbar:
+                    ts_analysis_result = basic_stats.time_series_analysis(df)
+                    pbar.update(1)  # Update progress bar after computation
+
+                ts_analysis_results.append(ts_analysis_result)
+                basic_stats.print_time_series_analysis(ts_analysis_result)
+                # Update global stats
+                stats_collector.update_time_series_stats(file, ts_analysis_result)
+
+            # Add a file-specific summary at the end of each file analysis
+            if (args.all_stats or args.descriptive_stats or args.distribution_analysis or
+                args.outlier_analysis or args.time_series_analysis):
+                print(f"\n{Fore.YELLOW + Style.BRIGHT}File-Specific Summary for {os.path.basename(file)}:{Style.RESET_ALL}")
+                print("  • This file contains data with the following characteristics:")
+                # Print key metrics
+                try:
+                    print(f"    - {df.shape[0]} rows and {df.shape[1]} columns")
+                    numeric_cols = df.select_dtypes(include=['number']).columns
+                    print(f"    - {len(numeric_cols)} numeric columns that can be used for modeling")
+                    # Check for datetime columns
+                    datetime_cols = [col for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])]
+                    if datetime_cols:
+                        print(f"    - Contains datetime column(s): {', '.join(datetime_cols)}")
+                        # Show date range if available
+                        for dt_col in datetime_cols:
+                            try:
+                                min_date = df[dt_col].min()
+                                max_date = df[dt_col].max()
+                                print(f"    - Date range: {min_date} to {max_date}")
+                            except:
+                                pass
+                except Exception as e:
+                    print(f"    - Error generating file summary: {e}")
+
+        # Clean up memory after processing each file
+        if df is not None:
+            del df
+        optimize_memory()
+        
+        # Add extra space after each file
+        print("\n")
+        return partial
+
+    # Default mode - just print file info
+    print(f"\n\n{Fore.CYAN}[{idx}/{total_files}] File: {info.get('file_path')}{Style.RESET_ALL}")
+    print(f"  {Fore.YELLOW}Name:{Style.RESET_ALL} {info.get('file_name')}")
+    print(f"  {Fore.YELLOW}Size:{Style.RESET_ALL} {info.get('file_size_mb')} MB")
+    if 'error' in info:
+        print(f"  {Fore.RED}Error reading file:{Style.RESET_ALL} {info['error']}")
+        return partial
+    print(f"  {Fore.YELLOW}Rows:{Style.RESET_ALL} {info.get('n_rows')}, {Fore.YELLOW}Columns:{Style.RESET_ALL} {info.get('n_cols')}")
+    print(f"  {Fore.YELLOW}Columns:{Style.RESET_ALL} {info.get('columns')}")
+
+    # Print dtype information
+    dtypes_dict = info.get('dtypes')
+    if dtypes_dict:
+        print(f"  {Fore.YELLOW}Dtypes:{Style.RESET_ALL}")
+        max_col_len = max(len(str(col)) for col in dtypes_dict.keys()) if dtypes_dict else 0
+        for col, dtype in dtypes_dict.items():
+            print(f"    {col.ljust(max_col_len)} : {dtype}")
+    print(f"  {Fore.MAGENTA}DateTime/Timestamp fields (schema):{Style.RESET_ALL} {info.get('datetime_or_timestamp_fields')}")
+
+    # Print sample rows
+    if args.streaming:
+        try:
+            head, tail = streaming_stats.sample_rows(file)
+            print(f"  {Fore.GREEN}First 5 rows:{Style.RESET_ALL}\n", head.to_string())
+            print(f"  {Fore.GREEN}Last 5 rows:{Style.RESET_ALL}\n", tail.to_string())
+        except Exception as e:
+            print(f"  {Fore.RED}Error reading rows:{Style.RESET_ALL} {e}")
+        print("\n")
+        return partial
+
+    try:
+        df = safe_read_parquet(file)
+        if df is not None:
+            print(f"  {Fore.GREEN}First 5 rows:{Style.RESET_ALL}\n", df.head(5).to_string())
+            print(f"  {Fore.GREEN}Last 5 rows:{Style.RESET_ALL}\n", df.tail(5).to_string())
+            # Clean up memory after displaying sample rows
+            del df
+            optimize_memory()
+        else:
+            print(f"  {Fore.RED}Error reading rows: Memory limit exceeded or file read error{Style.RESET_ALL}")
+    except Exception as e:
+        print(f"  {Fore.RED}Error reading rows:{Style.RESET_ALL} {e}")
+
+    # Add extra space
+    print("\n")
+
+    return partial
+
+
+def _slim_summary_frames(partial):
+    """
+    Replace the DataFrames attached to zero/negative/inf summary entries by the
+    rows the summary printers show, so worker results stay small to send back.
+    """
+    for key, select in (('zero_summary', lambda df, col: df[col] == 0),
+                        ('negative_summary', lambda df, col: df[col] < 0),
+                        ('inf_summary', lambda df, col: (df[col] == float('inf')) | (df[col] == float('-inf')))):
+        for entry in partial[key]:
+            df = entry.get('df')
+            if df is None:
+                continue
+            try:
+                entry['df'] = df[select(df, entry['column'])].head(20)
+            except Exception:
+                pass  # Keep the full frame if the column cannot be compared
+
+
+def _process_file_captured(idx, file, total_files, args):
+    """Worker entry point: process_file with its console output captured."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        partial = process_file(idx, file, total_files, args)
+    _slim_summary_frames(partial)
+    partial['output'] = buffer.getvalue()
+    return partial
+
+
+def process_files_parallel(parquet_files, args):
+    """
+    Process files in a pool of args.jobs worker processes.
+
+    Yields the partials in file order, so merging and printing them gives the
+    same output as a sequential run.
+    """
+    total_files = len(parquet_files)
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(_process_file_captured, idx, file, total_files, args)
+                   for idx, file in enumerate(parquet_files, 1)]
+        for future in futures:
+            yield future.result()
+
+
 # Main function to handle command line arguments and execute the appropriate functions
 def main():
     """Main function to handle command line arguments and execute the appropriate functions."""
@@ -400,6 +827,13 @@ def main():
   {Fore.GREEN}--clean-stats-logs{Style.RESET_ALL}         Remove all statistics log files
   {Fore.GREEN}--clean-reports{Style.RESET_ALL}            Remove all HTML report directories for all analyses
 
+{Fore.YELLOW}Streaming Flags:{Style.RESET_ALL}
+  {Fore.GREEN}--streaming{Style.RESET_ALL}                Read files batch by batch with constant memory (no file limit)
+  {Fore.GREEN}--batch-rows N{Style.RESET_ALL}             Rows per batch in streaming mode (default: 65536)
+
+{Fore.YELLOW}Parallel Flags:{Style.RESET_ALL}
+  {Fore.GREEN}--jobs N, -j N{Style.RESET_ALL}             Process N files in parallel worker processes (default: 1)
+
 {Fore.YELLOW}Examples:{Style.RESET_ALL}
   # Check data quality issues
   python eda_batch_check.py --nan-check --duplicate-check
@@ -435,6 +869,9 @@ def main():
   
   # Statistical analysis on a single file
   python eda_batch_check.py --file mydata.parquet --descriptive-stats
+
+  # Profile files of any size with constant memory
+  python eda_batch_check.py --streaming --data-quality-checks --all-stats
 """
     parser = argparse.ArgumentParser(
         description=help_header,
@@ -473,6 +910,11 @@ def main():
     parser.add_argument('--clean-reports', action='store_true', help='Remove all HTML report directories for all analyses')
     # File selection
     parser.add_argument('--file', type=str, help='Specify a single file name for analysis (within the data directory)')
+    # Streaming mode
+    parser.add_argument('--streaming', action='store_true', help='Read files batch by batch with constant memory (no file limit)')
+    parser.add_argument('--batch-rows', type=int, default=streaming_stats.DEFAULT_BATCH_ROWS, help='Rows per batch in streaming mode')
+    # Parallel processing
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='Number of files processed in parallel worker processes')
     args = parser.parse_args()
 
     # Handle the clean logs request if specified
@@ -546,7 +988,8 @@ def main():
     initial_memory = check_memory_usage()
     
     # Limit number of files processed in Docker to prevent memory issues
-    max_files = 10 if os.environ.get('DOCKER_CONTAINER') else total_files
+    # (streaming mode reads footers and record batches only, so it has no limit)
+    max_files = 10 if os.environ.get('DOCKER_CONTAINER') and not args.streaming else total_files
     if total_files > max_files:
         print(f"{Fore.YELLOW}Warning: Limiting processing to {max_files} files to prevent memory issues in Docker{Style.RESET_ALL}")
         parquet_files = parquet_files[:max_files]
@@ -555,221 +998,29 @@ def main():
     print(f"{Fore.CYAN}Processing {total_files} files...{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}Initial memory usage: {initial_memory:.1f}MB{Style.RESET_ALL}")
 
-    for idx, file in enumerate(tqdm(parquet_files, desc="Processing files"), 1):  # Add progress bar
-        info = file_info.get_file_info(file)
-
-        # Data quality or statistical analysis modes
-        if (
-            args.data_quality_checks or args.nan_check or args.duplicate_check or args.gap_check or
-            args.zero_check or args.negative_check or args.inf_check or
-            args.descriptive_stats or args.distribution_analysis or args.outlier_analysis or
-            args.time_series_analysis or args.all_stats or args.basic_stats
-        ):
-            if 'error' in info:
-                print(f"\n\n{Fore.CYAN}[{idx}/{total_files}] File: {info.get('file_path')}{Style.RESET_ALL}")
-                print(f"  {Fore.RED}Error reading file:{Style.RESET_ALL} {info['error']}")
-                continue
-
-            # Read the DataFrame safely with memory monitoring
-            df = safe_read_parquet(file)
-            if df is None:
-                print(f"\n\n{Fore.CYAN}[{idx}/{total_files}] File: {info.get('file_path')}{Style.RESET_ALL}")
-                print(f"  {Fore.RED}Error reading file or memory limit exceeded{Style.RESET_ALL}")
-                continue
-
-            if df is not None:
-                # Track this file for logging
-                processed_file_paths.append(file)
-
-                # Print file header with extra newlines for better separation
-                print(f"\n\n{Fore.CYAN}[{idx}/{total_files}] File: {info.get('file_path')}{Style.RESET_ALL}")
-
-                # Data quality checks
-                if args.data_quality_checks or args.nan_check:
-                    data_quality.nan_check(df, nan_summary_all, Fore, Style)
-                if args.data_quality_checks or args.duplicate_check:
-                    data_quality.duplicate_check(df, dupe_summary_all, Fore, Style)
-                if args.data_quality_checks or args.gap_check:
-                    data_quality.gap_check(df, gap_summary_all, Fore, Style, schema_datetime_fields=info.get('datetime_or_timestamp_fields'), file_name=info.get('file_path'))
-                if args.data_quality_checks or args.zero_check:
-                    data_quality.zero_check(df, zero_summary_all, Fore, Style, file_name=info.get('file_path'))
-                if args.data_quality_checks or args.negative_check:
-                    data_quality.negative_check(df, negative_summary_all, Fore, Style, file_name=info.get('file_path'))
-                if args.data_quality_checks or args.inf_check:
-                    data_quality.inf_check(df, inf_summary_all, Fore, Style, file_name=info.get('file_path'))
-
-                # Statistical analysis
-                if args.all_stats or args.basic_stats:
-                    print(f"\n{Fore.BLUE + Style.BRIGHT}Basic Statistics for {info.get('file_path')}:{Style.RESET_ALL}")
-                    # Add progress bar for column processing
-                    columns = df.columns
-                    with tqdm(total=len(columns), desc=f"Basic stats analysis", leave=False) as pbar:
-                        basic_stats_result = basic_stats.compute_basic_stats(df)
-                        pbar.update(len(columns))  # Update progress bar after computation
-
-                    basic_stats_results.append(basic_stats_result)
-
-                    # Group columns by type (similar to print_descriptive_stats)
-                    column_groups = {}
-                    for col in basic_stats_result.keys():
-                        # Group by OHLCV pattern
-                        if 'open' in col.lower() or 'high' in col.lower() or 'low' in col.lower() or 'close' in col.lower():
-                            group = 'price_ohlc'
-                        elif 'volume' in col.lower():
-                            group = 'volume'
-                        else:
-                            group = 'other'
-
-                        if group not in column_groups:
-                            column_groups[group] = []
-                        column_groups[group].append(col)
-
-                    # Print each group
-                    for group, columns in column_groups.items():
-                        if group == 'price_ohlc':
-                            print(f"\n\033[96mPrice Data (OHLC):\033[0m")
-                        elif group == 'volume':
-                            print(f"\n\033[96mVolume Data:\033[0m")
-                        else:
-                            print(f"\n\033[96mOther Data:\033[0m")
-
-                        # Print common metrics in rows for each column group
-                        metrics_to_show = ['mean', 'median', 'std', 'min', 'max', 'missing']
-                        for metric in metrics_to_show:
-                            values = []
-                            for col in columns:
-                                stats = basic_stats_result[col]
-                                if metric in stats:
-                                    val = stats[metric]
-                                    if isinstance(val, float):
-                                        values.append(f"{col}: {val:.4f}")
-                                    else:
-                                        values.append(f"{col}: {val}")
-
-                            if values:
-                                print(f"  {metric.capitalize()}: {' | '.join(values)}")
-                        print()  # Extra line for readability
-
-                    # Print basic stats summary
-                    basic_stats.print_basic_stats_summary(basic_stats_result)
-
-                # Run more detailed statistical analyses
-                if args.all_stats or args.descriptive_stats:
-                    print(f"\n{Fore.BLUE + Style.BRIGHT}Descriptive Statistics for {info.get('file_path')}:{Style.RESET_ALL}")
-                    columns = df.select_dtypes(include=['number']).columns
-                    with tqdm(total=len(columns), desc=f"Descriptive stats analysis", leave=False) as pbar:
-                        desc_stats_result = basic_stats.descriptive_stats(df)
-                        pbar.update(len(columns))  # Update progress bar after computation
-
-                    desc_stats_results.append(desc_stats_result)
-                    basic_stats.print_descriptive_stats(desc_stats_result)
-                    # Update global stats
-                    stats_collector.update_descriptive_stats(file, desc_stats_result)
-
-                if args.all_stats or args.distribution_analysis:
-                    print(f"\n{Fore.BLUE + Style.BRIGHT}Distribution Analysis for {info.get('file_path')}:{Style.RESET_ALL}")
-                    columns = df.select_dtypes(include=['number']).columns
-                    with tqdm(total=len(columns), desc=f"Distribution analysis", leave=False) as pbar:
-                        dist_analysis_result = basic_stats.distribution_analysis(df)
-                        pbar.update(len(columns))  # Update progress bar after computation
-
-                    dist_analysis_results.append(dist_analysis_result)
-                    basic_stats.print_distribution_analysis(dist_analysis_result)
-                    # Update global stats
-                    stats_collector.update_distribution_stats(file, dist_analysis_result)
-
-                if args.all_stats or args.outlier_analysis:
-                    print(f"\n{Fore.BLUE + Style.BRIGHT}Outlier Analysis for {info.get('file_path')}:{Style.RESET_ALL}")
-                    columns = df.select_dtypes(include=['number']).columns
-                    with tqdm(total=len(columns), desc=f"Outlier detection", leave=False) as pbar:
-                        outlier_analysis_result = basic_stats.outlier_analysis(df)
-                        pbar.update(len(columns))  # Update progress bar after computation
-
-                    outlier_analysis_results.append(outlier_analysis_result)
-                    basic_stats.print_outlier_analysis(outlier_analysis_result)
-                    # Update global stats
-                    stats_collector.update_outlier_stats(file, outlier_analysis_result)
-
-                if args.all_stats or args.time_series_analysis:
-                    print(f"\n{Fore.BLUE + Style.BRIGHT}Time Series Analysis for {info.get('file_path')}:{Style.RESET_ALL}")
-                    with tqdm(total=1, desc=f"Time series analysis", leave=False) as pbar:
-                        ts_analysis_result = basic_stats.time_series_analysis(df)
-                        pbar.update(1)  # Update progress bar after computation
-
-                    ts_analysis_results.append(ts_analysis_result)
-                    basic_stats.print_time_series_analysis(ts_analysis_result)
-                    # Update global stats
-                    stats_collector.update_time_series_stats(file, ts_analysis_result)
-
-                # Add a file-specific summary at the end of each file analysis
-                if (args.all_stats or args.descriptive_stats or args.distribution_analysis or
-                    args.outlier_analysis or args.time_series_analysis):
-                    print(f"\n{Fore.YELLOW + Style.BRIGHT}File-Specific Summary for {os.path.basename(file)}:{Style.RESET_ALL}")
-                    print("  • This file contains data with the following characteristics:")
-                    # Print key metrics
-                    try:
-                        print(f"    - {df.shape[0]} rows and {df.shape[1]} columns")
-                        numeric_cols = df.select_dtypes(include=['number']).columns
-                        print(f"    - {len(numeric_cols)} numeric columns that can be used for modeling")
-                        # Check for datetime columns
-                        datetime_cols = [col for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])]
-                        if datetime_cols:
-                            print(f"    - Contains datetime column(s): {', '.join(datetime_cols)}")
-                            # Show date range if available
-                            for dt_col in datetime_cols:
-                                try:
-                                    min_date = df[dt_col].min()
-                                    max_date = df[dt_col].max()
-                                    print(f"    - Date range: {min_date} to {max_date}")
-                                except:
-                                    pass
-                    except Exception as e:
-                        print(f"    - Error generating file summary: {e}")
-
-            # Clean up memory after processing each file
-            if df is not None:
-                del df
-            optimize_memory()
-            
-            # Add extra space after each file
-            print("\n")
-            continue
-
-        # Default mode - just print file info
-        print(f"\n\n{Fore.CYAN}[{idx}/{total_files}] File: {info.get('file_path')}{Style.RESET_ALL}")
-        print(f"  {Fore.YELLOW}Name:{Style.RESET_ALL} {info.get('file_name')}")
-        print(f"  {Fore.YELLOW}Size:{Style.RESET_ALL} {info.get('file_size_mb')} MB")
-        if 'error' in info:
-            print(f"  {Fore.RED}Error reading file:{Style.RESET_ALL} {info['error']}")
-            continue
-        print(f"  {Fore.YELLOW}Rows:{Style.RESET_ALL} {info.get('n_rows')}, {Fore.YELLOW}Columns:{Style.RESET_ALL} {info.get('n_cols')}")
-        print(f"  {Fore.YELLOW}Columns:{Style.RESET_ALL} {info.get('columns')}")
-
-        # Print dtype information
-        dtypes_dict = info.get('dtypes')
-        if dtypes_dict:
-            print(f"  {Fore.YELLOW}Dtypes:{Style.RESET_ALL}")
-            max_col_len = max(len(str(col)) for col in dtypes_dict.keys()) if dtypes_dict else 0
-            for col, dtype in dtypes_dict.items():
-                print(f"    {col.ljust(max_col_len)} : {dtype}")
-        print(f"  {Fore.MAGENTA}DateTime/Timestamp fields (schema):{Style.RESET_ALL} {info.get('datetime_or_timestamp_fields')}")
-
-        # Print sample rows
-        try:
-            df = safe_read_parquet(file)
-            if df is not None:
-                print(f"  {Fore.GREEN}First 5 rows:{Style.RESET_ALL}\n", df.head(5).to_string())
-                print(f"  {Fore.GREEN}Last 5 rows:{Style.RESET_ALL}\n", df.tail(5).to_string())
-                # Clean up memory after displaying sample rows
-                del df
-                optimize_memory()
-            else:
-                print(f"  {Fore.RED}Error reading rows: Memory limit exceeded or file read error{Style.RESET_ALL}")
-        except Exception as e:
-            print(f"  {Fore.RED}Error reading rows:{Style.RESET_ALL} {e}")
-
-        # Add extra space
-        print("\n")
+    if args.jobs > 1:
+        print(f"{Fore.CYAN}Using {args.jobs} worker processes{Style.RESET_ALL}")
+        partials = process_files_parallel(parquet_files, args)
+    else:
+        partials = (process_file(idx, file, total_files, args) for idx, file in enumerate(parquet_files, 1))
+
+    for partial in tqdm(partials, total=total_files, desc="Processing files"):  # Add progress bar
+        if partial['output']:
+            # Output captured in a worker process, printed in file order
+            print(partial['output'], end='')
+        nan_summary_all.extend(partial['nan_summary'])
+        dupe_summary_all.extend(partial['dupe_summary'])
+        gap_summary_all.extend(partial['gap_summary'])
+        zero_summary_all.extend(partial['zero_summary'])
+        negative_summary_all.extend(partial['negative_summary'])
+        inf_summary_all.extend(partial['inf_summary'])
+        basic_stats_results.extend(partial['basic_stats'])
+        desc_stats_results.extend(partial['descriptive_stats'])
+        dist_analysis_results.extend(partial['distribution_analysis'])
+        outlier_analysis_results.extend(partial['outlier_analysis'])
+        ts_analysis_results.extend(partial['time_series_analysis'])
+        processed_file_paths.extend(partial['processed_files'])
+        stats_collector.merge(partial['stats'])
 
     # Print summaries for quality checks
     print("\n\n")  # Extra space
@@ -797,11 +1048,11 @@ def main():
 
     # Log individual statistics if they were computed
     if processed_file_paths:
-        if args.basic_stats or args.all_stats:
+        if (args.basic_stats or args.all_stats) and basic_stats_results:
             log_path = stats_logger.log_basic_stats(basic_stats_results, processed_file_paths)
             print(f"{Fore.GREEN}Basic statistics logged to: {log_path}{Style.RESET_ALL}")
 
-        if args.descriptive_stats or args.all_stats:
+        if (args.descriptive_stats or args.all_stats) and desc_stats_results:
             log_path = stats_logger.log_descriptive_stats(desc_stats_results, processed_file_paths)
             print(f"{Fore.GREEN}Descriptive statistics logged to: {log_path}{Style.RESET_ALL}")
 
@@ -813,7 +1064,7 @@ def main():
             log_path = stats_logger.log_outlier_analysis(outlier_analysis_results, processed_file_paths)
             print(f"{Fore.GREEN}Outlier analysis logged to: {log_path}{Style.RESET_ALL}")
 
-        if args.time_series_analysis or args.all_stats:
+        if (args.time_series_analysis or args.all_stats) and ts_analysis_results:
             log_path = stats_logger.log_time_series_analysis(ts_analysis_results, processed_file_paths)
             print(f"{Fore.GREEN}Time series analysis logged to: {log_path}{Style.RESET_ALL}")
 
@@ -5,8 +5,9 @@ import pandas as pd
 import pyarrow.parquet as pq
 
 # Handles file information extraction
-def get_file_info(filepath):
+def get_file_info(filepath, metadata_only=False):
    # Get file information
+   # (metadata_only takes rows, columns and dtypes from the Parquet footer instead of reading the data)
     info = {}
     info['file_path'] = filepath
     info['file_name'] = os.path.basename(filepath)
@@ -18,15 +19,20 @@ def get_file_info(filepath):
         info['parquet_schema'] = str(schema)
 
         # Get schema fields
-        schema_arrow = schema.to_arrow_schema()
+        schema_arrow = parquet_file.schema_arrow
         datetime_fields = []
         for name, typ in zip(schema_arrow.names, schema_arrow.types):
             if 'timestamp' in str(typ).lower() or 'datetime' in str(typ).lower():
                 datetime_fields.append(name)
         info['datetime_or_timestamp_fields'] = datetime_fields
 
-        df = pd.read_parquet(filepath)
-        info['n_rows'], info['n_cols'] = df.shape
+        if metadata_only:
+            # An empty table keeps the pandas index restoration and dtypes of a full read
+            df = schema_arrow.empty_table().to_pandas()
+            info['n_rows'], info['n_cols'] = parquet_file.metadata.num_rows, df.shape[1]
+        else:
+            df = pd.read_parquet(filepath)
+            info['n_rows'], info['n_cols'] = df.shape
         info['columns'] = list(df.columns)
         info['dtypes'] = dict(df.dtypes.apply(lambda x: str(x)))
 
@@ -0,0 +1,651 @@
+# Streaming (out-of-core) EDA statistics
+
+"""
+Streaming EDA statistics for parquet files of any size.
+
+Files are read batch by batch (row group by row group) with pyarrow and every
+column updates a mergeable accumulator, so memory stays constant no matter how
+large a file is:
+
+* NumericAccumulator - NaN/zero/negative/inf tallies, min/max, the first four
+  central moments (merged with the pairwise update of Chan/Pebay, a batched
+  Welford) and a t-digest for quantiles and outlier fractions.
+* TimestampAccumulator - NaT/negative tallies, min/max and a histogram of the
+  deltas between consecutive timestamps plus the largest deltas for gap checks.
+* OtherAccumulator - row and missing counts for all remaining columns.
+
+A FileProfile holds the accumulators of one file; profiles of several files are
+merged column by column into the global summary of StatsCollector. The
+``*_stats`` methods return dictionaries in the format of basic_stats, and the
+``*_check`` functions mirror data_quality, so the existing printers and loggers
+work unchanged.
+"""
+
+import heapq
+import math
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from scipy import stats as scipy_stats
+
+# Rows per record batch read from a parquet file
+DEFAULT_BATCH_ROWS = 65_536
+# t-digest compression (maximum number of centroids is about this value)
+TDIGEST_COMPRESSION = 200
+# Distinct timestamp deltas kept exactly before they are folded into log2 buckets
+MAX_DISTINCT_DELTAS = 4096
+# Largest timestamp deltas kept for gap reporting
+MAX_REPORTED_GAPS = 20
+
+OHLCV_KEYS = ['open', 'high', 'low', 'close', 'volume', 'amount', 'qty']
+
+
+class TDigest:
+    """
+    Mergeable quantile sketch (merging t-digest with the arcsine scale function).
+
+    Values are merged into at most about ``compression`` centroids; centroids are
+    small near the tails, so extreme quantiles stay accurate.
+    """
+
+    def __init__(self, compression=TDIGEST_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def total_weight(self):
+        return float(self.weights.sum())
+
+    def update(self, values):
+        """Add a batch of finite values."""
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._compress(np.concatenate((self.means, values)),
+                       np.concatenate((self.weights, np.ones(len(values)))))
+
+    def merge(self, other):
+        """Merge the centroids of another digest into this one."""
+        if len(other.means) == 0:
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate((self.means, other.means)),
+                       np.concatenate((self.weights, other.weights)))
+
+    def _compress(self, means, weights):
+        order = np.argsort(means, kind='mergesort')
+        means = means[order]
+        weights = weights[order]
+        cumulative = np.cumsum(weights)
+        q_mid = (cumulative - weights / 2) / cumulative[-1]
+        # Scale function k1: centroid i belongs to bucket floor(k(q_i))
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q_mid - 1)
+        groups = np.floor(k)
+        starts = np.flatnonzero(np.concatenate(([True], groups[1:] != groups[:-1])))
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+
+    def quantile(self, q):
+        """Estimated q-quantile (0 <= q <= 1), NaN when empty."""
+        if len(self.means) == 0:
+            return float('nan')
+        positions, values = self._knots()
+        return float(np.interp(q * positions[-1], positions, values))
+
+    def cdf(self, x):
+        """Estimated fraction of values <= x (x may be an array)."""
+        if len(self.means) == 0:
+            return np.full(np.shape(x), np.nan) if np.ndim(x) else float('nan')
+        positions, values = self._knots()
+        return np.interp(x, values, positions, left=0.0, right=positions[-1]) / positions[-1]
+
+    def _knots(self):
+        # Centroid means sit at the middle of their weight; min/max close the ends
+        cumulative = np.cumsum(self.weights)
+        positions = np.concatenate(([0.0], cumulative - self.weights / 2, [cumulative[-1]]))
+        values = np.concatenate(([self.min], self.means, [self.max]))
+        return positions, values
+
+
+class NumericAccumulator:
+    """Mergeable tallies, moments and quantile sketch of a numeric column."""
+
+    kind = 'numeric'
+
+    def __init__(self):
+        self.rows = 0
+        self.nan = 0
+        self.zero = 0
+        self.negative = 0
+        self.posinf = 0
+        self.neginf = 0
+        # Moments of the finite values: count, mean and central sums M2..M4
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.digest = TDigest()
+
+    def update(self, values):
+        """Add a batch of float values (NaN marks missing values)."""
+        self.rows += len(values)
+        nan_mask = np.isnan(values)
+        self.nan += int(nan_mask.sum())
+        self.zero += int((values == 0).sum())
+        self.negative += int((values < 0).sum())
+        self.posinf += int((values == np.inf).sum())
+        self.neginf += int((values == -np.inf).sum())
+
+        finite = values[np.isfinite(values)]
+        if len(finite) == 0:
+            return
+        mean = float(finite.mean())
+        centered = finite - mean
+        squared = centered * centered
+        self._combine(len(finite), mean, float(squared.sum()),
+                      float((squared * centered).sum()), float((squared * squared).sum()))
+        self.min = min(self.min, float(finite.min()))
+        self.max = max(self.max, float(finite.max()))
+        self.digest.update(finite)
+
+    def merge(self, other):
+        """Merge the accumulator of another batch or file."""
+        for name in ('rows', 'nan', 'zero', 'negative', 'posinf', 'neginf'):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        if other.n == 0:
+            return
+        self._combine(other.n, other.mean, other.m2, other.m3, other.m4)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.digest.merge(other.digest)
+
+    def _combine(self, n_b, mean_b, m2_b, m3_b, m4_b):
+        # Pairwise update of the central moments (Chan et al., Pebay)
+        n_a, mean_a, m2_a, m3_a = self.n, self.mean, self.m2, self.m3
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        delta_n = delta / n
+        self.m4 = (self.m4 + m4_b
+                   + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+                   + 6 * delta_n ** 2 * (n_a * n_a * m2_b + n_b * n_b * m2_a)
+                   + 4 * delta_n * (n_a * m3_b - n_b * m3_a))
+        self.m3 = (m3_a + m3_b
+                   + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+                   + 3 * delta_n * (n_a * m2_b - n_b * m2_a))
+        self.m2 = m2_a + m2_b + delta * delta_n * n_a * n_b
+        self.mean = mean_a + delta_n * n_b
+        self.n = n
+
+    @property
+    def var(self):
+        """Sample variance (ddof=1), as pandas computes it."""
+        return self.m2 / (self.n - 1) if self.n > 1 else float('nan')
+
+    @property
+    def skewness(self):
+        """Bias-corrected sample skewness, as pandas ``Series.skew``."""
+        n = self.n
+        if n < 3 or self.m2 == 0:
+            return float('nan') if n < 3 else 0.0
+        g1 = math.sqrt(n) * self.m3 / self.m2 ** 1.5
+        return g1 * math.sqrt(n * (n - 1)) / (n - 2)
+
+    @property
+    def kurtosis(self):
+        """Bias-corrected sample excess kurtosis, as pandas ``Series.kurt``."""
+        n = self.n
+        if n < 4 or self.m2 == 0:
+            return float('nan') if n < 4 else 0.0
+        g2 = n * self.m4 / (self.m2 * self.m2) - 3
+        return ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+
+    def descriptive_stats(self):
+        """Column entry in the format of ``basic_stats.descriptive_stats``."""
+        if self.n == 0:
+            return {'error': 'No non-null data points'}
+        std = math.sqrt(self.var) if self.n > 1 else float('nan')
+        q1, median, q3 = (self.digest.quantile(q) for q in (0.25, 0.5, 0.75))
+        return {
+            'mean': self.mean,
+            'median': median,
+            'std': std,
+            'var': self.var,
+            'min': self.min,
+            'max': self.max,
+            '25%': q1,
+            '50%': median,
+            '75%': q3,
+            'iqr': q3 - q1,
+            'range': self.max - self.min,
+            'coef_variation': std / self.mean if self.mean != 0 else float('inf'),
+            'data_points': self.n,
+            'missing': self.nan,
+            'missing_pct': self.nan / self.rows * 100 if self.rows else 0.0
+        }
+
+    def distribution_analysis(self):
+        """Column entry in the format of ``basic_stats.distribution_analysis``.
+
+        The normality test is Jarque-Bera, which only needs the moments.
+        """
+        if self.n < 8:
+            return {'error': 'Insufficient data points for distribution analysis',
+                    'normality_test': None, 'is_normal': 'Unknown'}
+        skewness = self.skewness
+        kurtosis = self.kurtosis
+        jb_statistic = self.n / 6 * (skewness ** 2 + kurtosis ** 2 / 4)
+        p_value = float(scipy_stats.chi2.sf(jb_statistic, 2))
+        # Same rule as basic_stats.distribution_analysis
+        is_normal = "Yes" if (p_value > 0.05 and abs(skewness) < 0.5 and abs(kurtosis - 3) < 1) else "No"
+        return {
+            'skewness': skewness,
+            'kurtosis': kurtosis,
+            'jarque_bera_pvalue': p_value,
+            'normality_test': (jb_statistic, p_value),
+            'is_normal': is_normal
+        }
+
+    def outlier_analysis(self):
+        """Column entry in the format of ``basic_stats.outlier_analysis``.
+
+        Outlier counts are estimated from the t-digest; indices and values of
+        individual outliers are not available in streaming mode.
+        """
+        if self.n < 3:
+            return {'error': 'Insufficient data points for outlier analysis',
+                    'iqr_method': {'lower_bound': float('nan'), 'upper_bound': float('nan'),
+                                   'outliers_count': 0, 'outlier_percentage': 0.0},
+                    'z_score_method': {'threshold': 3, 'outliers_count': 0, 'outlier_percentage': 0.0}}
+        q1 = self.digest.quantile(0.25)
+        q3 = self.digest.quantile(0.75)
+        lower_bound = q1 - 1.5 * (q3 - q1)
+        upper_bound = q3 + 1.5 * (q3 - q1)
+        iqr_count = self._count_outside(lower_bound, upper_bound)
+        std = math.sqrt(self.var)
+        z_count = self._count_outside(self.mean - 3 * std, self.mean + 3 * std) if std > 0 else 0
+        return {
+            'iqr_method': {
+                'lower_bound': lower_bound,
+                'upper_bound': upper_bound,
+                'outliers_count': iqr_count,
+                'outlier_percentage': iqr_count / self.n * 100
+            },
+            'z_score_method': {
+                'threshold': 3,
+                'outliers_count': z_count,
+                'outlier_percentage': z_count / self.n * 100
+            }
+        }
+
+    def _count_outside(self, lower, upper):
+        below, above = self.digest.cdf(np.array([lower, upper]))
+        return int(round((below + 1.0 - above) * self.n))
+
+
+class TimestampAccumulator:
+    """Mergeable tallies and delta histogram of a timestamp column (int64 ns)."""
+
+    kind = 'timestamp'
+
+    def __init__(self):
+        self.rows = 0
+        self.nan = 0
+        self.negative = 0
+        self.out_of_order = 0
+        self.min = None
+        self.max = None
+        self.last = None
+        # Exact delta (ns) -> count; folded into log2 buckets when it grows too large
+        self.deltas = {}
+        self.deltas_bucketed = False
+        # Min-heap of (delta, from, to) for the largest deltas
+        self.largest = []
+
+    def update(self, values, missing):
+        """Add a batch of int64 nanosecond timestamps; ``missing`` marks NaT."""
+        self.rows += len(values)
+        self.nan += int(missing.sum())
+        values = values[~missing]
+        if len(values) == 0:
+            return
+        self.negative += int((values < 0).sum())
+        self.min = int(values.min()) if self.min is None else min(self.min, int(values.min()))
+        self.max = int(values.max()) if self.max is None else max(self.max, int(values.max()))
+
+        if self.last is not None:
+            values_with_prev = np.concatenate(([self.last], values))
+        else:
+            values_with_prev = values
+        self.last = int(values[-1])
+        deltas = np.diff(values_with_prev)
+        self.out_of_order += int((deltas < 0).sum())
+        positive = deltas > 0
+        self._add_deltas(*np.unique(deltas[positive], return_counts=True))
+
+        # Largest deltas of this batch, with the timestamps around them
+        if positive.any():
+            top = np.argsort(deltas)[-MAX_REPORTED_GAPS:]
+            for pos in top[deltas[top] > 0]:
+                self._push_gap((int(deltas[pos]), int(values_with_prev[pos]), int(values_with_prev[pos + 1])))
+
+    def merge(self, other):
+        """Merge the accumulator of another file; deltas across files are not bridged."""
+        self.rows += other.rows
+        self.nan += other.nan
+        self.negative += other.negative
+        self.out_of_order += other.out_of_order
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        if other.deltas:
+            self._add_deltas(np.fromiter(other.deltas.keys(), dtype=np.int64),
+                             np.fromiter(other.deltas.values(), dtype=np.int64))
+        for gap in other.largest:
+            self._push_gap(gap)
+
+    def _add_deltas(self, deltas, counts):
+        if self.deltas_bucketed:
+            deltas = self._bucket(deltas)
+        for delta, count in zip(deltas.tolist(), counts.tolist()):
+            self.deltas[delta] = self.deltas.get(delta, 0) + count
+        if not self.deltas_bucketed and len(self.deltas) > MAX_DISTINCT_DELTAS:
+            keys = np.fromiter(self.deltas.keys(), dtype=np.int64)
+            counts = np.fromiter(self.deltas.values(), dtype=np.int64)
+            self.deltas = {}
+            self.deltas_bucketed = True
+            self._add_deltas(keys, counts)
+
+    @staticmethod
+    def _bucket(deltas):
+        # Lower power of two of every delta
+        return np.left_shift(1, np.floor(np.log2(deltas)).astype(np.int64))
+
+    def _push_gap(self, gap):
+        if len(self.largest) < MAX_REPORTED_GAPS:
+            heapq.heappush(self.largest, gap)
+        elif gap > self.largest[0]:
+            heapq.heapreplace(self.largest, gap)
+
+    def median_delta(self):
+        """Weighted median of the positive deltas in ns, None without deltas."""
+        if not self.deltas:
+            return None
+        keys = np.array(sorted(self.deltas))
+        counts = np.array([self.deltas[k] for k in keys])
+        cumulative = np.cumsum(counts)
+        return int(keys[np.searchsorted(cumulative, cumulative[-1] / 2)])
+
+    def gap_count(self, expected):
+        """Number of deltas larger than ``2 * expected`` ns."""
+        return int(sum(count for delta, count in self.deltas.items() if delta > 2 * expected))
+
+    def largest_gaps(self, expected):
+        """Largest recorded gaps over ``2 * expected`` ns as (delta, from, to), largest first."""
+        return sorted((gap for gap in self.largest if gap[0] > 2 * expected), reverse=True)
+
+
+class OtherAccumulator:
+    """Row and missing counts of a non-numeric column."""
+
+    kind = 'other'
+
+    def __init__(self):
+        self.rows = 0
+        self.nan = 0
+
+    def update(self, missing_count, rows):
+        self.rows += rows
+        self.nan += missing_count
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.nan += other.nan
+
+
+def _new_accumulator(arrow_type):
+    if pa.types.is_timestamp(arrow_type) or pa.types.is_date64(arrow_type):
+        return TimestampAccumulator()
+    if pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type) or pa.types.is_boolean(arrow_type):
+        return NumericAccumulator()
+    return OtherAccumulator()
+
+
+class FileProfile:
+    """Column accumulators of one file (or of several merged files)."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.rows = 0
+        self.batches = 0
+        self.columns = {}
+
+    def update(self, batch):
+        """Add a pyarrow RecordBatch."""
+        self.rows += batch.num_rows
+        self.batches += 1
+        for name, array in zip(batch.schema.names, batch.columns):
+            if name == '__index_level_0__':
+                name = 'index'
+            acc = self.columns.get(name)
+            if acc is None:
+                acc = self.columns[name] = _new_accumulator(array.type)
+            if acc.kind == 'numeric':
+                values = array.cast(pa.float64()).to_numpy(zero_copy_only=False)
+                acc.update(values)
+            elif acc.kind == 'timestamp':
+                missing = pc.is_null(array).to_numpy(zero_copy_only=False)
+                values = array.cast(pa.int64()).fill_null(0).to_numpy(zero_copy_only=False)
+                if pa.types.is_date64(array.type):
+                    values = values * 1_000_000  # ms -> ns
+                elif array.type.unit != 'ns':
+                    values = values * {'s': 1_000_000_000, 'ms': 1_000_000, 'us': 1_000}[array.type.unit]
+                acc.update(values, missing)
+            else:
+                acc.update(array.null_count, len(array))
+
+    def merge(self, other):
+        """Merge another profile column by column (columns matched by name)."""
+        self.rows += other.rows
+        self.batches += other.batches
+        for name, other_acc in other.columns.items():
+            acc = self.columns.get(name)
+            if acc is None:
+                acc = self.columns[name] = type(other_acc)()
+            if acc.kind == other_acc.kind:
+                acc.merge(other_acc)
+
+    def _numeric(self):
+        return {name: acc for name, acc in self.columns.items() if acc.kind == 'numeric'}
+
+    def basic_stats(self):
+        """Basic statistics in the format of ``basic_stats.compute_basic_stats``.
+
+        Distinct counts (``unique``, ``top``, ``freq``) need the whole column and are left out.
+        """
+        keys = ('mean', 'median', 'std', 'min', 'max', '25%', '50%', '75%')
+        result = {}
+        for name, acc in self.columns.items():
+            if acc.kind == 'numeric':
+                stats = acc.descriptive_stats()
+                result[name] = {key: stats.get(key, float('nan')) for key in keys}
+                result[name]['missing'] = int(acc.nan)
+            else:
+                result[name] = {'missing': int(acc.nan)}
+        return result
+
+    def descriptive_stats(self):
+        """Descriptive statistics in the format of ``basic_stats.descriptive_stats``."""
+        return {name: acc.descriptive_stats() for name, acc in self._numeric().items()}
+
+    def distribution_analysis(self):
+        """Distribution statistics in the format of ``basic_stats.distribution_analysis``."""
+        return {name: acc.distribution_analysis() for name, acc in self._numeric().items()}
+
+    def outlier_analysis(self):
+        """Outlier statistics in the format of ``basic_stats.outlier_analysis``."""
+        return {name: acc.outlier_analysis() for name, acc in self._numeric().items()}
+
+    def datetime_column(self):
+        """Name of the first timestamp column, None if there is none."""
+        for name, acc in self.columns.items():
+            if acc.kind == 'timestamp':
+                return name
+        return None
+
+
+def profile_parquet_file(file_path, batch_rows=DEFAULT_BATCH_ROWS, columns=None):
+    """
+    Stream a parquet file batch by batch into a FileProfile.
+
+    Args:
+        file_path (str): Path of the parquet file
+        batch_rows (int): Maximum rows per record batch
+        columns (list, optional): Columns to read (all by default)
+
+    Returns:
+        FileProfile: Accumulated column statistics of the file
+    """
+    profile = FileProfile(file_path)
+    parquet_file = pq.ParquetFile(file_path)
+    for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=columns):
+        profile.update(batch)
+    return profile
+
+
+def sample_rows(file_path, n=5):
+    """
+    First and last rows of a parquet file, reading only the row groups that hold them.
+
+    Args:
+        file_path (str): Path of the parquet file
+        n (int): Rows at each end
+
+    Returns:
+        tuple: (head, tail) DataFrames
+    """
+    parquet_file = pq.ParquetFile(file_path)
+    metadata = parquet_file.metadata
+
+    def read(groups):
+        return parquet_file.read_row_groups(sorted(groups), use_pandas_metadata=True).to_pandas()
+
+    head_groups, rows = [], 0
+    for i in range(metadata.num_row_groups):
+        if rows >= n:
+            break
+        head_groups.append(i)
+        rows += metadata.row_group(i).num_rows
+    tail_groups, rows = [], 0
+    for i in reversed(range(metadata.num_row_groups)):
+        if rows >= n:
+            break
+        tail_groups.append(i)
+        rows += metadata.row_group(i).num_rows
+
+    if not head_groups:
+        empty = parquet_file.schema_arrow.empty_table().to_pandas()
+        return empty, empty
+    return read(head_groups).head(n), read(tail_groups).tail(n)
+
+
+def nan_check(profile, nan_summary, Fore, Style):
+    """
+    Streaming counterpart of ``data_quality.nan_check`` (no example rows).
+    """
+    print(f"  {Fore.MAGENTA}Data Quality Check: Missing values (NaN){Style.RESET_ALL}")
+    for col, acc in profile.columns.items():
+        if acc.nan > 0:
+            percent = 100 * acc.nan / acc.rows
+            print(f"    {Fore.YELLOW}{col}{Style.RESET_ALL}: {acc.nan} missing ({percent:.2f}%)")
+            nan_summary.append({'column': col, 'missing': acc.nan, 'percent': percent})
+
+
+def gap_check(profile, gap_summary, Fore, Style, file_name=None):
+    """
+    Streaming counterpart of ``data_quality.gap_check``: gaps are deltas larger than
+    twice the median delta of the first timestamp column.
+    """
+    dt_col = profile.datetime_column()
+    if dt_col is None:
+        print(f"  {Fore.MAGENTA}Gap Check: No timestamp column found (columns: {list(profile.columns)}){Style.RESET_ALL}")
+        return
+    acc = profile.columns[dt_col]
+    expected = acc.median_delta()
+    if expected is None:
+        print(f"  {Fore.MAGENTA}Gap Check: Not enough timestamps in '{dt_col}'.{Style.RESET_ALL}")
+        return
+    n_gaps = acc.gap_count(expected)
+    if acc.out_of_order:
+        print(f"  {Fore.YELLOW}Gap Check: '{dt_col}' is not sorted ({acc.out_of_order} decreasing steps), gaps are approximate{Style.RESET_ALL}")
+    if n_gaps == 0:
+        print(f"  {Fore.MAGENTA}Gap Check: No significant gaps found in '{dt_col}'.{Style.RESET_ALL}")
+        return
+    print(f"  {Fore.MAGENTA}Gap Check: Found {n_gaps} gaps in '{dt_col}' (interval > {pd.Timedelta(2 * expected)}){Style.RESET_ALL}")
+    for i, (delta, start, end) in enumerate(acc.largest_gaps(expected)):
+        if i < 5:
+            print(f"    Gap from {pd.Timestamp(start)} to {pd.Timestamp(end)}: {pd.Timedelta(delta)}")
+        gap_summary.append({'file': file_name, 'column': dt_col, 'from': pd.Timestamp(start),
+                            'to': pd.Timestamp(end), 'delta': pd.Timedelta(delta)})
+
+
+def zero_check(profile, zero_summary, Fore, Style, file_name=None):
+    """
+    Streaming counterpart of ``data_quality.zero_check``.
+    """
+    print(f"  {Fore.MAGENTA}Data Quality Check: Zero values (0){Style.RESET_ALL}")
+    for col, acc in profile._numeric().items():
+        if acc.zero > 0:
+            col_lower = col.lower()
+            if any(key in col_lower for key in ['volume', 'qty', 'amount']):
+                note = f"{Fore.GREEN}OK (likely normal){Style.RESET_ALL}"
+                anomaly = False
+            elif any(key in col_lower for key in ['price', 'close', 'open', 'high', 'low']):
+                note = f"{Fore.RED}ANOMALY? (check!){Style.RESET_ALL}"
+                anomaly = True
+            else:
+                note = f"{Fore.YELLOW}Check meaning{Style.RESET_ALL}"
+                anomaly = None
+            print(f"    {Fore.YELLOW}{col}{Style.RESET_ALL}: {acc.zero} zeros. {note}")
+            zero_summary.append({'column': col, 'zeros': acc.zero, 'anomaly': anomaly, 'df': None, 'file': file_name})
+
+
+def negative_check(profile, negative_summary, Fore, Style, file_name=None):
+    """
+    Streaming counterpart of ``data_quality.negative_check``.
+    """
+    print(f"  {Fore.MAGENTA}Data Quality Check: Negative values{Style.RESET_ALL}")
+    for col, acc in profile.columns.items():
+        is_datetime = acc.kind == 'timestamp'
+        if not is_datetime and not (acc.kind == 'numeric' and any(key in col.lower() for key in OHLCV_KEYS)):
+            continue
+        if acc.negative > 0:
+            kind = 'negative datetime values' if is_datetime else 'negative values'
+            print(f"    {Fore.YELLOW}{col}{Style.RESET_ALL}: {acc.negative} {kind}. {Fore.RED}ANOMALY!{Style.RESET_ALL}")
+            entry = {'column': col, 'negatives': acc.negative, 'df': None, 'file': file_name}
+            if is_datetime:
+                entry['is_datetime'] = True
+            negative_summary.append(entry)
+
+
+def inf_check(profile, inf_summary, Fore, Style, file_name=None):
+    """
+    Streaming counterpart of ``data_quality.inf_check``.
+    """
+    print(f"  {Fore.MAGENTA}Data Quality Check: Inf values (+inf, -inf){Style.RESET_ALL}")
+    for col, acc in profile._numeric().items():
+        if acc.posinf > 0 or acc.neginf > 0:
+            print(f"    {Fore.YELLOW}{col}{Style.RESET_ALL}: +inf: {acc.posinf}, -inf: {acc.neginf}")
+            inf_summary.append({'column': col, 'posinf': acc.posinf, 'neginf': acc.neginf, 'df': None, 'file': file_name})
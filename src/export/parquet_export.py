@@ -12,6 +12,49 @@ from pathlib import Path
 from src.common import logger
 
 
+def get_indicator_parquet_path(data_info, selected_rule, args) -> Path:
+    """
+    Returns the parquet file an indicator result is exported to.
+
+    The name is the original data file (or ticker/interval) with the rule name
+    as a postfix, inside data/indicators/parquet.
+
+    Args:
+        data_info (dict): Information about the data source
+        selected_rule: The trading rule used for the calculation
+        args (argparse.Namespace): Command-line arguments
+
+    Returns:
+        Path: Output parquet file path
+    """
+    # Determine base filename from parquet_cache_file or create one based on ticker/interval
+    original_file = data_info.get("parquet_cache_file")
+
+    if not original_file:
+        # Create a filename based on ticker and interval if no cache file exists
+        if getattr(args, 'mode', None) == 'demo':
+            filename = "DEMO"
+        else:
+            ticker = args.ticker if hasattr(args, 'ticker') and args.ticker else "UNKNOWN"
+            interval = args.interval if hasattr(args, 'interval') and args.interval else "D1"
+            filename = f"{ticker}_{interval}"
+    else:
+        original_file = Path(original_file)
+        filename = original_file.stem
+
+    output_dir = Path("data/indicators/parquet")
+
+    # Create the new filename with the rule postfix
+    # Handle the case when selected_rule is an Enum or an object with a name attribute
+    if hasattr(selected_rule, 'name'):
+        rule_shortname = selected_rule.name.replace("_", "")
+    else:
+        rule_shortname = str(selected_rule).replace("_", "")
+
+    output_file = output_dir / f"{filename}_{rule_shortname}.parquet"
+    return output_file
+
+
 def export_indicator_to_parquet(result_df, data_info, selected_rule, args):
     """
     Exports the calculated indicator data to a parquet file.
@@ -52,33 +95,9 @@ def export_indicator_to_parquet(result_df, data_info, selected_rule, args):
         logger.print_error(export_info["error_message"])
         return export_info
 
-    # Determine base filename from parquet_cache_file or create one based on ticker/interval
-    original_file = data_info.get("parquet_cache_file")
-
-    if not original_file:
-        # Create a filename based on ticker and interval if no cache file exists
-        if getattr(args, 'mode', None) == 'demo':
-            filename = "DEMO"
-        else:
-            ticker = args.ticker if hasattr(args, 'ticker') and args.ticker else "UNKNOWN"
-            interval = args.interval if hasattr(args, 'interval') and args.interval else "D1"
-            filename = f"{ticker}_{interval}"
-    else:
-        original_file = Path(original_file)
-        filename = original_file.stem
-
     # Create output directory for indicators
-    output_dir = Path("data/indicators/parquet")
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create the new filename with the rule postfix
-    # Handle the case when selected_rule is an Enum or an object with a name attribute
-    if hasattr(selected_rule, 'name'):
-        rule_shortname = selected_rule.name.replace("_", "")
-    else:
-        rule_shortname = str(selected_rule).replace("_", "")
-
-    output_file = output_dir / f"{filename}_{rule_shortname}.parquet"
+    output_file = get_indicator_parquet_path(data_info, selected_rule, args)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
     logger.print_debug(f"Output file will be: {output_file}")
 
     try:
@@ -263,6 +263,7 @@ stat_analysis.py and time_analysis.py from data/fixed/ folder. You can run clear
             return {
                 'mode': 'batch',
                 'directory': 'data/fixed/',
+                'garch_fit_cache': True,  # reruns over unchanged files reuse the GARCH fits
                 'valid': True
             }
         elif args.batch_all:
@@ -5,14 +5,17 @@ This module contains core financial analysis components including:
 - price_validation: Price validation logic
 - volume_analysis: Volume analysis
 - garch_models: GARCH modeling
+- garch_scheduler: Concurrent, warm-started and cached GARCH fitting
 """
 
 from .price_validation import PriceValidator
 from .volume_analysis import VolumeAnalyzer
 from .garch_models import GARCHModeler
+from .garch_scheduler import GARCHFitScheduler
 
 __all__ = [
     'PriceValidator',
     'VolumeAnalyzer', 
-    'GARCHModeler'
+    'GARCHModeler',
+    'GARCHFitScheduler'
 ]
@@ -9,10 +9,12 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, List, Tuple, Optional
 import logging
+import warnings
 from scipy import stats
 
 try:
     from arch import arch_model
+    from arch.utility.exceptions import StartingValueWarning
     ARCH_AVAILABLE = True
 except ImportError:
     ARCH_AVAILABLE = False
@@ -30,7 +32,8 @@ class GARCHModeler:
     def fit_garch_model(self, returns: pd.Series, 
                        model_type: str = 'GARCH',
                        p: int = 1, q: int = 1,
-                       vol: str = 'GARCH') -> Dict[str, Any]:
+                       vol: str = 'GARCH',
+                       starting_values: Optional[List[float]] = None) -> Dict[str, Any]:
         """
         Fit a GARCH model to returns data.
         
@@ -40,6 +43,9 @@ class GARCHModeler:
             p: Number of autoregressive terms
             q: Number of moving average terms
             vol: Volatility model type
+            starting_values: Parameter vector of a previous fit of the same model
+                (``parameter_vector`` of its results) to warm-start the optimizer;
+                invalid or non-converging warm starts fall back to a cold fit
             
         Returns:
             Dictionary with GARCH model results
@@ -81,15 +87,19 @@ class GARCHModeler:
                 return results
             
             # Fit the model
-            fitted_model = model.fit(disp='off')
+            fitted_model = self._fit_with_warm_start(model, starting_values)
+            results['warm_start'] = fitted_model is not None
+            if fitted_model is None:
+                fitted_model = model.fit(disp='off')
             
             # Extract parameters
             results['parameters'] = {
                 'omega': float(fitted_model.params['omega']),
-                'alpha': [float(fitted_model.params[f'alpha[{i}]']) for i in range(p)],
-                'beta': [float(fitted_model.params[f'beta[{i}]']) for i in range(q)],
+                'alpha': [float(fitted_model.params[f'alpha[{i + 1}]']) for i in range(p)],
+                'beta': [float(fitted_model.params[f'beta[{i + 1}]']) for i in range(q)],
                 'gamma': float(fitted_model.params.get('gamma[1]', 0.0)) if model_type == 'GJR-GARCH' else None
             }
+            results['parameter_vector'] = [float(value) for value in fitted_model.params]
             
             # Fit statistics
             results['fit_statistics'] = {
@@ -97,7 +107,7 @@ class GARCHModeler:
                 'aic': float(fitted_model.aic),
                 'bic': float(fitted_model.bic),
                 'convergence': fitted_model.convergence_flag,
-                'iterations': fitted_model.num_iterations
+                'iterations': int(fitted_model.optimization_result.nit)
             }
             
             # Volatility forecast
@@ -122,6 +132,19 @@ class GARCHModeler:
         
         return results
     
+    def _fit_with_warm_start(self, model, starting_values: Optional[List[float]]):
+        """Fit from previous parameters; None if there are none or the warm start fails."""
+        if starting_values is None:
+            return None
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', StartingValueWarning)
+                fitted_model = model.fit(disp='off', starting_values=np.asarray(starting_values, dtype=float))
+        except (StartingValueWarning, ValueError) as e:
+            self.logger.debug(f"GARCH warm start rejected: {str(e)}")
+            return None
+        return fitted_model if fitted_model.convergence_flag == 0 else None
+    
     def analyze_volatility_clustering(self, returns: pd.Series,
                                     window: int = 20) -> Dict[str, Any]:
         """
@@ -0,0 +1,183 @@
+"""
+GARCH Fit Scheduler Module
+
+This module schedules GARCH family fits for volatility analysis:
+- fits of several columns and model types run concurrently in a process pool
+- every fit warm-starts from the last parameters fitted for the same source (file),
+  column and model
+- with use_cache, fitted results are cached on disk by series fingerprint and model
+  spec, so batch reruns over unchanged files (finance_analysis.py --batch-fixed) skip
+  refitting; the cache is off by default
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .garch_models import GARCHModeler
+
+# Bump when the cached result format changes
+CACHE_VERSION = 1
+
+# Below this many observations across pending fits, process start-up costs more than it saves
+PARALLEL_MIN_OBSERVATIONS = 20_000
+
+
+def series_fingerprint(returns: pd.Series) -> str:
+    """Hash of the returns values (the only input of a fit besides the model spec)."""
+    values = np.ascontiguousarray(returns.dropna().to_numpy(dtype=np.float64))
+    return hashlib.sha1(values.tobytes()).hexdigest()
+
+
+def model_spec(model_type: str, p: int = 1, q: int = 1, vol: str = 'GARCH') -> str:
+    """Model specification part of the cache key."""
+    return f"{model_type}_p{p}_q{q}_{vol}"
+
+
+def _warm_start_key(source: str, col: str, spec: str) -> str:
+    """Warm starts are only shared by fits of the same source and column."""
+    return f"{source}|{col}|{spec}"
+
+
+def _fit_job(returns: pd.Series, model_type: str, p: int, q: int, vol: str,
+             starting_values: Optional[List[float]]) -> Dict[str, Any]:
+    """Fit one model in a worker process."""
+    return GARCHModeler().fit_garch_model(returns, model_type=model_type, p=p, q=q, vol=vol,
+                                          starting_values=starting_values)
+
+
+class GARCHFitScheduler:
+    """Runs GARCH fits concurrently with warm starts and an on-disk fit cache."""
+
+    def __init__(self, modeler: Optional[GARCHModeler] = None,
+                 cache_dir: Optional[Path] = None,
+                 max_workers: Optional[int] = None,
+                 use_cache: bool = False):
+        """
+        Initialize the fit scheduler.
+
+        Args:
+            modeler: GARCHModeler for fits run in this process
+            cache_dir: Directory of the fit cache. Defaults to data/cache/garch_fits.
+            max_workers: Worker processes for concurrent fits (default: CPU count, 1 disables the pool)
+            use_cache: Read and write the fit cache and warm starts on disk
+        """
+        self.logger = logging.getLogger(__name__)
+        self.modeler = modeler or GARCHModeler()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else Path("data/cache/garch_fits")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_cache = use_cache
+        self.warm_starts_file = self.cache_dir / "warm_starts.json"
+        self.warm_starts: Dict[str, List[float]] = self._load_json(self.warm_starts_file) or {}
+
+    def fit_models(self, returns_by_column: Dict[str, pd.Series], model_types: List[str],
+                   p: int = 1, q: int = 1, vol: str = 'GARCH',
+                   source: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Fit every model type to every returns series.
+
+        Args:
+            returns_by_column: Returns series per column
+            model_types: GARCH model types ('GARCH', 'EGARCH', 'GJR-GARCH')
+            p: Number of autoregressive terms
+            q: Number of moving average terms
+            vol: Volatility model type
+            source: Identity of the series (e.g. file path); fits warm-start only from
+                earlier fits of the same source, none without one
+
+        Returns:
+            Dictionary of fit results per column and model type, in input order;
+            a fit that raised has an ``error`` entry instead
+        """
+        results = {col: {} for col in returns_by_column}
+        pending = []
+
+        for col, returns in returns_by_column.items():
+            fingerprint = series_fingerprint(returns) if self.use_cache else None
+            for model_type in model_types:
+                spec = model_spec(model_type, p, q, vol)
+                cached = self._load_json(self._cache_path(fingerprint, spec)) if self.use_cache else None
+                if cached is not None:
+                    cached['from_cache'] = True
+                    results[col][model_type] = cached
+                else:
+                    pending.append((col, model_type, spec, fingerprint))
+
+        if pending:
+            fitted = self._run_fits(returns_by_column, pending, p, q, vol, source)
+            for (col, model_type, spec, fingerprint), result in zip(pending, fitted):
+                results[col][model_type] = result
+                if result.get('success', False):
+                    if self.use_cache:
+                        self._save_json(self._cache_path(fingerprint, spec), result)
+                    if source is not None:
+                        self.warm_starts[_warm_start_key(source, col, spec)] = result['parameter_vector']
+            if self.use_cache and source is not None:
+                self._save_json(self.warm_starts_file, self.warm_starts)
+
+        return results
+
+    def _run_fits(self, returns_by_column: Dict[str, pd.Series], pending: List[tuple],
+                  p: int, q: int, vol: str, source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Run the pending fits, in a process pool when the work is large enough."""
+        jobs = [(returns_by_column[col], model_type, p, q, vol,
+                 self.warm_starts.get(_warm_start_key(source, col, spec)) if source is not None else None)
+                for col, model_type, spec, _ in pending]
+        observations = sum(len(job[0]) for job in jobs)
+
+        if self.max_workers > 1 and len(jobs) > 1 and observations >= PARALLEL_MIN_OBSERVATIONS:
+            try:
+                with ProcessPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+                    futures = [executor.submit(_fit_job, *job) for job in jobs]
+                    results = []
+                    for future in futures:
+                        error = future.exception()
+                        if isinstance(error, BrokenExecutor):
+                            raise error
+                        results.append({'error': str(error)} if error is not None else future.result())
+                    return results
+            except (OSError, BrokenExecutor) as e:
+                # No usable worker processes (e.g. restricted sandbox): fit in this process
+                self.logger.warning(f"GARCH process pool unavailable, fitting sequentially: {str(e)}")
+
+        results = []
+        for returns, model_type, p, q, vol, starting_values in jobs:
+            try:
+                results.append(self.modeler.fit_garch_model(returns, model_type=model_type, p=p, q=q, vol=vol,
+                                                            starting_values=starting_values))
+            except Exception as e:
+                results.append({'error': str(e)})
+        return results
+
+    def _cache_path(self, fingerprint: str, spec: str) -> Path:
+        """Cache file of one fit."""
+        return self.cache_dir / f"v{CACHE_VERSION}_{fingerprint}_{spec}.json"
+
+    def _load_json(self, path: Path) -> Optional[Any]:
+        """Load a cache file, None if missing or unreadable."""
+        if not self.use_cache or not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.debug(f"Failed to load GARCH cache file {path}: {str(e)}")
+            return None
+
+    def _save_json(self, path: Path, data: Any) -> None:
+        """Write a cache file atomically, so concurrent batch runs never read partial files."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.debug(f"Failed to save GARCH cache file {path}: {str(e)}")
@@ -10,6 +10,7 @@ import numpy as np
 from typing import Dict, Any, List, Optional, Tuple
 import logging
 from .color_utils import ColorUtils
+from .drawdown_episodes import DrawdownEpisodes, compute_drawdown_episodes
 
 
 class DrawdownAnalysis:
@@ -18,6 +19,8 @@ class DrawdownAnalysis:
     def __init__(self):
         """Initialize the drawdown analyzer."""
         self.logger = logging.getLogger(__name__)
+        # Drawdown episodes per cumulative column, shared by all metrics of one analysis
+        self._episodes: Dict[str, DrawdownEpisodes] = {}
     
     def analyze_drawdowns(self, data: pd.DataFrame, 
                          numeric_columns: List[str]) -> Dict[str, Any]:
@@ -56,6 +59,12 @@ class DrawdownAnalysis:
                 results['error'] = "Unable to calculate cumulative returns for drawdown analysis"
                 return results
             
+            # Derive drawdown episodes once per column
+            self._episodes = {
+                column: compute_drawdown_episodes(cumulative_returns[column].dropna())
+                for column in cumulative_returns.columns
+            }
+            
             # Maximum drawdown analysis
             results['maximum_drawdown'] = self._analyze_maximum_drawdown(
                 cumulative_returns, price_columns
@@ -94,9 +103,26 @@ class DrawdownAnalysis:
         except Exception as e:
             self.logger.error(f"Error in drawdown analysis: {str(e)}")
             results['error'] = str(e)
+        finally:
+            self._episodes = {}
         
         return results
     
+    def _drawdown_episodes(self, cumulative_series: pd.Series) -> DrawdownEpisodes:
+        """
+        Drawdown episodes of a cumulative series, reused within one analysis.
+        
+        Args:
+            cumulative_series: Cumulative returns of one price column
+            
+        Returns:
+            DrawdownEpisodes for the series
+        """
+        episodes = self._episodes.get(cumulative_series.name)
+        if episodes is not None and episodes.drawdown.index.equals(cumulative_series.index):
+            return episodes
+        return compute_drawdown_episodes(cumulative_series)
+    
     def _identify_price_columns(self, data: pd.DataFrame, 
                                numeric_columns: List[str]) -> List[str]:
         """
@@ -183,11 +209,9 @@ class DrawdownAnalysis:
                     if len(cumulative_series) == 0:
                         continue
                     
-                    # Calculate running maximum
-                    running_max = cumulative_series.expanding().max()
-                    
                     # Calculate drawdown
-                    drawdown = (cumulative_series - running_max) / running_max
+                    episodes = self._drawdown_episodes(cumulative_series)
+                    drawdown = episodes.drawdown
                     
                     # Maximum drawdown
                     max_drawdown = drawdown.min()
@@ -221,7 +245,7 @@ class DrawdownAnalysis:
                     results['current_drawdown'][col] = {
                         'is_in_drawdown': current_drawdown < 0,
                         'drawdown_magnitude': abs(current_drawdown),
-                        'time_in_drawdown': self._calculate_time_in_drawdown(drawdown),
+                        'time_in_drawdown': self._calculate_time_in_drawdown(episodes),
                         'recovery_needed': abs(current_drawdown) if current_drawdown < 0 else 0.0
                     }
         
@@ -385,8 +409,7 @@ class DrawdownAnalysis:
                         continue
                     
                     # Calculate drawdown series
-                    running_max = cumulative_series.expanding().max()
-                    drawdown = (cumulative_series - running_max) / running_max
+                    drawdown = self._drawdown_episodes(cumulative_series).drawdown
                     
                     # Overall statistics
                     overall_stats = {
@@ -468,8 +491,7 @@ class DrawdownAnalysis:
                         continue
                     
                     # Calculate drawdown
-                    running_max = cumulative_series.expanding().max()
-                    drawdown = (cumulative_series - running_max) / running_max
+                    drawdown = self._drawdown_episodes(cumulative_series).drawdown
                     
                     # Risk metrics
                     risk_metrics = {
@@ -546,47 +568,7 @@ class DrawdownAnalysis:
     def _identify_drawdown_periods(self, cumulative_series: pd.Series) -> List[Dict[str, Any]]:
         """Identify individual drawdown periods."""
         try:
-            # Calculate running maximum
-            running_max = cumulative_series.expanding().max()
-            drawdown = (cumulative_series - running_max) / running_max
-            
-            # Find drawdown periods
-            drawdown_periods = []
-            in_drawdown = False
-            start_date = None
-            
-            for date, dd in drawdown.items():
-                if dd < 0 and not in_drawdown:
-                    # Start of drawdown
-                    in_drawdown = True
-                    start_date = date
-                elif dd >= 0 and in_drawdown:
-                    # End of drawdown
-                    in_drawdown = False
-                    if start_date is not None:
-                        duration = (date - start_date).days if hasattr(date, 'days') else 1
-                        max_dd = drawdown.loc[start_date:date].min()
-                        drawdown_periods.append({
-                            'start_date': str(start_date),
-                            'end_date': str(date),
-                            'duration': duration,
-                            'maximum_drawdown': float(max_dd),
-                            'recovery_time': duration
-                        })
-            
-            # Handle case where series ends in drawdown
-            if in_drawdown and start_date is not None:
-                duration = (cumulative_series.index[-1] - start_date).days if hasattr(cumulative_series.index[-1], 'days') else 1
-                max_dd = drawdown.loc[start_date:].min()
-                drawdown_periods.append({
-                    'start_date': str(start_date),
-                    'end_date': 'ongoing',
-                    'duration': duration,
-                    'maximum_drawdown': float(max_dd),
-                    'recovery_time': 'ongoing'
-                })
-            
-            return drawdown_periods
+            return self._drawdown_episodes(cumulative_series).to_periods()
         
         except Exception as e:
             self.logger.error(f"Error identifying drawdown periods: {str(e)}")
@@ -621,19 +603,11 @@ class DrawdownAnalysis:
         else:
             return 'minimal'
     
-    def _calculate_time_in_drawdown(self, drawdown: pd.Series) -> int:
+    def _calculate_time_in_drawdown(self, episodes: DrawdownEpisodes) -> int:
         """Calculate current time in drawdown."""
         try:
-            # Find the last time the series was at a new high
-            running_max = drawdown.expanding().max()
-            last_high = drawdown[running_max == 0].index[-1] if (running_max == 0).any() else drawdown.index[0]
-            
-            # Calculate time since last high
-            current_time = drawdown.index[-1]
-            if hasattr(current_time, 'days'):
-                return (current_time - last_high).days
-            else:
-                return len(drawdown.loc[last_high:]) - 1
+            # Time since the last bar at a new high
+            return episodes.time_since_high()
         except:
             return 0
     
@@ -663,26 +637,11 @@ class DrawdownAnalysis:
     def _calculate_recovery_metrics(self, cumulative_series: pd.Series) -> Dict[str, Any]:
         """Calculate recovery metrics."""
         try:
-            # Calculate drawdown
-            running_max = cumulative_series.expanding().max()
-            drawdown = (cumulative_series - running_max) / running_max
-            
-            # Find recovery periods
-            recovery_periods = []
-            in_drawdown = False
-            drawdown_start = None
-            
-            for date, dd in drawdown.items():
-                if dd < 0 and not in_drawdown:
-                    in_drawdown = True
-                    drawdown_start = date
-                elif dd >= 0 and in_drawdown:
-                    in_drawdown = False
-                    if drawdown_start is not None:
-                        recovery_time = (date - drawdown_start).days if hasattr(date, 'days') else 1
-                        recovery_periods.append(recovery_time)
-            
-            if not recovery_periods:
+            # Recovered drawdown episodes
+            episodes = self._drawdown_episodes(cumulative_series)
+            recovery_periods = episodes.recovery_times
+            
+            if len(recovery_periods) == 0:
                 return {
                     'fast_recoveries': 0,
                     'slow_recoveries': 0,
@@ -691,12 +650,12 @@ class DrawdownAnalysis:
                 }
             
             # Calculate metrics
-            fast_recoveries = len([r for r in recovery_periods if r <= 5])
-            slow_recoveries = len([r for r in recovery_periods if r > 20])
+            fast_recoveries = int((recovery_periods <= 5).sum())
+            slow_recoveries = int((recovery_periods > 20).sum())
             avg_recovery = np.mean(recovery_periods)
             
             # Recovery success rate (recoveries vs ongoing drawdowns)
-            total_drawdowns = len(recovery_periods) + (1 if in_drawdown else 0)
+            total_drawdowns = len(recovery_periods) + (1 if episodes.is_ongoing else 0)
             success_rate = len(recovery_periods) / total_drawdowns if total_drawdowns > 0 else 0
             
             return {
@@ -717,8 +676,7 @@ class DrawdownAnalysis:
         """Assess current recovery status."""
         try:
             # Calculate current drawdown
-            running_max = cumulative_series.expanding().max()
-            current_dd = (cumulative_series.iloc[-1] - running_max.iloc[-1]) / running_max.iloc[-1]
+            current_dd = self._drawdown_episodes(cumulative_series).drawdown.iloc[-1]
             
             if current_dd >= 0:
                 return 'at_high'
@@ -879,8 +837,7 @@ class DrawdownAnalysis:
                 return 'insufficient_data'
             
             # Calculate rolling maximum drawdown
-            running_max = cumulative_series.expanding().max()
-            drawdown = (cumulative_series - running_max) / running_max
+            drawdown = self._drawdown_episodes(cumulative_series).drawdown
             
             # Analyze trend in drawdown severity
             recent_dd = drawdown.tail(20)
@@ -905,8 +862,7 @@ class DrawdownAnalysis:
                 return 'insufficient_data'
             
             # Calculate drawdown volatility
-            running_max = cumulative_series.expanding().max()
-            drawdown = (cumulative_series - running_max) / running_max
+            drawdown = self._drawdown_episodes(cumulative_series).drawdown
             
             dd_volatility = drawdown.std()
             
@@ -926,8 +882,7 @@ class DrawdownAnalysis:
                 return 'insufficient_data'
             
             # Calculate rolling maximum
-            running_max = cumulative_series.expanding().max()
-            drawdown = (cumulative_series - running_max) / running_max
+            drawdown = self._drawdown_episodes(cumulative_series).drawdown
             
             # Split into early and recent periods
             mid_point = len(drawdown) // 2
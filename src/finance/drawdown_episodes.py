@@ -0,0 +1,119 @@
+"""
+Drawdown Episodes Module
+
+This module derives the drawdown series and its episodes (underwater runs) of a
+cumulative return series in one vectorized pass: run-length encoding of
+``drawdown < 0`` gives the episode boundaries and ``np.minimum.reduceat`` their
+depth. DrawdownAnalysis reuses one DrawdownEpisodes per column for all metrics.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+NS_PER_DAY = 86_400_000_000_000
+
+
+@dataclass
+class DrawdownEpisodes:
+    """
+    Drawdown series and underwater episodes of a cumulative return series.
+
+    ``starts`` holds the position of the first bar below the running maximum and
+    ``ends`` the position of the recovery bar (the first bar back at the
+    maximum), or -1 for an episode still ongoing at the end of the series.
+    ``durations`` are calendar days for a DatetimeIndex and bars otherwise,
+    measured up to the recovery bar or the last bar.
+    """
+    drawdown: pd.Series
+    starts: np.ndarray
+    ends: np.ndarray
+    depths: np.ndarray
+    durations: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def recovered(self) -> np.ndarray:
+        """Mask of the episodes that recovered."""
+        return self.ends >= 0
+
+    @property
+    def is_ongoing(self) -> bool:
+        """True if the series ends below its running maximum."""
+        return len(self.ends) > 0 and self.ends[-1] < 0
+
+    @property
+    def recovery_times(self) -> np.ndarray:
+        """Durations of the recovered episodes."""
+        return self.durations[self.recovered]
+
+    def time_since_high(self) -> int:
+        """Days (or bars) since the last bar at the running maximum."""
+        if not self.is_ongoing:
+            return 0
+        return int(_span(self.drawdown.index, np.array([self.starts[-1] - 1]),
+                         np.array([len(self.drawdown) - 1]))[0])
+
+    def to_periods(self) -> List[Dict[str, Any]]:
+        """Episodes as drawdown period dictionaries."""
+        index = self.drawdown.index
+        periods = []
+        for start, end, depth, duration in zip(self.starts, self.ends, self.depths, self.durations):
+            recovered = end >= 0
+            periods.append({
+                'start_date': str(index[start]),
+                'end_date': str(index[end]) if recovered else 'ongoing',
+                'duration': int(duration),
+                'maximum_drawdown': float(depth),
+                'recovery_time': int(duration) if recovered else 'ongoing'
+            })
+        return periods
+
+
+def _span(index: pd.Index, first: np.ndarray, last: np.ndarray) -> np.ndarray:
+    # Whole days between positions for datetime indexes, bar counts otherwise
+    if isinstance(index, pd.DatetimeIndex) and len(first):
+        ns = index.asi8
+        return (ns[last] - ns[first]) // (NS_PER_DAY // _ns_per_unit(index))
+    return last - first
+
+
+def _ns_per_unit(index: pd.DatetimeIndex) -> int:
+    # asi8 is in the index resolution (pandas >= 2 supports s/ms/us/ns)
+    return {'s': 1_000_000_000, 'ms': 1_000_000, 'us': 1_000}.get(getattr(index, 'unit', 'ns'), 1)
+
+
+def compute_drawdown_episodes(cumulative_series: pd.Series) -> DrawdownEpisodes:
+    """
+    Drawdown series and episodes of a cumulative return series.
+
+    Args:
+        cumulative_series: Cumulative returns (or prices) without NaN
+
+    Returns:
+        DrawdownEpisodes for the series
+    """
+    values = cumulative_series.to_numpy(dtype=float)
+    running_max = np.maximum.accumulate(values) if len(values) else values
+    drawdown_values = (values - running_max) / running_max
+    drawdown = pd.Series(drawdown_values, index=cumulative_series.index, name=cumulative_series.name)
+
+    # Run-length encoding of the underwater bars
+    underwater = np.concatenate(([False], drawdown_values < 0, [False])).astype(np.int8)
+    transitions = np.diff(underwater)
+    starts = np.flatnonzero(transitions == 1)
+    ends = np.flatnonzero(transitions == -1)  # first bar back at the maximum
+    if len(starts) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return DrawdownEpisodes(drawdown, empty, empty, np.empty(0), empty)
+
+    # Bars between episodes are >= 0, so each reduceat segment's minimum is the episode depth
+    depths = np.minimum.reduceat(drawdown_values, starts)
+    last_bar = np.minimum(ends, len(values) - 1)
+    durations = _span(cumulative_series.index, starts, last_bar)
+    ends = np.where(ends < len(values), ends, -1)
+    return DrawdownEpisodes(drawdown, starts, ends, depths, durations)
@@ -10,25 +10,36 @@ import numpy as np
 from typing import Dict, Any, List, Optional
 import logging
 from .core.garch_models import GARCHModeler
+from .core.garch_scheduler import GARCHFitScheduler
 from .color_utils import ColorUtils
 
 
 class VolatilityAnalysis:
     """Comprehensive volatility analysis for financial data."""
     
-    def __init__(self):
-        """Initialize the volatility analyzer."""
+    def __init__(self, fit_scheduler: Optional[GARCHFitScheduler] = None,
+                 use_fit_cache: bool = False):
+        """
+        Initialize the volatility analyzer.
+        
+        Args:
+            fit_scheduler: Scheduler running the GARCH fits (concurrent and warm-started)
+            use_fit_cache: Cache the fits of the default scheduler in data/cache/garch_fits
+        """
         self.logger = logging.getLogger(__name__)
         self.garch_modeler = GARCHModeler()
+        self.fit_scheduler = fit_scheduler or GARCHFitScheduler(self.garch_modeler, use_cache=use_fit_cache)
     
     def analyze_volatility(self, data: pd.DataFrame, 
-                         numeric_columns: List[str]) -> Dict[str, Any]:
+                         numeric_columns: List[str],
+                         source: Optional[str] = None) -> Dict[str, Any]:
         """
         Perform comprehensive volatility analysis.
         
         Args:
             data: DataFrame with financial data
             numeric_columns: List of numeric columns to analyze
+            source: Source of the data (e.g. file path), used to warm-start GARCH fits
             
         Returns:
             Dictionary with volatility analysis results
@@ -64,7 +75,7 @@ class VolatilityAnalysis:
             
             # GARCH modeling
             results['garch_models'] = self._analyze_garch_models(
-                returns_data, price_columns
+                returns_data, price_columns, source
             )
             
             # Volatility clustering analysis
@@ -213,13 +224,15 @@ class VolatilityAnalysis:
         return results
     
     def _analyze_garch_models(self, returns_data: pd.DataFrame,
-                            price_columns: List[str]) -> Dict[str, Any]:
+                            price_columns: List[str],
+                            source: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze GARCH models for volatility modeling.
         
         Args:
             returns_data: DataFrame with returns data
             price_columns: List of price columns
+            source: Source of the data, for warm starts
             
         Returns:
             Dictionary with GARCH model analysis
@@ -231,6 +244,7 @@ class VolatilityAnalysis:
         }
         
         try:
+            returns_by_column = {}
             for col in price_columns:
                 returns_col = f'{col}_returns'
                 if returns_col in returns_data.columns:
@@ -239,23 +253,20 @@ class VolatilityAnalysis:
                     if len(col_returns) < 50:
                         continue
                     
-                    col_results = {}
-                    
-                    # Try different GARCH models
-                    model_types = ['GARCH', 'EGARCH', 'GJR-GARCH']
-                    
-                    for model_type in model_types:
-                        try:
-                            garch_result = self.garch_modeler.fit_garch_model(
-                                col_returns, model_type=model_type
-                            )
-                            
-                            if garch_result.get('success', False):
-                                col_results[model_type] = garch_result
-                        except Exception as e:
-                            col_results[model_type] = {'error': str(e)}
-                    
-                    results['garch_models'][col] = col_results
+                    returns_by_column[col] = col_returns
+            
+            # Try different GARCH models, all columns and models scheduled together
+            model_types = ['GARCH', 'EGARCH', 'GJR-GARCH']
+            fits = self.fit_scheduler.fit_models(returns_by_column, model_types, source=source)
+            
+            for col, col_fits in fits.items():
+                col_results = {}
+                for model_type, garch_result in col_fits.items():
+                    # Unsuccessful fits are skipped, fits that raised keep their error
+                    if garch_result.get('success', False) or 'success' not in garch_result:
+                        col_results[model_type] = garch_result
+                
+                results['garch_models'][col] = col_results
             
             # Model comparison
             results['model_comparison'] = self._compare_garch_models(
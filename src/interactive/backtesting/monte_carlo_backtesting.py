@@ -12,6 +12,67 @@ from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.linear_model import LogisticRegression, LinearRegression
 import warnings
 
+from src.calculation.trading_metrics import MC_BLOCK_BYTES
+
+METRIC_COLUMNS = ["total_return", "volatility", "sharpe_ratio", "max_drawdown"]
+
+# 8-byte arrays held per simulated step: resample indices, returns, growth, running peak, drawdown
+_ARRAYS_PER_STEP = 5
+
+
+def path_metrics(returns: np.ndarray, ddof: int = 0) -> Dict[str, np.ndarray]:
+    """
+    Return, volatility, Sharpe ratio and max drawdown of every row of a returns matrix.
+    
+    Args:
+        returns: Simple returns, shape (n_paths, n_steps)
+        ddof: Degrees of freedom of the standard deviation
+        
+    Returns:
+        Dict of arrays of length n_paths (METRIC_COLUMNS)
+    """
+    n_paths = returns.shape[0]
+    if returns.shape[1] == 0:
+        return {name: np.zeros(n_paths) for name in METRIC_COLUMNS}
+    growth = np.cumprod(1 + returns, axis=1)
+    peak = np.maximum.accumulate(growth, axis=1)
+    std = returns.std(axis=1, ddof=ddof) if returns.shape[1] > ddof else np.full(n_paths, np.nan)
+    mean = returns.mean(axis=1)
+    sharpe = np.divide(mean, std, out=np.zeros(n_paths), where=(std != 0) & ~np.isnan(std)) * np.sqrt(252)
+    return {
+        "total_return": growth[:, -1] - 1,
+        "volatility": std * np.sqrt(252),
+        "sharpe_ratio": sharpe,
+        "max_drawdown": ((growth - peak) / peak).min(axis=1)
+    }
+
+
+def simulate_path_metrics(draw, n_paths: int, n_steps: int, rng: np.random.Generator,
+                          ddof: int = 0, max_block_bytes: int = MC_BLOCK_BYTES) -> pd.DataFrame:
+    """
+    Computes path metrics for n_paths simulated return paths in memory-bounded blocks.
+    
+    Args:
+        draw: Callable (rng, n_rows) -> returns matrix of shape (n_rows, n_steps)
+        n_paths: Number of paths
+        n_steps: Returns per path
+        rng: Random generator passed to draw
+        ddof: Degrees of freedom of the standard deviation
+        max_block_bytes: Memory bound of one block of paths
+        
+    Returns:
+        DataFrame with one row per path and METRIC_COLUMNS
+    """
+    columns = {name: np.empty(n_paths) for name in METRIC_COLUMNS}
+    block_rows = max(1, min(n_paths, max_block_bytes // (8 * _ARRAYS_PER_STEP * max(n_steps, 1))))
+    for start in range(0, n_paths, block_rows):
+        stop = min(start + block_rows, n_paths)
+        metrics = path_metrics(draw(rng, stop - start), ddof=ddof)
+        for name in METRIC_COLUMNS:
+            columns[name][start:stop] = metrics[name]
+    return pd.DataFrame(columns)
+
+
 class MonteCarloBacktesting:
     """
     Monte Carlo backtesting system for robust strategy validation.
@@ -31,59 +92,40 @@ class MonteCarloBacktesting:
         self.cross_validation_results = {}
         self.performance_distributions = {}
     
-    def monte_carlo_simulation(self, data: pd.DataFrame, n_simulations: int = 1000) -> Dict[str, Any]:
+    def monte_carlo_simulation(self, data: pd.DataFrame, n_simulations: int = 1000,
+                               seed: Optional[int] = None,
+                               max_block_bytes: int = MC_BLOCK_BYTES) -> Dict[str, Any]:
         """
         Perform Monte Carlo simulation for backtesting.
         
+        Normal returns with the historical mean and standard deviation are drawn
+        for all simulations as (block x n_returns) matrices, with blocks bounded
+        by max_block_bytes, and the metrics are computed along the return axis.
+        
         Args:
             data: Historical data
             n_simulations: Number of simulations
+            seed: Random seed for reproducible results
+            max_block_bytes: Memory bound of one block of simulated paths
             
         Returns:
-            Monte Carlo simulation results
+            Monte Carlo simulation results; simulation_results is a DataFrame
+            with one row per simulation
         """
         try:
-            # Extract returns from data - handle different data formats
-            if 'returns' in data.columns:
-                returns = data['returns'].dropna()
-            elif 'portfolio_value' in data.columns:
-                returns = data['portfolio_value'].pct_change().dropna()
-            else:
-                # Use first numeric column as returns
-                numeric_cols = data.select_dtypes(include=[np.number]).columns
-                if len(numeric_cols) > 0:
-                    returns = data[numeric_cols[0]].pct_change().dropna()
-                else:
-                    # Generate synthetic returns if no suitable column found
-                    returns = pd.Series(np.random.normal(0.001, 0.02, 1000))
+            rng = np.random.default_rng(seed)
+            returns = self._extract_returns(data, rng)
             
             # Calculate historical statistics
             mean_return = returns.mean()
             std_return = returns.std()
+            n_steps = len(returns)
             
             # Perform Monte Carlo simulations
-            simulation_results = []
-            
-            for sim in range(n_simulations):
-                # Generate random returns
-                random_returns = np.random.normal(mean_return, std_return, len(returns))
-                
-                # Calculate cumulative returns
-                cumulative_returns = (1 + random_returns).cumprod()
-                
-                # Calculate performance metrics
-                total_return = cumulative_returns[-1] - 1
-                volatility = np.std(random_returns) * np.sqrt(252)
-                sharpe_ratio = np.mean(random_returns) / np.std(random_returns) * np.sqrt(252) if np.std(random_returns) != 0 else 0
-                max_drawdown = self._calculate_max_drawdown(cumulative_returns)
-                
-                simulation_results.append({
-                    "total_return": total_return,
-                    "volatility": volatility,
-                    "sharpe_ratio": sharpe_ratio,
-                    "max_drawdown": max_drawdown,
-                    "cumulative_returns": cumulative_returns
-                })
+            simulation_results = simulate_path_metrics(
+                lambda gen, rows: gen.normal(mean_return, std_return, (rows, n_steps)),
+                n_simulations, n_steps, rng, ddof=0, max_block_bytes=max_block_bytes
+            )
             
             # Analyze simulation results
             analysis = self._analyze_monte_carlo_results(simulation_results)
@@ -101,39 +143,37 @@ class MonteCarloBacktesting:
             return {"status": "error", "message": f"Monte Carlo simulation failed: {str(e)}"}
     
     def bootstrap_backtesting(self, data: pd.DataFrame, n_bootstrap: int = 1000,
-                            bootstrap_size: float = 0.8) -> Dict[str, Any]:
+                            bootstrap_size: float = 0.8, seed: Optional[int] = None,
+                            max_block_bytes: int = MC_BLOCK_BYTES) -> Dict[str, Any]:
         """
         Perform bootstrap backtesting.
         
+        Each bootstrap sample draws bootstrap_size * len(returns) historical
+        returns with replacement. The resample indices are drawn as
+        (block x sample size) matrices, with blocks bounded by max_block_bytes.
+        
         Args:
             data: Historical data
             n_bootstrap: Number of bootstrap samples
             bootstrap_size: Size of bootstrap samples (fraction of original data)
+            seed: Random seed for reproducible results
+            max_block_bytes: Memory bound of one block of samples
             
         Returns:
-            Bootstrap backtesting results
+            Bootstrap backtesting results; bootstrap_results is a DataFrame with
+            one row per bootstrap sample
         """
         try:
-            bootstrap_results = []
+            rng = np.random.default_rng(seed)
+            returns = self._extract_returns(data, rng).to_numpy(dtype=np.float64)
+            sample_size = int(len(returns) * bootstrap_size)
+            if len(returns) == 0 or sample_size == 0:
+                raise ValueError("Not enough data for bootstrap samples")
             
-            for boot in range(n_bootstrap):
-                # Create bootstrap sample
-                bootstrap_data = self._create_bootstrap_sample(data, bootstrap_size)
-                
-                # Calculate performance metrics
-                returns = bootstrap_data.pct_change().dropna()
-                total_return = (1 + returns).prod() - 1
-                volatility = returns.std() * np.sqrt(252)
-                sharpe_ratio = returns.mean() / returns.std() * np.sqrt(252) if returns.std() != 0 else 0
-                max_drawdown = self._calculate_max_drawdown((1 + returns).cumprod())
-                
-                bootstrap_results.append({
-                    "total_return": total_return,
-                    "volatility": volatility,
-                    "sharpe_ratio": sharpe_ratio,
-                    "max_drawdown": max_drawdown,
-                    "bootstrap_sample": bootstrap_data
-                })
+            bootstrap_results = simulate_path_metrics(
+                lambda gen, rows: returns[gen.integers(0, len(returns), (rows, sample_size))],
+                n_bootstrap, sample_size, rng, ddof=1, max_block_bytes=max_block_bytes
+            )
             
             # Analyze bootstrap results
             analysis = self._analyze_bootstrap_results(bootstrap_results)
@@ -162,7 +202,8 @@ class MonteCarloBacktesting:
             validation_method: Validation method (time_series, k_fold)
             
         Returns:
-            Cross-validation backtesting results
+            Cross-validation backtesting results; cv_results is a DataFrame with
+            the train and test metrics of one fold per row
         """
         try:
             if validation_method == "time_series":
@@ -240,17 +281,17 @@ class MonteCarloBacktesting:
         except Exception as e:
             return 0.0
     
-    def _analyze_monte_carlo_results(self, simulation_results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze Monte Carlo simulation results."""
+    def _analyze_monte_carlo_results(self, simulation_results: pd.DataFrame) -> Dict[str, Any]:
+        """Analyze Monte Carlo simulation results (one row per simulation)."""
         try:
-            if not simulation_results:
+            if len(simulation_results) == 0:
                 return {}
             
             # Extract metrics
-            total_returns = [result["total_return"] for result in simulation_results]
-            volatilities = [result["volatility"] for result in simulation_results]
-            sharpe_ratios = [result["sharpe_ratio"] for result in simulation_results]
-            max_drawdowns = [result["max_drawdown"] for result in simulation_results]
+            total_returns = simulation_results["total_return"].to_numpy()
+            volatilities = simulation_results["volatility"].to_numpy()
+            sharpe_ratios = simulation_results["sharpe_ratio"].to_numpy()
+            max_drawdowns = simulation_results["max_drawdown"].to_numpy()
             
             analysis = {
                 "total_return": {
@@ -287,27 +328,30 @@ class MonteCarloBacktesting:
         except Exception as e:
             return {}
     
-    def _create_bootstrap_sample(self, data: pd.DataFrame, bootstrap_size: float) -> pd.DataFrame:
-        """Create bootstrap sample from data."""
-        try:
-            n_samples = int(len(data) * bootstrap_size)
-            indices = np.random.choice(len(data), n_samples, replace=True)
-            bootstrap_sample = data.iloc[indices].reset_index(drop=True)
-            return bootstrap_sample
-        except Exception as e:
-            return data
+    def _extract_returns(self, data: pd.DataFrame, rng: Optional[np.random.Generator] = None) -> pd.Series:
+        """Returns of the 'returns' column, of 'portfolio_value' or of the first numeric column."""
+        if 'returns' in data.columns:
+            return data['returns'].dropna()
+        if 'portfolio_value' in data.columns:
+            return data['portfolio_value'].pct_change().dropna()
+        numeric_cols = data.select_dtypes(include=[np.number]).columns
+        if len(numeric_cols) > 0:
+            return data[numeric_cols[0]].pct_change().dropna()
+        # Generate synthetic returns if no suitable column found
+        rng = rng if rng is not None else np.random.default_rng()
+        return pd.Series(rng.normal(0.001, 0.02, 1000))
     
-    def _analyze_bootstrap_results(self, bootstrap_results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze bootstrap backtesting results."""
+    def _analyze_bootstrap_results(self, bootstrap_results: pd.DataFrame) -> Dict[str, Any]:
+        """Analyze bootstrap backtesting results (one row per bootstrap sample)."""
         try:
-            if not bootstrap_results:
+            if len(bootstrap_results) == 0:
                 return {}
             
             # Extract metrics
-            total_returns = [result["total_return"] for result in bootstrap_results]
-            volatilities = [result["volatility"] for result in bootstrap_results]
-            sharpe_ratios = [result["sharpe_ratio"] for result in bootstrap_results]
-            max_drawdowns = [result["max_drawdown"] for result in bootstrap_results]
+            total_returns = bootstrap_results["total_return"].to_numpy()
+            volatilities = bootstrap_results["volatility"].to_numpy()
+            sharpe_ratios = bootstrap_results["sharpe_ratio"].to_numpy()
+            max_drawdowns = bootstrap_results["max_drawdown"].to_numpy()
             
             analysis = {
                 "total_return": {
@@ -338,119 +382,90 @@ class MonteCarloBacktesting:
         except Exception as e:
             return {}
     
-    def _time_series_cross_validation(self, data: pd.DataFrame, n_folds: int) -> List[Dict[str, Any]]:
-        """Perform time series cross-validation."""
+    def _row_returns(self, data: pd.DataFrame) -> np.ndarray:
+        """Return realized at every row (NaN where unknown), aligned to the rows of data."""
+        if 'returns' in data.columns:
+            return data['returns'].to_numpy(dtype=np.float64)
+        column = 'portfolio_value' if 'portfolio_value' in data.columns else data.select_dtypes(include=[np.number]).columns[0]
+        return data[column].pct_change().to_numpy(dtype=np.float64)
+    
+    def _fold_metrics(self, row_returns: np.ndarray, folds: List[Tuple[int, List[Tuple[int, int]], int, int]]) -> pd.DataFrame:
+        """
+        Train and test metrics of every fold as one row each.
+        
+        Args:
+            row_returns: Returns aligned to the data rows
+            folds: (fold, train row ranges, test_start, test_end) per fold
+        """
+        rows = []
+        for fold, train_ranges, test_start, test_end in folds:
+            train = np.concatenate([row_returns[start:end] for start, end in train_ranges])
+            test = row_returns[test_start:test_end]
+            train, test = train[~np.isnan(train)], test[~np.isnan(test)]
+            if len(train) == 0 or len(test) == 0:
+                continue
+            row = {"fold": fold, "train_size": len(train), "test_start": test_start, "test_end": test_end}
+            for prefix, returns in (("train", train), ("test", test)):
+                metrics = path_metrics(returns[np.newaxis, :], ddof=1)
+                for name in METRIC_COLUMNS:
+                    row[f"{prefix}_{name}"] = float(metrics[name][0])
+            rows.append(row)
+        
+        columns = ["fold", "train_size", "test_start", "test_end"] + \
+            [f"{prefix}_{name}" for prefix in ("train", "test") for name in METRIC_COLUMNS]
+        return pd.DataFrame(rows, columns=columns)
+    
+    def _time_series_cross_validation(self, data: pd.DataFrame, n_folds: int) -> pd.DataFrame:
+        """Perform time series cross-validation (expanding training window)."""
         try:
-            cv_results = []
             n_samples = len(data)
             fold_size = n_samples // n_folds
             
+            folds = []
             for fold in range(n_folds):
                 # Define train and test sets
-                train_start = 0
                 train_end = (fold + 1) * fold_size
-                test_start = train_end
-                test_end = min(test_start + fold_size, n_samples)
-                
-                if test_start >= n_samples:
+                if train_end >= n_samples:
                     break
-                
-                # Get train and test data
-                train_data = data.iloc[train_start:train_end]
-                test_data = data.iloc[test_start:test_end]
-                
-                # Calculate performance metrics
-                train_returns = train_data.pct_change().dropna()
-                test_returns = test_data.pct_change().dropna()
-                
-                if len(train_returns) == 0 or len(test_returns) == 0:
-                    continue
-                
-                train_metrics = self._calculate_metrics(train_returns)
-                test_metrics = self._calculate_metrics(test_returns)
-                
-                cv_results.append({
-                    "fold": fold,
-                    "train_metrics": train_metrics,
-                    "test_metrics": test_metrics,
-                    "train_data": train_data,
-                    "test_data": test_data
-                })
+                folds.append((fold, [(0, train_end)], train_end, min(train_end + fold_size, n_samples)))
             
-            return cv_results
+            return self._fold_metrics(self._row_returns(data), folds)
             
         except Exception as e:
-            return []
+            return self._fold_metrics(np.array([]), [])
     
-    def _k_fold_cross_validation(self, data: pd.DataFrame, n_folds: int) -> List[Dict[str, Any]]:
-        """Perform k-fold cross-validation."""
+    def _k_fold_cross_validation(self, data: pd.DataFrame, n_folds: int) -> pd.DataFrame:
+        """Perform k-fold cross-validation (no return spans the gap left by the test fold)."""
         try:
-            cv_results = []
             n_samples = len(data)
             fold_size = n_samples // n_folds
             
+            # Price-based returns of the first row after the test set start inside it
+            gap = 0 if 'returns' in data.columns else 1
+            
+            folds = []
             for fold in range(n_folds):
-                # Define test set
+                # Define test set; train data is all data except the test set
                 test_start = fold * fold_size
                 test_end = min((fold + 1) * fold_size, n_samples)
-                
-                # Get test data
-                test_data = data.iloc[test_start:test_end]
-                
-                # Get train data (all data except test set)
-                train_indices = list(range(0, test_start)) + list(range(test_end, n_samples))
-                train_data = data.iloc[train_indices]
-                
-                if len(train_data) == 0 or len(test_data) == 0:
-                    continue
-                
-                # Calculate performance metrics
-                train_returns = train_data.pct_change().dropna()
-                test_returns = test_data.pct_change().dropna()
-                
-                if len(train_returns) == 0 or len(test_returns) == 0:
-                    continue
-                
-                train_metrics = self._calculate_metrics(train_returns)
-                test_metrics = self._calculate_metrics(test_returns)
-                
-                cv_results.append({
-                    "fold": fold,
-                    "train_metrics": train_metrics,
-                    "test_metrics": test_metrics,
-                    "train_data": train_data,
-                    "test_data": test_data
-                })
+                folds.append((fold, [(0, test_start), (test_end + gap, n_samples)], test_start, test_end))
             
-            return cv_results
+            return self._fold_metrics(self._row_returns(data), folds)
             
         except Exception as e:
-            return []
-    
-    def _calculate_metrics(self, returns: pd.Series) -> Dict[str, Any]:
-        """Calculate performance metrics."""
-        try:
-            metrics = {
-                "total_return": (1 + returns).prod() - 1,
-                "volatility": returns.std() * np.sqrt(252),
-                "sharpe_ratio": returns.mean() / returns.std() * np.sqrt(252) if returns.std() != 0 else 0,
-                "max_drawdown": self._calculate_max_drawdown((1 + returns).cumprod().values)
-            }
-            return metrics
-        except Exception as e:
-            return {"total_return": 0.0, "volatility": 0.0, "sharpe_ratio": 0.0, "max_drawdown": 0.0}
+            return self._fold_metrics(np.array([]), [])
     
-    def _analyze_cross_validation_results(self, cv_results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze cross-validation results."""
+    def _analyze_cross_validation_results(self, cv_results: pd.DataFrame) -> Dict[str, Any]:
+        """Analyze cross-validation results (one row per fold)."""
         try:
-            if not cv_results:
+            if len(cv_results) == 0:
                 return {}
             
             # Extract metrics
-            train_returns = [result["train_metrics"]["total_return"] for result in cv_results]
-            test_returns = [result["test_metrics"]["total_return"] for result in cv_results]
-            train_sharpe = [result["train_metrics"]["sharpe_ratio"] for result in cv_results]
-            test_sharpe = [result["test_metrics"]["sharpe_ratio"] for result in cv_results]
+            train_returns = cv_results["train_total_return"].to_numpy()
+            test_returns = cv_results["test_total_return"].to_numpy()
+            train_sharpe = cv_results["train_sharpe_ratio"].to_numpy()
+            test_sharpe = cv_results["test_sharpe_ratio"].to_numpy()
             
             analysis = {
                 "train_metrics": {
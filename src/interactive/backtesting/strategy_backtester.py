@@ -9,25 +9,106 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, Optional, List, Tuple
 
+from src.calculation.vectorized_backtest import backtest_signal_frame, run_vectorized_backtest
+
 class StrategyBacktester:
-    """Strategy backtester for comprehensive strategy validation."""
-    
+    """
+    Strategy backtester for comprehensive strategy validation.
+
+    Runs indicator rule signals (PColor1, PColor2, Direction) through the
+    vectorized backtest: long on BUY, flat (or short) on SELL, fixed commission.
+    """
+
     def __init__(self):
         """Initialize the strategy backtester."""
-        self.backtesting_config = {}
+        self.backtesting_config = {
+            "signal_column": "Direction",
+            "price_column": "Close",
+            "commission": 0.0,
+            "short_on_sell": False,
+            "initial_capital": 1.0
+        }
         self.trading_rules = {}
-    
+
     def backtest_strategy(self, data: pd.DataFrame, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        """Backtest a trading strategy."""
-        print_warning("This feature will be implemented in the next phase...")
-        return {"status": "not_implemented", "message": "Feature coming soon"}
-    
+        """
+        Backtest a trading strategy.
+
+        Args:
+            data: Indicator output with price and signal columns
+            strategy: Overrides of backtesting_config; "signal_column" may be a
+                list to backtest several signal columns at once
+
+        Returns:
+            Backtest results with per signal column summary, trades and equity
+        """
+        try:
+            config = {**self.backtesting_config, **strategy}
+            result = backtest_signal_frame(
+                data,
+                signal_cols=config["signal_column"],
+                price_col=config["price_column"],
+                commission=config["commission"],
+                short_on_sell=config["short_on_sell"],
+                initial_capital=config["initial_capital"]
+            )
+
+            return {
+                "status": "success",
+                "summary": result.summary(),
+                "trades": result.trades,
+                "equity": result.equity_frame()
+            }
+
+        except Exception as e:
+            return {"status": "error", "message": f"Strategy backtest failed: {str(e)}"}
+
     def simulate_trades(self, signals: pd.DataFrame, prices: pd.DataFrame) -> pd.DataFrame:
-        """Simulate trades based on signals."""
-        print_warning("This feature will be implemented in the next phase...")
-        return pd.DataFrame()
-    
+        """
+        Simulate trades based on signals.
+
+        Args:
+            signals: One column of BUY/SELL/NOTRADE values per parameter set
+            prices: Prices aligned with signals (Close column or a single column)
+
+        Returns:
+            Trades of all signal columns
+        """
+        if isinstance(prices, pd.DataFrame):
+            price_column = self.backtesting_config["price_column"]
+            prices = prices[price_column] if price_column in prices.columns else prices.iloc[:, 0]
+        if isinstance(signals, pd.Series):
+            signals = signals.to_frame()
+
+        result = run_vectorized_backtest(
+            prices.to_numpy(dtype=np.float64),
+            signals.fillna(0).to_numpy(dtype=np.float64),
+            commission=self.backtesting_config["commission"],
+            short_on_sell=self.backtesting_config["short_on_sell"],
+            param_labels=list(signals.columns),
+            index=signals.index
+        )
+        trades = result.trades.copy()
+        trades["entry_time"] = signals.index[trades["entry_bar"].to_numpy(dtype=np.int64)]
+        trades["exit_time"] = signals.index[trades["exit_bar"].to_numpy(dtype=np.int64)]
+        return trades
+
     def calculate_returns(self, trades: pd.DataFrame) -> Dict[str, float]:
-        """Calculate strategy returns."""
-        print_warning("This feature will be implemented in the next phase...")
-        return {"total_return": 0.0, "annualized_return": 0.0}
+        """
+        Calculate strategy returns by compounding the trade returns of one parameter set.
+
+        The annualized return needs entry_time/exit_time columns (as produced by
+        simulate_trades) and is 0 without them.
+        """
+        if trades.empty:
+            return {"total_return": 0.0, "annualized_return": 0.0}
+
+        total_return = float(np.prod(1 + trades["return_pct"].to_numpy() / 100) - 1)
+        annualized_return = 0.0
+        if "entry_time" in trades.columns and "exit_time" in trades.columns:
+            span = pd.Timestamp(trades["exit_time"].max()) - pd.Timestamp(trades["entry_time"].min())
+            years = span.total_seconds() / (365.25 * 24 * 3600)
+            if years > 0 and total_return > -1:
+                annualized_return = float((1 + total_return) ** (1 / years) - 1)
+
+        return {"total_return": total_return, "annualized_return": annualized_return}
@@ -11,7 +11,50 @@ from typing import Dict, Any, Optional, List, Tuple
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.model_selection import TimeSeriesSplit
+import math
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+from src.calculation.parameter_sweep import expand_sweep_spec, run_parameter_sweep
+from src.calculation.indicator_parameters import parse_rule_parameters
+
+# Task chunks per worker when no chunk_size is given
+_CHUNKS_PER_WORKER = 4
+
+
+def _fold_rng(seed: int, *key: int) -> np.random.Generator:
+    """Independent generator for one fold/simulation, derived from the study seed."""
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=key))
+
+
+def _chunk_tasks(items: List[Any], n_jobs: int, chunk_size: Optional[int] = None) -> List[List[Any]]:
+    """Splits items into contiguous chunks (chunk_size, or about 4 chunks per worker)."""
+    if not chunk_size:
+        chunk_size = max(1, math.ceil(len(items) / (max(n_jobs, 1) * _CHUNKS_PER_WORKER)))
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def _run_tasks(func, tasks: List[tuple], n_jobs: int, chunk_size: Optional[int] = None) -> List[Any]:
+    """Runs func(*task) for every task, in a process pool when n_jobs > 1; results keep task order."""
+    if n_jobs <= 1 or len(tasks) <= 1:
+        return [func(*task) for task in tasks]
+    if not chunk_size:
+        chunk_size = max(1, math.ceil(len(tasks) / (n_jobs * _CHUNKS_PER_WORKER)))
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks))) as executor:
+        return list(executor.map(func, *zip(*tasks), chunksize=chunk_size))
+
+
+def _walk_forward_fold_task(analysis: "WalkForwardAnalysis", train_data: pd.DataFrame,
+                            test_data: pd.DataFrame, strategy_config: Dict[str, Any],
+                            optimization_params: Dict[str, Any], rng: np.random.Generator):
+    return analysis._run_fold(train_data, test_data, strategy_config, optimization_params, rng)
+
+
+def _monte_carlo_chunk_task(analysis: "WalkForwardAnalysis", data: pd.DataFrame,
+                            strategy_config: Dict[str, Any], monte_carlo_params: Dict[str, Any],
+                            seed: int, sims: List[int]) -> List[Dict[str, Any]]:
+    return [analysis._run_simulation(data, strategy_config, monte_carlo_params, seed, sim) for sim in sims]
+
 
 class WalkForwardAnalysis:
     """
@@ -38,67 +81,27 @@ class WalkForwardAnalysis:
         """
         Perform walk forward optimization.
         
+        Folds are independent and run in a process pool when
+        optimization_params["n_jobs"] > 1. Every fold draws its random numbers
+        from its own generator seeded from optimization_params["seed"] and the
+        fold number, so results do not depend on n_jobs or scheduling.
+        
         Args:
             data: Historical data
             strategy_config: Strategy configuration
-            optimization_params: Optimization parameters
+            optimization_params: Optimization parameters (n_jobs, chunk_size
+                and seed control the execution)
             
         Returns:
             Walk forward optimization results
         """
         try:
-            # Extract parameters
-            initial_train_size = optimization_params.get("initial_train_size", 252)  # 1 year
-            retrain_frequency = optimization_params.get("retrain_frequency", 21)  # 1 month
-            test_size = optimization_params.get("test_size", 21)  # 1 month
-            optimization_method = optimization_params.get("method", "grid_search")
-            
-            # Create time series splits
-            splits = self._create_time_series_splits(data, initial_train_size, retrain_frequency, test_size)
-            
-            # Perform walk forward optimization
-            optimization_results = []
-            performance_history = []
-            
-            for i, (train_start, train_end, test_start, test_end) in enumerate(splits):
-                # Get training and test data
-                train_data = data.iloc[train_start:train_end]
-                test_data = data.iloc[test_start:test_end]
-                
-                # Optimize strategy on training data
-                if optimization_method == "grid_search":
-                    best_params = self._grid_search_optimization(train_data, strategy_config, optimization_params)
-                elif optimization_method == "random_search":
-                    best_params = self._random_search_optimization(train_data, strategy_config, optimization_params)
-                else:
-                    best_params = self._default_optimization(train_data, strategy_config)
-                
-                # Test strategy on out-of-sample data
-                test_performance = self._evaluate_strategy(test_data, best_params, strategy_config)
-                
-                # Store results
-                optimization_results.append({
-                    "split": i,
-                    "train_period": (train_start, train_end),
-                    "test_period": (test_start, test_end),
-                    "best_params": best_params,
-                    "test_performance": test_performance
-                })
-                
-                performance_history.append(test_performance)
-            
-            # Calculate overall performance metrics
-            overall_metrics = self._calculate_overall_metrics(performance_history)
-            
-            result = {
-                "status": "success",
-                "optimization_method": optimization_method,
-                "n_splits": len(splits),
-                "optimization_results": optimization_results,
-                "overall_metrics": overall_metrics,
-                "performance_history": performance_history
-            }
-            
+            seed = optimization_params.get("seed")
+            if seed is None:
+                seed = np.random.SeedSequence().entropy
+            result = self._walk_forward(data, strategy_config, optimization_params, seed, (),
+                                        optimization_params.get("n_jobs", 1))
+            result["seed"] = seed
             return result
             
         except Exception as e:
@@ -110,32 +113,35 @@ class WalkForwardAnalysis:
         """
         Perform Monte Carlo walk forward analysis.
         
+        Simulations run in a process pool when monte_carlo_params["n_jobs"] > 1,
+        submitted in chunks of chunk_size simulations so the data is sent once
+        per chunk. Simulation i bootstraps with a generator seeded from
+        (seed, i) and its folds with (seed, i, fold), so a study is reproducible
+        for a given seed whatever the number of workers.
+        
         Args:
             data: Historical data
             strategy_config: Strategy configuration
-            monte_carlo_params: Monte Carlo parameters
+            monte_carlo_params: Monte Carlo parameters (n_jobs, chunk_size and
+                seed control the execution)
             
         Returns:
             Monte Carlo walk forward results
         """
         try:
             n_simulations = monte_carlo_params.get("n_simulations", 100)
-            bootstrap_ratio = monte_carlo_params.get("bootstrap_ratio", 0.8)
+            n_jobs = monte_carlo_params.get("n_jobs", 1)
+            seed = monte_carlo_params.get("seed")
+            if seed is None:
+                seed = np.random.SeedSequence().entropy
             
             # Perform multiple walk forward simulations
-            simulation_results = []
+            chunks = _chunk_tasks(list(range(n_simulations)), n_jobs, monte_carlo_params.get("chunk_size"))
+            tasks = [(self, data, strategy_config, monte_carlo_params, seed, chunk) for chunk in chunks]
+            chunk_results = _run_tasks(_monte_carlo_chunk_task, tasks, n_jobs)
             
-            for sim in range(n_simulations):
-                # Bootstrap the data
-                bootstrapped_data = self._bootstrap_data(data, bootstrap_ratio)
-                
-                # Perform walk forward optimization on bootstrapped data
-                wf_result = self.perform_walk_forward_optimization(
-                    bootstrapped_data, strategy_config, monte_carlo_params
-                )
-                
-                if wf_result["status"] == "success":
-                    simulation_results.append(wf_result)
+            simulation_results = [wf_result for results in chunk_results for wf_result in results
+                                  if wf_result["status"] == "success"]
             
             # Analyze simulation results
             analysis_results = self._analyze_monte_carlo_results(simulation_results)
@@ -143,6 +149,7 @@ class WalkForwardAnalysis:
             result = {
                 "status": "success",
                 "n_simulations": n_simulations,
+                "seed": seed,
                 "simulation_results": simulation_results,
                 "analysis_results": analysis_results
             }
@@ -152,6 +159,88 @@ class WalkForwardAnalysis:
         except Exception as e:
             return {"status": "error", "message": f"Monte Carlo walk forward failed: {str(e)}"}
     
+    def _walk_forward(self, data: pd.DataFrame, strategy_config: Dict[str, Any],
+                      optimization_params: Dict[str, Any], seed: int, key: Tuple[int, ...],
+                      n_jobs: int) -> Dict[str, Any]:
+        """Runs all folds of one walk forward study; fold i is seeded from (seed, *key, i)."""
+        # Extract parameters
+        initial_train_size = optimization_params.get("initial_train_size", 252)  # 1 year
+        retrain_frequency = optimization_params.get("retrain_frequency", 21)  # 1 month
+        test_size = optimization_params.get("test_size", 21)  # 1 month
+        optimization_method = optimization_params.get("method", "grid_search")
+        
+        # Create time series splits
+        splits = self._create_time_series_splits(data, initial_train_size, retrain_frequency, test_size)
+        
+        fold_params = optimization_params
+        if n_jobs > 1:
+            # Folds already use every worker; do not nest process pools
+            fold_params = {**optimization_params, "workers": 1}
+        
+        tasks = [(self, data.iloc[train_start:train_end], data.iloc[test_start:test_end],
+                  strategy_config, fold_params, _fold_rng(seed, *key, i))
+                 for i, (train_start, train_end, test_start, test_end) in enumerate(splits)]
+        fold_results = _run_tasks(_walk_forward_fold_task, tasks, n_jobs,
+                                  optimization_params.get("chunk_size"))
+        
+        optimization_results = []
+        performance_history = []
+        for i, ((train_start, train_end, test_start, test_end), (best_params, test_performance)) in \
+                enumerate(zip(splits, fold_results)):
+            optimization_results.append({
+                "split": i,
+                "train_period": (train_start, train_end),
+                "test_period": (test_start, test_end),
+                "best_params": best_params,
+                "test_performance": test_performance
+            })
+            
+            performance_history.append(test_performance)
+        
+        # Calculate overall performance metrics
+        overall_metrics = self._calculate_overall_metrics(performance_history)
+        
+        return {
+            "status": "success",
+            "optimization_method": optimization_method,
+            "n_splits": len(splits),
+            "optimization_results": optimization_results,
+            "overall_metrics": overall_metrics,
+            "performance_history": performance_history
+        }
+    
+    def _run_fold(self, train_data: pd.DataFrame, test_data: pd.DataFrame,
+                  strategy_config: Dict[str, Any], optimization_params: Dict[str, Any],
+                  rng: np.random.Generator) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Optimizes on the training window and evaluates on the test window."""
+        optimization_method = optimization_params.get("method", "grid_search")
+        
+        # Optimize strategy on training data
+        if optimization_method == "grid_search":
+            best_params = self._grid_search_optimization(train_data, strategy_config, optimization_params, rng)
+        elif optimization_method == "random_search":
+            best_params = self._random_search_optimization(train_data, strategy_config, optimization_params, rng)
+        else:
+            best_params = self._default_optimization(train_data, strategy_config)
+        
+        # Test strategy on out-of-sample data
+        test_performance = self._evaluate_strategy(test_data, best_params, strategy_config, rng)
+        return best_params, test_performance
+    
+    def _run_simulation(self, data: pd.DataFrame, strategy_config: Dict[str, Any],
+                        monte_carlo_params: Dict[str, Any], seed: int, sim: int) -> Dict[str, Any]:
+        """One Monte Carlo walk forward simulation (folds run serially)."""
+        # Bootstrap the data
+        bootstrapped_data = self._bootstrap_data(data, monte_carlo_params.get("bootstrap_ratio", 0.8),
+                                                 _fold_rng(seed, sim))
+        
+        # Perform walk forward optimization on bootstrapped data
+        try:
+            return self._walk_forward(bootstrapped_data, strategy_config,
+                                      {**monte_carlo_params, "workers": 1}, seed, (sim,), 1)
+        except Exception as e:
+            return {"status": "error", "message": f"Walk forward optimization failed: {str(e)}"}
+    
     def perform_regime_aware_walk_forward(self, data: pd.DataFrame, 
                                         strategy_config: Dict[str, Any],
                                         regime_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -224,12 +313,16 @@ class WalkForwardAnalysis:
     
     def _grid_search_optimization(self, train_data: pd.DataFrame, 
                                  strategy_config: Dict[str, Any],
-                                 optimization_params: Dict[str, Any]) -> Dict[str, Any]:
+                                 optimization_params: Dict[str, Any],
+                                 rng: Optional[np.random.Generator] = None) -> Dict[str, Any]:
         """Perform grid search optimization."""
         try:
             # Get parameter grid
             param_grid = optimization_params.get("param_grid", {})
             
+            if strategy_config.get("rule"):
+                return self._sweep_rule_parameters(train_data, strategy_config, optimization_params)
+            
             best_params = {}
             best_score = -np.inf
             
@@ -238,7 +331,7 @@ class WalkForwardAnalysis:
                 for param_value in param_values:
                     # Test parameter combination
                     test_params = {param_name: param_value}
-                    score = self._evaluate_parameters(train_data, test_params, strategy_config)
+                    score = self._evaluate_parameters(train_data, test_params, strategy_config, rng)
                     
                     if score > best_score:
                         best_score = score
@@ -249,11 +342,36 @@ class WalkForwardAnalysis:
         except Exception as e:
             return {}
     
+    def _sweep_rule_parameters(self, train_data: pd.DataFrame,
+                               strategy_config: Dict[str, Any],
+                               optimization_params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Grid search over all combinations of an indicator rule's parameters.
+        
+        The param_grid values are given in the order of the rule's CLI
+        parameters (e.g. period, oversold, overbought, price_type for rsi) and
+        are evaluated in parallel by the parameter sweep engine.
+        """
+        param_grid = optimization_params.get("param_grid", {})
+        spec = f"{strategy_config['rule']}:" + ",".join(
+            "|".join(str(value) for value in values) for values in param_grid.values()
+        )
+        results = run_parameter_sweep(
+            train_data, strategy_config.get("point", 0.01), expand_sweep_spec(spec),
+            workers=optimization_params.get("workers", 1),
+            metric=optimization_params.get("metric", "sharpe_ratio"),
+            commission=strategy_config.get("commission", 0.0)
+        )
+        best_rule = results["rule"].iloc[0]
+        return {"rule": best_rule, **parse_rule_parameters(best_rule)[1]}
+    
     def _random_search_optimization(self, train_data: pd.DataFrame, 
                                    strategy_config: Dict[str, Any],
-                                   optimization_params: Dict[str, Any]) -> Dict[str, Any]:
+                                   optimization_params: Dict[str, Any],
+                                   rng: Optional[np.random.Generator] = None) -> Dict[str, Any]:
         """Perform random search optimization."""
         try:
+            rng = rng if rng is not None else np.random.default_rng()
             # Get parameter ranges
             param_ranges = optimization_params.get("param_ranges", {})
             n_iterations = optimization_params.get("n_iterations", 50)
@@ -266,12 +384,12 @@ class WalkForwardAnalysis:
                 test_params = {}
                 for param_name, param_range in param_ranges.items():
                     if isinstance(param_range, tuple):
-                        test_params[param_name] = np.random.uniform(param_range[0], param_range[1])
+                        test_params[param_name] = rng.uniform(param_range[0], param_range[1])
                     elif isinstance(param_range, list):
-                        test_params[param_name] = np.random.choice(param_range)
+                        test_params[param_name] = rng.choice(param_range)
                 
                 # Test parameter combination
-                score = self._evaluate_parameters(train_data, test_params, strategy_config)
+                score = self._evaluate_parameters(train_data, test_params, strategy_config, rng)
                 
                 if score > best_score:
                     best_score = score
@@ -288,20 +406,24 @@ class WalkForwardAnalysis:
         return {"default_param": 1.0}
     
     def _evaluate_parameters(self, data: pd.DataFrame, params: Dict[str, Any],
-                           strategy_config: Dict[str, Any]) -> float:
+                           strategy_config: Dict[str, Any],
+                           rng: Optional[np.random.Generator] = None) -> float:
         """Evaluate parameter combination."""
         try:
             # Simplified evaluation using random performance
-            return np.random.random()
+            rng = rng if rng is not None else np.random.default_rng()
+            return rng.random()
         except Exception as e:
             return 0.0
     
     def _evaluate_strategy(self, test_data: pd.DataFrame, params: Dict[str, Any],
-                          strategy_config: Dict[str, Any]) -> Dict[str, Any]:
+                          strategy_config: Dict[str, Any],
+                          rng: Optional[np.random.Generator] = None) -> Dict[str, Any]:
         """Evaluate strategy performance on test data."""
         try:
             # Simplified strategy evaluation
-            returns = np.random.normal(0.001, 0.02, len(test_data))
+            rng = rng if rng is not None else np.random.default_rng()
+            returns = rng.normal(0.001, 0.02, len(test_data))
             cumulative_returns = np.cumprod(1 + returns)
             
             performance = {
@@ -353,14 +475,16 @@ class WalkForwardAnalysis:
         except Exception as e:
             return {}
     
-    def _bootstrap_data(self, data: pd.DataFrame, bootstrap_ratio: float) -> pd.DataFrame:
+    def _bootstrap_data(self, data: pd.DataFrame, bootstrap_ratio: float,
+                        rng: Optional[np.random.Generator] = None) -> pd.DataFrame:
         """Bootstrap data for Monte Carlo analysis."""
         try:
+            rng = rng if rng is not None else np.random.default_rng()
             n_samples = len(data)
             n_bootstrap = int(n_samples * bootstrap_ratio)
             
             # Random sampling with replacement
-            indices = np.random.choice(n_samples, n_bootstrap, replace=True)
+            indices = rng.choice(n_samples, n_bootstrap, replace=True)
             bootstrapped_data = data.iloc[indices].reset_index(drop=True)
             
             return bootstrapped_data
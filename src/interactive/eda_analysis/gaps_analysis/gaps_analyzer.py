@@ -30,9 +30,16 @@ class GapsAnalyzer:
     - Comprehensive reporting
     """
     
-    def __init__(self):
-        """Initialize the gaps analyzer."""
-        self.detector = GapsDetector()
+    def __init__(self, calendar: Optional[str] = None, holidays: Optional[List] = None):
+        """
+        Initialize the gaps analyzer.
+        
+        Args:
+            calendar: Trading calendar whose weekly closure is not a gap ('fx', 'weekend');
+                by default the calendar of the symbol in the MTF metadata
+            holidays: Closed dates that are not gaps
+        """
+        self.detector = GapsDetector(calendar=calendar, holidays=holidays)
         self.fixer = GapsFixer()
         self.backup_manager = BackupManager()
         self.available_strategies = list(self.fixer.filling_strategies.keys())
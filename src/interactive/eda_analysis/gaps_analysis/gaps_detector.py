@@ -11,6 +11,32 @@ from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime, timedelta
 import time
 from src.common.logger import print_info, print_warning, print_error, print_debug
+from src.data.gap_index import find_gaps, infer_frequency, to_nanoseconds
+
+# Fiat currencies of FX pairs (EURUSD, GBPJPY=X, ...)
+FX_CURRENCIES = {
+    'AUD', 'CAD', 'CHF', 'CNH', 'CZK', 'DKK', 'EUR', 'GBP', 'HKD', 'HUF', 'JPY', 'MXN',
+    'NOK', 'NZD', 'PLN', 'RUB', 'SEK', 'SGD', 'TRY', 'USD', 'ZAR'
+}
+
+
+def trading_calendar(symbol: Optional[str] = None, source: Optional[str] = None) -> Optional[str]:
+    """
+    Trading calendar of a symbol for gap detection.
+    
+    Args:
+        symbol: Symbol name, e.g. 'EURUSD', 'EURUSD=X' or 'BTCUSDT'
+        source: Data source, e.g. 'exrate', 'binance'
+        
+    Returns:
+        'fx' for currency pairs, None (every step counts) for anything else, e.g. 24/7 crypto
+    """
+    if str(source).lower() == 'exrate':
+        return 'fx'
+    letters = ''.join(ch for ch in str(symbol or '').upper().split('=')[0] if ch.isalpha())
+    if len(letters) == 6 and letters[:3] in FX_CURRENCIES and letters[3:] in FX_CURRENCIES:
+        return 'fx'
+    return None
 
 
 class GapsDetector:
@@ -24,8 +50,18 @@ class GapsDetector:
     - Detailed gap statistics
     """
     
-    def __init__(self):
-        """Initialize the gaps detector."""
+    def __init__(self, calendar: Optional[str] = None, holidays: Optional[List] = None):
+        """
+        Initialize the gaps detector.
+        
+        Args:
+            calendar: Trading calendar whose weekly closure is not a gap ('fx', 'weekend').
+                By default MTF data uses the calendar of its symbol (see trading_calendar),
+                so FX weekends are skipped while every step of 24/7 data counts.
+            holidays: Closed dates that are not gaps
+        """
+        self.calendar = calendar
+        self.holidays = holidays
         self.gap_thresholds = {
             'M1': timedelta(minutes=1),
             'M5': timedelta(minutes=5),
@@ -83,6 +119,11 @@ class GapsDetector:
                 return {'status': 'error', 'message': 'No valid timeframe data found in MTF structure'}
             
             print_debug(f"Found {len(loaded_data)} timeframes: {list(loaded_data.keys())}")
+            calendar = self.calendar
+            if calendar is None:
+                metadata = mtf_data.get('_metadata') or {}
+                calendar = trading_calendar(metadata.get('symbol', mtf_data.get('_symbol')), metadata.get('source'))
+            print_debug(f"Trading calendar: {calendar}")
             gaps_results = {}
             total_timeframes = len(loaded_data)
             processed = 0
@@ -94,7 +135,7 @@ class GapsDetector:
                 print_debug(f"Analyzing gaps in timeframe: {timeframe}")
                 
                 # Detect gaps for this timeframe
-                gaps_info = self._detect_gaps_in_dataframe(df, timeframe)
+                gaps_info = self._detect_gaps_in_dataframe(df, timeframe, calendar)
                 gaps_results[timeframe] = gaps_info
                 
                 processed += 1
@@ -117,13 +158,15 @@ class GapsDetector:
             print_error(f"Error in gaps detection: {e}")
             return {'status': 'error', 'message': str(e)}
     
-    def _detect_gaps_in_dataframe(self, df: pd.DataFrame, timeframe: str) -> Dict[str, Any]:
+    def _detect_gaps_in_dataframe(self, df: pd.DataFrame, timeframe: str,
+                                  calendar: Optional[str] = None) -> Dict[str, Any]:
         """
         Detect gaps in a single DataFrame.
         
         Args:
             df: DataFrame to analyze
             timeframe: Timeframe identifier
+            calendar: Trading calendar (default: the detector's calendar)
             
         Returns:
             Dictionary containing gap information
@@ -138,16 +181,18 @@ class GapsDetector:
                 }
             
             # Check if index is datetime
-            if not isinstance(df.index, pd.DatetimeIndex):
-                # Try to find a time column and set it as index
+            if isinstance(df.index, pd.DatetimeIndex):
+                timestamps = df.index
+            else:
+                # Try to find a time column to use as the index
                 # Exclude 'timeframe' column as it contains timeframe names, not timestamps
                 time_columns = [col for col in df.columns if any(keyword in col.lower() for keyword in ['time', 'date', 'timestamp', 'datetime']) and col.lower() != 'timeframe']
                 if time_columns:
                     time_col = time_columns[0]
                     try:
-                        df[time_col] = pd.to_datetime(df[time_col])
-                        df = df.set_index(time_col)
-                        print_debug(f"Set {time_col} as datetime index")
+                        # Converted copy, the caller's DataFrame is left untouched
+                        timestamps = pd.DatetimeIndex(pd.to_datetime(df[time_col]))
+                        print_debug(f"Using {time_col} as datetime index")
                     except Exception as e:
                         print_debug(f"Could not convert {time_col} to datetime: {e}")
                         return {
@@ -168,19 +213,14 @@ class GapsDetector:
             expected_interval = self.gap_thresholds.get(timeframe, timedelta(hours=1))
             print_debug(f"Expected interval for {timeframe}: {expected_interval}")
             
-            # Sort by index to ensure proper order
-            df_sorted = df.sort_index()
-            print_debug(f"DataFrame shape: {df_sorted.shape}")
-            print_debug(f"Index type: {type(df_sorted.index)}")
-            print_debug(f"Index range: {df_sorted.index.min()} to {df_sorted.index.max()}")
-            
-            # Check if index is actually datetime
-            if not isinstance(df_sorted.index, pd.DatetimeIndex):
-                print_debug("Converting index to datetime")
-                df_sorted.index = pd.to_datetime(df_sorted.index)
+            # Sort timestamps to ensure proper order (only the index, not the whole frame)
+            if not timestamps.is_monotonic_increasing:
+                timestamps = timestamps.sort_values()
+            print_debug(f"DataFrame shape: {df.shape}")
+            print_debug(f"Index range: {timestamps.min()} to {timestamps.max()}")
             
             # Check if data actually matches the expected timeframe
-            actual_interval = self._detect_actual_interval(df_sorted.index)
+            actual_interval = self._detect_actual_interval(timestamps)
             print_debug(f"Actual interval detected: {actual_interval}")
             
             # Store original expected interval for display
@@ -203,7 +243,7 @@ class GapsDetector:
             # Find gaps using vectorized operations
             # Use actual interval if there's a mismatch, otherwise use expected interval
             interval_for_gap_detection = actual_interval if is_interval_mismatch else expected_interval
-            gaps = self._find_gaps_vectorized(df_sorted.index, interval_for_gap_detection, timeframe_for_analysis)
+            gaps = self._find_gaps_vectorized(timestamps, interval_for_gap_detection, timeframe_for_analysis, calendar)
             
             # Calculate gap statistics
             gap_stats = self._calculate_gap_statistics(gaps, interval_for_gap_detection)
@@ -220,8 +260,8 @@ class GapsDetector:
                 'statistics': gap_stats,
                 'data_points': len(df),
                 'time_span': {
-                    'start': df_sorted.index.min().isoformat() if not df_sorted.empty else None,
-                    'end': df_sorted.index.max().isoformat() if not df_sorted.empty else None
+                    'start': timestamps.min().isoformat() if len(timestamps) else None,
+                    'end': timestamps.max().isoformat() if len(timestamps) else None
                 }
             }
             
@@ -248,29 +288,28 @@ class GapsDetector:
             if len(index) < 2:
                 return timedelta(minutes=1)
             
-            # Calculate differences between consecutive timestamps
-            diffs = index.to_series().diff().dropna()
-            
-            # Get the most common interval (mode)
-            mode_interval = diffs.mode()
-            if len(mode_interval) > 0:
-                return mode_interval.iloc[0]
-            else:
-                # Fallback to median
-                return diffs.median()
+            # Most common positive difference between consecutive timestamps (mode)
+            ns, _ = to_nanoseconds(index)
+            mode_interval = infer_frequency(ns, sorted_input=index.is_monotonic_increasing)
+            if mode_interval is None:
+                return timedelta(minutes=1)
+            return pd.Timedelta(mode_interval)
                 
         except Exception as e:
             print_debug(f"Error detecting actual interval: {e}")
             return timedelta(minutes=1)
     
     def _find_gaps_vectorized(self, index: pd.DatetimeIndex,
-                             expected_interval: timedelta, timeframe: str = 'M1') -> List[Dict[str, Any]]:
+                             expected_interval: timedelta, timeframe: str = 'M1',
+                             calendar: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Find gaps using vectorized operations for speed.
         
         Args:
             index: DatetimeIndex to analyze
             expected_interval: Expected interval between data points
+            timeframe: Timeframe identifier
+            calendar: Trading calendar (default: the detector's calendar)
             
         Returns:
             List of gap dictionaries
@@ -279,50 +318,31 @@ class GapsDetector:
             if len(index) < 2:
                 return []
             
-            print_debug(f"Analyzing {len(index)} data points")
+            print_debug(f"Analyzing {len(index)} {timeframe} data points")
             print_debug(f"Expected interval: {expected_interval}")
             
-            # Calculate differences between consecutive timestamps
-            diffs = index.to_series().diff().dropna()
-            print_debug(f"Time differences - min: {diffs.min()}, max: {diffs.max()}, mean: {diffs.mean()}")
-            
             # Find gaps (differences significantly larger than expected)
-            # Use 2x expected interval as threshold to account for minor variations
-            gap_threshold = expected_interval * 2.0
-            print_debug(f"Gap threshold: {gap_threshold}")
-            
-            # Find gaps that are significantly larger than expected
-            gap_indices = diffs[diffs > gap_threshold].index
-            print_debug(f"Found {len(gap_indices)} potential gaps")
-            
-            # Filter out very large gaps that might be market closures (weekends, holidays)
-            # For M1 data, gaps larger than 24 hours are likely market closures
-            if timeframe == 'M1':
-                max_gap_threshold = timedelta(hours=24)
-                gap_indices = gap_indices[diffs[gap_indices] <= max_gap_threshold]
-                print_debug(f"Filtered gaps (removed >24h): {len(gap_indices)} remaining")
+            # Use 2x expected interval as threshold to account for minor variations;
+            # market closures (weekends, holidays) of the calendar are not counted as missing time
+            calendar = calendar if calendar is not None else self.calendar
+            gap_index = find_gaps(index, freq=expected_interval, threshold=2.0,
+                                  calendar=calendar, holidays=self.holidays)
+            print_debug(f"Gap threshold: {gap_index.frequency * 2.0} (calendar: {calendar})")
+            print_debug(f"Found {len(gap_index)} gaps")
             
             gaps = []
-            for gap_start_idx in gap_indices:
-                # Find the position in the original index
-                gap_start_pos = index.get_loc(gap_start_idx) - 1
-                gap_end_pos = index.get_loc(gap_start_idx)
+            for gap_start, gap_end in zip(gap_index.start_times(), gap_index.end_times()):
+                gap_duration = gap_end - gap_start
+                expected_points = int(gap_duration / expected_interval) - 1
                 
-                if gap_start_pos >= 0:
-                    gap_start = index[gap_start_pos]  # Previous timestamp
-                    gap_end = index[gap_end_pos]      # Current timestamp
-                    
-                    gap_duration = gap_end - gap_start
-                    expected_points = int(gap_duration / expected_interval) - 1
-                    
-                    gaps.append({
-                        'start': gap_start.isoformat(),
-                        'end': gap_end.isoformat(),
-                        'duration': str(gap_duration),
-                        'duration_seconds': gap_duration.total_seconds(),
-                        'expected_missing_points': max(0, expected_points),
-                        'gap_size': gap_duration / expected_interval
-                    })
+                gaps.append({
+                    'start': gap_start.isoformat(),
+                    'end': gap_end.isoformat(),
+                    'duration': str(gap_duration),
+                    'duration_seconds': gap_duration.total_seconds(),
+                    'expected_missing_points': max(0, expected_points),
+                    'gap_size': gap_duration / expected_interval
+                })
             
             return gaps
             
@@ -19,6 +19,7 @@ import webbrowser
 from typing import Dict, Any, Optional
 
 from src.common import logger
+from src.plotting.segment_batching import SEGMENT_TRACE_LIMIT, count_segments, nan_separated, sign_colors
 
 
 def _create_discontinuous_line_segments(x_data, y_data, mask):
@@ -179,7 +180,7 @@ def _plot_macd_indicator(indicator_fig, source, display_df):
     
     if 'macd_histogram' in display_df.columns:
         # Color histogram bars - same as fastest mode
-        colors = ['green' if val >= 0 else 'red' for val in display_df['macd_histogram']]
+        colors = sign_colors(display_df['macd_histogram'])
         display_df_copy = display_df.copy()
         display_df_copy['histogram_color'] = colors
         hist_source = ColumnDataSource(display_df_copy)
@@ -398,7 +399,7 @@ def _plot_monte_indicator(indicator_fig, source, display_df):
     # Add Monte Carlo histogram
     if 'montecarlo_histogram' in display_df.columns:
         # Color histogram bars based on values
-        colors = ['green' if val >= 0 else 'red' for val in display_df['montecarlo_histogram']]
+        colors = sign_colors(display_df['montecarlo_histogram'])
         display_df_copy = display_df.copy()
         display_df_copy['histogram_color'] = colors
         hist_source = ColumnDataSource(display_df_copy)
@@ -742,7 +743,7 @@ def _plot_putcallratio_indicator(indicator_fig, source, display_df):
         )
     # Histogram (difference between PutCallRatio and Signal)
     if 'putcallratio_histogram' in display_df.columns:
-        colors = ['green' if val >= 0 else 'red' for val in display_df['putcallratio_histogram']]
+        colors = sign_colors(display_df['putcallratio_histogram'])
         display_df_copy = display_df.copy()
         display_df_copy['histogram_color'] = colors
         hist_source = ColumnDataSource(display_df_copy)
@@ -777,7 +778,7 @@ def _plot_cot_indicator(indicator_fig, source, display_df):
         )
     # Histogram
     if 'cot_histogram' in display_df.columns:
-        colors = ['green' if val >= 0 else 'red' for val in display_df['cot_histogram']]
+        colors = sign_colors(display_df['cot_histogram'])
         display_df_copy = display_df.copy()
         display_df_copy['histogram_color'] = colors
         hist_source = ColumnDataSource(display_df_copy)
@@ -812,7 +813,7 @@ def _plot_feargreed_indicator(indicator_fig, source, display_df):
         )
     # Histogram
     if 'feargreed_histogram' in display_df.columns:
-        colors = ['green' if val >= 0 else 'red' for val in display_df['feargreed_histogram']]
+        colors = sign_colors(display_df['feargreed_histogram'])
         display_df_copy = display_df.copy()
         display_df_copy['histogram_color'] = colors
         hist_source = ColumnDataSource(display_df_copy)
@@ -932,77 +933,39 @@ def _plot_supertrend_indicator(indicator_fig, source, display_df):
         # The indicator chart already has its own hover tool, so this invisible line
         # was redundant and causing the "3 dates" issue
     
-    # Now draw the visual segments for styling
-    # Segmentation with signal change consideration
-    segments = []
-    color_arr = np.where(trend == 1, uptrend_color, downtrend_color)
+    # Draw the SuperTrend as one line (and glow) per color: uptrend and downtrend
+    # runs, and a two-point signal change segment at every trend flip
     idx_arr = np.array(idx)
-    st_arr = np.array(supertrend_values)
-    last_color = color_arr[0]
-    seg_x, seg_y = [idx_arr[0]], [st_arr[0]]
-    for i in range(1, len(idx_arr)):
-        current_color = color_arr[i]
-        # Signal change
-        if (trend.iloc[i] == 1 and trend.iloc[i-1] == -1) or (trend.iloc[i] == -1 and trend.iloc[i-1] == 1):
-            if len(seg_x) > 1:
-                segments.append((seg_x.copy(), seg_y.copy(), last_color))
-            # Insert yellow segment
-            segments.append(([idx_arr[i-1], idx_arr[i]], [st_arr[i-1], st_arr[i]], signal_change_color))
-            seg_x, seg_y = [idx_arr[i]], [st_arr[i]]
-            last_color = current_color
-        elif current_color != last_color:
-            segments.append((seg_x.copy(), seg_y.copy(), last_color))
-            seg_x, seg_y = [idx_arr[i-1]], [st_arr[i-1]]
-            last_color = current_color
-        seg_x.append(idx_arr[i])
-        seg_y.append(st_arr[i])
-    if len(seg_x) > 0:
-        segments.append((seg_x, seg_y, last_color))
-    
-    # Draw lines and glow with different labels in legend
-    legend_shown = {uptrend_color: False, downtrend_color: False, signal_change_color: False}
-    for seg_x, seg_y, seg_color in segments:
-        if len(seg_x) > 1:
-            # Glow
-            glow_color = seg_color + '4D'  # Add 30% opacity (4D in hex)
-            indicator_fig.line(
-                x=seg_x, y=seg_y,
-                line_color=glow_color, line_width=10, line_alpha=1.0
-            )
-            # Legend
-            if seg_color == uptrend_color:
-                legend_label = 'SuperTrend (Uptrend)'
-            elif seg_color == downtrend_color:
-                legend_label = 'SuperTrend (Downtrend)'
-            elif seg_color == signal_change_color:
-                legend_label = 'SuperTrend (Signal Change)'
-            else:
-                legend_label = 'SuperTrend'
-            show_legend = not legend_shown.get(seg_color, False)
-            legend_shown[seg_color] = True
-            line_kwargs = dict(x=seg_x, y=seg_y, line_color=seg_color, line_width=5, line_alpha=1.0)
-            if show_legend:
-                line_kwargs['legend_label'] = legend_label
-            
-            # Create line with proper source for hover
-            segment_source = ColumnDataSource({
-                'x': seg_x,
-                'y': seg_y,
-                'supertrend': seg_y  # Add supertrend column for hover
-            })
-            
-            # Update line_kwargs to use source properly
-            line_kwargs = dict(
-                x='x', y='y',  # Use column names when using source
-                source=segment_source,
-                line_color=seg_color, 
-                line_width=5, 
-                line_alpha=1.0
-            )
-            if show_legend:
-                line_kwargs['legend_label'] = legend_label
-            
-            indicator_fig.line(**line_kwargs)
+    st_arr = np.array(supertrend_values, dtype=float)
+    trend_arr = trend.to_numpy()
+    flips = np.concatenate(([False], trend_arr[1:] != trend_arr[:-1]))
+    flip_segments = flips | np.concatenate((flips[1:], [False]))
+    for seg_color, legend_label, mask in ((uptrend_color, 'SuperTrend (Uptrend)', trend_arr == 1),
+                                          (downtrend_color, 'SuperTrend (Downtrend)', trend_arr == -1),
+                                          (signal_change_color, 'SuperTrend (Signal Change)', flip_segments)):
+        if not mask.any():
+            continue
+        seg_x, seg_y = nan_separated(idx_arr, st_arr, mask)
+        # Glow
+        glow_color = seg_color + '4D'  # Add 30% opacity (4D in hex)
+        indicator_fig.line(
+            x=seg_x, y=seg_y,
+            line_color=glow_color, line_width=10, line_alpha=1.0
+        )
+        # Create line with proper source for hover
+        segment_source = ColumnDataSource({
+            'x': seg_x,
+            'y': seg_y,
+            'supertrend': seg_y  # Add supertrend column for hover
+        })
+        indicator_fig.line(
+            x='x', y='y',  # Use column names when using source
+            source=segment_source,
+            line_color=seg_color,
+            line_width=5,
+            line_alpha=1.0,
+            legend_label=legend_label
+        )
     
     # BUY/SELL signals with white outline and pulse
     buy_idx = idx_arr[(trend == 1) & (trend.shift(1) == -1)]
@@ -1032,14 +995,13 @@ def _plot_supertrend_indicator(indicator_fig, source, display_df):
             size=28, color='rgba(255, 68, 68, 0.4)', marker='circle', alpha=0.4
         )
     # Transparent trend zones
-    trend_changes = idx_arr[trend != trend.shift(1)]
-    if len(trend_changes) > 0:
+    change_positions = np.flatnonzero(trend != trend.shift(1))
+    if len(change_positions) > 0:
+        trend_changes = idx_arr[change_positions]
         for i in range(len(trend_changes)):
             start_idx = trend_changes[i]
             end_idx = trend_changes[i + 1] if i + 1 < len(trend_changes) else idx_arr[-1]
-            # Find the index of start_idx in idx_arr
-            start_idx_pos = np.where(idx_arr == start_idx)[0][0]
-            zone_color = '#00C851' if trend.iloc[start_idx_pos] == 1 else '#FF4444'
+            zone_color = '#00C851' if trend_arr[change_positions[i]] == 1 else '#FF4444'
             indicator_fig.add_layout(BoxAnnotation(
                 left=start_idx, right=end_idx,
                 fill_color=zone_color + '14', fill_alpha=0.08,  # 14 in hex = 8% opacity
@@ -1083,7 +1045,16 @@ def _plot_wave_indicator(indicator_fig, source, display_df):
             blue_mask = wave_data[plot_color_col] == 2
             
             # Create discontinuous line segments for red (BUY = 1)
-            if red_mask.any():
+            if red_mask.any() and count_segments(red_mask) > SEGMENT_TRACE_LIMIT:
+                # Signal-heavy series: one line with NaN breaks instead of a glyph per segment
+                x_values, y_values = nan_separated(wave_data.index, wave_data[plot_wave_col], red_mask)
+                indicator_fig.line(
+                    x=x_values, y=y_values,
+                    line_color='red',
+                    line_width=2,
+                    legend_label='Wave'
+                )
+            elif red_mask.any():
                 red_segments = _create_discontinuous_line_segments(
                     wave_data.index, 
                     wave_data[plot_wave_col], 
@@ -1100,7 +1071,16 @@ def _plot_wave_indicator(indicator_fig, source, display_df):
                     )
             
             # Create discontinuous line segments for blue (SELL = 2)
-            if blue_mask.any():
+            if blue_mask.any() and count_segments(blue_mask) > SEGMENT_TRACE_LIMIT:
+                # Signal-heavy series: one line with NaN breaks instead of a glyph per segment
+                x_values, y_values = nan_separated(wave_data.index, wave_data[plot_wave_col], blue_mask)
+                indicator_fig.line(
+                    x=x_values, y=y_values,
+                    line_color='blue',
+                    line_width=2,
+                    legend_label='Wave'
+                )
+            elif blue_mask.any():
                 blue_segments = _create_discontinuous_line_segments(
                     wave_data.index, 
                     wave_data[plot_wave_col], 
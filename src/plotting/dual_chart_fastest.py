@@ -17,6 +17,15 @@ import webbrowser
 from typing import Dict, Any, Optional
 
 from src.common import logger
+from src.plotting.segment_batching import SEGMENT_TRACE_LIMIT, nan_separated, segment_bounds, sign_colors
+
+# Line traces with more points than this are rendered with WebGL (Scattergl)
+SCATTERGL_POINT_THRESHOLD = 20_000
+
+
+def scatter_trace_type(n_points: int):
+    """Plotly trace class for a line of ``n_points``: Scattergl above the threshold."""
+    return go.Scattergl if n_points > SCATTERGL_POINT_THRESHOLD else go.Scatter
 
 
 def add_rsi_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
@@ -188,7 +197,7 @@ def add_macd_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
     
     if 'macd_histogram' in display_df.columns:
         # Add Histogram
-        colors = ['green' if val >= 0 else 'red' for val in display_df['macd_histogram']]
+        colors = sign_colors(display_df['macd_histogram'])
         fig.add_trace(
             go.Bar(
                 x=display_df.index,
@@ -245,7 +254,8 @@ def add_sma_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
             row=2, col=1
         )
 
-def create_discontinuous_line_traces(x_data, y_data, mask, name, color, width=2, showlegend=True):
+def create_discontinuous_line_traces(x_data, y_data, mask, name, color, width=2, showlegend=True,
+                                     batched=None):
     """
     Create line traces that are discontinuous where mask is False.
     This prevents interpolation between points where there are no signals.
@@ -258,6 +268,8 @@ def create_discontinuous_line_traces(x_data, y_data, mask, name, color, width=2,
         color: Line color
         width: Line width
         showlegend: Whether to show in legend
+        batched: Draw all segments as one trace with NaN separators; by default
+            only when the mask has more than SEGMENT_TRACE_LIMIT segments
     
     Returns:
         List of traces
@@ -267,14 +279,26 @@ def create_discontinuous_line_traces(x_data, y_data, mask, name, color, width=2,
     if not mask.any():
         return traces
     
-    # Convert mask to numpy array for easier processing
-    mask_array = mask.values
-    
     # Find continuous segments where mask is True
-    # Use numpy diff to find transitions
-    transitions = np.diff(np.concatenate(([False], mask_array, [False])).astype(int))
-    starts = np.where(transitions == 1)[0]  # Transitions from False to True
-    ends = np.where(transitions == -1)[0] - 1  # Transitions from True to False (adjust index)
+    starts, ends = segment_bounds(mask)
+    if batched is None:
+        batched = len(starts) > SEGMENT_TRACE_LIMIT
+
+    if batched:
+        # One trace for every segment of this color, broken at NaN separators
+        x_values, y_values = nan_separated(x_data, y_data, mask)
+        trace_type = scatter_trace_type(len(x_values))
+        return [trace_type(
+            x=x_values,
+            y=y_values,
+            mode='lines',
+            name=name,
+            line=dict(color=color, width=width),
+            connectgaps=False,
+            showlegend=showlegend,
+            hoverinfo='skip',
+            hovertemplate=None
+        )]
     
     # Create traces for each continuous segment
     for i, (start_idx, end_idx) in enumerate(zip(starts, ends)):
@@ -294,9 +318,6 @@ def create_discontinuous_line_traces(x_data, y_data, mask, name, color, width=2,
                 trace_name = name if i == 0 else None
                 trace_showlegend = showlegend if i == 0 else False
                 
-                # Determine color name for hover display
-                color_name = "Red (BUY)" if color == 'red' else "Blue (SELL)" if color == 'blue' else "Black (NOTRADE)"
-                
                 traces.append(go.Scatter(
                     x=segment_x,
                     y=segment_y,
@@ -386,17 +407,10 @@ def add_wave_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
             red_blue_data = display_df[red_blue_mask]
             
             # Create color array for hover display
-            hover_colors = []
-            for idx in red_blue_data.index:
-                if red_mask.loc[idx]:
-                    hover_colors.append("Red (BUY)")
-                elif blue_mask.loc[idx]:
-                    hover_colors.append("Blue (SELL)")
-                else:
-                    hover_colors.append("Unknown")
+            hover_colors = np.where(red_mask[red_blue_mask], "Red (BUY)", "Blue (SELL)")
             
             fig.add_trace(
-                go.Scatter(
+                scatter_trace_type(len(red_blue_data))(
                     x=red_blue_data.index,
                     y=red_blue_data[plot_wave_col],
                     mode='markers',  # Use markers to show only at specific points
@@ -736,7 +750,7 @@ def add_monte_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
     # Add Monte Carlo histogram
     if 'montecarlo_histogram' in display_df.columns:
         # Color histogram bars based on values
-        colors = ['green' if val >= 0 else 'red' for val in display_df['montecarlo_histogram']]
+        colors = sign_colors(display_df['montecarlo_histogram'])
         fig.add_trace(
             go.Bar(
                 x=display_df.index,
@@ -829,7 +843,7 @@ def add_kelly_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
     # Add Kelly histogram
     if 'kelly_histogram' in display_df.columns:
         # Color histogram bars based on values
-        colors = ['green' if val >= 0 else 'red' for val in display_df['kelly_histogram']]
+        colors = sign_colors(display_df['kelly_histogram'])
         fig.add_trace(
             go.Bar(
                 x=display_df.index,
@@ -1293,7 +1307,7 @@ def add_putcallratio_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None
     # Add Put/Call Ratio histogram
     if 'putcallratio_histogram' in display_df.columns:
         # Color histogram bars based on values
-        colors = ['green' if val >= 0 else 'red' for val in display_df['putcallratio_histogram']]
+        colors = sign_colors(display_df['putcallratio_histogram'])
         fig.add_trace(
             go.Bar(
                 x=display_df.index,
@@ -1386,7 +1400,7 @@ def add_cot_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
     # Add COT histogram
     if 'cot_histogram' in display_df.columns:
         # Color histogram bars based on values
-        colors = ['green' if val >= 0 else 'red' for val in display_df['cot_histogram']]
+        colors = sign_colors(display_df['cot_histogram'])
         fig.add_trace(
             go.Bar(
                 x=display_df.index,
@@ -1477,7 +1491,7 @@ def add_feargreed_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
     # Add Fear & Greed histogram (difference between main and signal)
     if 'feargreed' in display_df.columns and 'feargreed_signal' in display_df.columns:
         histogram = display_df['feargreed'] - display_df['feargreed_signal']
-        colors = ['green' if val >= 0 else 'red' for val in histogram]
+        colors = sign_colors(histogram)
         fig.add_trace(
             go.Bar(
                 x=display_df.index,
@@ -1531,6 +1545,126 @@ def add_feargreed_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
     )
 
 
+def _add_supertrend_segments(fig: go.Figure, idx, values, trend, colors, glow: bool = True) -> None:
+    """
+    Add the SuperTrend line to the secondary subplot with one trace per color.
+
+    Uptrend and downtrend runs are drawn in their colors and every trend flip is
+    highlighted by a two-point segment in the signal change color; the runs of a
+    color are joined with NaN separators instead of one trace per segment.
+
+    Args:
+        fig (go.Figure): Plotly figure object
+        idx: X values (index)
+        values: SuperTrend values
+        trend: Trend direction per bar (1 = up, -1 = down)
+        colors (tuple): (uptrend, downtrend, signal change) colors
+        glow (bool): Add a wide semi-transparent glow trace under each color
+    """
+    uptrend_color, downtrend_color, signal_change_color = colors
+    trend = np.asarray(trend)
+    flips = np.concatenate(([False], trend[1:] != trend[:-1]))
+    flip_segments = flips | np.concatenate((flips[1:], [False]))
+
+    for legend_name, color, mask in (('SuperTrend (Uptrend)', uptrend_color, trend == 1),
+                                     ('SuperTrend (Downtrend)', downtrend_color, trend == -1),
+                                     ('SuperTrend (Signal Change)', signal_change_color, flip_segments)):
+        if not mask.any():
+            continue
+        x_values, y_values = nan_separated(idx, values, mask)
+        trace_type = scatter_trace_type(len(x_values))
+        # WebGL traces do not support spline smoothing
+        line_shape = 'spline' if trace_type is go.Scatter else 'linear'
+
+        fig.add_trace(
+            trace_type(
+                x=x_values,
+                y=y_values,
+                mode='lines',
+                name=legend_name,
+                line=dict(
+                    color=color,
+                    width=5,
+                    shape=line_shape  # Smooth curve for modern look
+                ),
+                connectgaps=False,
+                showlegend=True,
+                hoverinfo='y+name',
+                hoverlabel=dict(
+                    bgcolor=color,
+                    font_size=12,
+                    font_color='white',
+                    font_family='Arial, sans-serif'
+                )
+            ),
+            row=2, col=1
+        )
+
+        if glow:
+            # Add subtle glow effect for enhanced visual appeal
+            fig.add_trace(
+                trace_type(
+                    x=x_values,
+                    y=y_values,
+                    mode='lines',
+                    name='SuperTrend Glow',
+                    line=dict(
+                        color=color.replace('0.95', '0.3'),
+                        width=10
+                    ),
+                    connectgaps=False,
+                    showlegend=False,
+                    hoverinfo='skip'
+                ),
+                row=2, col=1
+            )
+
+
+def _add_trend_zones(fig: go.Figure, idx, trend, y0: float, y1: float) -> None:
+    """
+    Shade uptrend/downtrend periods with one filled trace per trend.
+
+    Args:
+        fig (go.Figure): Plotly figure object
+        idx: X values (index)
+        trend: Trend direction per bar (1 = up, -1 = down)
+        y0 (float): Bottom of the zones
+        y1 (float): Top of the zones
+    """
+    trend = np.asarray(trend)
+    x = np.asarray(idx, dtype=object)
+    change_pos = np.flatnonzero(np.concatenate(([True], trend[1:] != trend[:-1])))
+    end_pos = np.concatenate((change_pos[1:], [len(x) - 1]))
+
+    for is_up, zone_name, zone_color in ((True, 'Uptrend Zone', 'rgba(0, 200, 81, 0.08)'),
+                                         (False, 'Downtrend Zone', 'rgba(255, 68, 68, 0.08)')):
+        selected = (trend[change_pos] == 1) == is_up
+        if not selected.any():
+            continue
+        starts, ends = x[change_pos[selected]], x[end_pos[selected]]
+        # Closed rectangles separated by None, filled as one trace
+        zone_x = np.empty((len(starts), 6), dtype=object)
+        zone_x[:, [0, 3, 4]] = starts[:, None]
+        zone_x[:, [1, 2]] = ends[:, None]
+        zone_y = np.empty((len(starts), 6), dtype=object)
+        zone_y[:, [0, 1, 4]] = y0
+        zone_y[:, [2, 3]] = y1
+        fig.add_trace(
+            go.Scatter(
+                x=zone_x.ravel(),
+                y=zone_y.ravel(),
+                mode='lines',
+                name=zone_name,
+                fill='toself',
+                fillcolor=zone_color,
+                line=dict(width=0),
+                showlegend=False,
+                hoverinfo='skip'
+            ),
+            row=2, col=1
+        )
+
+
 def add_supertrend_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
     """
     Add SuperTrend indicator to the secondary subplot.
@@ -1563,103 +1697,9 @@ def add_supertrend_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
         downtrend_color = 'rgba(255, 68, 68, 0.95)'  # Modern red for downtrend
         signal_change_color = 'rgba(255, 193, 7, 0.95)'  # Golden yellow for signal changes
         
-        # Detect signal change points
-        buy_signals = (trend == 1) & (trend.shift(1) == -1)
-        sell_signals = (trend == -1) & (trend.shift(1) == 1)
-        signal_changes = buy_signals | sell_signals
-        
-        # Create color array with signal change highlighting
-        color_arr = np.where(trend == 1, uptrend_color, downtrend_color)
-        
-        # Enhanced segmentation with signal change detection
-        segments = []
-        last_color = color_arr[0]
-        seg_x, seg_y = [idx[0]], [st.iloc[0]]
-        
-        for i in range(1, len(idx)):
-            current_color = color_arr[i]
-            
-            # Check if this is a signal change point
-            if signal_changes.iloc[i]:
-                # Add previous segment
-                if len(seg_x) > 1:
-                    segments.append((seg_x.copy(), seg_y.copy(), last_color))
-                
-                # Add signal change point with golden color
-                segments.append(([idx[i-1], idx[i]], [st.iloc[i-1], st.iloc[i]], signal_change_color))
-                
-                # Start new segment
-                seg_x, seg_y = [idx[i]], [st.iloc[i]]
-                last_color = current_color
-            elif current_color != last_color:
-                # Regular trend change (not a signal)
-                segments.append((seg_x.copy(), seg_y.copy(), last_color))
-                seg_x, seg_y = [idx[i-1]], [st.iloc[i-1]]
-                last_color = current_color
-            
-            seg_x.append(idx[i])
-            seg_y.append(st.iloc[i])
-        
-        # Add final segment
-        if len(seg_x) > 0:
-            segments.append((seg_x, seg_y, last_color))
-        
-        # Add SuperTrend line segments with enhanced styling
-        legend_shown = {uptrend_color: False, downtrend_color: False, signal_change_color: False}
-        for seg_x, seg_y, seg_color in segments:
-            # Main SuperTrend line with smooth curve
-            # Determine legend name based on color
-            if seg_color == uptrend_color:
-                legend_name = 'SuperTrend (Uptrend)'
-            elif seg_color == downtrend_color:
-                legend_name = 'SuperTrend (Downtrend)'
-            elif seg_color == signal_change_color:
-                legend_name = 'SuperTrend (Signal Change)'
-            else:
-                legend_name = 'SuperTrend'
-            
-            show_legend = not legend_shown.get(seg_color, False)
-            legend_shown[seg_color] = True
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=seg_x,
-                    y=seg_y,
-                    mode='lines',
-                    name=legend_name,
-                    line=dict(
-                        color=seg_color,
-                        width=5,
-                        shape='spline'  # Smooth curve for modern look
-                    ),
-                    showlegend=show_legend,
-                    hoverinfo='y+name',
-                    hoverlabel=dict(
-                        bgcolor=seg_color,
-                        font_size=12,
-                        font_color='white',
-                        font_family='Arial, sans-serif'
-                    )
-                ),
-                row=2, col=1
-            )
-            
-            # Add subtle glow effect for enhanced visual appeal
-            fig.add_trace(
-                go.Scatter(
-                    x=seg_x,
-                    y=seg_y,
-                    mode='lines',
-                    name='SuperTrend Glow',
-                    line=dict(
-                        color=seg_color.replace('0.95', '0.3'),
-                        width=10
-                    ),
-                    showlegend=False,
-                    hoverinfo='skip'
-                ),
-                row=2, col=1
-            )
+        # SuperTrend line, one trace (and glow) per color
+        _add_supertrend_segments(fig, idx, st, trend,
+                                 (uptrend_color, downtrend_color, signal_change_color))
         
         # Enhanced trend change markers with modern styling
         buy_idx = idx[(trend == 1) & (trend.shift(1) == -1)]
@@ -1766,22 +1806,7 @@ def add_supertrend_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
         # Add trend background zones for better visual context
         trend_changes = idx[trend != trend.shift(1)]
         if len(trend_changes) > 0:
-            for i in range(len(trend_changes)):
-                start_idx = trend_changes[i]
-                end_idx = trend_changes[i + 1] if i + 1 < len(trend_changes) else idx[-1]
-                
-                zone_color = 'rgba(0, 200, 81, 0.08)' if trend.loc[start_idx] == 1 else 'rgba(255, 68, 68, 0.08)'
-                
-                fig.add_shape(
-                    type="rect",
-                    x0=start_idx,
-                    x1=end_idx,
-                    y0=st.min() * 0.995,
-                    y1=st.max() * 1.005,
-                    fillcolor=zone_color,
-                    line=dict(width=0),
-                    row=2, col=1
-                )
+            _add_trend_zones(fig, idx, trend, st.min() * 0.995, st.max() * 1.005)
                 
     elif 'supertrend' in display_df.columns:
         # Enhanced fallback: modern single line
@@ -1827,86 +1852,9 @@ def add_supertrend_indicator(fig: go.Figure, display_df: pd.DataFrame) -> None:
         downtrend_color = 'rgba(255, 68, 68, 0.95)'  # Modern red for downtrend
         signal_change_color = 'rgba(255, 193, 7, 0.95)'  # Golden yellow for signal changes
         
-        # Detect signal change points
-        buy_signals = (trend == 1) & (trend.shift(1) == -1)
-        sell_signals = (trend == -1) & (trend.shift(1) == 1)
-        signal_changes = buy_signals | sell_signals
-        
-        # Create color array with signal change highlighting
-        color_arr = np.where(trend == 1, uptrend_color, downtrend_color)
-        
-        # Enhanced segmentation with signal change detection
-        segments = []
-        last_color = color_arr[0]
-        seg_x, seg_y = [idx[0]], [supertrend_values[0]]
-        
-        for i in range(1, len(idx)):
-            current_color = color_arr[i]
-            
-            # Check if this is a signal change point
-            if signal_changes.iloc[i]:
-                # Add previous segment
-                if len(seg_x) > 1:
-                    segments.append((seg_x.copy(), seg_y.copy(), last_color))
-                
-                # Add signal change point with golden color
-                segments.append(([idx[i-1], idx[i]], [supertrend_values[i-1], supertrend_values[i]], signal_change_color))
-                
-                # Start new segment
-                seg_x, seg_y = [idx[i]], [supertrend_values[i]]
-                last_color = current_color
-            elif current_color != last_color:
-                # Regular trend change (not a signal)
-                segments.append((seg_x.copy(), seg_y.copy(), last_color))
-                seg_x, seg_y = [idx[i-1]], [supertrend_values[i-1]]
-                last_color = current_color
-            
-            seg_x.append(idx[i])
-            seg_y.append(supertrend_values[i])
-        
-        # Add final segment
-        if len(seg_x) > 0:
-            segments.append((seg_x, seg_y, last_color))
-        
-        # Add SuperTrend line segments with enhanced styling
-        legend_shown = {uptrend_color: False, downtrend_color: False, signal_change_color: False}
-        for seg_x, seg_y, seg_color in segments:
-            # Main SuperTrend line with smooth curve
-            # Determine legend name based on color
-            if seg_color == uptrend_color:
-                legend_name = 'SuperTrend (Uptrend)'
-            elif seg_color == downtrend_color:
-                legend_name = 'SuperTrend (Downtrend)'
-            elif seg_color == signal_change_color:
-                legend_name = 'SuperTrend (Signal Change)'
-            else:
-                legend_name = 'SuperTrend'
-            
-            show_legend = not legend_shown.get(seg_color, False)
-            legend_shown[seg_color] = True
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=seg_x,
-                    y=seg_y,
-                    mode='lines',
-                    name=legend_name,
-                    line=dict(
-                        color=seg_color,
-                        width=5,
-                        shape='spline'  # Smooth curve for modern look
-                    ),
-                    showlegend=show_legend,
-                    hoverinfo='y+name',
-                    hoverlabel=dict(
-                        bgcolor=seg_color,
-                        font_size=12,
-                        font_color='white',
-                        font_family='Arial, sans-serif'
-                    )
-                ),
-                row=2, col=1
-            )
+        # SuperTrend line, one trace per color
+        _add_supertrend_segments(fig, idx, supertrend_values, trend,
+                                 (uptrend_color, downtrend_color, signal_change_color), glow=False)
 
 
 def plot_dual_chart_fastest(
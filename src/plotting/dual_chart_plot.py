@@ -53,6 +53,7 @@ from .dual_chart_fast import plot_dual_chart_fast
 from .dual_chart_mpl import plot_dual_chart_mpl
 from .dual_chart_seaborn import plot_dual_chart_seaborn
 from .dual_chart_terminal import plot_dual_chart_terminal
+from .plot_downsampling import downsample_for_plot
 
 
 def is_dual_chart_rule(rule: str) -> bool:
@@ -854,6 +855,10 @@ def plot_dual_chart_results(
         df_with_indicator = calculate_additional_indicator(df, rule)
         logger.print_info(f"[dual_chart_plot] After calculation: {len(df_with_indicator.columns)} columns")
     
+    # Decimate after the indicators are calculated on the full data
+    if mode != 'term':
+        df_with_indicator = downsample_for_plot(df_with_indicator, target_width=width)
+
     # Create layout configuration
     layout = create_dual_chart_layout(mode, rule)
     
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# src/plotting/plot_downsampling.py
+
+"""
+Level-of-detail downsampling shared by the graphical plotting backends.
+
+A chart can only show about one bar per horizontal pixel, yet every backend
+used to push every row into its traces, so multi-million row charts produced
+HTML files of hundreds of MB. ``downsample_for_plot`` reduces a result frame
+to the rows that are visible at the target width using M4 decimation: the
+rows are split into one bucket per pixel and for every bucket the first and
+last rows (bucket open/close), the row holding the High maximum, the row
+holding the Low minimum and the min/max rows of every other numeric column
+are kept. Rows where a signal column (Direction, *_signal) changes value are
+always kept, so no trend switch disappears from the chart; sparse signal
+columns additionally keep every BUY/SELL row.
+
+Indicators must be calculated on the full frame *before* it is downsampled.
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.common import logger
+from src.common.constants import NOTRADE
+
+# Width of the dual charts; a little wider than most monitors' plot area
+DEFAULT_TARGET_WIDTH = 1800
+# M4 keeps up to 4 rows per pixel bucket, so smaller frames are left untouched
+MIN_ROWS_PER_PIXEL = 4
+
+SIGNAL_COLUMN_NAMES = ('direction', '_direction', 'signal', '_signal', 'signals')
+
+
+def is_signal_column(name: str, values: np.ndarray) -> bool:
+    """
+    Check whether a column holds discrete signal codes (BUY/SELL/NOTRADE, +-1 trend).
+
+    Args:
+        name (str): Column name
+        values (np.ndarray): Column values as float
+
+    Returns:
+        bool: True for signal-named columns whose values are all integral
+    """
+    lowered = str(name).lower()
+    if lowered not in SIGNAL_COLUMN_NAMES and not lowered.endswith(('_signal', '_direction')):
+        return False
+    finite = values[np.isfinite(values)]
+    return bool(np.all(finite == np.round(finite)))
+
+
+def bucket_extremes(values: np.ndarray, bucket_size: int) -> tuple:
+    """
+    Row positions of the maximum and minimum of every bucket of ``bucket_size`` rows.
+
+    NaN values are ignored; an all-NaN bucket reports its first row.
+
+    Args:
+        values (np.ndarray): 1D float values
+        bucket_size (int): Rows per bucket
+
+    Returns:
+        tuple: (argmax positions, argmin positions), one entry per bucket
+    """
+    n = len(values)
+    n_buckets = -(-n // bucket_size)
+    pad = n_buckets * bucket_size - n
+    nan = np.isnan(values)
+    high = np.pad(np.where(nan, -np.inf, values), (0, pad), constant_values=-np.inf)
+    low = np.pad(np.where(nan, np.inf, values), (0, pad), constant_values=np.inf)
+    offsets = np.arange(n_buckets) * bucket_size
+    argmax = np.minimum(offsets + high.reshape(n_buckets, bucket_size).argmax(axis=1), n - 1)
+    argmin = np.minimum(offsets + low.reshape(n_buckets, bucket_size).argmin(axis=1), n - 1)
+    return argmax, argmin
+
+
+def signal_rows(values: np.ndarray, max_signal_rows: int) -> np.ndarray:
+    """
+    Row positions of a signal column that must survive decimation.
+
+    Value changes are always kept. Every non-NOTRADE row is kept as well unless the
+    column holds more of them than ``max_signal_rows`` (a dense trend state such as
+    "price above SMA"), where the changes alone describe the series.
+
+    Args:
+        values (np.ndarray): 1D float signal values
+        max_signal_rows (int): Maximum number of active rows kept individually
+
+    Returns:
+        np.ndarray: Row positions (unsorted, may contain duplicates)
+    """
+    changes = signal_change_rows(values)
+    active = np.flatnonzero(np.nan_to_num(values, nan=NOTRADE) != NOTRADE)
+    if len(active) > max_signal_rows:
+        return changes
+    return np.concatenate((changes, active))
+
+
+def signal_change_rows(values: np.ndarray) -> np.ndarray:
+    """
+    Row positions where a signal column changes value (NaN to NaN is no change).
+
+    Args:
+        values (np.ndarray): 1D float signal values
+
+    Returns:
+        np.ndarray: Positions of the changes (the first row is always included)
+    """
+    if len(values) == 0:
+        return np.empty(0, dtype=np.int64)
+    prev = values[:-1]
+    curr = values[1:]
+    same = (curr == prev) | (np.isnan(curr) & np.isnan(prev))
+    return np.concatenate(([0], np.flatnonzero(~same) + 1))
+
+
+def m4_row_positions(df: pd.DataFrame, n_buckets: int,
+                     signal_columns: Optional[Iterable[str]] = None) -> np.ndarray:
+    """
+    Sorted row positions kept by M4 decimation of ``df`` into ``n_buckets`` buckets.
+
+    Args:
+        df (pd.DataFrame): Result frame (OHLCV plus indicator columns)
+        n_buckets (int): Number of buckets (horizontal pixels)
+        signal_columns (Iterable[str], optional): Signal columns whose changes must be
+            kept; detected from the column names when omitted
+
+    Returns:
+        np.ndarray: Row positions in ascending order
+    """
+    n = len(df)
+    bucket_size = max(1, -(-n // max(1, n_buckets)))
+    starts = np.arange(0, n, bucket_size)
+    keep: List[np.ndarray] = [starts, np.minimum(starts + bucket_size - 1, n - 1)]
+
+    numeric = df.select_dtypes(include=[np.number, 'bool'])
+    explicit_signals = set(signal_columns) if signal_columns is not None else None
+    for col in numeric.columns:
+        values = numeric[col].to_numpy(dtype=float)
+        lowered = str(col).lower()
+        if explicit_signals is not None:
+            is_signal = col in explicit_signals
+        else:
+            is_signal = is_signal_column(col, values)
+        if is_signal:
+            keep.append(signal_rows(values, n_buckets * MIN_ROWS_PER_PIXEL))
+            continue
+        argmax, argmin = bucket_extremes(values, bucket_size)
+        if lowered == 'high':
+            keep.append(argmax)
+        elif lowered == 'low':
+            keep.append(argmin)
+        elif lowered not in ('open', 'close'):
+            # Open/Close are represented by the first/last row of each bucket
+            keep.extend((argmax, argmin))
+    return np.unique(np.concatenate(keep))
+
+
+def downsample_for_plot(df: pd.DataFrame, target_width: int = DEFAULT_TARGET_WIDTH,
+                        signal_columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Reduce a result frame to the rows visible at ``target_width`` pixels.
+
+    Frames with fewer than ``MIN_ROWS_PER_PIXEL * target_width`` rows are returned
+    unchanged (the same object).
+
+    Args:
+        df (pd.DataFrame): Result frame with indicators already calculated
+        target_width (int): Plot width in pixels
+        signal_columns (Iterable[str], optional): Signal columns to preserve; detected
+            from the column names when omitted
+
+    Returns:
+        pd.DataFrame: Original frame or the decimated rows in their original order
+    """
+    if df is None or target_width is None or target_width <= 0:
+        return df
+    if len(df) <= MIN_ROWS_PER_PIXEL * target_width:
+        return df
+    positions = m4_row_positions(df, target_width, signal_columns)
+    logger.print_info(f"Downsampled {len(df):,} rows to {len(positions):,} for a "
+                      f"{target_width}px wide plot (M4 decimation)")
+    return df.iloc[positions]
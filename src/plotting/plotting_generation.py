@@ -13,6 +13,7 @@ from .fixed_term_phld_plot import safe_plot_phld_terminal  # Fixed version witho
 from src.calculation.core_calculations import calculate_hl, calculate_pressure, calculate_pv
 from src.calculation.indicator_calculation import calculate_indicator
 from src.plotting.term_auto_plot import auto_plot_from_dataframe  # Auto plotting function
+from src.plotting.plot_downsampling import downsample_for_plot  # Level-of-detail decimation
 import plotext as plt  # Add import for plotext
 from typing import List, Dict, Optional, Union, Tuple  # Add necessary types from typing module
 
@@ -798,17 +799,21 @@ def generate_plot(args, data_info, result_df, selected_rule, point_size, estimat
                 use_dual_chart = True
                 logger.print_info(f"Detected {indicator_name} command with parameters, using dual chart plotting for {draw_mode} mode")
         
+        # Graphical backends cannot show more than a few rows per pixel; terminal
+        # plots page through the full data in chunks instead
+        plot_df = result_df if draw_mode == 'term' else downsample_for_plot(result_df)
+
         if use_dual_chart:
             # Use dual chart plotting for RSI and MACD commands with parameters
             from src.plotting.dual_chart_plot import plot_dual_chart_results
             mode = 'mpl' if draw_mode in ['mpl', 'mplfinance'] else 'sb'
             plot_dual_chart_results(result_df, rule_str, plot_title, mode=mode)
         elif draw_mode in ['mplfinance', 'mpl']:
-            generate_mplfinance_plot(result_df, selected_rule, plot_title)
+            generate_mplfinance_plot(plot_df, selected_rule, plot_title)
         elif draw_mode in ['seaborn', 'sb']:
-            generate_seaborn_plot(result_df, selected_rule, plot_title)
+            generate_seaborn_plot(plot_df, selected_rule, plot_title)
         elif draw_mode == 'fast':
-            generate_fast_plot(result_df, selected_rule, plot_title, args)
+            generate_fast_plot(plot_df, selected_rule, plot_title, args)
         elif draw_mode == 'term':
             # If no rule is specified, default to OHLCV rule for terminal mode
             if selected_rule is None or (isinstance(selected_rule, str) and selected_rule.lower() == 'none'):
@@ -819,7 +824,7 @@ def generate_plot(args, data_info, result_df, selected_rule, point_size, estimat
             # Pass args and data_info to terminal plot function
             generate_term_plot(result_df, selected_rule, plot_title, args, data_info)
         else:
-            generate_plotly_plot(result_df, selected_rule, plot_title, data_info)
+            generate_plotly_plot(plot_df, selected_rule, plot_title, data_info)
     except Exception as e:
         # Log error with exception type and message
         logger.print_error(f"An error occurred during plot generation: {type(e).__name__}: {e}")
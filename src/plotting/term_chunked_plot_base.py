@@ -8,9 +8,10 @@ Contains common functions used across all plotting modules.
 
 import sys
 import re
+import numpy as np
 import pandas as pd
 import plotext as plt
-from typing import Tuple, Dict, Any, List
+from typing import Tuple, Dict, Any, List, Optional
 
 # Use absolute imports when possible, fallback to relative
 try:
@@ -81,11 +82,83 @@ def calculate_optimal_chunk_size(
     return max(min_chunk_size, chunk_size)
 
 
+class LazyChunkView:
+    """
+    Sequence of dataFrame chunks that only computes the chunk boundaries.
+
+    A chunk is sliced (and copied) when it is accessed, so opening the navigation
+    over a 100k-bar dataFrame does not materialize every chunk up front. The view
+    supports len(), indexing (including negative indexes) and iteration like the
+    list returned by split_dataframe_into_chunks.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame], chunk_size: int):
+        """
+        Args:
+        df (pd.DataFrame): dataFrame to split
+        chunk_size (int): Size of each chunk
+        """
+        self.df = df if df is not None else pd.DataFrame()
+        self.chunk_size = max(1, int(chunk_size))
+        self.starts = np.arange(0, len(self.df), self.chunk_size)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _position(self, chunk_index: int) -> int:
+        if chunk_index < 0:
+            chunk_index += len(self)
+        if not 0 <= chunk_index < len(self):
+            raise IndexError(f"chunk index {chunk_index} out of range")
+        return chunk_index
+
+    def bounds(self, chunk_index: int) -> Tuple[int, int]:
+        """Row positions [start, end) of a chunk."""
+        start = int(self.starts[self._position(chunk_index)])
+        return start, min(start + self.chunk_size, len(self.df))
+
+    def index_bounds(self, chunk_index: int) -> Tuple[Any, Any]:
+        """First and last index labels of a chunk, without slicing it."""
+        start, end = self.bounds(chunk_index)
+        return self.df.index[start], self.df.index[end - 1]
+
+    def __getitem__(self, chunk_index):
+        if isinstance(chunk_index, slice):
+            return [self[i] for i in range(len(self))[chunk_index]]
+        start, end = self.bounds(chunk_index)
+        return self.df.iloc[start:end].copy()
+
+    def __iter__(self):
+        for chunk_index in range(len(self)):
+            yield self[chunk_index]
+
+    def find_chunk(self, label: Any) -> Optional[int]:
+        """
+        Index of the chunk containing an index label (exact or nearest earlier label).
+
+        Returns:
+        Optional[int]: Chunk index, or None when the label lies outside the data or
+        the index is not sorted
+        """
+        index = self.df.index
+        if len(index) == 0 or not index.is_monotonic_increasing:
+            return None
+        try:
+            if label < index[0] or label > index[-1]:
+                return None
+            position = int(index.searchsorted(label, side='right')) - 1
+        except TypeError:
+            return None
+        return position // self.chunk_size
+
+
 def split_dataframe_into_chunks(df: pd.DataFrame,
                                 chunk_size: int) -> List[pd.DataFrame]:
     """
     Split dataFrame into chunks of specified size.
 
+    Materializes every chunk; the plot_*_chunks functions use LazyChunkView.
+
     Args:
     df (pd.DataFrame): dataFrame to split
     chunk_size (int): Size of each chunk
@@ -96,15 +169,7 @@ def split_dataframe_into_chunks(df: pd.DataFrame,
     if df is None or df.empty:
         return []
 
-    chunks = []
-    total_rows = len(df)
-
-    for start_idx in range(0, total_rows, chunk_size):
-        end_idx = min(start_idx + chunk_size, total_rows)
-        chunk = df.iloc[start_idx:end_idx].copy()
-        chunks.append(chunk)
-
-    return chunks
+    return list(LazyChunkView(df, chunk_size))
 
 
 def parse_rsi_rule(rule_str: str) -> Tuple[str, Dict[str, Any]]:
@@ -40,7 +40,7 @@ except ImportError:
 from .term_chunked_plot_base import (
     get_terminal_plot_size,
     calculate_optimal_chunk_size,
-    split_dataframe_into_chunks,
+    LazyChunkView,
     parse_rsi_rule,
     draw_ohlc_candles
 )
@@ -85,14 +85,14 @@ def plot_phld_chunks(df: pd.DataFrame, title: str = "PHLD Chunks", style: str =
         # Calculate optimal chunk size
         total_rows = len(df)
         chunk_size = calculate_optimal_chunk_size(total_rows)
-        chunks = split_dataframe_into_chunks(df, chunk_size)
+        chunks = LazyChunkView(df, chunk_size)
 
         logger.print_info(
             f"Split {total_rows} rows into {len(chunks)} chunks of ~{chunk_size} candles each")
 
         if Use_Navigation:
             # Use Navigation system
-            navigator = TerminalNavigator(chunks, title)
+            navigator = TerminalNavigator(chunks, title, prefetch=True)
 
             def plot_chunk_with_Navigation(
                     chunk: pd.DataFrame,
@@ -6,9 +6,12 @@ Terminal navigation system for chunked plotting.
 Provides interactive navigation controls for viewing data chunks.
 """
 
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import pandas as pd
 import plotext as plt
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Hashable, Tuple
 import re
 from datetime import datetime, date
 import sys
@@ -50,25 +53,74 @@ except ImportError:
             NOTRADE = "NOTRADE"
 
 
+class _ThreadOutputRouter:
+    """
+    sys.stdout replacement that sends the output of capturing threads to a buffer.
+
+    plotext and the logger print to sys.stdout; while a frame is rendered (in the
+    main thread or the prefetch thread) its output is captured so it can be cached,
+    while everything else (navigation prompt, input echo) goes to the real stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, 'buffer', None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def capture(self, render: Callable[[], None]) -> str:
+        """Run ``render`` and return everything it printed from this thread."""
+        self._local.buffer = io.StringIO()
+        try:
+            render()
+            return self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
 class TerminalNavigator:
     """
     Interactive terminal navigator for chunked data viewing.
     Supports navigation commands: n/p/s/e/c for next/previous/start/end/choose.
+
+    Rendered frames of the current chunk and its neighbours are cached, and with
+    ``prefetch`` the next chunk is rendered in a background thread while the prompt
+    waits for input, so paging does not recompute plots and overlays.
     """
-    
-    def __init__(self, chunks: List[pd.DataFrame], title: str = "Terminal Navigation"):
+
+    def __init__(self, chunks: List[pd.DataFrame], title: str = "Terminal Navigation",
+                 prefetch: bool = False):
         """
         Initialize the terminal navigator.
         
         Args:
-            chunks (List[pd.DataFrame]): List of data chunks
+            chunks (List[pd.DataFrame] | LazyChunkView): Data chunks (a list or a lazy view)
             title (str): Navigation title
+            prefetch (bool): Render the next chunk in the background while waiting for input
         """
         self.chunks = chunks
         self.title = title
+        self.prefetch = prefetch
         self.current_chunk_index = 0
         self.total_chunks = len(chunks)
         self.navigation_active = True
+
+        # Rendered frames keyed by (chunk index, view state); plotext keeps global
+        # figure state, so renders are serialized by a lock
+        self._frames: Dict[Tuple[int, Hashable], str] = {}
+        self._pending: Dict[Tuple[int, Hashable], Future] = {}
+        self._render_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._output: Optional[_ThreadOutputRouter] = None
         
         # Navigation commands mapping
         self.commands = {
@@ -159,6 +211,17 @@ class TerminalNavigator:
                 logger.print_error("Invalid date format. Use YYYY-MM-DD or YYYY-MM-DD HH:MM")
                 return True  # Continue navigation instead of exiting
             
+            # Lazy views locate the chunk with a binary search on the index
+            if hasattr(self.chunks, 'find_chunk'):
+                chunk_index = self.chunks.find_chunk(pd.Timestamp(target_date))
+                if chunk_index is not None:
+                    self.current_chunk_index = chunk_index
+                    logger.print_success(f"Found date in chunk {chunk_index+1}")
+                    return True
+                if self.chunks.df.index.is_monotonic_increasing:
+                    logger.print_warning(f"Date {date_input} not found in any chunk")
+                    return True
+
             # Find chunk containing the target date
             for i, chunk in enumerate(self.chunks):
                 if len(chunk) > 0:
@@ -225,10 +288,26 @@ class TerminalNavigator:
     
     def get_current_chunk_info(self) -> Dict[str, Any]:
         """Get information about current chunk."""
-        chunk = self.get_current_chunk()
+        return self.get_chunk_info(self.current_chunk_index)
+
+    def get_chunk_info(self, chunk_index: int) -> Dict[str, Any]:
+        """Get information about a chunk."""
+        if hasattr(self.chunks, 'index_bounds'):
+            # Lazy view: no need to slice the chunk for its dates
+            start, end = self.chunks.bounds(chunk_index)
+            start_date, end_date = self.chunks.index_bounds(chunk_index)
+            return {
+                'index': chunk_index + 1,
+                'total': self.total_chunks,
+                'start_date': start_date,
+                'end_date': end_date,
+                'rows': end - start
+            }
+
+        chunk = self.chunks[chunk_index]
         if len(chunk) == 0:
             return {
-                'index': self.current_chunk_index + 1,
+                'index': chunk_index + 1,
                 'total': self.total_chunks,
                 'start_date': 'N/A',
                 'end_date': 'N/A',
@@ -239,7 +318,7 @@ class TerminalNavigator:
         end_date = chunk.index[-1] if len(chunk) > 0 else "N/A"
         
         return {
-            'index': self.current_chunk_index + 1,
+            'index': chunk_index + 1,
             'total': self.total_chunks,
             'start_date': start_date,
             'end_date': end_date,
@@ -289,6 +368,51 @@ class TerminalNavigator:
         logger.print_warning(f"Unknown command '{user_input}'. Type 'n/p/s/e/c/d/q' for navigation.")
         return True
     
+    def _view_state(self) -> Hashable:
+        """State besides the chunk index that changes the rendered frame."""
+        return None
+
+    def _render_frame(self, plot_function: Callable, chunk_index: int) -> str:
+        """Render a chunk and return the captured terminal output."""
+        with self._render_lock:
+            chunk = self.chunks[chunk_index]
+            chunk_info = self.get_chunk_info(chunk_index)
+            return self._output.capture(lambda: plot_function(chunk, chunk_index, chunk_info))
+
+    def _get_frame(self, plot_function: Callable, chunk_index: int) -> str:
+        """Cached frame of a chunk, waiting for its prefetch or rendering it now."""
+        key = (chunk_index, self._view_state())
+        if key not in self._frames:
+            pending = self._pending.pop(key, None)
+            try:
+                frame = pending.result() if pending is not None else None
+            except Exception:
+                # Prefetch failed; render in the foreground so errors surface normally
+                frame = None
+            self._frames[key] = frame if frame is not None else self._render_frame(plot_function, chunk_index)
+        return self._frames[key]
+
+    def _retain_neighbour_frames(self) -> None:
+        """Drop cached frames except the current chunk's and its neighbours'."""
+        state = self._view_state()
+        keep = {(i, state) for i in (self.current_chunk_index - 1, self.current_chunk_index,
+                                     self.current_chunk_index + 1)}
+        for key in [k for k in self._frames if k not in keep]:
+            del self._frames[key]
+        for key in [k for k in self._pending if k not in keep]:
+            self._pending.pop(key).cancel()
+
+    def _prefetch(self, plot_function: Callable, chunk_index: int) -> None:
+        """Render a chunk in the background unless it is cached or out of range."""
+        if not self.prefetch or not 0 <= chunk_index < self.total_chunks:
+            return
+        key = (chunk_index, self._view_state())
+        if key in self._frames or key in self._pending:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chunk-prefetch')
+        self._pending[key] = self._executor.submit(self._render_frame, plot_function, chunk_index)
+
     def navigate(self, plot_function: Callable[[pd.DataFrame, int, Dict[str, Any]], None]) -> None:
         """
         Main navigation loop.
@@ -296,25 +420,40 @@ class TerminalNavigator:
         Args:
             plot_function: Function to call for plotting each chunk
         """
-        while self.navigation_active and self.current_chunk_index < self.total_chunks:
-            # Get current chunk info
-            chunk_info = self.get_current_chunk_info()
-            current_chunk = self.get_current_chunk()
-            
-            # Plot current chunk
-            plot_function(current_chunk, self.current_chunk_index, chunk_info)
-            
-            # Note: We don't automatically exit when reaching the end
-            # User can continue navigating even at the last chunk
-            
-            # Show navigation prompt
-            user_input = self.show_navigation_prompt()
-            
-            # Process navigation input
-            if not self.process_navigation_input(user_input):
-                # If process_navigation_input returns False, it means we should quit
-                break
-        
+        self._output = _ThreadOutputRouter(sys.stdout)
+        sys.stdout = self._output
+        try:
+            while self.navigation_active and self.current_chunk_index < self.total_chunks:
+                # Plot current chunk (from the frame cache when available)
+                frame = self._get_frame(plot_function, self.current_chunk_index)
+                self._output.stream.write(frame)
+                self._output.stream.flush()
+
+                # Keep the neighbours cached and render the next chunk while waiting
+                self._retain_neighbour_frames()
+                self._prefetch(plot_function, self.current_chunk_index + 1)
+
+                # Note: We don't automatically exit when reaching the end
+                # User can continue navigating even at the last chunk
+
+                # Show navigation prompt
+                user_input = self.show_navigation_prompt()
+
+                # Process navigation input
+                if not self.process_navigation_input(user_input):
+                    # If process_navigation_input returns False, it means we should quit
+                    break
+        finally:
+            for pending in self._pending.values():
+                pending.cancel()
+            self._pending.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            self._frames.clear()
+            sys.stdout = self._output.stream
+            self._output = None
+
         if self.navigation_active:
             logger.print_success("Navigation completed successfully!")
 
@@ -395,6 +534,10 @@ class AutoTerminalNavigator(TerminalNavigator):
     """
     Extended terminal navigator for AUTO mode with field array switching.
     Supports switching between different field arrays (OHLC, pressure_high, pressure_low, etc.).
+
+    The plot function reads the selected field when it runs, so a background render
+    could pick up a field switched in the meantime; frames are cached per field but
+    not prefetched.
     """
     
     def __init__(self, chunks: List[pd.DataFrame], title: str = "AUTO Terminal Navigation", field_columns: List[str] = None):
@@ -521,6 +664,9 @@ class AutoTerminalNavigator(TerminalNavigator):
             logger.print_warning("Already at the first field group")
             return False
     
+    def _view_state(self) -> Hashable:
+        return (self.current_group_index, self.current_field_index)
+
     def get_current_field(self) -> str:
         """Get the current field name."""
         if self.total_groups == 0:
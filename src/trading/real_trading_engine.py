@@ -93,6 +93,36 @@ class Trade:
     commission: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+class BarView:
+    """
+    Lightweight read-only view of one bar for fast backtests.
+    
+    Supports the parts of the pd.Series row API that strategies use
+    (row['close'], row.get('close'), 'close' in row.index, row.name)
+    while reading values straight from columns extracted once per backtest.
+    """
+    __slots__ = ('_columns', '_position', 'index', 'name')
+    
+    def __init__(self, columns: Dict[str, list], index: pd.Index, position: int, name: Any = None):
+        self._columns = columns
+        self._position = position
+        self.index = index
+        self.name = name
+    
+    def __getitem__(self, key):
+        return self._columns[key][self._position]
+    
+    def __contains__(self, key) -> bool:
+        return key in self._columns
+    
+    def get(self, key, default=None):
+        column = self._columns.get(key)
+        return default if column is None else column[self._position]
+    
+    def to_series(self) -> pd.Series:
+        """Builds the equivalent pd.Series row."""
+        return pd.Series({key: column[self._position] for key, column in self._columns.items()}, name=self.name)
+
 class BacktestEngine:
     """Backtesting engine for historical data analysis."""
     
@@ -107,8 +137,15 @@ class BacktestEngine:
         self.current_time = None
         
     def run_backtest(self, data: pd.DataFrame, strategy: Callable, 
-                    start_date: datetime, end_date: datetime) -> Dict[str, Any]:
-        """Run backtest with historical data."""
+                    start_date: datetime, end_date: datetime, fast: bool = False) -> Dict[str, Any]:
+        """
+        Run backtest with historical data.
+        
+        With fast=True the bars are read from columns extracted once, the
+        strategy receives a BarView instead of a pd.Series and the portfolio
+        history is kept in preallocated arrays; fills and P&L are the same as
+        in the default per-row mode.
+        """
         try:
             logger.info(f"Starting backtest from {start_date} to {end_date}")
             
@@ -125,6 +162,16 @@ class BacktestEngine:
             # Initialize portfolio
             self._initialize_portfolio()
             
+            if fast:
+                history = self._run_bars_fast(backtest_data, strategy)
+                results = self._calculate_backtest_results(history)
+                logger.info(f"Backtest completed. Final portfolio value: ${results['final_value']:.2f}")
+                return {
+                    'status': 'success',
+                    'results': results,
+                    'message': 'Backtest completed successfully'
+                }
+            
             # Run strategy for each time step
             for timestamp, row in backtest_data.iterrows():
                 self.current_time = timestamp
@@ -164,6 +211,89 @@ class BacktestEngine:
                 'message': f'Backtest failed: {str(e)}'
             }
     
+    def _run_bars_fast(self, backtest_data: pd.DataFrame, strategy: Callable) -> pd.DataFrame:
+        """
+        Runs the strategy over all bars using extracted columns and preallocated history arrays.
+        
+        Only orders that are still pending are checked on each bar, in placement order.
+        
+        The per-bar states are also stored in portfolio_history, as in the per-row mode.
+        
+        Returns:
+            pd.DataFrame: Portfolio history indexed by timestamp
+        """
+        columns = {column: backtest_data[column].tolist() for column in backtest_data.columns}
+        column_index = backtest_data.columns
+        timestamps = backtest_data.index
+        n_bars = len(backtest_data)
+        
+        cash = np.empty(n_bars)
+        total_value = np.empty(n_bars)
+        unrealized_pnl = np.empty(n_bars)
+        realized_pnl = np.empty(n_bars)
+        positions_count = np.empty(n_bars, dtype=np.int64)
+        
+        pending = []
+        seen_orders = 0
+        for i, timestamp in enumerate(timestamps):
+            self.current_time = timestamp
+            bar = BarView(columns, column_index, i, timestamp)
+            
+            # Update current prices
+            for symbol, position in self.positions.items():
+                column = columns.get(symbol)
+                if column is not None:
+                    position.current_price = column[i]
+            
+            # Execute strategy
+            try:
+                strategy(self, bar, timestamp)
+            except Exception as e:
+                logger.warning(f"Strategy error at {timestamp}: {e}")
+            
+            # Process pending orders (placed earlier or during this bar)
+            if seen_orders < len(self.orders):
+                pending.extend(self.orders[seen_orders:])
+                seen_orders = len(self.orders)
+            if pending:
+                done = False
+                for order in pending:
+                    if order.status != OrderStatus.PENDING:
+                        done = True
+                        continue
+                    column = columns.get(order.symbol)
+                    if column is not None and self._order_triggered(order, column[i]):
+                        self._fill_order(order, bar)
+                        done = True
+                if done:
+                    pending = [order for order in pending if order.status == OrderStatus.PENDING]
+            
+            # Update portfolio and record its state
+            value = self.cash
+            unrealized = 0
+            realized = 0
+            for position in self.positions.values():
+                position.unrealized_pnl = (position.current_price - position.average_price) * position.quantity
+                value += position.quantity * position.current_price
+                unrealized += position.unrealized_pnl
+                realized += position.realized_pnl
+            cash[i] = self.cash
+            total_value[i] = value
+            unrealized_pnl[i] = unrealized
+            realized_pnl[i] = realized
+            positions_count[i] = len(self.positions)
+        
+        history = pd.DataFrame({
+            'cash': cash,
+            'total_value': total_value,
+            'unrealized_pnl': unrealized_pnl,
+            'realized_pnl': realized_pnl,
+            'positions_count': positions_count,
+            'return_pct': (total_value - self.initial_capital) / self.initial_capital * 100,
+        }, index=pd.Index(timestamps, name='timestamp'))
+        self.portfolio_history = history.reset_index().to_dict('records')
+        return history
+    
     def _initialize_portfolio(self):
         """Initialize portfolio for backtest."""
         self.cash = self.initial_capital
@@ -190,8 +320,10 @@ class BacktestEngine:
         if order.symbol not in row.index:
             return False
         
-        current_price = row[order.symbol]
-        
+        return self._order_triggered(order, row[order.symbol])
+    
+    def _order_triggered(self, order: Order, current_price: float) -> bool:
+        """Check if an order's price condition is met at the current price."""
         if order.order_type == OrderType.MARKET:
             return True
         elif order.order_type == OrderType.LIMIT:
@@ -301,13 +433,15 @@ class BacktestEngine:
         
         self.portfolio_history.append(portfolio_state)
     
-    def _calculate_backtest_results(self) -> Dict[str, Any]:
-        """Calculate backtest performance metrics."""
-        if not self.portfolio_history:
-            return {}
-        
-        df = pd.DataFrame(self.portfolio_history)
-        df.set_index('timestamp', inplace=True)
+    def _calculate_backtest_results(self, history: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """Calculate backtest performance metrics (from portfolio_history unless a history frame is given)."""
+        if history is not None:
+            df = history
+        else:
+            if not self.portfolio_history:
+                return {}
+            df = pd.DataFrame(self.portfolio_history)
+            df.set_index('timestamp', inplace=True)
         
         # Basic metrics
         initial_value = self.initial_capital
@@ -627,9 +761,9 @@ class RealTradingSystem:
             }
     
     def run_backtest(self, data: pd.DataFrame, strategy: Callable, 
-                    start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+                    start_date: datetime, end_date: datetime, fast: bool = False) -> Dict[str, Any]:
         """Run a backtest with historical data."""
-        return self.backtest_engine.run_backtest(data, strategy, start_date, end_date)
+        return self.backtest_engine.run_backtest(data, strategy, start_date, end_date, fast=fast)
     
     def add_strategy(self, name: str, strategy: Callable):
         """Add a trading strategy."""
@@ -16,6 +16,9 @@ from src.common import logger
 from src.data.data_acquisition import acquire_data
 from src.utils.point_size_determination import get_point_size
 from src.calculation.indicator_calculation import calculate_indicator
+from src.calculation.batch_indicator_calculation import calculate_indicators_batch
+from src.calculation.parameter_sweep import run_parameter_sweep, write_sweep_results
+from src.calculation.incremental_calculation import calculate_indicator_for_export, save_indicator_state
 from src.plotting.plotting_generation import generate_plot
 from src.cli.cli_show_mode import handle_show_mode
 # Import the export functions
@@ -179,11 +182,51 @@ def run_indicator_workflow(args):
             workflow_results["error_message"] = "Shutdown requested by user"
             return workflow_results
 
+        # --- Step 3 (sweep): Rank parameter combinations instead of a single calculation ---
+        sweep_rules = getattr(args, 'sweep_rules', None)
+        if sweep_rules:
+            logger.print_info(f"--- Step 3: Parameter Sweep ({len(sweep_rules)} combinations of {args.sweep}) ---")
+            t_sweep_start = time.perf_counter()
+            sweep_results = run_parameter_sweep(
+                ohlcv_df, point_size, sweep_rules,
+                workers=getattr(args, 'workers', 1),
+                metric=getattr(args, 'sweep_metric', 'sharpe_ratio'),
+                commission=getattr(args, 'fee_per_trade', 0.07) / 100
+            )
+            rule_name = sweep_rules[0].split(':', 1)[0]
+            output_file = write_sweep_results(sweep_results, getattr(args, 'sweep_output', None), rule_name)
+            workflow_results["steps_duration"]["sweep"] = time.perf_counter() - t_sweep_start
+            logger.print_info(f"Top combinations by {getattr(args, 'sweep_metric', 'sharpe_ratio')}:\n"
+                              f"{sweep_results.head(10).to_string(index=False)}")
+            logger.print_success(f"Sweep results saved to {output_file}")
+            workflow_results["sweep_results_file"] = str(output_file)
+            workflow_results["success"] = True
+            return workflow_results
+
         # --- Step 3: Calculate Indicator ---
-        logger.print_info(f"--- Step 3: Calculating Indicator (Rule: {args.rule}) ---")
         t_calc_start = time.perf_counter()
-        # Pass the DataFrame obtained from data_info
-        result_df, selected_rule = calculate_indicator(args, ohlcv_df.copy(), point_size)
+        rules_list = getattr(args, 'rules', None)
+        indicator_state = None
+        if rules_list:
+            # All requested indicators in one pass; the input frame is not modified
+            logger.print_info(f"--- Step 3: Calculating Indicators (Rules: {', '.join(rules_list)}) ---")
+            result_df, selected_rules = calculate_indicators_batch(
+                ohlcv_df, point_size, rules_list, price_type=getattr(args, 'price_type', 'close')
+            )
+            selected_rule = selected_rules[0]
+            setattr(args, 'original_rule_with_params', rules_list[0])
+            setattr(selected_rule, 'original_rule_with_params', rules_list[0])
+            workflow_results["selected_rules"] = selected_rules
+        elif getattr(args, 'export_parquet', False):
+            logger.print_info(f"--- Step 3: Calculating Indicator (Rule: {args.rule}) ---")
+            # Records resumable state with the export (and reuses it with --incremental)
+            result_df, selected_rule, indicator_state = calculate_indicator_for_export(
+                args, ohlcv_df, point_size, data_info
+            )
+        else:
+            logger.print_info(f"--- Step 3: Calculating Indicator (Rule: {args.rule}) ---")
+            # Pass the DataFrame obtained from data_info
+            result_df, selected_rule = calculate_indicator(args, ohlcv_df.copy(), point_size)
         t_calc_end = time.perf_counter()
         workflow_results["selected_rule"] = selected_rule
         workflow_results["calc_duration"] = t_calc_end - t_calc_start
@@ -204,6 +247,8 @@ def run_indicator_workflow(args):
         lot_size = getattr(args, 'lot_size', 1.0)
         risk_reward_ratio = getattr(args, 'risk_reward_ratio', 2.0)
         fee_per_trade = getattr(args, 'fee_per_trade', 0.07)
+        mc_simulations = getattr(args, 'mc_sims', 1000)
+        mc_seed = getattr(args, 'mc_seed', None)
         
         logger.print_info("--- Step 3b: Displaying Universal Trading Metrics ---")
         
@@ -216,7 +261,9 @@ def run_indicator_workflow(args):
                 lot_size=lot_size,
                 risk_reward_ratio=risk_reward_ratio,
                 fee_per_trade=fee_per_trade,
-                timeout_seconds=timeout_seconds
+                timeout_seconds=timeout_seconds,
+                mc_simulations=mc_simulations,
+                mc_seed=mc_seed
             )
             logger.print_success("Universal trading metrics displayed successfully")
         except Exception as e:
@@ -247,6 +294,8 @@ def run_indicator_workflow(args):
             logger.print_info("--- Step 5a: Exporting Indicator Data to Parquet ---")
             t_export_start = time.perf_counter()
             export_info = export_indicator_to_parquet(result_df, data_info, selected_rule, args)
+            if export_info.get("success") and indicator_state is not None:
+                save_indicator_state(export_info["output_file"], indicator_state)
             t_export_end = time.perf_counter()
             export_results["parquet"] = export_info
             workflow_results["export_parquet_duration"] = t_export_end - t_export_start
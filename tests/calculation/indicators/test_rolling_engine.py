@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# tests/calculation/indicators/test_rolling_engine.py
+
+"""
+Tests for the shared rolling-window engine used by Monte Carlo, Kelly and TSForecast.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculation.indicators.rolling_engine import (
+    block_ranges, make_rng, rolling_window_apply, rolling_linreg_forecast,
+    rolling_win_loss_stats, simulate_median_growth
+)
+from src.calculation.indicators.predictive.tsforecast_ind import calculate_tsforecast
+from src.calculation.indicators.probability.kelly_ind import calculate_kelly
+from src.calculation.indicators.probability.montecarlo_ind import calculate_montecarlo
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(11)
+    return pd.Series(100 + np.cumsum(rng.normal(0, 1, 300)),
+                     index=pd.date_range('2024-01-01', periods=300, freq='h'))
+
+
+class TestBlocks:
+    def test_block_ranges_cover_all_items(self):
+        blocks = list(block_ranges(10, bytes_per_item=8, max_block_bytes=24))
+        assert blocks == [(0, 3), (3, 6), (6, 9), (9, 10)]
+
+    def test_block_ranges_minimum_one_item(self):
+        assert list(block_ranges(2, bytes_per_item=100, max_block_bytes=1)) == [(0, 1), (1, 2)]
+
+    def test_rolling_window_apply_is_block_size_independent(self):
+        values = np.arange(50, dtype=float)
+        full = rolling_window_apply(values, 5, lambda block: block.sum(axis=1))
+        small = rolling_window_apply(values, 5, lambda block: block.sum(axis=1), max_block_bytes=200)
+        assert np.array_equal(full, small)
+        assert len(full) == 46
+        assert full[0] == 10.0
+
+    def test_rolling_window_apply_short_input(self):
+        assert len(rolling_window_apply(np.arange(3.0), 5, lambda b: b.sum(axis=1))) == 0
+
+
+class TestRollingReductions:
+    def test_linreg_forecast_matches_polyfit(self):
+        rng = np.random.default_rng(2)
+        values = rng.normal(0, 1, 40)
+        window = 7
+        forecast = rolling_linreg_forecast(values, window)
+        for k in (0, 10, len(forecast) - 1):
+            slope, intercept = np.polyfit(np.arange(window), values[k:k + window], 1)
+            assert forecast[k] == pytest.approx(slope * window + intercept)
+
+    def test_linreg_forecast_extends_line(self):
+        values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        assert np.allclose(rolling_linreg_forecast(values, 3), [4.0, 5.0, 6.0])
+
+    def test_win_loss_stats(self):
+        values = np.array([0.1, -0.2, 0.0, 0.3, -0.1])
+        win_count, win_sum, loss_count, loss_sum = rolling_win_loss_stats(values, 3)
+        assert win_count.tolist() == [1.0, 1.0, 1.0]
+        assert loss_count.tolist() == [1.0, 1.0, 1.0]
+        assert np.allclose(win_sum, [0.1, 0.3, 0.3])
+        assert np.allclose(loss_sum, [-0.2, -0.2, -0.1])
+
+
+class TestRandomDraws:
+    def test_seeded_generator_is_reproducible(self):
+        a = simulate_median_growth(20, 50, 5, 0.0, 0.01, rng=make_rng(7))
+        b = simulate_median_growth(20, 50, 5, 0.0, 0.01, rng=make_rng(7))
+        assert np.array_equal(a, b)
+
+    def test_global_seed_controls_default_generator(self):
+        np.random.seed(5)
+        a = make_rng().normal(size=3)
+        np.random.seed(5)
+        b = make_rng().normal(size=3)
+        assert np.array_equal(a, b)
+
+    def test_zero_volatility_growth(self):
+        growth = simulate_median_growth(4, 10, 3, 0.01, 0.0, rng=make_rng(1))
+        assert np.allclose(growth, 1.01 ** 3)
+
+
+class TestIndicatorsUseEngine:
+    def test_tsforecast_alignment(self, prices):
+        forecast = calculate_tsforecast(prices, 14)
+        assert forecast.iloc[:14].isna().all()
+        slope, intercept = np.polyfit(np.arange(14), prices.iloc[86:100].to_numpy(), 1)
+        assert forecast.iloc[100] == pytest.approx(slope * 14 + intercept)
+
+    def test_kelly_bounds_and_alignment(self, prices):
+        kelly = calculate_kelly(prices, 20)
+        valid = kelly.dropna()
+        assert kelly.iloc[:20].isna().all()
+        assert ((valid >= 0) & (valid <= 0.25)).all()
+
+    def test_montecarlo_seed_reproducible(self, prices):
+        a = calculate_montecarlo(prices, simulations=200, period=10, seed=123)
+        b = calculate_montecarlo(prices, simulations=200, period=10, seed=123)
+        pd.testing.assert_series_equal(a, b)
+        assert a.iloc[:10].isna().all()
+        assert a.iloc[10:].notna().all()
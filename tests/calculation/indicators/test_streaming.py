@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+# tests/calculation/indicators/test_streaming.py
+
+"""
+Tests for the bar-by-bar streaming indicators against the batch calculations.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculation.indicators.streaming import (
+    StreamingEMA, StreamingSMA, StreamingRSI, StreamingATR, StreamingBollingerBands,
+    StreamingMACD, StreamingSAR, StreamingSuperTrend, StreamingOBV, StreamingVWAP,
+    StreamingDonchian, StreamingCCI, StreamingStochastic, StreamingHMA, StreamingStDev,
+    StreamingADX, StreamingPivot, StreamingTSForecast, StreamingPipeline, create_streaming_indicator
+)
+from src.calculation.indicators.trend.ema_ind import calculate_ema
+from src.calculation.indicators.trend.sma_ind import calculate_sma
+from src.calculation.indicators.trend.sar_ind import calculate_sar
+from src.calculation.indicators.trend.supertrend_ind import calculate_supertrend
+from src.calculation.indicators.oscillators.rsi_ind_calc import calculate_rsi
+from src.calculation.indicators.volatility.atr_ind import calculate_atr
+from src.calculation.indicators.volatility.bb_ind import calculate_bollinger_bands
+from src.calculation.indicators.momentum.macd_ind import calculate_macd
+from src.calculation.indicators.volume.obv_ind import calculate_obv
+from src.calculation.indicators.volume.vwap_ind import calculate_vwap
+from src.calculation.indicators.suportresist.donchain_ind import calculate_donchain
+from src.calculation.indicators.oscillators.cci_ind import apply_rule_cci
+from src.calculation.indicators.oscillators.stoch_ind import apply_rule_stochastic
+from src.calculation.indicators.predictive.hma_ind import apply_rule_hma
+from src.calculation.indicators.predictive.tsforecast_ind import apply_rule_tsforecast
+from src.calculation.indicators.volatility.stdev_ind import apply_rule_stdev
+from src.calculation.indicators.trend.adx_ind import apply_rule_adx
+from src.calculation.indicators.suportresist.pivot_ind import apply_rule_pivot
+from src.common.constants import TradingRule
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(3)
+    n = 500
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    spread = rng.random(n) + 0.1
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.2, n),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': rng.integers(1, 100, n).astype(float),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='h'))
+
+
+def _stream(indicator, df, column):
+    return np.array([indicator.update(bar)[column] for bar in df.to_dict('records')])
+
+
+def _assert_exact(streamed, expected):
+    np.testing.assert_array_equal(streamed, np.asarray(expected, dtype=float))
+
+
+def _assert_close(streamed, expected):
+    np.testing.assert_allclose(streamed, np.asarray(expected, dtype=float), rtol=1e-9, atol=1e-9)
+
+
+class TestExactRecursions:
+    def test_ema(self, ohlcv):
+        _assert_exact(_stream(StreamingEMA(20), ohlcv, 'EMA'), calculate_ema(ohlcv['Close'], 20))
+
+    def test_ema_open_price(self, ohlcv):
+        _assert_exact(_stream(StreamingEMA(10, 'open'), ohlcv, 'EMA'), calculate_ema(ohlcv['Open'], 10))
+
+    def test_ema_with_missing_values(self, ohlcv):
+        df = ohlcv.copy()
+        df.iloc[[0, 50, 51], df.columns.get_loc('Close')] = np.nan
+        _assert_exact(_stream(StreamingEMA(20), df, 'EMA'), calculate_ema(df['Close'], 20))
+
+    def test_rsi(self, ohlcv):
+        _assert_exact(_stream(StreamingRSI(14), ohlcv, 'RSI'), calculate_rsi(ohlcv['Close'], 14))
+
+    def test_atr(self, ohlcv):
+        _assert_exact(_stream(StreamingATR(14), ohlcv, 'ATR'), calculate_atr(ohlcv, 14))
+
+    def test_macd(self, ohlcv):
+        line, signal, histogram = calculate_macd(ohlcv['Close'], 12, 26, 9)
+        macd = StreamingMACD(12, 26, 9)
+        values = [macd.update(bar) for bar in ohlcv.to_dict('records')]
+        _assert_exact([v['MACD_Line'] for v in values], line)
+        _assert_exact([v['MACD_Signal'] for v in values], signal)
+        _assert_exact([v['MACD_Histogram'] for v in values], histogram)
+
+    def test_sar(self, ohlcv):
+        _assert_exact(_stream(StreamingSAR(0.02, 0.2), ohlcv, 'SAR'), calculate_sar(ohlcv, 0.02, 0.2))
+
+    def test_vwap(self, ohlcv):
+        _assert_exact(_stream(StreamingVWAP(), ohlcv, 'VWAP'), calculate_vwap(ohlcv))
+
+
+class TestWindowedIndicators:
+    def test_sma(self, ohlcv):
+        _assert_close(_stream(StreamingSMA(20), ohlcv, 'SMA'), calculate_sma(ohlcv['Close'], 20))
+
+    def test_bollinger_bands(self, ohlcv):
+        upper, middle, lower = calculate_bollinger_bands(ohlcv['Close'], 20, 2.0)
+        bb = StreamingBollingerBands(20, 2.0)
+        values = [bb.update(bar) for bar in ohlcv.to_dict('records')]
+        _assert_close([v['BB_Upper'] for v in values], upper)
+        _assert_close([v['BB_Middle'] for v in values], middle)
+        _assert_close([v['BB_Lower'] for v in values], lower)
+
+    def test_supertrend(self, ohlcv):
+        supertrend, trend = calculate_supertrend(ohlcv, 10, 3.0)
+        st = StreamingSuperTrend(10, 3.0)
+        values = [st.update(bar) for bar in ohlcv.to_dict('records')]
+        _assert_close([v['SuperTrend'] for v in values], supertrend)
+        _assert_exact([v['SuperTrend_Direction'] for v in values], trend)
+
+    def test_obv(self, ohlcv):
+        _assert_close(_stream(StreamingOBV(20), ohlcv, 'OBV'),
+                      calculate_obv(ohlcv['Close'], ohlcv['Volume'], 20))
+
+    def test_donchian_with_missing_values(self, ohlcv):
+        df = ohlcv.copy()
+        df.iloc[100, df.columns.get_loc('High')] = np.nan
+        upper, middle, lower = calculate_donchain(df, 20)
+        donchian = StreamingDonchian(20)
+        values = [donchian.update(bar) for bar in df.to_dict('records')]
+        _assert_exact([v['Donchain_Upper'] for v in values], upper)
+        _assert_exact([v['Donchain_Lower'] for v in values], lower)
+        _assert_exact([v['Donchain_Middle'] for v in values], middle)
+
+
+class TestRuleOutputs:
+    """Streamed values and signals against the columns the batch rules write."""
+
+    @pytest.mark.parametrize('indicator, apply_rule', [
+        (StreamingCCI(20), apply_rule_cci),
+        (StreamingStochastic(14, 3), apply_rule_stochastic),
+        (StreamingHMA(20), apply_rule_hma),
+        (StreamingStDev(20), apply_rule_stdev),
+        (StreamingADX(14), apply_rule_adx),
+        (StreamingPivot(), apply_rule_pivot),
+        (StreamingTSForecast(14), apply_rule_tsforecast),
+    ], ids=lambda value: getattr(value, 'name', ''))
+    def test_matches_batch_rule(self, ohlcv, indicator, apply_rule):
+        df = ohlcv.copy()
+        df.iloc[[100, 200, 201], df.columns.get_loc('Close')] = np.nan
+        expected = apply_rule(df.copy(), 0.01)
+        values = pd.DataFrame([indicator.update(bar) for bar in df.to_dict('records')])
+
+        for column in values.columns:
+            _assert_close(values[column], expected[column])
+
+
+class TestFactoryAndPipeline:
+    def test_create_from_rule_string(self):
+        rsi = create_streaming_indicator('rsi:10,20,80,open')
+        assert isinstance(rsi, StreamingRSI)
+        assert (rsi.period, rsi.oversold, rsi.overbought) == (10, 20.0, 80.0)
+        assert isinstance(create_streaming_indicator(TradingRule.SAR), StreamingSAR)
+        stoch = create_streaming_indicator('stochastic:10,5,close')
+        assert isinstance(stoch, StreamingStochastic)
+        assert isinstance(create_streaming_indicator('tsf:20,open'), StreamingTSForecast)
+
+    def test_unsupported_rule(self):
+        with pytest.raises(ValueError, match="no streaming version"):
+            create_streaming_indicator('montecarlo')
+
+    def test_lowercase_bar_keys(self):
+        ema = StreamingEMA(3)
+        assert ema.update({'close': 10.0})['EMA'] == 10.0
+
+    def test_process_frame_only_feeds_new_bars(self, ohlcv):
+        pipeline = StreamingPipeline(['ema:20,close', 'rsi:14,30,70,close'], closed_bars_only=False)
+        first = pipeline.process_frame(ohlcv.iloc[:300])
+        second = pipeline.process_frame(ohlcv.iloc[250:400])
+        assert len(first) == 300
+        assert second.index[0] == ohlcv.index[300]
+        assert pipeline.process_frame(ohlcv.iloc[:400]).empty
+
+        combined = pd.concat([first, second])
+        _assert_exact(combined['EMA'], calculate_ema(ohlcv['Close'].iloc[:400], 20))
+        _assert_exact(combined['RSI'], calculate_rsi(ohlcv['Close'].iloc[:400], 14))
+        assert list(combined.columns[:5]) == list(ohlcv.columns)
+
+    def test_holds_back_forming_bar_by_default(self, ohlcv):
+        pipeline = StreamingPipeline([StreamingATR(14)])
+        assert len(pipeline.process_frame(ohlcv.iloc[:100])) == 99
+        assert pipeline.process_frame(ohlcv.iloc[:100]).empty
+        new = pipeline.process_frame(ohlcv.iloc[:101])
+        assert list(new.index) == [ohlcv.index[99]]
+
+    def test_reset(self, ohlcv):
+        pipeline = StreamingPipeline([StreamingSAR()], closed_bars_only=False)
+        first = pipeline.process_frame(ohlcv)
+        pipeline.reset()
+        pd.testing.assert_frame_equal(pipeline.process_frame(ohlcv), first)
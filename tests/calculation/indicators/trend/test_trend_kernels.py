@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+# tests/calculation/indicators/trend/test_trend_kernels.py
+
+"""
+Tests for the recursive trend indicator kernels.
+
+The kernels must reproduce the original pandas ``.iloc`` loops bit-for-bit,
+so every comparison here uses exact equality.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculation.indicators.trend.trend_kernels import (
+    sar_kernel, sar_kernel_resumable, supertrend_kernel, smooth_kernel, draw_lines_kernel, tr_switch_kernel,
+    TR_CODE_FAST, TR_CODE_BETTER_FAST, TR_CODE_NONE,
+    _sar_loop, _sar_numpy, _supertrend_loop, _supertrend_numpy, _tr_switch_loop, _tr_switch_numpy
+)
+from src.calculation.indicators.trend.sar_ind import calculate_sar
+from src.calculation.indicators.trend.supertrend_ind import calculate_supertrend
+from src.calculation.indicators.trend.wave_ind import (
+    calculate_ecore, calc_draw_lines, tr_switch, ENUM_MOM_TR
+)
+from src.common.constants import BUY, SELL, NOTRADE
+
+
+@pytest.fixture
+def ohlc():
+    rng = np.random.default_rng(7)
+    n = 400
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    spread = rng.random(n)
+    close[40] = np.nan
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.2, n),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+    }, index=pd.date_range('2024-01-01', periods=n, freq='h'))
+
+
+def _reference_sar(high, low, acceleration, maximum):
+    sar, ep, af, trend = [low[0]], [high[0]], [acceleration], [1]
+    for i in range(1, len(high)):
+        if trend[-1] == 1:
+            if high[i] > ep[-1]:
+                new_ep, new_af, new_trend = high[i], min(af[-1] + acceleration, maximum), 1
+            else:
+                new_ep, new_af, new_trend = low[i], acceleration, -1
+            value = min(sar[-1] + af[-1] * (ep[-1] - sar[-1]), low[i - 1], low[i])
+        else:
+            if low[i] < ep[-1]:
+                new_ep, new_af, new_trend = low[i], min(af[-1] + acceleration, maximum), -1
+            else:
+                new_ep, new_af, new_trend = high[i], acceleration, 1
+            value = max(sar[-1] + af[-1] * (ep[-1] - sar[-1]), high[i - 1], high[i])
+        sar.append(value)
+        ep.append(new_ep)
+        af.append(new_af)
+        trend.append(new_trend)
+    return np.array(sar)
+
+
+def test_sar_kernel_matches_reference():
+    rng = np.random.default_rng(1)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.001, 1000))
+    high = close + 0.0005
+    low = close - 0.0005
+    expected = _reference_sar(high.tolist(), low.tolist(), 0.02, 0.2)
+    assert np.array_equal(sar_kernel(high, low, 0.02, 0.2), expected)
+
+
+def test_calculate_sar_uses_kernel(ohlc):
+    sar = calculate_sar(ohlc, 0.02, 0.2)
+    assert isinstance(sar, pd.Series)
+    assert sar.index.equals(ohlc.index)
+    assert sar.dtype == np.float64
+    assert np.array_equal(sar.to_numpy(), sar_kernel(ohlc['High'], ohlc['Low'], 0.02, 0.2), equal_nan=True)
+
+
+def test_supertrend_kernel_trend_values(ohlc):
+    supertrend, trend = calculate_supertrend(ohlc, 10, 3.0)
+    assert supertrend.dtype == np.float64
+    assert trend.dtype == np.float64
+    assert set(np.unique(trend.to_numpy())) <= {1.0, -1.0}
+    assert trend.iloc[0] == 1.0
+
+
+def test_supertrend_kernel_band_ratchet():
+    close = np.array([10.0, 11.0, 12.0, 9.0, 8.0])
+    upper = np.array([13.0, 14.0, 15.0, 12.0, 11.5])
+    lower = np.array([9.0, 10.0, 9.5, 7.0, 6.0])
+    supertrend, trend = supertrend_kernel(close, upper, lower)
+    # Uptrend keeps the higher lower band, then flips to the upper band on a close below it
+    assert supertrend.tolist() == [9.0, 10.0, 10.0, 12.0, 11.5]
+    assert trend.tolist() == [1.0, 1.0, 1.0, -1.0, -1.0]
+
+
+def test_smooth_and_draw_lines_match_recurrence():
+    rng = np.random.default_rng(3)
+    source = rng.normal(0, 1, 200)
+    alpha = 2.0 / 22
+    expected = [0.0]
+    for value in source[1:]:
+        expected.append(expected[-1] + alpha * (value - expected[-1]))
+    assert np.array_equal(smooth_kernel(source, alpha), np.array(expected))
+
+    wave, fastline = draw_lines_kernel(source, 0.2, 0.5)
+    assert np.array_equal(wave, smooth_kernel(source, 0.2))
+    assert np.array_equal(fastline, smooth_kernel(wave, 0.5))
+
+
+def test_wave_functions_preserve_series_shape(ohlc):
+    ecore = calculate_ecore(2.0 / 22, ohlc['Open'])
+    wave, fastline = calc_draw_lines(2.0 / 11, 2.0 / 5, ecore)
+    for series in (ecore, wave, fastline):
+        assert series.index.equals(ohlc.index)
+        assert series.dtype == np.float64
+        assert series.iloc[0] == 0.0
+
+
+def test_tr_switch_kernel_fast_rule():
+    wave = np.array([0.0, 1.0, -1.0, 2.0])
+    fastline = np.array([0.0, 0.5, 0.0, 3.0])
+    colors = tr_switch_kernel(TR_CODE_FAST, wave, fastline, NOTRADE, 0.0)
+    assert colors.tolist() == [NOTRADE, BUY, SELL, SELL]
+
+
+def test_tr_switch_kernel_unknown_rule_is_notrade():
+    wave = np.linspace(-1, 1, 10)
+    colors = tr_switch_kernel(TR_CODE_NONE, wave, wave * 0.5, NOTRADE, 0.0)
+    assert (colors == NOTRADE).all()
+
+
+def test_tr_switch_rost_rules_are_notrade(ohlc):
+    ecore = calculate_ecore(2.0 / 22, ohlc['Open'])
+    wave, fastline = calc_draw_lines(2.0 / 11, 2.0 / 5, ecore)
+    for rule in (ENUM_MOM_TR.TR_Rost, ENUM_MOM_TR.TR_TrendRost, ENUM_MOM_TR.TR_BetterTrendRost):
+        assert (tr_switch(rule, wave, fastline, NOTRADE, 0.0) == NOTRADE).all()
+
+
+def test_tr_switch_kernel_better_fast_state():
+    wave = np.array([0.0, -1.0, 1.0, 2.0, 1.5, -0.5])
+    fastline = np.array([0.0, 0.0, 0.5, 1.0, 1.0, 0.0])
+    colors = tr_switch_kernel(TR_CODE_BETTER_FAST, wave, fastline, NOTRADE, 0.0)
+    # Zone cross up -> BUY, rising wave -> BUY, falling wave above fastline -> SELL, cross down -> SELL
+    assert colors.tolist() == [NOTRADE, NOTRADE, BUY, BUY, SELL, SELL]
+
+
+class TestResumableKernels:
+    def test_sar_resumes_from_checkpoint_state(self, ohlc):
+        high, low = ohlc['High'].to_numpy(), ohlc['Low'].to_numpy()
+        full, state = sar_kernel_resumable(high, low, 0.02, 0.2, checkpoint=300)
+        resumed, _ = sar_kernel_resumable(high, low, 0.02, 0.2, start=300, initial=state)
+        assert np.isnan(resumed[:300]).all()
+        assert np.array_equal(resumed[300:], full[300:], equal_nan=True)
+
+    def test_supertrend_resumes_from_saved_trend(self, ohlc):
+        close = ohlc['Close'].ffill().to_numpy()
+        upper, lower = close + 1.5, close - 1.5
+        st, trend = supertrend_kernel(close, upper, lower)
+        resumed_st, resumed_trend = supertrend_kernel(close, upper, lower, start=300,
+                                                      initial=[st[300], trend[300]])
+        assert np.array_equal(resumed_st[300:], st[300:])
+        assert np.array_equal(resumed_trend[300:], trend[300:])
+
+
+class TestNumpyFallback:
+    """The vectorized fallback must match the plain loops used by the Numba path."""
+
+    @pytest.fixture
+    def bars(self):
+        rng = np.random.default_rng(11)
+        n = 3000
+        close = 100 + np.cumsum(rng.normal(0, 1, n))
+        spread = np.round(rng.random(n), 1)
+        high, low = close + spread, close - spread
+        high[[50, 51, 900]] = np.nan
+        low[[52, 1500]] = np.nan
+        close[[60, 2000]] = np.nan
+        atr = np.abs(rng.normal(1, 0.3, n))
+        atr[:10] = np.nan
+        return close, high, low, (high + low) / 2 + 2 * atr, (high + low) / 2 - 2 * atr
+
+    @pytest.mark.parametrize('start, initial, checkpoint', [
+        (0, [0.0] * 4, 2500), (700, [101.0, 99.0, 0.5, -1.0], 700), (1200, [np.nan, 98.0, 0.06, 1.0], -1),
+    ])
+    def test_sar_matches_loop(self, bars, start, initial, checkpoint):
+        _, high, low, _, _ = bars
+        expected, expected_state = [0.0] * len(high), [0.0] * 4
+        _sar_loop(high.tolist(), low.tolist(), 0.02, 0.2, expected, start, initial, checkpoint, expected_state)
+        sar, state = _sar_numpy(high, low, 0.02, 0.2, start, np.array(initial), checkpoint)
+        assert np.array_equal(sar, expected, equal_nan=True)
+        assert np.array_equal(state, expected_state, equal_nan=True)
+
+    def test_sar_smooth_prices_match_loop(self):
+        # Few bars clamp on a smooth curve, so the sweeps hand over to the sequential loop
+        close = 1.5 + 0.1 * np.sin(np.arange(5000) / 50)
+        expected, state = [0.0] * len(close), [0.0] * 4
+        _sar_loop((close + 1e-4).tolist(), (close - 1e-4).tolist(), 0.02, 0.2, expected, 0, [0.0] * 4, -1, state)
+        sar, _ = _sar_numpy(close + 1e-4, close - 1e-4, 0.02, 0.2, 0, np.zeros(4), -1)
+        assert np.array_equal(sar, expected)
+
+    @pytest.mark.parametrize('start, initial', [(0, [0.0, 0.0]), (400, [100.0, -1.0]), (5, [np.nan, 1.0])])
+    def test_supertrend_matches_loop(self, bars, start, initial):
+        close, _, _, upper, lower = bars
+        expected_st, expected_trend = [0.0] * len(close), [0.0] * len(close)
+        _supertrend_loop(close.tolist(), upper.tolist(), lower.tolist(), expected_st, expected_trend, start, initial)
+        supertrend, trend = _supertrend_numpy(close, upper, lower, start, np.array(initial))
+        assert np.array_equal(supertrend, expected_st, equal_nan=True)
+        assert np.array_equal(trend, expected_trend, equal_nan=True)
+
+    @pytest.mark.parametrize('rule', range(-1, 7))
+    @pytest.mark.parametrize('prev_signal, prev_wave', [(NOTRADE, 0.0), (BUY, 0.5), (SELL, np.nan)])
+    def test_tr_switch_matches_loop(self, rule, prev_signal, prev_wave):
+        rng = np.random.default_rng(5)
+        wave = np.round(np.cumsum(rng.normal(0, 1, 2000)) * 0.3, 1)
+        fastline = wave + np.round(rng.normal(0, 0.5, 2000), 1)
+        wave[[100, 700]] = np.nan
+        expected = [0.0] * len(wave)
+        _tr_switch_loop(rule, wave.tolist(), fastline.tolist(), prev_signal, prev_wave, expected)
+        colors = _tr_switch_numpy(rule, wave, fastline, prev_signal, prev_wave)
+        assert np.array_equal(colors, expected)
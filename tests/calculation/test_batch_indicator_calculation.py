@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# tests/calculation/test_batch_indicator_calculation.py
+
+"""
+Tests for the single-pass multi-indicator calculation and shared intermediates.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculation.batch_indicator_calculation import (
+    calculate_indicators_batch, resolve_trading_rule
+)
+from src.calculation.indicator import calculate_pressure_vector
+from src.calculation.indicator_calculation import calculate_indicator
+from src.calculation.indicators.shared_intermediates import (
+    shared_intermediates, ewm_mean, pct_returns, true_range
+)
+from src.cli.cli import split_rules_argument
+from src.common.constants import TradingRule, EMPTY_VALUE
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(3)
+    n = 300
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.2, n),
+        'High': close + 1.0,
+        'Low': close - 1.0,
+        'Close': close,
+        'Volume': rng.integers(100, 1000, n).astype(float),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='h'))
+
+
+class TestSharedIntermediates:
+    def test_no_cache_outside_block(self, ohlcv):
+        a = ewm_mean(ohlcv['Close'], 12)
+        b = ewm_mean(ohlcv['Close'], 12)
+        assert a is not b
+        pd.testing.assert_series_equal(a, ohlcv['Close'].ewm(span=12, adjust=False).mean())
+
+    def test_same_source_and_params_hit_cache(self, ohlcv):
+        with shared_intermediates() as cache:
+            first = ewm_mean(ohlcv['Close'], 12)
+            second = ewm_mean(ohlcv['Close'], 12)
+            ewm_mean(ohlcv['Close'], 26)
+            ewm_mean(ohlcv['Open'], 12)
+        assert (cache.hits, cache.misses) == (1, 3)
+        pd.testing.assert_series_equal(first, second)
+
+    def test_cached_results_are_independent_copies(self, ohlcv):
+        with shared_intermediates():
+            first = pct_returns(ohlcv['Close'])
+            first.iloc[5] = 123.0
+            second = pct_returns(ohlcv['Close'])
+        assert second.iloc[5] != 123.0
+
+    def test_true_range_matches_definition(self, ohlcv):
+        prev_close = ohlcv['Close'].shift(1)
+        expected = pd.concat([ohlcv['High'] - ohlcv['Low'],
+                              (ohlcv['High'] - prev_close).abs(),
+                              (ohlcv['Low'] - prev_close).abs()], axis=1).max(axis=1)
+        pd.testing.assert_series_equal(true_range(ohlcv), expected)
+
+
+class TestBatchCalculation:
+    def test_matches_single_rule_calculation(self, ohlcv):
+        result, selected = calculate_indicators_batch(
+            ohlcv, 0.01, ['macd:12,26,9,close', 'ema:12,close', 'atr:14', 'rsi']
+        )
+        assert selected == [TradingRule.MACD, TradingRule.EMA, TradingRule.ATR, TradingRule.RSI]
+
+        single_macd = calculate_pressure_vector(ohlcv.copy(), 0.01, TradingRule.MACD,
+                                                macd_fast=12, macd_slow=26, macd_signal=9)
+        single_ema = calculate_pressure_vector(ohlcv.copy(), 0.01, TradingRule.EMA, ema_period=12)
+        single_rsi = calculate_pressure_vector(ohlcv.copy(), 0.01, TradingRule.RSI)
+
+        for col in ['PV', 'MACD_Line', 'MACD_Histogram']:
+            np.testing.assert_array_equal(result[col].to_numpy(), single_macd[col].to_numpy())
+        np.testing.assert_array_equal(result['EMA'].to_numpy(), single_ema['EMA'].to_numpy())
+        np.testing.assert_array_equal(result['EMA_PColor1'].to_numpy(), single_ema['PColor1'].to_numpy())
+        np.testing.assert_array_equal(result['RSI'].to_numpy(), single_rsi['RSI'].to_numpy())
+
+    def test_first_rule_outputs_also_under_plain_names(self, ohlcv):
+        result, _ = calculate_indicators_batch(ohlcv, 0.01, ['ema', 'bb'])
+        np.testing.assert_array_equal(result['PColor1'].to_numpy(), result['EMA_PColor1'].to_numpy())
+        assert 'Bollinger_Bands_PColor1' in result.columns
+        assert 'BB_Upper' in result.columns
+
+    def test_repeated_rules_get_unique_labels(self, ohlcv):
+        result, _ = calculate_indicators_batch(ohlcv, 0.01, ['ema:10,close', 'ema:30,close'])
+        assert {'EMA', 'EMA_2_EMA', 'EMA_PColor1', 'EMA_2_PColor1'} <= set(result.columns)
+        assert not np.array_equal(result['EMA'].to_numpy(), result['EMA_2_EMA'].to_numpy())
+
+    def test_input_frame_is_not_modified_or_copied(self, ohlcv):
+        before = ohlcv.copy()
+        result, _ = calculate_indicators_batch(ohlcv, 0.01, ['rsi', 'atr'])
+        pd.testing.assert_frame_equal(ohlcv, before)
+        assert np.shares_memory(result['Close'].to_numpy(), ohlcv['Close'].to_numpy())
+
+    def test_tick_volume_is_accepted(self, ohlcv):
+        result, _ = calculate_indicators_batch(ohlcv.rename(columns={'Volume': 'TickVolume'}), 0.01, ['pv'])
+        assert 'Volume' in result.columns
+        assert 'PV' in result.columns
+
+    @pytest.mark.parametrize('rule', ['obv', 'vwap:close', 'pv'])
+    def test_volume_columns_match_single_rule_calculation(self, ohlcv, rule):
+        # Real and tick volume differ: volume indicators use Volume, the other rules TickVolume
+        ohlcv['TickVolume'] = np.arange(len(ohlcv), dtype=float) % 7 + 1
+        result, _ = calculate_indicators_batch(ohlcv, 0.01, [rule])
+        single, _ = calculate_indicator(SimpleNamespace(rule=rule, mode='demo', price_type='close'),
+                                        ohlcv, 0.01)
+
+        for col in ['Volume', 'Pressure', 'PV', 'PPrice1', 'PPrice2', 'Direction']:
+            pd.testing.assert_series_equal(result[col], single[col].replace(EMPTY_VALUE, np.nan),
+                                           check_dtype=False, check_names=False)
+
+    def test_invalid_input(self, ohlcv):
+        with pytest.raises(ValueError):
+            calculate_indicators_batch(ohlcv, 0.01, [])
+        with pytest.raises(ValueError):
+            calculate_indicators_batch(ohlcv, 0.0, ['rsi'])
+        with pytest.raises(ValueError):
+            calculate_indicators_batch(ohlcv.drop(columns=['Low']), 0.01, ['rsi'])
+
+    def test_resolve_trading_rule(self):
+        assert resolve_trading_rule('bb') == (TradingRule.Bollinger_Bands, {})
+        assert resolve_trading_rule('kelly')[0] == TradingRule.Kelly
+        rule, params = resolve_trading_rule('rsi:10,20,80,open')
+        assert rule == TradingRule.RSI
+        assert params['rsi_period'] == 10
+        with pytest.raises(ValueError):
+            resolve_trading_rule('not_a_rule')
+
+
+class TestRulesArgument:
+    def test_plain_list(self):
+        assert split_rules_argument('rsi,macd,bb,atr') == ['rsi', 'macd', 'bb', 'atr']
+
+    def test_parameters_and_separators(self):
+        assert split_rules_argument('rsi:14,30,70,close,macd:12,26,9,close;mc:100,10,ema') == [
+            'rsi:14,30,70,close', 'macd:12,26,9,close', 'monte:100,10', 'ema'
+        ]
+
+    def test_invalid_lists(self):
+        with pytest.raises(ValueError):
+            split_rules_argument(' , ;')
+        with pytest.raises(ValueError):
+            split_rules_argument('unknown,rsi')
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# tests/calculation/test_incremental_calculation.py
+
+"""
+Tests for incremental (append-only) indicator recalculation.
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculation.incremental_calculation import (
+    calculate_indicator_incremental, load_indicator_state, save_indicator_state, state_file_path
+)
+from src.calculation.indicator_calculation import calculate_indicator
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(0)
+    n = 1200
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    spread = rng.random(n) + 0.1
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.2, n),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': rng.integers(1, 100, n).astype(float),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='h'))
+
+
+def _args(rule):
+    return argparse.Namespace(rule=rule, mode='demo', price_type='close')
+
+
+def _run_in_steps(rule, df, splits):
+    result, state = None, None
+    computed = []
+    for stop in splits:
+        result, _, state, rows = calculate_indicator_incremental(_args(rule), df.iloc[:stop], 0.01, result, state)
+        computed.append(rows)
+    return result, state, computed
+
+
+@pytest.mark.parametrize("rule", [
+    'ema:20,close', 'rsi:14,30,70,close', 'rsi_mom:14,30,70,close',
+    'atr:14', 'sar:0.02,0.2', 'supertrend:10,3.0',
+])
+def test_recursive_rules_match_full_calculation_exactly(ohlcv, rule):
+    full, _ = calculate_indicator(_args(rule), ohlcv, 0.01)
+    result, state, computed = _run_in_steps(rule, ohlcv, [800, 1000, 1200])
+
+    assert computed == [800, 200, 200]
+    assert state is not None
+    assert list(result.columns) == list(full.columns)
+    pd.testing.assert_frame_equal(result, full, check_exact=True, check_freq=False)
+
+
+@pytest.mark.parametrize("rule", ['sma:20,close', 'bb:20,2,close'])
+def test_rolling_rules_match_to_float_precision(ohlcv, rule):
+    full, _ = calculate_indicator(_args(rule), ohlcv, 0.01)
+    result, _, computed = _run_in_steps(rule, ohlcv, [900, 1200])
+
+    assert computed == [900, 300]
+    pd.testing.assert_frame_equal(result, full, check_exact=False, rtol=1e-9, check_freq=False)
+
+
+def test_changed_history_falls_back_to_full_calculation(ohlcv):
+    result, _, state, _ = calculate_indicator_incremental(_args('ema:20,close'), ohlcv.iloc[:1000], 0.01)
+    revised = ohlcv.copy()
+    revised.iloc[990, revised.columns.get_loc('Close')] += 1.0
+
+    updated, _, _, rows = calculate_indicator_incremental(_args('ema:20,close'), revised, 0.01, result, state)
+
+    assert rows == len(revised)
+    full, _ = calculate_indicator(_args('ema:20,close'), revised, 0.01)
+    pd.testing.assert_frame_equal(updated, full, check_freq=False)
+
+
+def test_no_new_bars_reuses_previous_result(ohlcv):
+    result, _, state, _ = calculate_indicator_incremental(_args('atr:14'), ohlcv, 0.01)
+    again, _, again_state, rows = calculate_indicator_incremental(_args('atr:14'), ohlcv, 0.01, result, state)
+    assert rows == 0
+    assert again is result
+    assert again_state == state
+
+
+def test_other_rule_state_is_not_reused(ohlcv):
+    result, _, state, _ = calculate_indicator_incremental(_args('ema:20,close'), ohlcv.iloc[:1000], 0.01)
+    _, _, _, rows = calculate_indicator_incremental(_args('ema:30,close'), ohlcv, 0.01, result, state)
+    assert rows == len(ohlcv)
+
+
+def test_unsupported_rule_has_no_state(ohlcv):
+    result, _, state, rows = calculate_indicator_incremental(_args('macd:12,26,9,close'), ohlcv, 0.01)
+    assert result is not None
+    assert state is None
+    assert rows == len(ohlcv)
+
+
+def test_state_file_round_trip(ohlcv, tmp_path):
+    result, _, state, _ = calculate_indicator_incremental(_args('rsi:14,30,70,close'), ohlcv.iloc[:1000], 0.01)
+    parquet_file = tmp_path / "DEMO_RSI.parquet"
+    result.reset_index(names='DateTime').to_parquet(parquet_file, index=False)
+
+    assert save_indicator_state(parquet_file, state) == state_file_path(parquet_file)
+    previous, loaded_state = load_indicator_state(parquet_file)
+    assert loaded_state == state
+
+    updated, _, _, rows = calculate_indicator_incremental(_args('rsi:14,30,70,close'), ohlcv, 0.01, previous, loaded_state)
+    assert rows == 200
+    full, _ = calculate_indicator(_args('rsi:14,30,70,close'), ohlcv, 0.01)
+    np.testing.assert_array_equal(updated['RSI'].to_numpy(), full['RSI'].to_numpy())
+
+
+def test_missing_state_file(tmp_path):
+    assert load_indicator_state(tmp_path / "missing.parquet") == (None, None)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# tests/calculation/test_indicator_cache.py
+
+"""Tests for the content-addressed indicator result cache."""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculation import indicator_cache
+from src.calculation.indicator import calculate_pressure_vector
+from src.calculation.indicator_cache import (IndicatorResultCache, cached_calculate_pressure_vector,
+                                             result_cache_key)
+from src.calculation.indicators.resumable_state import resumable_checkpoint
+from src.common.constants import TradingRule
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(1)
+    n = 300
+    close = 100 + rng.standard_normal(n).cumsum()
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.2, n),
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'TickVolume': rng.integers(100, 1000, n).astype(float),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='h'))
+
+
+@pytest.fixture
+def counting_calc(monkeypatch):
+    calls = []
+
+    def _calc(**kwargs):
+        calls.append(kwargs['tr_num'])
+        return calculate_pressure_vector(**kwargs)
+
+    monkeypatch.setattr(indicator_cache, 'calculate_pressure_vector', _calc)
+    return calls
+
+
+def test_hit_returns_identical_result(tmp_path, ohlcv, counting_calc):
+    cache = IndicatorResultCache(tmp_path)
+    params = {'rsi_period': 14, 'oversold': 30, 'overbought': 70, 'price_type': 'close'}
+
+    first = cached_calculate_pressure_vector(ohlcv, 0.01, TradingRule.RSI, cache=cache, **params)
+    second = cached_calculate_pressure_vector(ohlcv, 0.01, TradingRule.RSI, cache=cache, **params)
+
+    assert len(counting_calc) == 1
+    pd.testing.assert_frame_equal(second, first, check_freq=False)
+
+
+def test_key_changes_with_data_rule_and_params(ohlcv):
+    base = result_cache_key(ohlcv, TradingRule.EMA, 0.01, ema_period=20)
+    changed = ohlcv.copy()
+    changed.iloc[-1, changed.columns.get_loc('Close')] += 0.5
+
+    assert base == result_cache_key(ohlcv.copy(), TradingRule.EMA, 0.01, ema_period=20)
+    assert base != result_cache_key(changed, TradingRule.EMA, 0.01, ema_period=20)
+    assert base != result_cache_key(ohlcv, TradingRule.EMA, 0.01, ema_period=21)
+    assert base != result_cache_key(ohlcv, TradingRule.SMA, 0.01, ema_period=20)
+    assert base != result_cache_key(ohlcv, TradingRule.EMA, 0.001, ema_period=20)
+    assert result_cache_key(ohlcv, TradingRule.EMA, 0.01, extra=object()) is None
+
+
+def test_code_version_is_part_of_key(ohlcv, monkeypatch):
+    base = result_cache_key(ohlcv, TradingRule.EMA, 0.01)
+    monkeypatch.setattr(indicator_cache, '_CODE_VERSION', 'other')
+    assert result_cache_key(ohlcv, TradingRule.EMA, 0.01) != base
+
+
+def test_lru_eviction(tmp_path, ohlcv):
+    cache = IndicatorResultCache(tmp_path, max_bytes=10**9)
+    for key in ('a', 'b', 'c'):
+        cache.put(key, ohlcv)
+        time.sleep(0.01)
+    size = os.path.getsize(tmp_path / 'a.parquet')
+
+    assert cache.get('a') is not None  # 'a' becomes the most recently used
+    cache.max_bytes = 2 * size
+    cache.evict()
+
+    assert sorted(p.stem for p in tmp_path.glob('*.parquet')) == ['a', 'c']
+    assert cache.get('b') is None
+
+
+def test_bypassed_inside_resumable_checkpoint(tmp_path, ohlcv, counting_calc):
+    cache = IndicatorResultCache(tmp_path)
+    cached_calculate_pressure_vector(ohlcv, 0.01, TradingRule.EMA, cache=cache)
+    with resumable_checkpoint(record_from_end=30) as checkpoint:
+        cached_calculate_pressure_vector(ohlcv, 0.01, TradingRule.EMA, cache=cache)
+
+    assert len(counting_calc) == 2
+    assert checkpoint.records
+
+
+def test_unreadable_file_is_dropped(tmp_path):
+    cache = IndicatorResultCache(tmp_path)
+    (tmp_path / 'bad.parquet').write_bytes(b'not parquet')
+    assert cache.get('bad') is None
+    assert not (tmp_path / 'bad.parquet').exists()
+
+
+def test_fingerprint_handles_timezones_and_objects(ohlcv):
+    aware = ohlcv.tz_localize('UTC')
+    aware['Label'] = 'x'
+
+    assert indicator_cache.data_fingerprint(aware) == indicator_cache.data_fingerprint(aware.copy())
+    assert indicator_cache.data_fingerprint(aware) != indicator_cache.data_fingerprint(aware.tz_convert('Europe/London'))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# tests/calculation/test_parameter_sweep.py
+
+"""Tests for the indicator parameter sweep."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculation import parameter_sweep
+from src.calculation.batch_indicator_calculation import calculate_indicators_batch
+from src.calculation.indicators.shared_intermediates import shared_intermediates
+from src.calculation.parameter_sweep import expand_sweep_spec, run_parameter_sweep, write_sweep_results
+from src.calculation.trade_ledger import resolve_signal_values
+from src.calculation.vectorized_backtest import run_vectorized_backtest
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(11)
+    n = 600
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.2, n),
+        'High': close + 1.0,
+        'Low': close - 1.0,
+        'Close': close,
+        'Volume': rng.integers(100, 1000, n).astype(float),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='h'))
+
+
+def test_expand_sweep_spec():
+    rules = expand_sweep_spec('rsi:7..21..7,20|30,70,close')
+    assert rules == ['rsi:7,20,70,close', 'rsi:7,30,70,close', 'rsi:14,20,70,close',
+                     'rsi:14,30,70,close', 'rsi:21,20,70,close', 'rsi:21,30,70,close']
+    assert expand_sweep_spec('ema:10..11,close|open') == ['ema:10,close', 'ema:10,open',
+                                                         'ema:11,close', 'ema:11,open']
+    assert expand_sweep_spec('rsi:14,25..30..2.5,70,close')[1] == 'rsi:14,27.5,70,close'
+
+    with pytest.raises(ValueError):
+        expand_sweep_spec('rsi')
+    with pytest.raises(ValueError):
+        expand_sweep_spec('rsi:0|14,30,70,close')
+
+
+def test_sweep_matches_single_backtests(ohlcv):
+    rules = expand_sweep_spec('rsi:7|14,25|30,70|75,close')
+    results = run_parameter_sweep(ohlcv, 0.01, rules, commission=0.001)
+
+    assert results['rank'].tolist() == list(range(1, len(rules) + 1))
+    assert sorted(results['rule']) == sorted(rules)
+    assert results['sharpe_ratio'].is_monotonic_decreasing
+    assert {'rsi_period', 'oversold', 'overbought', 'price_type'} <= set(results.columns)
+
+    for rule in rules:
+        result_df, _ = calculate_indicators_batch(ohlcv, 0.01, [rule])
+        expected = run_vectorized_backtest(ohlcv['Close'], resolve_signal_values(result_df, 'Direction'),
+                                           commission=0.001).summary().iloc[0]
+        row = results[results['rule'] == rule].iloc[0]
+        assert row['total_return_pct'] == pytest.approx(expected['total_return_pct'])
+        assert row['num_trades'] == expected['num_trades']
+
+
+def test_parallel_sweep_matches_serial(ohlcv):
+    rules = expand_sweep_spec('rsi:7..14..7,25|30,70,close')
+    serial = run_parameter_sweep(ohlcv, 0.01, rules, metric='total_return_pct')
+    parallel = run_parameter_sweep(ohlcv, 0.01, rules, workers=2, metric='total_return_pct')
+
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+def test_single_worker_evaluates_one_chunk(ohlcv, monkeypatch):
+    chunks = []
+    evaluate_chunk = parameter_sweep._evaluate_chunk
+
+    def recording_evaluate_chunk(data, point, rule_strings, *args):
+        chunks.append(list(rule_strings))
+        return evaluate_chunk(data, point, rule_strings, *args)
+
+    monkeypatch.setattr(parameter_sweep, '_evaluate_chunk', recording_evaluate_chunk)
+    rules = expand_sweep_spec('rsi:7..14,25|30,70,close')
+    run_parameter_sweep(ohlcv, 0.01, rules)
+
+    assert chunks == [rules]
+
+
+def test_rsi_thresholds_reuse_shared_rsi(ohlcv):
+    with shared_intermediates() as cache:
+        for rule in expand_sweep_spec('rsi:14,20|25|30,70,close'):
+            calculate_indicators_batch(ohlcv, 0.01, [rule])
+        assert cache.hits >= 2
+
+
+def test_write_sweep_results(ohlcv, tmp_path):
+    results = run_parameter_sweep(ohlcv, 0.01, expand_sweep_spec('rsi:14,25|30,70,close'))
+    path = write_sweep_results(results, str(tmp_path / 'sweeps' / 'rsi.parquet'))
+
+    pd.testing.assert_frame_equal(pd.read_parquet(path), results)
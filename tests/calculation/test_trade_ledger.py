@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# tests/calculation/test_trade_ledger.py
+
+"""Tests for the vectorized trade ledger."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculation.trade_ledger import TradeLedger, build_trade_ledger, resolve_signal_values
+from src.common.constants import BUY, SELL, NOTRADE
+
+
+def _reference_trades(prices, signals, volumes=None):
+    """Bar-by-bar position logic the ledger must reproduce."""
+    trades, in_position, entry, entry_i = [], False, 0.0, 0
+    for i in range(1, len(prices)):
+        price, prev = prices[i], prices[i - 1]
+        if np.isnan(price) or np.isnan(prev) or price <= 0 or prev <= 0:
+            continue
+        if volumes is not None and (np.isnan(volumes[i]) or volumes[i] <= 0):
+            continue
+        if not in_position and signals[i] == BUY:
+            in_position, entry, entry_i = True, price, i
+        elif in_position and signals[i] == SELL:
+            trades.append((entry_i, i, (price - entry) / entry * 100))
+            in_position = False
+        elif in_position and signals[i] == BUY:
+            trades.append((entry_i, i, (price - entry) / entry * 100))
+            entry, entry_i = price, i
+    final_ok = prices[-1] > 0 and (volumes is None or volumes[-1] > 0)
+    if in_position and final_ok:
+        trades.append((entry_i, len(prices) - 1, (prices[-1] - entry) / entry * 100))
+    return trades
+
+
+def _reference_bar_returns(prices, signals):
+    returns, in_position = [], False
+    for i in range(1, len(prices)):
+        price, prev = prices[i], prices[i - 1]
+        if np.isnan(price) or np.isnan(prev) or price <= 0 or prev <= 0:
+            returns.append(0.0)
+            continue
+        if not in_position and signals[i] == BUY:
+            in_position = True
+        returns.append((price - prev) / prev if in_position else 0.0)
+        if in_position and signals[i] == SELL:
+            in_position = False
+    return returns
+
+
+def test_simple_sequence():
+    prices = [100, 101, 102, 104, 103, 105]
+    signals = [NOTRADE, BUY, NOTRADE, SELL, BUY, NOTRADE]
+    ledger = build_trade_ledger(prices, signals)
+
+    assert ledger.entry_positions.tolist() == [1, 4]
+    assert ledger.exit_positions.tolist() == [3, 5]
+    assert ledger.holding_bars.tolist() == [2, 1]
+    assert ledger.returns == pytest.approx([(104 - 101) / 101 * 100, (105 - 103) / 103 * 100])
+
+
+def test_reversal_and_entry_on_last_bar():
+    ledger = build_trade_ledger([10, 11, 12, 13], [NOTRADE, BUY, BUY, BUY])
+    assert ledger.entry_positions.tolist() == [1, 2, 3]
+    assert ledger.exit_positions.tolist() == [2, 3, 3]
+    assert ledger.returns[-1] == 0.0
+
+
+@pytest.mark.parametrize('seed', range(25))
+def test_matches_reference_loop(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(2, 200))
+    prices = 100 + rng.standard_normal(n).cumsum()
+    prices[rng.random(n) < 0.05] = np.nan
+    prices[rng.random(n) < 0.03] = -1.0
+    signals = rng.choice([NOTRADE, BUY, SELL], n, p=[0.6, 0.2, 0.2])
+    volumes = rng.random(n) * 100
+    volumes[rng.random(n) < 0.1] = np.nan
+
+    ledger = build_trade_ledger(prices, signals)
+    expected = _reference_trades(prices, signals)
+    assert list(zip(ledger.entry_positions, ledger.exit_positions)) == [(a, b) for a, b, _ in expected]
+    np.testing.assert_allclose(ledger.returns, [r for _, _, r in expected])
+    np.testing.assert_array_equal(ledger.bar_returns, _reference_bar_returns(prices, signals))
+
+    volume_ledger = build_trade_ledger(prices, signals, volumes)
+    expected = _reference_trades(prices, signals, volumes)
+    assert list(zip(volume_ledger.entry_positions, volume_ledger.exit_positions)) == [(a, b) for a, b, _ in expected]
+    np.testing.assert_allclose(volume_ledger.volumes,
+                               [(volumes[a] + volumes[b]) / 2 for a, b, _ in expected])
+
+
+def test_empty_and_single_bar():
+    assert build_trade_ledger([], []).num_trades == 0
+    ledger = build_trade_ledger([100.0], [BUY])
+    assert ledger.num_trades == 0
+    assert len(ledger.bar_returns) == 0
+    assert TradeLedger.empty(with_volumes=True).volumes is not None
+
+
+def test_resolve_signal_values():
+    df = pd.DataFrame({'_Signal': ['BUY', 'sell', None, '1', 'x']})
+    assert resolve_signal_values(df, 'Direction').tolist() == [BUY, SELL, NOTRADE, BUY, NOTRADE]
+    df = pd.DataFrame({'Direction': [1.0, np.nan, 2.0]})
+    assert resolve_signal_values(df, 'Direction').tolist() == [BUY, NOTRADE, SELL]
+    assert resolve_signal_values(pd.DataFrame({'Close': [1.0]}), 'Direction') is None
@@ -1,7 +1,8 @@
 import pytest
 import pandas as pd
 import numpy as np
-from src.calculation.trading_metrics import TradingMetricsCalculator, calculate_trading_metrics
+from src.calculation.trading_metrics import (TradingMetricsCalculator, bootstrap_final_returns,
+                                             calculate_trading_metrics)
 
 
 class TestTradingMetricsCalculator:
@@ -329,5 +330,48 @@ class TestCalculateTradingMetrics:
         assert 'volume_weighted_return' in metrics or 'volume_win_ratio' in metrics
 
 
+
+class TestMonteCarloBootstrap:
+    """Test cases for the batched Monte Carlo bootstrap."""
+    
+    def test_seed_is_reproducible(self):
+        """Same seed gives the same simulations, another seed does not."""
+        trades = [2.0, -1.0, 3.5, -0.5, 1.2]
+        first = bootstrap_final_returns(trades, 500, seed=7)
+        assert len(first) == 500
+        np.testing.assert_array_equal(first, bootstrap_final_returns(trades, 500, seed=7))
+        assert not np.array_equal(first, bootstrap_final_returns(trades, 500, seed=8))
+    
+    def test_small_blocks_match_expected_growth(self):
+        """Block-wise simulation keeps the bootstrap expectation."""
+        trades = np.array([2.0, -1.0, 3.5, -0.5, 1.2])
+        results = bootstrap_final_returns(trades, 20000, seed=1, max_block_bytes=1024)
+        expected = np.mean(1 + trades / 100) ** len(trades) - 1
+        assert results.mean() == pytest.approx(expected, abs=1e-3)
+    
+    def test_single_trade_and_empty(self):
+        """Single trade is deterministic; no trades gives no simulations."""
+        np.testing.assert_allclose(bootstrap_final_returns([5.0], 10, seed=0), 0.05)
+        assert len(bootstrap_final_returns([], 10)) == 0
+    
+    def test_calculator_uses_simulation_count_and_seed(self, monkeypatch):
+        """mc_simulations and mc_seed reach the bootstrap."""
+        calls = []
+        import src.calculation.trading_metrics as trading_metrics
+        original = trading_metrics.bootstrap_final_returns
+        monkeypatch.setattr(trading_metrics, 'bootstrap_final_returns',
+                            lambda trades, n, seed: calls.append((n, seed)) or original(trades, n, seed))
+        
+        dates = pd.date_range('2024-01-01', periods=50, freq='D')
+        df = pd.DataFrame({'Close': np.linspace(100, 120, 50),
+                           'Direction': [1, 0, 0, 2, 0] * 10}, index=dates)
+        calculator = TradingMetricsCalculator(mc_simulations=5000, mc_seed=3)
+        first = calculator._calculate_monte_carlo_metrics(df, 'Close', 'Direction')
+        second = calculator._calculate_monte_carlo_metrics(df, 'Close', 'Direction')
+        
+        assert calls == [(5000, 3), (5000, 3)]
+        assert first == second
+
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -449,7 +449,7 @@ class TestDisplayUniversalTradingMetrics:
             metrics = display_universal_trading_metrics(sample_data, "Test_Rule")
             
             # Check that class was instantiated with default parameters (including timeout_seconds)
-            mock_class.assert_called_once_with(1.0, 2.0, 0.07, 30)
+            mock_class.assert_called_once_with(1.0, 2.0, 0.07, 30, mc_simulations=1000, mc_seed=None)
             
             # Check that method was called with correct parameters
             mock_instance.calculate_and_display_metrics.assert_called_once_with(
@@ -475,7 +475,7 @@ class TestDisplayUniversalTradingMetrics:
             )
             
             # Check that class was instantiated with custom parameters (including default timeout_seconds)
-            mock_class.assert_called_once_with(2.5, 3.0, 0.1, 30)
+            mock_class.assert_called_once_with(2.5, 3.0, 0.1, 30, mc_simulations=1000, mc_seed=None)
             
             # Check that method was called with correct parameters
             mock_instance.calculate_and_display_metrics.assert_called_once_with(
@@ -502,7 +502,7 @@ class TestDisplayUniversalTradingMetrics:
             )
             
             # Check that class was instantiated with custom timeout
-            mock_class.assert_called_once_with(1.0, 2.0, 0.07, 60)
+            mock_class.assert_called_once_with(1.0, 2.0, 0.07, 60, mc_simulations=1000, mc_seed=None)
             
             # Check that method was called with correct parameters
             mock_instance.calculate_and_display_metrics.assert_called_once_with(
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# tests/calculation/test_vectorized_backtest.py
+
+"""Tests for the vectorized signal-to-equity backtest."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculation.vectorized_backtest import (
+    backtest_signal_frame, run_vectorized_backtest, signals_to_positions
+)
+from src.common.constants import BUY, SELL, NOTRADE
+from src.interactive.backtesting.strategy_backtester import StrategyBacktester
+
+
+def _reference(prices, signals, commission, short_on_sell):
+    """Bar-by-bar loop the vectorized backtest must reproduce."""
+    position, equity, curve, trades, entry = 0.0, 1.0, [], [], None
+    for i, price in enumerate(prices):
+        previous = position
+        if signals[i] == BUY:
+            position = 1.0
+        elif signals[i] == SELL:
+            position = -1.0 if short_on_sell else 0.0
+        price_return = price / prices[i - 1] - 1 if i > 0 else 0.0
+        equity *= 1 + previous * price_return - commission * abs(position - previous)
+        if position != previous:
+            if previous != 0:
+                trades.append((entry, i, previous))
+            entry = i if position != 0 else None
+        curve.append(equity)
+    if position != 0:
+        trades.append((entry, len(prices) - 1, position))
+    return np.array(curve), trades
+
+
+@pytest.mark.parametrize('short_on_sell', [False, True])
+def test_matches_reference_loop(short_on_sell):
+    rng = np.random.default_rng(7)
+    n = 400
+    prices = 100 * np.exp(rng.normal(0, 0.01, n).cumsum())
+    signals = rng.choice([NOTRADE, BUY, SELL], (n, 3), p=[0.8, 0.1, 0.1])
+
+    result = run_vectorized_backtest(prices, signals, commission=0.001, short_on_sell=short_on_sell)
+
+    for j in range(3):
+        curve, trades = _reference(prices, signals[:, j], 0.001, short_on_sell)
+        assert result.equity[:, j] == pytest.approx(curve)
+        set_trades = result.trades[result.trades['param_set'] == j]
+        assert list(zip(set_trades['entry_bar'], set_trades['exit_bar'], set_trades['side'])) == \
+            [(s, e, int(side)) for s, e, side in trades]
+
+
+def test_equity_drawdown_and_trades():
+    prices = np.array([100.0, 110.0, 99.0, 99.0, 108.9, 120.0])
+    signals = np.array([BUY, NOTRADE, SELL, BUY, NOTRADE, NOTRADE])
+    result = run_vectorized_backtest(prices, signals)
+
+    assert result.positions[:, 0].tolist() == [1, 1, 0, 1, 1, 1]
+    assert result.equity[:, 0] == pytest.approx([1.0, 1.1, 0.99, 0.99, 1.089, 1.2])
+    assert result.drawdown[:, 0].min() == pytest.approx(-0.1)
+    assert result.trades[['entry_bar', 'exit_bar']].values.tolist() == [[0, 2], [3, 5]]
+    assert result.trades['is_open'].tolist() == [False, True]
+
+    summary = result.summary().loc[0]
+    assert summary['num_trades'] == 2
+    assert summary['total_return_pct'] == pytest.approx(20.0)
+    assert summary['max_drawdown_pct'] == pytest.approx(-10.0)
+
+
+def test_parameter_axis_matches_single_runs():
+    rng = np.random.default_rng(3)
+    prices = 50 + rng.normal(0, 1, 300).cumsum()
+    signals = rng.choice([NOTRADE, BUY, SELL], (300, 5), p=[0.7, 0.15, 0.15])
+    labels = [(14, 70, 30), (14, 80, 20), (21, 70, 30), (21, 80, 20), (7, 70, 30)]
+
+    batch = run_vectorized_backtest(prices, signals, commission=0.0005, param_labels=labels)
+    summary = batch.summary()
+
+    for j, label in enumerate(labels):
+        single = run_vectorized_backtest(prices, signals[:, j], commission=0.0005)
+        np.testing.assert_allclose(batch.equity[:, j], single.equity[:, 0])
+        assert summary.loc[[label], 'num_trades'].iloc[0] == len(single.trades)
+
+
+def test_signals_to_positions_forward_fills():
+    signals = [NOTRADE, SELL, BUY, NOTRADE, SELL, NOTRADE]
+    assert signals_to_positions(signals).tolist() == [0, 0, 1, 1, 0, 0]
+    assert signals_to_positions(signals, short_on_sell=True).tolist() == [0, -1, 1, 1, -1, -1]
+
+
+def test_backtest_signal_frame_uses_columns_as_parameter_sets():
+    df = pd.DataFrame({
+        'Close': [10.0, 11.0, 12.0, 11.0],
+        'PColor1': [BUY, NOTRADE, SELL, NOTRADE],
+        'PColor2': [NOTRADE, BUY, NOTRADE, NOTRADE],
+    }, index=pd.date_range('2024-01-01', periods=4, freq='D'))
+
+    result = backtest_signal_frame(df, ['PColor1', 'PColor2'])
+
+    assert list(result.summary().index) == ['PColor1', 'PColor2']
+    assert list(result.equity_frame().columns) == ['PColor1', 'PColor2']
+    with pytest.raises(ValueError):
+        backtest_signal_frame(df, 'Missing')
+
+
+def test_strategy_backtester():
+    df = pd.DataFrame({
+        'Close': [10.0, 11.0, 12.0, 11.0],
+        'Direction': [BUY, NOTRADE, SELL, NOTRADE],
+    }, index=pd.date_range('2024-01-01', periods=4, freq='D'))
+    backtester = StrategyBacktester()
+
+    result = backtester.backtest_strategy(df, {'commission': 0.001})
+    assert result['status'] == 'success'
+    assert result['summary'].loc['Direction', 'num_trades'] == 1
+
+    trades = backtester.simulate_trades(df[['Direction']], df[['Close']])
+    assert trades['entry_time'].tolist() == [df.index[0]]
+    assert backtester.calculate_returns(trades)['total_return'] == pytest.approx(0.2)
+    assert backtester.backtest_strategy(df, {'price_column': 'Missing'})['status'] == 'error'
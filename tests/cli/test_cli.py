@@ -91,6 +91,18 @@ class TestCli(unittest.TestCase):
             parse_arguments()
         self.assertEqual(cm.exception.code, 2)
 
+    @patch('sys.argv', ['run_analysis.py', 'csv', '--csv-folder', 'mql5_feed', '--point', '0.01', '--workers', '4'])
+    def test_parse_arguments_csv_folder_workers(self):
+        args = parse_arguments()
+        self.assertEqual(args.csv_folder, 'mql5_feed')
+        self.assertEqual(args.workers, 4)
+
+    @patch('sys.argv', ['run_analysis.py', 'csv', '--csv-folder', 'mql5_feed', '--point', '0.01', '--workers', '0'])
+    def test_parse_arguments_csv_folder_fail_no_workers(self):
+        with self.assertRaises(SystemExit) as cm:
+            parse_arguments()
+        self.assertEqual(cm.exception.code, 2)
+
     # --- Polygon Mode Tests ---
     @patch('sys.argv', ['run_analysis.py', 'polygon', '--ticker', 'MSFT', '--start', '2024-01-01', '--end', '2024-02-01', '--point', '0.01'])
     def test_parse_arguments_polygon_success(self):
@@ -206,6 +218,12 @@ class TestCli(unittest.TestCase):
         with self.assertRaises(SystemExit) as cm: parse_arguments()
         self.assertEqual(cm.exception.code, 2)
 
+    # Test that --sweep is rejected in show mode, which never runs the sweep step
+    @patch('sys.argv', ['run_analysis.py', 'show', 'csv', 'mn1', '--sweep', 'rsi:7|14,30,70,close'])
+    def test_parse_arguments_sweep_in_show_mode(self):
+        with self.assertRaises(SystemExit) as cm: parse_arguments()
+        self.assertEqual(cm.exception.code, 2)
+
 
 # Allow running the tests directly
 if __name__ == '__main__':
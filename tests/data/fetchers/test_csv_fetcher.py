@@ -12,8 +12,10 @@ import os
 import pandas as pd
 import numpy as np # Import numpy
 from pathlib import Path
+from unittest.mock import patch
 
 # Adjust the import path based on the project structure
+from src.data.fetchers import csv_fetcher
 from src.data.fetchers.csv_fetcher import fetch_csv_data
 
 
@@ -182,6 +184,40 @@ class TestCsvFetcher(unittest.TestCase):
         self.assertEqual(result.index[0], pd.Timestamp('2023-01-01 10:01:00'))
         # --- END FIXED ASSERTIONS ---
 
+    def _fetch_uncached(self, path, engine):
+        """ Fetch with an empty cache directory so the CSV is parsed again. """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(csv_fetcher, 'CSV_CACHE_DIR', Path(cache_dir)):
+                return fetch_csv_data(path, ohlc_columns=self.test_ohlc_map,
+                                      datetime_column=self.test_dt_col, skiprows=1, engine=engine)
+
+    @unittest.skipUnless(csv_fetcher.PYARROW_CSV_AVAILABLE, "pyarrow not installed")
+    def test_pyarrow_engine_matches_pandas(self):
+        """ The pyarrow reader produces the same frame as pd.read_csv. """
+        for path in (self.valid_csv_path, self.empty_csv_path):
+            expected = self._fetch_uncached(path, 'pandas')
+            result = self._fetch_uncached(path, 'pyarrow')
+            pd.testing.assert_frame_equal(result, expected, check_index_type=not expected.empty)
+
+    @unittest.skipUnless(csv_fetcher.PYARROW_CSV_AVAILABLE, "pyarrow not installed")
+    def test_pyarrow_engine_falls_back_on_invalid_dates(self):
+        """ Unparseable dates fall back to pandas, which drops those rows. """
+        result = self._fetch_uncached(self.invalid_date_path, 'pyarrow')
+        self.assertEqual(result.shape[0], 1)
+        self.assertEqual(result.index[0], pd.Timestamp('2023-01-01 10:01:00'))
+
+    @unittest.skipUnless(csv_fetcher.PYARROW_CSV_AVAILABLE, "pyarrow not installed")
+    def test_pyarrow_engine_trailing_separator(self):
+        """ MT5 exports ending each line with a separator produce no extra column. """
+        path = os.path.join(self.test_dir.name, "trailing.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Info\nDateTime,Open,High,Low,Close,TickVolume,\n"
+                    "2023.01.01 10:00,1.1,1.2,1.0,1.15,10,\n"
+                    "2023.01.01 10:01,1.15,1.25,1.1,1.2,12,\n")
+        result = self._fetch_uncached(path, 'pyarrow')
+        pd.testing.assert_frame_equal(result, self._fetch_uncached(path, 'pandas'))
+        self.assertEqual(sorted(result.columns), ['Close', 'High', 'Low', 'Open', 'Volume'])
+
 # Allow running the tests directly
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
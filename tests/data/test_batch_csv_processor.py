@@ -7,6 +7,7 @@ All comments are in English.
 """
 import pytest
 import tempfile
+import pandas as pd
 import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -254,3 +255,77 @@ class TestBatchCSVProcessor:
         assert len(results["failed_files"]) == 0
         assert len(results["error_messages"]) == 1
         assert "No CSV files found" in results["error_messages"][0]
+
+    def test_process_csv_folder_parallel_workers(self, monkeypatch):
+        """Test parallel conversion writes complete cache files and keeps the summary."""
+        from src.data.fetchers import csv_fetcher
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = Path(temp_dir) / "cache"
+            monkeypatch.setattr(csv_fetcher, "CSV_CACHE_DIR", cache_dir)
+
+            csv_dir = Path(temp_dir) / "csv"
+            csv_dir.mkdir()
+            for i in range(4):
+                lines = ["MT5 export", "DateTime,Open,High,Low,Close,TickVolume"]
+                lines += [f"2024.01.{day:02d} 00:00,{1.1 + i},{1.2 + i},{1.0 + i},{1.15 + i},{day}"
+                          for day in range(1, 11)]
+                (csv_dir / f"sym{i}.csv").write_text("\n".join(lines) + "\n")
+            (csv_dir / "broken.csv").write_text("MT5 export\nfoo,bar\n1,2\n")
+
+            args = MagicMock()
+            args.csv_folder = str(csv_dir)
+            args.point = 0.00001
+            args.workers = 3
+
+            results = process_csv_folder(args)
+
+            assert results["success"] is True
+            assert results["processed_files"] == 5
+            assert results["successful_conversions"] == 4
+            assert results["converted_files"] == [f"sym{i}.csv" for i in range(4)]
+            assert results["failed_files"] == ["broken.csv"]
+            assert sorted(p.name for p in cache_dir.iterdir()) == [f"sym{i}.parquet" for i in range(4)]
+            assert len(pd.read_parquet(cache_dir / "sym3.parquet")) == 10
+
+    def test_process_csv_folder_reports_in_file_order(self, monkeypatch):
+        """Test results finishing out of order are reported in file order."""
+        from src.data import batch_csv_processor
+
+        def finish_in_reverse(csv_files, workers, on_start=None):
+            for csv_file in reversed(csv_files):
+                name = Path(csv_file).name
+                yield (name, 0, f"Error processing {name}") if name.startswith('bad') else (name, 5, None)
+
+        monkeypatch.setattr(batch_csv_processor, "_iter_conversions", finish_in_reverse)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ["a.csv", "bad1.csv", "bad2.csv", "c.csv"]:
+                (Path(temp_dir) / name).write_text("x\n")
+            args = MagicMock()
+            args.csv_folder = temp_dir
+            args.workers = 2
+
+            results = process_csv_folder(args)
+
+        assert results["converted_files"] == ["a.csv", "c.csv"]
+        assert results["failed_files"] == ["bad1.csv", "bad2.csv"]
+        assert results["error_messages"] == ["Error processing bad1.csv", "Error processing bad2.csv"]
+
+    @patch('src.data.batch_csv_processor.fetch_csv_data')
+    def test_process_csv_folder_shows_current_file(self, mock_fetch_csv):
+        """Test the progress bar names the file being converted."""
+        mock_fetch_csv.return_value = pd.DataFrame({'Close': [1.0]})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "a.csv").write_text("x\n")
+            (Path(temp_dir) / "b.csv").write_text("x\n")
+            args = MagicMock()
+            args.csv_folder = temp_dir
+            args.workers = 1
+
+            with patch('src.data.batch_csv_processor.tqdm') as mock_tqdm:
+                process_csv_folder(args)
+
+        pbar = mock_tqdm.return_value.__enter__.return_value
+        postfixes = [call.args[0] for call in pbar.set_postfix_str.call_args_list]
+        assert postfixes[0] == "Processing: a.csv"
+        assert "Processing: b.csv" in postfixes
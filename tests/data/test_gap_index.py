@@ -0,0 +1,71 @@
+"""
+Tests for the shared gap index engine.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.gap_index import datetime_columns, find_gaps, infer_frequency, to_nanoseconds
+
+
+class TestGapIndex:
+    """Test cases for gap detection and frequency inference."""
+
+    def setup_method(self):
+        """Minute bars with a 60 minute hole."""
+        self.index = pd.date_range('2024-01-01', periods=1000, freq='min').delete(np.r_[100:160])
+
+    def test_infer_frequency_uses_modal_delta(self):
+        ns, _ = to_nanoseconds(self.index)
+        assert infer_frequency(ns) == pd.Timedelta(minutes=1).value
+        assert infer_frequency(np.array([5], dtype=np.int64)) is None
+
+    def test_find_gaps(self):
+        gaps = find_gaps(self.index)
+
+        assert len(gaps) == 1
+        assert gaps.frequency == pd.Timedelta(minutes=1)
+        assert gaps.start_times()[0] == pd.Timestamp('2024-01-01 01:39')
+        assert gaps.end_times()[0] == pd.Timestamp('2024-01-01 02:40')
+        assert pd.Timedelta(gaps.durations[0]) == pd.Timedelta(minutes=61)
+
+    def test_unsorted_input_with_nat(self):
+        values = pd.Series(self.index).sample(frac=1, random_state=0)
+        values.iloc[3] = pd.NaT
+        assert len(find_gaps(values, freq='1min')) == 1
+
+    def test_threshold_against_given_freq(self):
+        index = pd.DatetimeIndex(['2024-01-01', '2024-01-02', '2024-01-04', '2024-01-05'])
+        assert len(find_gaps(index, freq='1D', threshold=1.0)) == 1
+        assert len(find_gaps(index, freq='1D', threshold=2.0)) == 0
+
+    def test_fx_calendar_skips_weekend(self):
+        # Hourly FX bars: Friday 21:00 UTC is followed by Sunday 22:00 UTC
+        index = pd.date_range('2024-01-01', '2024-01-31', freq='h', tz='UTC')
+        weekday = index.dayofweek + index.hour / 24
+        index = index[(weekday < 4 + 22 / 24) | (weekday >= 6 + 22 / 24)]
+
+        assert len(find_gaps(index)) == 4
+        assert len(find_gaps(index, calendar='fx')) == 0
+        assert str(find_gaps(index).start_times().tz) == 'UTC'
+
+    def test_holidays_are_not_gaps(self):
+        index = pd.date_range('2024-01-01', periods=10, freq='D').delete(4)
+        assert len(find_gaps(index, threshold=1.5)) == 1
+        assert len(find_gaps(index, threshold=1.5, holidays=['2024-01-05'])) == 0
+
+    def test_datetime_columns_do_not_modify_frame(self):
+        df = pd.DataFrame({
+            'timestamp': self.index.astype(str),
+            'timeframe': 'M1',
+            'close': np.arange(len(self.index), dtype=float),
+        })
+        assert datetime_columns(df) == ['timestamp']
+        assert df['timestamp'].dtype != 'datetime64[ns]'
+        assert len(find_gaps(df['timestamp'])) == 1
+
+    @pytest.mark.parametrize('unit', ['s', 'ms'])
+    def test_epoch_numbers(self, unit):
+        epochs = to_nanoseconds(self.index)[0] // pd.Timedelta(1, unit=unit).value
+        assert len(find_gaps(epochs, unit=unit)) == 1
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# tests/data/test_live_data_manager.py
+
+"""
+Tests for LiveDataManager subscriptions with streaming indicator pipelines.
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+
+from src.data.live_data_manager import LiveDataManager, DataConfig, DataSource, DataType
+from src.calculation.indicators.streaming import StreamingPipeline, StreamingEMA
+from src.calculation.indicators.trend.ema_ind import calculate_ema
+
+
+def _frame(n):
+    close = 100 + np.arange(n, dtype=float)
+    return pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1,
+                         'close': close, 'volume': np.ones(n)},
+                        index=pd.date_range('2024-01-01', periods=n, freq='min'))
+
+
+def _run_update(manager, config, data):
+    async def _fetch(cfg):
+        return {'status': 'success', 'data': data}
+    manager.get_historical_data = _fetch
+    key = next(iter(manager.subscribers))
+    asyncio.run(manager._update_subscription_data(key, config, manager.subscribers[key]))
+
+
+def test_pipeline_subscriber_receives_only_new_bars():
+    manager = LiveDataManager()
+    config = DataConfig(DataSource.BINANCE, 'BTCUSDT', '1m', DataType.OHLCV)
+    received, raw = [], []
+    manager.subscribe_to_data(config, lambda data, cfg: received.append(data), pipeline=['ema:5,close'])
+    manager.subscribe_to_data(config, lambda data, cfg: raw.append(data))
+
+    _run_update(manager, config, _frame(30))
+    _run_update(manager, config, _frame(30))
+    _run_update(manager, config, _frame(35))
+
+    # The last (still forming) bar of each poll is held back until it closes
+    assert [len(d) for d in received] == [29, 5]
+    assert [len(d) for d in raw] == [30, 30, 35]
+    ema = pd.concat(received)['EMA']
+    np.testing.assert_array_equal(ema.to_numpy(), calculate_ema(_frame(34)['close'], 5).to_numpy())
+
+
+def test_subscribe_accepts_pipeline_object():
+    manager = LiveDataManager()
+    config = DataConfig(DataSource.BYBIT, 'ETHUSDT', '1m', DataType.OHLCV)
+    pipeline = StreamingPipeline([StreamingEMA(3)])
+    manager.subscribe_to_data(config, lambda data, cfg: None, pipeline=pipeline)
+    subscriber = next(iter(manager.subscribers.values()))[0]
+    assert subscriber['pipeline'] is pipeline
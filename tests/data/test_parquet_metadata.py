@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# tests/data/test_parquet_metadata.py
+
+"""Tests for footer-based parquet metadata and the persistent metadata index."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data import parquet_metadata
+from src.data.parquet_metadata import ParquetMetadataIndex, read_parquet_metadata
+
+
+def _write_ohlcv(path, rows=1000, row_group_size=100, start='2024-01-01'):
+    index = pd.date_range(start, periods=rows, freq='h', name='DateTime')
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(rows).cumsum()
+    df = pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1,
+                       'Close': close, 'Volume': rng.integers(1, 100, rows)}, index=index)
+    df.to_parquet(path, row_group_size=row_group_size)
+    return df
+
+
+def test_metadata_matches_full_read(tmp_path):
+    path = tmp_path / 'data.parquet'
+    df = _write_ohlcv(path)
+    metadata = read_parquet_metadata(path)
+
+    assert metadata['num_rows'] == len(df)
+    assert metadata['first_date'] == df.index[0]
+    assert metadata['last_date'] == df.index[-1]
+    pd.testing.assert_series_equal(metadata['first_row'], df.iloc[0])
+    pd.testing.assert_series_equal(metadata['last_row'], df.iloc[-1])
+
+
+def test_dates_from_statistics_without_rows(tmp_path):
+    path = tmp_path / 'data.parquet'
+    df = _write_ohlcv(path)
+    metadata = read_parquet_metadata(path, include_rows=False)
+
+    assert metadata['first_row'] is None and metadata['last_row'] is None
+    assert metadata['first_date'] == df.index[0]
+    assert metadata['last_date'] == df.index[-1]
+
+
+def test_single_row_and_range_index(tmp_path):
+    path = tmp_path / 'one.parquet'
+    pd.DataFrame({'Timestamp': ['2024-01-01'], 'Close': [1.5]}).to_parquet(path)
+    metadata = read_parquet_metadata(path)
+
+    assert metadata['num_rows'] == 1
+    assert metadata['first_date'] == '2024-01-01'
+    assert metadata['last_row'] is metadata['first_row']
+
+
+def test_index_reuses_entry_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / 'data.parquet'
+    _write_ohlcv(path)
+    index_file = tmp_path / 'index.json'
+
+    index = ParquetMetadataIndex(index_file)
+    first = index.get_metadata(path)
+    index.save()
+
+    reads = []
+    original = parquet_metadata.read_parquet_metadata
+    monkeypatch.setattr(parquet_metadata, 'read_parquet_metadata',
+                        lambda *a, **kw: reads.append(a) or original(*a, **kw))
+
+    reloaded = ParquetMetadataIndex(index_file)
+    cached = reloaded.get_metadata(path)
+    assert reads == []
+    assert cached['num_rows'] == first['num_rows']
+    assert cached['last_date'] == first['last_date']
+    assert float(cached['last_row']['Close']) == pytest.approx(float(first['last_row']['Close']))
+
+    # Stats-only lookups are served by a full entry, not the other way round
+    assert reloaded.get_metadata(path, include_rows=False)['first_row'] is None
+    assert reads == []
+
+    _write_ohlcv(path, rows=1200)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert reloaded.get_metadata(path)['num_rows'] == 1200
+    assert len(reads) == 1
+
+
+def test_index_upgrades_stats_only_entry(tmp_path):
+    path = tmp_path / 'data.parquet'
+    _write_ohlcv(path)
+    index = ParquetMetadataIndex(tmp_path / 'index.json')
+
+    assert index.get_metadata(path, include_rows=False)['first_row'] is None
+    assert index.get_metadata(path, include_rows=True)['first_row'] is not None
+
+
+def test_prune_and_corrupt_index(tmp_path):
+    path = tmp_path / 'data.parquet'
+    _write_ohlcv(path)
+    index_file = tmp_path / 'index.json'
+
+    index = ParquetMetadataIndex(index_file)
+    index.get_metadata(path)
+    index.save()
+    path.unlink()
+    index.prune()
+    assert index.entries == {}
+
+    index_file.write_text('{not json')
+    assert ParquetMetadataIndex(index_file).entries == {}
+
+
+def test_index_saves_nat_and_timedelta_rows(tmp_path):
+    path = tmp_path / 'data.parquet'
+    pd.DataFrame({'Timestamp': [pd.NaT, pd.Timestamp('2024-01-02')],
+                  'Hold': [pd.Timedelta(minutes=5), pd.NaT],
+                  'Close': [1.5, 2.5]}).to_parquet(path)
+    index_file = tmp_path / 'index.json'
+
+    index = ParquetMetadataIndex(index_file)
+    first = index.get_metadata(path)
+    index.save()
+    assert not index_file.with_name(index_file.name + '.tmp').exists()
+
+    cached = ParquetMetadataIndex(index_file).get_metadata(path)
+    assert pd.isna(cached['first_date'])
+    assert pd.isna(cached['first_row']['Timestamp'])
+    assert cached['first_row']['Hold'] == first['first_row']['Hold'] == pd.Timedelta(minutes=5)
+    assert cached['last_row']['Timestamp'] == pd.Timestamp('2024-01-02')
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# tests/data/test_parquet_reader.py
+
+"""
+Tests for the shared Parquet reader with column and time-range pushdown.
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.data.parquet_reader import find_time_column, parquet_row_count, read_parquet_data
+
+
+@pytest.fixture
+def ohlcv():
+    n = 1000
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        'Open': rng.random(n), 'High': rng.random(n), 'Low': rng.random(n),
+        'Close': rng.random(n), 'Volume': rng.random(n),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='h', name='DateTime'))
+
+
+@pytest.fixture
+def indexed_file(tmp_path, ohlcv):
+    path = tmp_path / "indexed.parquet"
+    ohlcv.to_parquet(path, row_group_size=100)
+    return path
+
+
+def test_full_read_matches_pandas(indexed_file):
+    pd.testing.assert_frame_equal(read_parquet_data(indexed_file), pd.read_parquet(indexed_file))
+
+
+def test_time_range_on_datetime_index(indexed_file, ohlcv):
+    df = read_parquet_data(indexed_file, start='2024-01-10', end='2024-01-12 05:00')
+    expected = ohlcv.loc['2024-01-10':'2024-01-12 05:00']
+    pd.testing.assert_frame_equal(df, expected, check_freq=False)
+
+
+def test_open_ended_ranges(indexed_file, ohlcv):
+    assert len(read_parquet_data(indexed_file, start='2024-02-01')) == len(ohlcv.loc['2024-02-01':])
+    assert len(read_parquet_data(indexed_file, end='2024-01-01 09:00')) == 10
+
+
+def test_column_projection_keeps_index(indexed_file):
+    df = read_parquet_data(indexed_file, columns=['Close', 'Missing'], start='2024-01-05')
+    assert list(df.columns) == ['Close']
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert df.index.min() == pd.Timestamp('2024-01-05')
+
+
+def test_time_column_stored_as_regular_column(tmp_path, ohlcv):
+    path = tmp_path / "column.parquet"
+    ohlcv.reset_index().to_parquet(path, index=False, row_group_size=100)
+    df = read_parquet_data(path, columns=['Open'], start='2024-01-03', end='2024-01-03 23:00')
+    assert list(df.columns) == ['DateTime', 'Open']
+    assert len(df) == 24
+
+
+def test_string_time_column_is_filtered_in_pandas(tmp_path, ohlcv):
+    path = tmp_path / "strings.parquet"
+    frame = ohlcv.reset_index()
+    frame['DateTime'] = frame['DateTime'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    frame.to_parquet(path, index=False)
+    df = read_parquet_data(path, start='2024-01-02', end='2024-01-02 11:00')
+    assert len(df) == 12
+
+
+def test_timezone_aware_column(tmp_path, ohlcv):
+    path = tmp_path / "tz.parquet"
+    ohlcv.tz_localize('UTC').to_parquet(path)
+    df = read_parquet_data(path, start='2024-01-02', end='2024-01-02 02:00')
+    assert len(df) == 3
+    assert str(df.index.tz) == 'UTC'
+
+
+def test_find_time_column_and_row_count(indexed_file):
+    schema = pq.read_schema(indexed_file)
+    assert find_time_column(schema) == 'DateTime'
+    assert find_time_column(schema, 'Close') == 'Close'
+    assert find_time_column(schema, 'Nope') is None
+    assert parquet_row_count(indexed_file) == 1000
@@ -0,0 +1,76 @@
+import os
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from src.eda import eda_batch_check
+
+
+@pytest.fixture
+def parquet_files(tmp_path):
+    rng = np.random.default_rng(11)
+    files = []
+    for i in range(4):
+        index = pd.date_range('2024-01-01', periods=500, freq='h').delete(np.r_[100 + i:110 + i])
+        close = 100 + rng.normal(0, 1, len(index)).cumsum()
+        df = pd.DataFrame({
+            'Open': close,
+            'Close': close,
+            'Volume': rng.exponential(10, len(index)),
+            'Timestamp': index
+        })
+        df.loc[5 + i, 'Close'] = np.nan
+        df.loc[7, 'Volume'] = 0.0
+        df.loc[9, 'Open'] = -1.0
+        df.loc[11, 'Close'] = np.inf
+        df = pd.concat([df, df.iloc[:2]], ignore_index=True)
+        path = tmp_path / f'file_{i}.parquet'
+        df.to_parquet(path)
+        files.append(str(path))
+    return files
+
+
+def run_main(files, extra_args, capsys):
+    argv = ['eda_batch_check.py', '--data-quality-checks', '--descriptive-stats',
+            '--outlier-analysis'] + extra_args
+    with patch('os.walk', return_value=[('/fake', [], [])]), \
+         patch('glob.glob', return_value=files), \
+         patch('src.eda.eda_batch_check.folder_stats'), \
+         patch('src.eda.eda_batch_check.stats_logger') as mock_logger, \
+         patch('src.eda.eda_batch_check.check_memory_usage', return_value=100.0), \
+         patch.object(sys, 'argv', argv):
+        mock_logger.log_global_stats_summary.return_value = 'global.json'
+        mock_logger.log_descriptive_stats.return_value = 'descriptive.json'
+        mock_logger.log_outlier_analysis.return_value = 'outliers.json'
+        eda_batch_check.main()
+    collector = mock_logger.log_global_stats_summary.call_args[0][0]
+    return capsys.readouterr().out, collector
+
+
+def test_parallel_output_matches_sequential(parquet_files, capsys):
+    sequential_out, sequential_stats = run_main(parquet_files, [], capsys)
+    parallel_out, parallel_stats = run_main(parquet_files, ['--jobs', '2'], capsys)
+
+    parallel_out = '\n'.join(line for line in parallel_out.split('\n') if 'Using 2 worker processes' not in line)
+    assert parallel_out == sequential_out
+    assert "Gap Check: Found 1 gaps" in sequential_out
+    assert parallel_stats.descriptive_summary == sequential_stats.descriptive_summary
+    assert parallel_stats.outlier_summary == sequential_stats.outlier_summary
+
+
+def test_stats_collector_merge():
+    first = eda_batch_check.StatsCollector()
+    first.update_descriptive_stats('a.parquet', {'x': {'mean': 1.0, 'std': 5.0}})
+    second = eda_batch_check.StatsCollector()
+    second.update_descriptive_stats('b.parquet', {'y': {'mean': 1.0, 'std': 0.5}, 'z': {'mean': 2.0, 'std': 4.0}})
+
+    merged = eda_batch_check.StatsCollector()
+    merged.merge(first)
+    merged.merge(second)
+    assert merged.descriptive_summary['files_analyzed'] == 2
+    assert merged.descriptive_summary['total_columns'] == 3
+    assert merged.descriptive_summary['high_variance_cols'] == [('a.parquet', 'x', 5.0), ('b.parquet', 'z', 2.0)]
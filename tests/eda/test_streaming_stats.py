@@ -0,0 +1,198 @@
+import os
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from src.eda import eda_batch_check, streaming_stats
+from src.eda.streaming_stats import FileProfile, NumericAccumulator, TDigest, profile_parquet_file
+
+
+@pytest.fixture
+def ohlcv_file(tmp_path):
+    rng = np.random.default_rng(7)
+    index = pd.date_range('2024-01-01', periods=20_000, freq='min').delete(np.r_[5000:5060])
+    close = 100 + rng.normal(0, 0.1, len(index)).cumsum()
+    close[10] = np.nan
+    close[20] = np.inf
+    df = pd.DataFrame({
+        'Open': close,
+        'Close': close,
+        'Volume': rng.exponential(10, len(index)),
+        'Symbol': 'EURUSD'
+    }, index=pd.Index(index, name='Timestamp'))
+    df.loc[df.index[30], 'Volume'] = -1.0
+    path = tmp_path / 'ohlcv.parquet'
+    df.to_parquet(path, row_group_size=3000)
+    return str(path), df
+
+
+def test_numeric_accumulator_matches_pandas():
+    rng = np.random.default_rng(1)
+    values = rng.lognormal(0, 1, 50_000)
+    acc = NumericAccumulator()
+    for chunk in np.array_split(values, 7):
+        acc.update(chunk)
+    series = pd.Series(values)
+
+    assert acc.mean == pytest.approx(series.mean())
+    assert acc.var == pytest.approx(series.var())
+    assert acc.skewness == pytest.approx(series.skew())
+    assert acc.kurtosis == pytest.approx(series.kurt())
+    assert acc.digest.quantile(0.5) == pytest.approx(series.median(), rel=0.01)
+    assert acc.digest.quantile(0.99) == pytest.approx(series.quantile(0.99), rel=0.02)
+
+
+def test_tdigest_merge_is_bounded():
+    rng = np.random.default_rng(2)
+    digests = []
+    for _ in range(5):
+        digest = TDigest()
+        digest.update(rng.normal(0, 1, 20_000))
+        digests.append(digest)
+    merged = TDigest()
+    for digest in digests:
+        merged.merge(digest)
+
+    assert merged.total_weight == 100_000
+    assert len(merged.means) <= merged.compression
+    assert merged.quantile(0.5) == pytest.approx(0.0, abs=0.02)
+    assert merged.cdf(1.0) == pytest.approx(0.8413, abs=0.005)
+
+
+def test_profile_parquet_file(ohlcv_file):
+    path, df = ohlcv_file
+    profile = profile_parquet_file(path, batch_rows=1000)
+
+    assert profile.rows == len(df)
+    assert profile.batches >= 20
+    close = profile.columns['Close']
+    assert (close.nan, close.posinf) == (1, 1)
+    assert profile.columns['Volume'].negative == 1
+    assert profile.columns['Symbol'].kind == 'other'
+
+    desc = profile.descriptive_stats()['Volume']
+    assert desc['mean'] == pytest.approx(df['Volume'].mean())
+    assert desc['std'] == pytest.approx(df['Volume'].std())
+
+    timestamps = profile.columns['Timestamp']
+    expected = timestamps.median_delta()
+    assert pd.Timedelta(expected) == pd.Timedelta(minutes=1)
+    assert timestamps.gap_count(expected) == 1
+    assert pd.Timedelta(timestamps.largest_gaps(expected)[0][0]) == pd.Timedelta(minutes=61)
+
+
+def test_profiles_merge_across_files(ohlcv_file):
+    path, df = ohlcv_file
+    merged = FileProfile('all files')
+    merged.merge(profile_parquet_file(path))
+    merged.merge(profile_parquet_file(path, batch_rows=4096))
+
+    volume = merged.columns['Volume']
+    assert merged.rows == 2 * len(df)
+    assert volume.n == 2 * len(df)
+    assert volume.mean == pytest.approx(df['Volume'].mean())
+    assert volume.var == pytest.approx(pd.concat([df['Volume']] * 2).var())
+
+
+def test_quality_checks_fill_summaries(ohlcv_file):
+    path, _ = ohlcv_file
+    profile = profile_parquet_file(path)
+    nan_summary, gap_summary, negative_summary, inf_summary = [], [], [], []
+    with patch('builtins.print'):
+        streaming_stats.nan_check(profile, nan_summary, eda_batch_check.Fore, eda_batch_check.Style)
+        streaming_stats.gap_check(profile, gap_summary, eda_batch_check.Fore, eda_batch_check.Style, file_name=path)
+        streaming_stats.negative_check(profile, negative_summary, eda_batch_check.Fore, eda_batch_check.Style, file_name=path)
+        streaming_stats.inf_check(profile, inf_summary, eda_batch_check.Fore, eda_batch_check.Style, file_name=path)
+
+    assert [entry['column'] for entry in nan_summary] == ['Open', 'Close']
+    assert len(gap_summary) == 1 and gap_summary[0]['delta'] == pd.Timedelta(minutes=61)
+    assert [entry['column'] for entry in negative_summary] == ['Volume']
+    assert [entry['column'] for entry in inf_summary] == ['Open', 'Close']
+
+
+@patch('src.eda.eda_batch_check.folder_stats')
+def test_main_streaming_has_no_file_limit(mock_folder_stats, ohlcv_file):
+    path, _ = ohlcv_file
+    files = [path] * 12
+    mock_folder_stats.get_folder_stats.return_value = {'folder': '/fake', 'total_size_mb': 1.0, 'file_count': 12}
+    with patch('os.walk', return_value=[('/fake', [], [])]), \
+         patch('glob.glob', return_value=files), \
+         patch.dict(os.environ, {'DOCKER_CONTAINER': '1'}), \
+         patch('src.eda.eda_batch_check.stats_logger') as mock_logger, \
+         patch('builtins.print'), \
+         patch.object(sys, 'argv', ['eda_batch_check.py', '--streaming', '--data-quality-checks', '--all-stats']):
+        mock_logger.log_global_stats_summary.return_value = 'global.json'
+        eda_batch_check.main()
+
+    collector = mock_logger.log_global_stats_summary.call_args[0][0]
+    assert collector.descriptive_summary['files_analyzed'] == 12
+    assert collector.streaming_profile.rows == 12 * profile_parquet_file(path).rows
+
+
+def test_sample_rows_reads_end_row_groups(ohlcv_file):
+    path, df = ohlcv_file
+    head, tail = streaming_stats.sample_rows(path)
+    pd.testing.assert_frame_equal(head, df.head(5))
+    pd.testing.assert_frame_equal(tail, df.tail(5))
+
+
+def test_file_info_metadata_only_matches_full_read(ohlcv_file):
+    path, _ = ohlcv_file
+    full = eda_batch_check.file_info.get_file_info(path)
+    with patch('pandas.read_parquet', side_effect=AssertionError('full read')):
+        footer = eda_batch_check.file_info.get_file_info(path, metadata_only=True)
+    footer.pop('parquet_schema'), full.pop('parquet_schema')  # repr includes an object address
+    assert footer == full
+
+
+@pytest.mark.parametrize('mode_args', [['--data-quality-checks', '--all-stats'], []])
+@patch('src.eda.eda_batch_check.folder_stats')
+def test_main_streaming_never_reads_whole_file(mock_folder_stats, ohlcv_file, mode_args):
+    path, _ = ohlcv_file
+    mock_folder_stats.get_folder_stats.return_value = {'folder': '/fake', 'total_size_mb': 1.0, 'file_count': 1}
+    with patch('os.walk', return_value=[('/fake', [], [])]), \
+         patch('glob.glob', return_value=[path]), \
+         patch('pandas.read_parquet', side_effect=AssertionError('full read in streaming mode')), \
+         patch('src.eda.eda_batch_check.stats_logger') as mock_logger, \
+         patch('builtins.print') as mock_print, \
+         patch.object(sys, 'argv', ['eda_batch_check.py', '--streaming'] + mode_args):
+        mock_logger.log_global_stats_summary.return_value = 'global.json'
+        eda_batch_check.main()
+
+    output = ' '.join(str(arg) for call in mock_print.call_args_list for arg in call.args)
+    assert 'Error reading' not in output
+    assert 'full read' not in output
+
+
+def test_basic_stats_match_pandas(ohlcv_file):
+    path, df = ohlcv_file
+    stats = profile_parquet_file(path, batch_rows=4096).basic_stats()
+
+    assert stats['Symbol'] == {'missing': 0}
+    assert stats['Volume']['missing'] == 0 and stats['Open']['missing'] == 1
+    volume = df['Volume']
+    assert stats['Volume']['mean'] == pytest.approx(volume.mean())
+    assert stats['Volume']['std'] == pytest.approx(volume.std())
+    assert stats['Volume']['max'] == volume.max()
+    assert stats['Volume']['50%'] == pytest.approx(volume.median(), rel=0.01)
+
+
+@patch('src.eda.eda_batch_check.folder_stats')
+def test_main_streaming_basic_stats_are_logged(mock_folder_stats, ohlcv_file):
+    path, _ = ohlcv_file
+    mock_folder_stats.get_folder_stats.return_value = {'folder': '/fake', 'total_size_mb': 1.0, 'file_count': 2}
+    with patch('os.walk', return_value=[('/fake', [], [])]), \
+         patch('glob.glob', return_value=[path, path]), \
+         patch('src.eda.eda_batch_check.stats_logger') as mock_logger, \
+         patch('builtins.print'), \
+         patch.object(sys, 'argv', ['eda_batch_check.py', '--streaming', '--basic-stats']):
+        mock_logger.log_basic_stats.return_value = 'basic.json'
+        eda_batch_check.main()
+
+    results, file_paths = mock_logger.log_basic_stats.call_args[0]
+    assert file_paths == [path, path]
+    assert len(results) == 2 and results[0]['Close']['missing'] == 1
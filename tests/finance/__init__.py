@@ -0,0 +1,3 @@
+"""
+Finance Tests Package
+"""
@@ -0,0 +1,85 @@
+"""
+Tests for the vectorized drawdown episode engine.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.finance.drawdown_analysis import DrawdownAnalysis
+from src.finance.drawdown_episodes import compute_drawdown_episodes
+
+
+def _reference_episodes(values):
+    """Loop implementation: (start, recovery or -1, depth) per underwater run."""
+    running_max = np.maximum.accumulate(values)
+    drawdown = (values - running_max) / running_max
+    episodes, start = [], None
+    for i, dd in enumerate(drawdown):
+        if dd < 0 and start is None:
+            start = i
+        elif dd >= 0 and start is not None:
+            episodes.append((start, i, drawdown[start:i].min()))
+            start = None
+    if start is not None:
+        episodes.append((start, -1, drawdown[start:].min()))
+    return episodes
+
+
+class TestDrawdownEpisodes:
+    """Test cases for compute_drawdown_episodes and its use in DrawdownAnalysis."""
+
+    def setup_method(self):
+        """Random walk on a daily index."""
+        rng = np.random.default_rng(3)
+        index = pd.date_range('2020-01-01', periods=2000, freq='D')
+        self.cumulative = pd.Series(np.exp(np.cumsum(rng.normal(0, 0.01, len(index)))),
+                                    index=index, name='Close_cumulative')
+
+    def test_matches_loop_reference(self):
+        episodes = compute_drawdown_episodes(self.cumulative)
+        reference = _reference_episodes(self.cumulative.to_numpy())
+
+        assert len(episodes) == len(reference) > 10
+        assert episodes.starts.tolist() == [start for start, _, _ in reference]
+        assert episodes.ends.tolist() == [end for _, end, _ in reference]
+        np.testing.assert_allclose(episodes.depths, [depth for _, _, depth in reference])
+
+    def test_durations_and_ongoing(self):
+        values = pd.Series([1.0, 0.9, 0.95, 1.0, 1.1, 1.0, 0.8],
+                           index=pd.date_range('2024-01-01', periods=7, freq='12h'))
+        episodes = compute_drawdown_episodes(values)
+
+        assert episodes.starts.tolist() == [1, 5]
+        assert episodes.ends.tolist() == [3, -1]
+        assert episodes.durations.tolist() == [1, 0]
+        assert episodes.is_ongoing
+        assert episodes.time_since_high() == 1
+        periods = episodes.to_periods()
+        assert periods[0]['maximum_drawdown'] == pytest.approx(-0.1)
+        assert periods[1]['end_date'] == 'ongoing'
+
+        # Bars for non-datetime indexes
+        bars = compute_drawdown_episodes(values.reset_index(drop=True))
+        assert bars.durations.tolist() == [2, 1]
+
+    def test_no_drawdown(self):
+        episodes = compute_drawdown_episodes(pd.Series([1.0, 1.1, 1.2]))
+        assert len(episodes) == 0
+        assert not episodes.is_ongoing
+        assert episodes.time_since_high() == 0
+
+    def test_analysis_uses_episodes(self):
+        data = pd.DataFrame({'Close': self.cumulative * 100})
+        analyzer = DrawdownAnalysis()
+        results = analyzer.analyze_drawdowns(data, ['Close'])
+
+        assert 'error' not in results
+        episodes = compute_drawdown_episodes(analyzer._calculate_cumulative_returns(data, ['Close'])['Close_cumulative'])
+        duration_stats = results['drawdown_duration']['duration_statistics']['Close']
+        assert duration_stats['total_drawdown_periods'] == len(episodes)
+        assert duration_stats['max_duration'] == episodes.durations.max()
+        recovery = results['recovery_analysis']['recovery_statistics']['Close']
+        assert recovery['average_recovery_time'] == pytest.approx(episodes.recovery_times.mean())
+        assert results['maximum_drawdown']['maximum_drawdowns']['Close']['maximum_drawdown'] == pytest.approx(episodes.depths.min())
+        assert analyzer._episodes == {}
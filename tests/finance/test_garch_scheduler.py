@@ -0,0 +1,87 @@
+"""
+Tests for concurrent, warm-started and cached GARCH fitting.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.finance.core import garch_scheduler
+from src.finance.core.garch_scheduler import GARCHFitScheduler, series_fingerprint
+from src.finance.volatility_analysis import VolatilityAnalysis
+
+pytest.importorskip("arch")
+
+MODEL_TYPES = ['GARCH', 'GJR-GARCH']
+
+
+def _returns(seed, n=1500):
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.standard_t(5, n), index=pd.date_range('2020-01-01', periods=n, freq='D'))
+
+
+@pytest.mark.filterwarnings('ignore')
+class TestGARCHFitScheduler:
+    """Test cases for GARCHFitScheduler."""
+
+    def setup_method(self):
+        """Two columns of returns."""
+        self.returns = {'Close': _returns(1), 'Open': _returns(2)}
+
+    def test_fingerprint_depends_on_values_only(self):
+        shifted = self.returns['Close'].copy()
+        shifted.index = shifted.index + pd.Timedelta(days=1)
+        assert series_fingerprint(shifted) == series_fingerprint(self.returns['Close'])
+        assert series_fingerprint(self.returns['Open']) != series_fingerprint(self.returns['Close'])
+
+    def test_cached_rerun_skips_fitting(self, tmp_path):
+        first = GARCHFitScheduler(cache_dir=tmp_path, max_workers=1, use_cache=True).fit_models(self.returns, MODEL_TYPES)
+        assert all(first[col][model]['success'] for col in first for model in MODEL_TYPES)
+
+        scheduler = GARCHFitScheduler(cache_dir=tmp_path, max_workers=1, use_cache=True)
+        with patch.object(scheduler.modeler, 'fit_garch_model') as mock_fit:
+            second = scheduler.fit_models(self.returns, MODEL_TYPES)
+        mock_fit.assert_not_called()
+        assert second['Close']['GARCH']['from_cache']
+        assert second['Close']['GARCH']['parameters'] == first['Close']['GARCH']['parameters']
+
+    def test_changed_series_warm_starts(self, tmp_path):
+        GARCHFitScheduler(cache_dir=tmp_path, max_workers=1, use_cache=True).fit_models(
+            self.returns, MODEL_TYPES, source='EURUSD.parquet')
+        extended = {'Close': pd.concat([self.returns['Close'], _returns(3, 50)], ignore_index=True)}
+
+        scheduler = GARCHFitScheduler(cache_dir=tmp_path, max_workers=1, use_cache=True)
+        result = scheduler.fit_models(extended, MODEL_TYPES, source='EURUSD.parquet')
+        assert result['Close']['GARCH']['warm_start']
+        assert 'from_cache' not in result['Close']['GARCH']
+
+        # Another instrument's Close never starts from EURUSD's parameters
+        other = scheduler.fit_models({'Close': _returns(5)}, MODEL_TYPES, source='BTCUSD.parquet')
+        assert not other['Close']['GARCH'].get('warm_start')
+
+    def test_cache_is_opt_in(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = GARCHFitScheduler(max_workers=1).fit_models(self.returns, MODEL_TYPES, source='EURUSD.parquet')
+        assert result['Close']['GARCH']['success']
+        assert not (tmp_path / 'data').exists()
+
+    def test_process_pool_matches_sequential(self, tmp_path):
+        sequential = GARCHFitScheduler(max_workers=1, use_cache=False).fit_models(self.returns, MODEL_TYPES)
+        with patch.object(garch_scheduler, 'PARALLEL_MIN_OBSERVATIONS', 0):
+            parallel = GARCHFitScheduler(max_workers=2, use_cache=False).fit_models(self.returns, MODEL_TYPES)
+
+        for col in self.returns:
+            for model in MODEL_TYPES:
+                assert parallel[col][model]['parameters'] == pytest.approx(sequential[col][model]['parameters'])
+
+    def test_volatility_analysis_uses_scheduler(self, tmp_path):
+        prices = 100 * np.exp(np.cumsum(_returns(4) * 0.01))
+        data = pd.DataFrame({'Close': prices})
+        analyzer = VolatilityAnalysis(GARCHFitScheduler(cache_dir=tmp_path, max_workers=1, use_cache=True))
+        results = analyzer.analyze_volatility(data, ['Close'])
+
+        models = results['garch_models']['garch_models']['Close']
+        assert set(models) == {'GARCH', 'EGARCH', 'GJR-GARCH'}
+        assert len(list(tmp_path.glob('v*_*.json'))) == 3
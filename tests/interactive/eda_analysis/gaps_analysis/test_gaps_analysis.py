@@ -82,6 +82,47 @@ class TestGapsDetector:
             assert 'duration' in gap
             assert 'expected_missing_points' in gap
     
+    def test_fx_weekend_is_not_a_gap(self):
+        """Test that the FX weekend closure is skipped for every timeframe."""
+        dates = pd.date_range('2024-01-01', '2024-01-31', freq='1min')
+        weekday = dates.dayofweek + (dates.hour + dates.minute / 60) / 24
+        dates = dates[(weekday < 4 + 22 / 24) | (weekday >= 6 + 22 / 24)]
+        # A 10 minute hole and one missing Monday (longer than 24h)
+        dates = dates[(dates < '2024-01-03 12:00') | (dates >= '2024-01-03 12:10')]
+        dates = dates[(dates < '2024-01-15 00:00') | (dates >= '2024-01-16 00:00')]
+        fx_detector = GapsDetector(calendar='fx')
+        
+        gaps = fx_detector._find_gaps_vectorized(dates, timedelta(minutes=1), 'M1')
+        assert [gap['start'] for gap in gaps] == ['2024-01-03T11:59:00', '2024-01-14T23:59:00']
+        
+        hourly = dates[dates.minute == 0]
+        gaps = fx_detector._find_gaps_vectorized(hourly, timedelta(hours=1), 'H1')
+        assert [gap['start'] for gap in gaps] == ['2024-01-14T23:00:00']
+        
+        no_calendar = self.detector._find_gaps_vectorized(hourly, timedelta(hours=1), 'H1')
+        assert len(no_calendar) == 5  # four weekends plus the missing Monday
+        
+        with_holiday = GapsDetector(calendar='fx', holidays=['2024-01-15'])._find_gaps_vectorized(
+            hourly, timedelta(hours=1), 'H1')
+        assert with_holiday == []
+        
+        # MTF data of an FX symbol uses the FX calendar by default
+        result = self.detector.detect_gaps_in_mtf_data({'H1': pd.DataFrame({'Close': 1.0}, index=hourly),
+                                                        '_metadata': {'symbol': 'EURUSD', 'source': 'csv'}})
+        assert result['timeframe_gaps']['H1']['gap_count'] == 1
+    
+    def test_weekend_outage_in_24_7_data_is_reported(self):
+        """Test that a weekend outage of 24/7 (crypto) data is a gap by default."""
+        dates = pd.date_range('2024-01-01', '2024-01-31', freq='1h')
+        dates = dates[(dates < '2024-01-13 06:00') | (dates >= '2024-01-14 18:00')]
+        mtf_data = {'H1': pd.DataFrame({'Close': 1.0}, index=dates),
+                    '_metadata': {'symbol': 'BTCUSDT', 'source': 'binance'}}
+        
+        result = GapsAnalyzer().detector.detect_gaps_in_mtf_data(mtf_data)
+        gaps = result['timeframe_gaps']['H1']['gaps']
+        assert len(gaps) == 1
+        assert gaps[0]['expected_missing_points'] == 36
+    
     def test_calculate_gap_statistics(self):
         """Test gap statistics calculation."""
         gaps = [
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# tests/interactive/test_monte_carlo_backtesting.py
+
+"""Tests for the matrix-based Monte Carlo backtesting engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.interactive.backtesting.monte_carlo_backtesting import (
+    METRIC_COLUMNS, MonteCarloBacktesting, path_metrics
+)
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({'Close': 100 * np.exp(rng.normal(0.0005, 0.01, 400).cumsum())})
+
+
+def test_path_metrics_match_per_path_loop():
+    returns = np.random.default_rng(2).normal(0.001, 0.02, (5, 60))
+    metrics = path_metrics(returns)
+
+    for i, row in enumerate(returns):
+        growth = np.cumprod(1 + row)
+        peak = np.maximum.accumulate(growth)
+        assert metrics['total_return'][i] == pytest.approx(growth[-1] - 1)
+        assert metrics['volatility'][i] == pytest.approx(np.std(row) * np.sqrt(252))
+        assert metrics['sharpe_ratio'][i] == pytest.approx(np.mean(row) / np.std(row) * np.sqrt(252))
+        assert metrics['max_drawdown'][i] == pytest.approx(np.min((growth - peak) / peak))
+
+
+def test_monte_carlo_simulation_is_columnar_and_block_independent(prices):
+    mcb = MonteCarloBacktesting()
+
+    result = mcb.monte_carlo_simulation(prices, n_simulations=300, seed=3)
+    blocked = mcb.monte_carlo_simulation(prices, n_simulations=300, seed=3, max_block_bytes=50_000)
+
+    assert result['status'] == 'success'
+    assert list(result['simulation_results'].columns) == METRIC_COLUMNS
+    assert len(result['simulation_results']) == 300
+    pd.testing.assert_frame_equal(blocked['simulation_results'], result['simulation_results'])
+    assert result['analysis']['n_simulations'] == 300
+
+
+def test_bootstrap_backtesting(prices):
+    mcb = MonteCarloBacktesting()
+
+    result = mcb.bootstrap_backtesting(prices, n_bootstrap=200, bootstrap_size=0.5, seed=4)
+    blocked = mcb.bootstrap_backtesting(prices, n_bootstrap=200, bootstrap_size=0.5, seed=4,
+                                        max_block_bytes=40_000)
+
+    assert result['status'] == 'success'
+    samples = result['bootstrap_results']
+    assert len(samples) == 200
+    pd.testing.assert_frame_equal(blocked['bootstrap_results'], samples)
+    low, high = result['analysis']['total_return']['confidence_interval']
+    assert low <= samples['total_return'].median() <= high
+
+
+@pytest.mark.parametrize('method', ['time_series', 'k_fold'])
+def test_cross_validation_backtesting(prices, method):
+    result = MonteCarloBacktesting().cross_validation_backtesting(prices, n_folds=4, validation_method=method)
+
+    assert result['status'] == 'success'
+    folds = result['cv_results']
+    assert len(folds) == (3 if method == 'time_series' else 4)
+    assert {'train_total_return', 'test_sharpe_ratio'} <= set(folds.columns)
+
+    returns = prices['Close'].pct_change().to_numpy()
+    first = folds.iloc[0]
+    test = returns[int(first['test_start']):int(first['test_end'])]
+    test = test[~np.isnan(test)]
+    assert first['test_total_return'] == pytest.approx(np.prod(1 + test) - 1)
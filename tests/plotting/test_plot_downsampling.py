@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# tests/plotting/test_plot_downsampling.py
+
+"""Tests for level-of-detail plot downsampling."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.common.constants import BUY, NOTRADE, SELL
+from src.plotting.plot_downsampling import bucket_extremes, downsample_for_plot, signal_change_rows
+
+
+@pytest.fixture
+def result_df():
+    rng = np.random.default_rng(3)
+    n = 200_000
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    direction = np.full(n, NOTRADE)
+    direction[rng.choice(n, 500, replace=False)] = BUY
+    direction[rng.choice(n, 500, replace=False)] = SELL
+    rsi = rng.uniform(0, 100, n)
+    rsi[:50] = np.nan
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.2, n),
+        'High': close + rng.uniform(0, 2, n),
+        'Low': close - rng.uniform(0, 2, n),
+        'Close': close,
+        'RSI': rsi,
+        'macd_signal': rng.normal(0, 1, n),
+        'Direction': direction,
+    }, index=pd.date_range('2020-01-01', periods=n, freq='min'))
+
+
+def test_small_frames_are_untouched(result_df):
+    small = result_df.iloc[:1000]
+    assert downsample_for_plot(small, target_width=500) is small
+
+
+def test_downsample_keeps_extremes_and_signals(result_df):
+    width = 800
+    reduced = downsample_for_plot(result_df, target_width=width)
+
+    assert len(reduced) < len(result_df) // 20
+    assert reduced.index.is_monotonic_increasing
+    assert reduced.index.isin(result_df.index).all()
+    # Global extremes of every plotted column survive
+    for col in ('High', 'RSI', 'macd_signal'):
+        assert reduced[col].max() == result_df[col].max()
+    for col in ('Low', 'RSI', 'macd_signal'):
+        assert reduced[col].min() == result_df[col].min()
+    # Every BUY/SELL signal is kept
+    signals = result_df[result_df['Direction'] != NOTRADE]
+    assert signals.index.isin(reduced.index).all()
+    # First and last bars keep the chart's open/close
+    assert reduced.index[0] == result_df.index[0]
+    assert reduced.index[-1] == result_df.index[-1]
+
+
+def test_bucket_extremes_per_bucket():
+    values = np.array([1.0, 5.0, np.nan, 3.0, -2.0, 4.0, 0.5])
+    argmax, argmin = bucket_extremes(values, 3)
+    assert argmax.tolist() == [1, 5, 6]
+    assert argmin.tolist() == [0, 4, 6]
+
+
+def test_signal_change_rows():
+    values = np.array([np.nan, np.nan, 0.0, 1.0, 1.0, 0.0, 2.0])
+    assert signal_change_rows(values).tolist() == [0, 2, 3, 5, 6]
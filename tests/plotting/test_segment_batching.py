@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# tests/plotting/test_segment_batching.py
+
+"""Tests for drawing signal-colored segments as one trace per color."""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from src.plotting.dual_chart_fastest import (SCATTERGL_POINT_THRESHOLD, _add_supertrend_segments,
+                                             create_discontinuous_line_traces)
+from src.plotting.segment_batching import (SEGMENT_TRACE_LIMIT, count_segments, nan_separated,
+                                           segment_bounds, sign_colors)
+
+
+def test_segment_bounds_and_count():
+    mask = np.array([True, True, False, True, False, False, True])
+    starts, ends = segment_bounds(mask)
+    assert starts.tolist() == [0, 3, 6]
+    assert ends.tolist() == [1, 3, 6]
+    assert count_segments(mask) == 3
+    assert count_segments(np.zeros(4, dtype=bool)) == 0
+
+
+def test_nan_separated_breaks_between_segments():
+    x = np.arange(7)
+    y = np.arange(7, dtype=float) * 10
+    mask = np.array([True, True, False, True, False, False, True])
+    x_values, y_values = nan_separated(x, y, mask)
+
+    assert x_values.tolist() == [0, 1, 1, 3, 3, 6]
+    np.testing.assert_array_equal(y_values, [0.0, 10.0, np.nan, 30.0, np.nan, 60.0])
+    empty_x, empty_y = nan_separated(x, y, np.zeros(7, dtype=bool))
+    assert len(empty_x) == len(empty_y) == 0
+
+
+def test_sign_colors():
+    colors = sign_colors(pd.Series([1.0, 0.0, -0.5, np.nan]))
+    assert colors.tolist() == ['green', 'green', 'red', 'red']
+    assert sign_colors([-1, 2], 'blue', 'orange').tolist() == ['orange', 'blue']
+
+
+def test_many_segments_are_batched_into_one_trace():
+    n = 1000
+    x = pd.date_range('2024-01-01', periods=n, freq='h')
+    y = pd.Series(np.sin(np.arange(n)), index=x)
+    mask = np.arange(n) % 4 == 0
+    assert count_segments(mask) > SEGMENT_TRACE_LIMIT
+
+    traces = create_discontinuous_line_traces(x, y, mask, 'Wave', 'red')
+    assert len(traces) == 1
+    assert isinstance(traces[0], go.Scatter)
+    assert np.isnan(np.asarray(traces[0].y, dtype=float)).sum() == count_segments(mask) - 1
+
+    # Few segments keep one trace per segment
+    few = np.zeros(n, dtype=bool)
+    few[10:20] = few[50:60] = True
+    assert len(create_discontinuous_line_traces(x, y, few, 'Wave', 'red')) == 2
+
+
+def test_large_batched_trace_uses_webgl():
+    n = SCATTERGL_POINT_THRESHOLD * 2
+    mask = (np.arange(n) // 3) % 2 == 0
+    traces = create_discontinuous_line_traces(np.arange(n), np.ones(n), mask, 'Wave', 'blue')
+    assert len(traces) == 1
+    assert isinstance(traces[0], go.Scattergl)
+
+
+def test_supertrend_trace_count_bounded_on_flips():
+    n = 2000
+    idx = pd.date_range('2024-01-01', periods=n, freq='h')
+    trend = np.where((np.arange(n) // 2) % 2 == 0, 1, -1)
+    fig = go.Figure().set_subplots(rows=2, cols=1)
+    _add_supertrend_segments(fig, idx, np.linspace(100, 110, n), trend,
+                             ('#00C851', '#FF4444', '#FFC107'))
+
+    names = [trace.name for trace in fig.data]
+    assert names.count('SuperTrend (Uptrend)') == 1
+    assert names.count('SuperTrend (Downtrend)') == 1
+    assert names.count('SuperTrend (Signal Change)') == 1
+    assert len(fig.data) == 6  # three colors plus their glow traces
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# tests/plotting/test_term_chunk_view.py
+
+"""Tests for lazy terminal chunks and cached/prefetched navigation frames."""
+
+import sys
+from collections import Counter
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.plotting.term_chunked_plot_base import LazyChunkView, split_dataframe_into_chunks
+from src.plotting.term_navigation import AutoTerminalNavigator, TerminalNavigator
+
+
+@pytest.fixture
+def df():
+    n = 1005
+    return pd.DataFrame({'Close': np.arange(n, dtype=float)},
+                        index=pd.date_range('2024-01-01', periods=n, freq='h'))
+
+
+def test_lazy_view_matches_split(df):
+    view = LazyChunkView(df, 100)
+    chunks = split_dataframe_into_chunks(df, 100)
+
+    assert len(view) == len(chunks) == 11
+    for lazy, eager in zip(view, chunks):
+        pd.testing.assert_frame_equal(lazy, eager)
+    assert len(view[-1]) == 5
+    assert view.bounds(10) == (1000, 1005)
+    assert view.index_bounds(0) == (df.index[0], df.index[99])
+    assert [len(c) for c in view[1:3]] == [100, 100]
+    with pytest.raises(IndexError):
+        view[11]
+    assert len(LazyChunkView(None, 10)) == 0
+
+
+def test_lazy_view_find_chunk(df):
+    view = LazyChunkView(df, 100)
+    assert view.find_chunk(df.index[250]) == 2
+    assert view.find_chunk(df.index[250] + pd.Timedelta(minutes=30)) == 2
+    assert view.find_chunk(pd.Timestamp('2023-01-01')) is None
+    assert view.find_chunk(df.index[-1]) == 10
+
+
+@patch('builtins.input')
+def test_navigation_renders_each_chunk_once(mock_input, df):
+    mock_input.side_effect = ['', 'p', 'n', 'q']
+    navigator = TerminalNavigator(LazyChunkView(df, 100), "Test", prefetch=True)
+    rendered = Counter()
+
+    def plot_function(chunk, chunk_index, chunk_info):
+        rendered[chunk_index] += 1
+        print(f"frame {chunk_index} rows={chunk_info['rows']}")
+
+    stdout_before = sys.stdout
+    navigator.navigate(plot_function)
+    assert sys.stdout is stdout_before
+
+    # Shown 0, 1, 0, 1 (chunk 2 may have been prefetched); nothing rendered twice
+    assert rendered[0] == rendered[1] == 1
+    assert set(rendered) <= {0, 1, 2} and max(rendered.values()) == 1
+
+
+@patch('builtins.input')
+def test_navigation_frames_are_replayed(mock_input, df, capsys):
+    mock_input.side_effect = ['n', 'p', 'q']
+    navigator = TerminalNavigator(LazyChunkView(df, 100), "Test", prefetch=True)
+    navigator.navigate(lambda chunk, i, info: print(f"frame {i} start={info['start_date']}"))
+
+    out = capsys.readouterr().out
+    assert out.count(f"frame 0 start={df.index[0]}") == 2
+    assert out.count(f"frame 1 start={df.index[100]}") == 1
+    assert "frame 2" not in out
+
+
+@patch('builtins.input')
+def test_auto_navigation_caches_per_field(mock_input, df):
+    mock_input.side_effect = ['f', 'b', 'n', 'q']
+    frame = df.assign(pressure=1.0, other=2.0)
+    navigator = AutoTerminalNavigator(LazyChunkView(frame, 100), "Test", ['Close', 'pressure', 'other'])
+    rendered = []
+    navigator.navigate(lambda chunk, i, info: rendered.append((i, navigator.get_current_field())))
+
+    assert rendered == [(0, 'Close'), (0, 'pressure'), (0, 'Close'), (1, 'Close')]
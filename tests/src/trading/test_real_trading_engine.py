@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# tests/src/trading/test_real_trading_engine.py
+
+"""Tests for the fast (array) mode of BacktestEngine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.trading.real_trading_engine import BacktestEngine, BarView, OrderSide, OrderType
+
+
+def _signal_strategy(engine, row, timestamp):
+    price = row['BTCUSDT']
+    signal = row['signal']
+    if signal == 1:
+        engine.place_order('BTCUSDT', OrderSide.BUY, OrderType.MARKET, 0.1)
+    elif signal == 2:
+        engine.place_order('BTCUSDT', OrderSide.SELL, OrderType.MARKET, 0.1)
+    elif signal == 3:
+        engine.place_order('BTCUSDT', OrderSide.BUY, OrderType.LIMIT, 0.05, price=price * 0.999)
+    elif signal == 4:
+        engine.place_order('BTCUSDT', OrderSide.SELL, OrderType.STOP, 0.05, stop_price=price * 0.999)
+    elif signal == 5:
+        raise ValueError("strategy failure is logged and skipped")
+
+
+def _run(data, fast):
+    engine = BacktestEngine(initial_capital=1000.0)
+    result = engine.run_backtest(data, _signal_strategy, data.index[0], data.index[-1], fast=fast)
+    trades = [(t.side, t.quantity, t.price, t.timestamp, t.commission) for t in engine.trades]
+    return result, trades, engine
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_fast_mode_matches_row_mode(seed):
+    rng = np.random.default_rng(seed)
+    n = 1500
+    data = pd.DataFrame({
+        'BTCUSDT': 100 + rng.standard_normal(n).cumsum() * 0.2,
+        'signal': rng.choice([0, 1, 2, 3, 4, 5], n, p=[0.9, 0.03, 0.03, 0.015, 0.015, 0.01]).astype(float),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='min'))
+
+    slow, slow_trades, slow_engine = _run(data, fast=False)
+    fast, fast_trades, fast_engine = _run(data, fast=True)
+
+    assert slow['status'] == fast['status'] == 'success'
+    assert fast_trades == slow_trades
+    assert fast_engine.cash == slow_engine.cash
+    slow_results, fast_results = dict(slow['results']), dict(fast['results'])
+    pd.testing.assert_frame_equal(pd.DataFrame(fast_results.pop('portfolio_history')),
+                                  pd.DataFrame(slow_results.pop('portfolio_history')))
+    assert fast_results == pytest.approx(slow_results, nan_ok=True)
+    assert len(fast_engine.portfolio_history) == len(data)
+    pd.testing.assert_frame_equal(pd.DataFrame(fast_engine.portfolio_history),
+                                  pd.DataFrame(slow_engine.portfolio_history))
+
+
+def test_bar_view_row_api():
+    index = pd.Index(['close', 'volume'])
+    bar = BarView({'close': [1.0, 2.0], 'volume': [10.0, 20.0]}, index, 1, name='t1')
+
+    assert bar['close'] == 2.0
+    assert bar.get('missing', -1) == -1
+    assert 'volume' in bar.index and 'volume' in bar
+    pd.testing.assert_series_equal(bar.to_series(), pd.Series({'close': 2.0, 'volume': 20.0}, name='t1'))